@@ -0,0 +1,17 @@
+import argparse
+from src.arena import BOT_NAMES, DEFAULT_MAX_MOVES, GAME_TYPES, run_arena
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ludoria headless bot arena")
+    parser.add_argument("game", choices=sorted(GAME_TYPES), help="game to play")
+    parser.add_argument("--bot-a", default="default", help=f"first bot, name:option=value,... (names: {', '.join(BOT_NAMES)})")
+    parser.add_argument("--bot-b", default="random", help="second bot, same format as --bot-a")
+    parser.add_argument("--games", type=int, default=10, help="number of games")
+    parser.add_argument("--processes", type=int, default=1, help="number of processes playing games in parallel")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the layouts and bots")
+    parser.add_argument("--max-moves", type=int, default=DEFAULT_MAX_MOVES, help="moves after which a game is a draw")
+    parser.add_argument("--output", default="arena_results.json", help="results file (json)")
+    args = parser.parse_args()
+
+    print("Starting Ludoria Arena...")
+    run_arena(args.game, args.bot_a, args.bot_b, args.games, args.processes, args.seed, args.max_moves, args.output)
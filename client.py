@@ -1,5 +1,7 @@
 from src.windows.launcher import Launcher
+from src.utils.logger import Logger
 
 if __name__ == "__main__":
+    Logger.start_async() # les logs ne bloquent jamais la boucle de rendu ni le fil réseau
     launcher = Launcher()
     launcher.start() 
\ No newline at end of file
@@ -0,0 +1,23 @@
+import argparse
+import sys
+from src.perft import DEFAULT_DEPTHS, GOLDEN_FILE, load_golden, run_perft, write_golden
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ludoria move generation benchmark (perft)")
+    parser.add_argument("--game", action="append", choices=sorted(DEFAULT_DEPTHS), help="game to measure, repeatable (default: all)")
+    parser.add_argument("--depth", type=int, help="maximum depth for every game (default: per game)")
+    parser.add_argument("--golden", default=GOLDEN_FILE, help="golden counts file (json)")
+    parser.add_argument("--update", action="store_true", help="write the measured counts to the golden file")
+    args = parser.parse_args()
+
+    print("Starting Ludoria Perft...")
+    games = args.game or sorted(DEFAULT_DEPTHS)
+    depths = {game: args.depth for game in games} if args.depth else None
+    results = run_perft(games, depths, golden=None if args.update else load_golden(args.golden))
+    for result in results:
+        status = "new" if result["expected"] is None else "ok" if result["ok"] else f"FAIL (expected {result['expected']})"
+        print(f"{result['game']:<10} {result['layout']:<20} depth {result['depth']}  {result['nodes']:>10} nodes  "
+              f"{result['elapsed']:8.3f}s  {result['nodes_per_second']:>12,.0f} nodes/s  {status}")
+    if args.update:
+        write_golden(results, args.golden)
+    sys.exit(0 if all(result["ok"] for result in results) else 1)
@@ -0,0 +1,218 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import ast
+import inspect
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+from src.game_state import GAME_TYPES, GameState, Move, layout_quadrants
+from src.parallel import ParallelSearch
+from src.congress.bot import CongressBot
+from src.isolation.bot import IsolationBot
+from src.katerenga.bot import KaterengaBot
+from src.windows.selector.config_loader import ConfigLoader
+from src.utils.logger import Logger
+
+# bots disponibles : "default" est le bot du jeu, "random" joue un coup légal au hasard (référence de force)
+BOT_NAMES = ("default", "random")
+# nombre de coups au-delà duquel une partie est déclarée nulle
+DEFAULT_MAX_MOVES = 200
+
+def parse_bot_spec(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    fonction : lit la description d'un bot de la forme "nom:option=valeur,option=valeur"
+    params :
+        spec - description, par exemple "default:max_time=0.2,tt_size_mb=1" ou "random"
+    retour : (nom du bot, options) ; les valeurs sont des littéraux python, sinon des chaînes
+    """
+    name, _, raw_options = spec.partition(":")
+    if name not in BOT_NAMES:
+        raise ValueError(f"Unknown bot: {name}")
+    options: Dict[str, Any] = {}
+    for item in filter(None, raw_options.split(",")):
+        key, separator, value = item.partition("=")
+        if not separator:
+            raise ValueError(f"Invalid bot option: {item}")
+        try:
+            options[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            options[key.strip()] = value.strip()
+    return name, options
+
+def random_quadrants(quadrants_config: Dict[str, List[List[List[Optional[int]]]]],
+                     rng: random.Random) -> Tuple[List[str], List[int], List[List[List[List[Optional[int]]]]]]:
+    """
+    fonction : tire une disposition au hasard (quatre quadrants de configs/quadrants.json, tournés au hasard)
+    params :
+        quadrants_config - configuration chargée par ConfigLoader
+        rng - générateur aléatoire
+    retour : (noms des quadrants, nombre de quarts de tour à droite, quadrants tournés)
+    """
+    names = [rng.choice(sorted(quadrants_config)) for _ in range(4)]
+    rotations = [rng.randrange(4) for _ in range(4)]
+    quadrants = layout_quadrants(quadrants_config, names, rotations)
+    return names, rotations, quadrants
+
+def create_player(game: GameState, name: str, options: Dict[str, Any], player: int,
+                  seed: int) -> Callable[[], Optional[Move]]:
+    """
+    fonction : crée un joueur de l'arène pour un côté de la partie
+    params :
+        game - partie lue par le bot
+        name - nom du bot (voir BOT_NAMES)
+        options - paramètres du constructeur du bot, ou attributs à modifier (par exemple max_time)
+        player - joueur contrôlé (0 ou 1)
+        seed - graine des tirages aléatoires
+    retour : fonction sans paramètre qui renvoie le coup choisi au format de GameState.legal_moves
+    """
+    if name == "random":
+        rng = random.Random(seed)
+        return lambda: rng.choice(game.legal_moves())
+
+    if game.game_type == GAME_TYPES["katerenga"]:
+        bot_class, arguments = KaterengaBot, {"game": game, "player": player, "seed": seed}
+    elif game.game_type == GAME_TYPES["congress"]:
+        bot_class, arguments = CongressBot, {"game": game, "player": player}
+    else:
+        bot_class, arguments = IsolationBot, {"player_id": player + 1}
+    parameters = inspect.signature(bot_class.__init__).parameters
+    arguments.update({key: value for key, value in options.items() if key in parameters})
+    bot = bot_class(**arguments)
+    for key, value in options.items():
+        if key in parameters:
+            continue
+        if not hasattr(bot, key):
+            raise ValueError(f"Unknown option for {bot_class.__name__}: {key}")
+        setattr(bot, key, value) # réglage sans paramètre de constructeur (max_time, max_depth, time_limit...)
+
+    if game.game_type == GAME_TYPES["katerenga"]:
+        return bot.choose_move
+    if game.game_type == GAME_TYPES["congress"]:
+        def congress_move() -> Optional[Move]:
+            move = bot.get_move()
+            return None if move is None else (*move[0], *move[1])
+        return congress_move
+    return lambda: bot.get_move(game.board.board, game.attack_map)
+
+def play_game(game_type: int, quadrants: List[List[List[List[Optional[int]]]]], bots: Sequence[Tuple[str, Dict[str, Any]]],
+              seed: int, max_moves: int = DEFAULT_MAX_MOVES) -> Dict[str, Any]:
+    """
+    fonction : joue une partie entre deux bots (fonction de module : exécutable dans un processus de ParallelSearch)
+    params :
+        game_type - numéro du jeu
+        quadrants - disposition du plateau
+        bots - (nom, options) du bot du joueur 0 puis du joueur 1
+        seed - graine de la partie
+        max_moves - nombre de coups au-delà duquel la partie est nulle
+    retour : gagnant (0, 1 ou None), nombre de coups et temps de réflexion de chaque coup par joueur
+    """
+    game = GameState(game_type, quadrants)
+    players = [create_player(game, name, options, player, seed + player) for player, (name, options) in enumerate(bots)]
+    think_times: List[List[float]] = [[], []]
+    winner: Optional[int] = None
+    moves = 0
+    while moves < max_moves:
+        player = game.round_turn
+        start = time.perf_counter()
+        move = players[player]()
+        think_times[player].append(time.perf_counter() - start)
+        if move is None or tuple(move) not in game.legal_moves():
+            Logger.error("Arena", f"Player {player + 1} returned an illegal move {move}, game lost")
+            winner = 1 - player
+            break
+        moves += 1
+        winner = game.apply_move(tuple(move))
+        if winner is not None:
+            break
+    return {"winner": winner, "moves": moves, "think_times": think_times}
+
+def _time_summary(times: List[float]) -> Dict[str, float]:
+    """
+    fonction : résume une liste de temps de réflexion
+    params :
+        times - durées en secondes
+    retour : nombre de coups, moyenne, médiane et maximum
+    """
+    if not times:
+        return {"moves": 0, "mean": 0.0, "median": 0.0, "max": 0.0}
+    return {"moves": len(times), "mean": statistics.mean(times), "median": statistics.median(times), "max": max(times)}
+
+def run_arena(game_name: str, bot_a: str, bot_b: str, games: int, processes: int = 1, seed: int = 0,
+              max_moves: int = DEFAULT_MAX_MOVES, output: Optional[str] = None,
+              quadrants_config: Optional[Dict[str, List[List[List[Optional[int]]]]]] = None) -> Dict[str, Any]:
+    """
+    fonction : joue un tournoi entre deux bots, les couleurs alternant d'une partie à l'autre
+    params :
+        game_name - "katerenga", "isolation" ou "congress"
+        bot_a, bot_b - descriptions des deux bots (voir parse_bot_spec)
+        games - nombre de parties
+        processes - nombre de processus qui jouent les parties en parallèle
+        seed - graine des dispositions et des bots (tournoi reproductible)
+        max_moves - nombre de coups au-delà duquel une partie est nulle
+        output - fichier json des résultats (None : pas d'écriture)
+        quadrants_config - quadrants disponibles (None : configs/quadrants.json)
+    retour : résultats (victoires et taux de victoire, longueur des parties, temps de réflexion, détail des parties)
+    """
+    if game_name not in GAME_TYPES:
+        raise ValueError(f"Unknown game: {game_name}")
+    specs = {"a": parse_bot_spec(bot_a), "b": parse_bot_spec(bot_b)}
+    if quadrants_config is None:
+        config_result = ConfigLoader().load_quadrants()
+        if not config_result:
+            raise ValueError("Failed to load quadrants configuration")
+        quadrants_config = config_result[0]
+
+    rng = random.Random(seed)
+    jobs, layouts = [], []
+    for index in range(games):
+        names, rotations, quadrants = random_quadrants(quadrants_config, rng)
+        sides = ("a", "b") if index % 2 == 0 else ("b", "a") # le bot a joue en premier une partie sur deux
+        layouts.append({"quadrants": names, "rotations": rotations, "sides": sides})
+        jobs.append((GAME_TYPES[game_name], quadrants, [specs[side] for side in sides], rng.getrandbits(32), max_moves))
+
+    start = time.time()
+    Logger.info("Arena", f"Playing {games} {game_name} games between '{bot_a}' and '{bot_b}' on {processes} processes")
+    if processes > 1:
+        pool = ParallelSearch(processes)
+        try:
+            outcomes = pool.run(play_game, jobs)
+        finally:
+            pool.shutdown()
+    else:
+        outcomes = [play_game(*job) for job in jobs]
+
+    wins = {"a": 0, "b": 0, "draws": 0}
+    think_times: Dict[str, List[float]] = {"a": [], "b": []}
+    details = []
+    for layout, outcome in zip(layouts, outcomes):
+        sides = layout["sides"]
+        winner = None if outcome["winner"] is None else sides[outcome["winner"]]
+        wins[winner or "draws"] += 1
+        for player, side in enumerate(sides):
+            think_times[side] += outcome["think_times"][player]
+        details.append({"quadrants": layout["quadrants"], "rotations": layout["rotations"], "first_player": sides[0],
+                        "winner": winner, "moves": outcome["moves"],
+                        "think_times": {side: outcome["think_times"][player] for player, side in enumerate(sides)}})
+
+    lengths = [outcome["moves"] for outcome in outcomes]
+    results = {
+        "game": game_name,
+        "bots": {"a": bot_a, "b": bot_b},
+        "games": games,
+        "seed": seed,
+        "elapsed": time.time() - start,
+        "wins": wins,
+        "win_rate": {side: wins[side] / games if games else 0.0 for side in ("a", "b")},
+        "game_length": {"mean": statistics.mean(lengths) if lengths else 0.0,
+                        "min": min(lengths, default=0), "max": max(lengths, default=0)},
+        "think_time": {side: _time_summary(times) for side, times in think_times.items()},
+        "results": details
+    }
+    Logger.success("Arena", f"'{bot_a}' won {wins['a']}, '{bot_b}' won {wins['b']}, {wins['draws']} draws "
+                            f"(mean length {results['game_length']['mean']:.1f} moves) in {results['elapsed']:.1f}s")
+    if output is not None:
+        with Path(output).open("w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        Logger.info("Arena", f"Results written to {output}")
+    return results
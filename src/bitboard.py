@@ -0,0 +1,276 @@
+from typing import Iterator, List, Optional, Tuple
+import struct
+
+# valeur utilisée dans la couche des couleurs pour une case sans type (bord gris du katerenga)
+NO_CELL_TYPE = 255
+# nombre de types de cases (0-3 : rouge, vert, bleu, jaune / 4-5 : camps du katerenga)
+CELL_TYPES = 6
+
+class BitBoard:
+    """
+    classe : représentation compacte du plateau de jeu
+    structure :
+        size - 8 (isolation, congress) ou 10 (katerenga)
+        occupancy - deux entiers (un par joueur), bit i à 1 si la case i est occupée par ce joueur
+        colors - un entier par type de case (0-5), bit i à 1 si la case i est de ce type
+        cells - bytearray plat des types de case (NO_CELL_TYPE si aucun type)
+    indexation : une case (row, col) correspond au bit row * size + col
+    """
+    __slots__ = ("size", "occupancy", "colors", "cells", "_not_first_col", "_not_last_col", "_full")
+
+    def __init__(self, size: int, cells: Optional[bytearray] = None, occupancy: Optional[List[int]] = None) -> None:
+        """
+        procédure : initialise un plateau compact
+        params :
+            size - taille du plateau (8 ou 10)
+            cells - types de case à plat (NO_CELL_TYPE si aucun type), toutes vides si None
+            occupancy - bitboards d'occupation des deux joueurs, plateau vide si None
+        """
+        self.size: int = size
+        self.cells: bytearray = cells if cells is not None else bytearray([NO_CELL_TYPE]) * (size * size)
+        self.occupancy: List[int] = occupancy if occupancy is not None else [0, 0]
+        self.colors: List[int] = [0] * CELL_TYPES
+        for square, cell_type in enumerate(self.cells):
+            if cell_type != NO_CELL_TYPE:
+                self.colors[cell_type] |= 1 << square
+        self._init_masks()
+
+    def _init_masks(self) -> None:
+        """
+        procédure : précalcule les masques de colonnes utilisés pour les décalages de bits
+        """
+        first_col = 0
+        for row in range(self.size):
+            first_col |= 1 << (row * self.size)
+        self._full: int = (1 << (self.size * self.size)) - 1
+        self._not_first_col: int = self._full & ~first_col
+        self._not_last_col: int = self._full & ~(first_col << (self.size - 1))
+
+    @classmethod
+    def from_board(cls, board: List[List[List[Optional[int]]]]) -> "BitBoard":
+        """
+        fonction : construit un plateau compact à partir du plateau en listes imbriquées
+        params :
+            board - plateau de jeu ([joueur, type_case] pour chaque case)
+        retour : plateau compact équivalent
+        """
+        size = len(board)
+        cells = bytearray(size * size)
+        occupancy = [0, 0]
+        square = 0
+        for row in board:
+            for player, cell_type in row:
+                cells[square] = NO_CELL_TYPE if cell_type is None else cell_type
+                if player is not None:
+                    occupancy[player] |= 1 << square
+                square += 1
+        return cls(size, cells, occupancy)
+
+    def to_board(self) -> List[List[List[Optional[int]]]]:
+        """
+        fonction : reconstruit le plateau en listes imbriquées
+        retour : plateau de jeu ([joueur, type_case] pour chaque case)
+        """
+        return [
+            [[self.player_at(row * self.size + col), self.cell_type(row * self.size + col)] for col in range(self.size)]
+            for row in range(self.size)
+        ]
+
+    def index(self, row: int, col: int) -> int:
+        """
+        fonction : convertit des coordonnées en index de case
+        params :
+            row - ligne de la case
+            col - colonne de la case
+        retour : index du bit correspondant
+        """
+        return row * self.size + col
+
+    def position(self, square: int) -> Tuple[int, int]:
+        """
+        fonction : convertit un index de case en coordonnées
+        params :
+            square - index de la case
+        retour : tuple (row, col)
+        """
+        return divmod(square, self.size)
+
+    @property
+    def occupied(self) -> int:
+        """
+        fonction : bitboard de toutes les cases occupées
+        retour : entier dont les bits à 1 sont les cases occupées
+        """
+        return self.occupancy[0] | self.occupancy[1]
+
+    def player_at(self, square: int) -> Optional[int]:
+        """
+        fonction : retourne le joueur présent sur une case
+        params :
+            square - index de la case
+        retour : 0, 1 ou None si la case est vide
+        """
+        bit = 1 << square
+        if self.occupancy[0] & bit:
+            return 0
+        if self.occupancy[1] & bit:
+            return 1
+        return None
+
+    def cell_type(self, square: int) -> Optional[int]:
+        """
+        fonction : retourne le type d'une case
+        params :
+            square - index de la case
+        retour : type de case (0-5) ou None pour une case sans type
+        """
+        cell_type = self.cells[square]
+        return None if cell_type == NO_CELL_TYPE else cell_type
+
+    def get(self, row: int, col: int) -> List[Optional[int]]:
+        """
+        fonction : retourne une case au format des listes imbriquées
+        params :
+            row - ligne de la case
+            col - colonne de la case
+        retour : [joueur, type_case]
+        """
+        square = row * self.size + col
+        return [self.player_at(square), self.cell_type(square)]
+
+    def place(self, square: int, player: int) -> None:
+        """
+        procédure : pose un pion sur une case vide
+        params :
+            square - index de la case
+            player - joueur propriétaire du pion (0 ou 1)
+        """
+        self.occupancy[player] |= 1 << square
+
+    def remove(self, square: int) -> Optional[int]:
+        """
+        fonction : retire le pion présent sur une case
+        params :
+            square - index de la case
+        retour : joueur dont le pion a été retiré, ou None si la case était vide
+        """
+        player = self.player_at(square)
+        if player is not None:
+            self.occupancy[player] &= ~(1 << square)
+        return player
+
+    def move(self, from_square: int, to_square: int) -> Optional[int]:
+        """
+        fonction : déplace un pion, en capturant le pion adverse éventuel
+        params :
+            from_square - index de la case de départ
+            to_square - index de la case d'arrivée
+        retour : joueur du pion capturé, ou None s'il n'y a pas eu de capture
+        """
+        player = self.remove(from_square)
+        captured = self.remove(to_square)
+        self.place(to_square, player)
+        return captured
+
+    def pieces(self, player: int) -> Iterator[int]:
+        """
+        fonction : parcourt les cases occupées par un joueur
+        params :
+            player - joueur (0 ou 1)
+        retour : itérateur sur les index des cases, dans l'ordre croissant
+        """
+        mask = self.occupancy[player]
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit.bit_length() - 1
+            mask ^= low_bit
+
+    def copy(self) -> "BitBoard":
+        """
+        fonction : copie le plateau (la couche des couleurs est partagée car elle ne change jamais)
+        retour : nouveau plateau compact indépendant pour l'occupation
+        """
+        clone = BitBoard.__new__(BitBoard)
+        clone.size = self.size
+        clone.cells = self.cells
+        clone.colors = self.colors
+        clone.occupancy = self.occupancy[:]
+        clone._full = self._full
+        clone._not_first_col = self._not_first_col
+        clone._not_last_col = self._not_last_col
+        return clone
+
+    def orthogonal_neighbors(self, mask: int) -> int:
+        """
+        fonction : calcule les cases orthogonalement voisines d'un ensemble de cases
+        params :
+            mask - bitboard des cases de départ
+        retour : bitboard des voisins (haut, bas, gauche, droite), cases de départ incluses
+        """
+        size = self.size
+        return (mask
+                | ((mask << 1) & self._not_first_col)
+                | ((mask >> 1) & self._not_last_col)
+                | ((mask << size) & self._full)
+                | (mask >> size))
+
+    def group_of(self, square: int, player: int) -> int:
+        """
+        fonction : remplissage par diffusion du groupe orthogonalement connecté contenant une case
+        params :
+            square - index d'une case occupée par le joueur
+            player - joueur (0 ou 1)
+        retour : bitboard des pièces du groupe
+        """
+        own = self.occupancy[player]
+        group = (1 << square) & own
+        while True:
+            grown = self.orthogonal_neighbors(group) & own
+            if grown == group:
+                return group
+            group = grown
+
+    def groups(self, player: int) -> List[int]:
+        """
+        fonction : découpe les pièces d'un joueur en groupes orthogonalement connectés
+        params :
+            player - joueur (0 ou 1)
+        retour : liste des bitboards de chaque groupe
+        """
+        remaining = self.occupancy[player]
+        groups = []
+        while remaining:
+            group = self.group_of((remaining & -remaining).bit_length() - 1, player)
+            groups.append(group)
+            remaining &= ~group
+        return groups
+
+    def serialize(self) -> bytes:
+        """
+        fonction : sérialise le plateau sous forme binaire compacte
+        format : taille (1 octet), types de case (size*size octets), occupation des deux joueurs
+        retour : octets représentant le plateau
+        """
+        byte_count = (self.size * self.size + 7) // 8
+        return (struct.pack("B", self.size) + bytes(self.cells)
+                + self.occupancy[0].to_bytes(byte_count, "little")
+                + self.occupancy[1].to_bytes(byte_count, "little"))
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> "BitBoard":
+        """
+        fonction : reconstruit un plateau à partir de sa forme sérialisée
+        params :
+            data - octets produits par serialize
+        retour : plateau compact
+        """
+        size = data[0]
+        square_count = size * size
+        byte_count = (square_count + 7) // 8
+        offset = 1 + square_count
+        cells = bytearray(data[1:offset])
+        occupancy = [
+            int.from_bytes(data[offset:offset + byte_count], "little"),
+            int.from_bytes(data[offset + byte_count:offset + 2 * byte_count], "little")
+        ]
+        return cls(size, cells, occupancy)
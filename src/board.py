@@ -1,5 +1,7 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence
 import copy
+from src.bitboard import BitBoard
+from src.zobrist import Position, hash_board
 from src.utils.logger import Logger
 
 class Board:
@@ -18,7 +20,7 @@ class Board:
             quadrants - liste des 4 quadrants du plateau
             game_number - type de jeu (0: katerenga, 1: isolation, 2: congress)
         """
-        Logger.board("Board", f"Initializing board for game {game_number}")
+        Logger.board("Board", "Initializing board for game %s", game_number)
         self.quadrants: List[List[List[List[Optional[int]]]]] = quadrants
         self.game_number: int = game_number
         self.board: List[List[List[Optional[int]]]] = self.get_board()
@@ -29,7 +31,7 @@ class Board:
         """
         procédure : place les pions initiaux selon le type de jeu
         """
-        Logger.board("Board", f"Setting up board for game type {self.game_number}")
+        Logger.board("Board", "Setting up board for game type %s", self.game_number)
         match self.game_number:
             case 0:
                 for i in range(8):
@@ -93,3 +95,42 @@ class Board:
             extended_board[row][col] = [None, camp_type]
 
         return extended_board
+
+    def to_bitboard(self) -> BitBoard:
+        """
+        fonction : convertit le plateau courant en représentation compacte
+        retour : plateau compact (bitboards d'occupation et couches de couleurs)
+        """
+        return BitBoard.from_board(self.board)
+
+    def load_bitboard(self, bitboard: BitBoard) -> None:
+        """
+        procédure : remplace l'occupation du plateau par celle d'un plateau compact
+        params :
+            bitboard - plateau compact de même taille
+        """
+        for row in range(len(self.board)):
+            for col in range(len(self.board[row])):
+                self.board[row][col][0] = bitboard.player_at(row * bitboard.size + col)
+
+    def to_position(self, round_turn: int, first_turn: bool = False, locked_pieces: Optional[Iterable[Sequence[int]]] = None) -> Position:
+        """
+        fonction : construit la position compacte hachée du plateau courant
+        params :
+            round_turn - joueur qui a le trait (0 ou 1)
+            first_turn - premier tour du katerenga en cours
+            locked_pieces - positions des pions verrouillés (katerenga)
+        retour : position avec hachage de Zobrist, mise à jour incrémentalement par make_move/unmake_move
+        """
+        return Position.from_board(self.board, round_turn, first_turn, locked_pieces)
+
+    def position_hash(self, round_turn: int, first_turn: bool = False, locked_pieces: Optional[Iterable[Sequence[int]]] = None) -> int:
+        """
+        fonction : hachage de Zobrist de la position courante, utilisable comme clé de cache
+        params :
+            round_turn - joueur qui a le trait (0 ou 1)
+            first_turn - premier tour du katerenga en cours
+            locked_pieces - positions des pions verrouillés (katerenga)
+        retour : hachage 64 bits
+        """
+        return hash_board(self.board, round_turn, first_turn, locked_pieces)
@@ -0,0 +1,123 @@
+from typing import Any, Callable, Optional
+import threading
+import pygame
+from src.utils.logger import Logger
+
+# événement pygame qui rapporte le coup calculé par le bot à la boucle de rendu
+BOT_MOVE_EVENT = pygame.event.custom_type()
+
+class BotWorker:
+    """
+    classe : calcule le coup du bot sur un fil d'exécution séparé de la boucle de rendu
+    le résultat revient par un événement BOT_MOVE_EVENT (attributs token, result, error) ;
+    chaque réflexion porte un jeton : un résultat dont le jeton n'est plus le jeton courant (réflexion annulée) est ignoré ;
+    pendant le tour du joueur, le même gestionnaire peut faire réfléchir le bot sur le temps du joueur (ponder)
+    """
+    def __init__(self) -> None:
+        """
+        procédure : initialise le gestionnaire sans démarrer de fil
+        """
+        self._token: int = 0
+        self._thread: Optional[threading.Thread] = None
+        self._bot: Any = None
+        self._thinking: bool = False
+        self._ponder_thread: Optional[threading.Thread] = None
+        self._ponder_bot: Any = None
+
+    def start(self, bot: Any, think: Callable[[], Any]) -> int:
+        """
+        fonction : lance une réflexion
+        params :
+            bot - bot qui réfléchit (sa méthode cancel, si elle existe, est appelée en cas d'annulation)
+            think - fonction sans paramètre qui calcule le coup sans modifier le jeu
+        retour : jeton de la réflexion
+        """
+        self.stop_pondering() # le bot ne doit pas chercher sur deux fils à la fois
+        self._token += 1
+        token = self._token
+        self._bot = bot
+        self._thinking = True
+        self._thread = threading.Thread(target=self._run, args=(token, think), name=f"bot-{token}", daemon=True)
+        self._thread.start()
+        return token
+
+    def _run(self, token: int, think: Callable[[], Any]) -> None:
+        """
+        procédure : corps du fil : calcule le coup puis le poste dans la file d'événements pygame
+        params :
+            token - jeton de la réflexion
+            think - fonction de calcul du coup
+        """
+        result, error = None, None
+        try:
+            result = think()
+        except Exception as e:
+            error = str(e)
+            Logger.error("BotWorker", f"Bot search failed: {error}")
+        if token == self._token and pygame.get_init():
+            pygame.event.post(pygame.event.Event(BOT_MOVE_EVENT, token=token, result=result, error=error))
+
+    def ponder(self, bot: Any, ponder: Callable[[], None]) -> None:
+        """
+        procédure : lance la réflexion du bot sur le temps du joueur (aucun événement n'est posté)
+        params :
+            bot - bot qui réfléchit (sa méthode cancel arrête la réflexion)
+            ponder - fonction sans paramètre qui cherche jusqu'à l'annulation sans modifier le jeu
+        """
+        self.stop_pondering()
+        self._ponder_bot = bot
+        self._ponder_thread = threading.Thread(target=ponder, name="bot-ponder", daemon=True)
+        self._ponder_thread.start()
+
+    def stop_pondering(self) -> None:
+        """
+        procédure : arrête la réflexion sur le temps du joueur et attend la fin du fil (son résultat reste dans le bot)
+        """
+        thread = self._ponder_thread
+        if thread is None:
+            return
+        while thread.is_alive():
+            # répété : une annulation arrivée avant le début de la recherche serait effacée par celle-ci
+            self._ponder_bot.cancel()
+            thread.join(0.05)
+        self._ponder_thread = None
+        self._ponder_bot = None
+
+    def is_pondering(self) -> bool:
+        """
+        fonction : indique si le bot réfléchit sur le temps du joueur
+        retour : True si le fil de réflexion est actif
+        """
+        return self._ponder_thread is not None and self._ponder_thread.is_alive()
+
+    def is_thinking(self) -> bool:
+        """
+        fonction : indique si une réflexion est en cours (ou son résultat pas encore traité)
+        retour : True pendant la réflexion du bot
+        """
+        return self._thinking
+
+    def accept(self, event: pygame.event.Event) -> bool:
+        """
+        fonction : vérifie qu'un événement BOT_MOVE_EVENT correspond à la réflexion courante
+        params :
+            event - événement reçu par la boucle de rendu
+        retour : True si le résultat doit être appliqué, False s'il provient d'une réflexion annulée
+        """
+        if event.token != self._token:
+            return False
+        self._thinking = False
+        return True
+
+    def cancel(self) -> None:
+        """
+        procédure : annule la réflexion en cours : le bot est interrompu et son résultat sera ignoré
+        """
+        self.stop_pondering()
+        if not self._thinking:
+            return
+        self._token += 1
+        self._thinking = False
+        if hasattr(self._bot, "cancel"):
+            self._bot.cancel()
+        Logger.bot("BotWorker", "Bot search cancelled")
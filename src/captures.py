@@ -1,8 +1,179 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+from src.bitboard import BitBoard
+from src.move_tables import get_move_tables
 from src.moves import available_move
 from src.utils.logger import Logger
 
-def is_threatened(board: List[List[List[Optional[int]]]], row: int, col: int, current_player: int, check_all_pieces: bool = False) -> bool:
+class AttackMap:
+    """
+    classe : carte des attaques du plateau, mise à jour incrémentalement à chaque pose ou retrait de pion
+    structure :
+        counts[player][square] - nombre de pions du joueur qui attaquent la case
+        attackers[square] - cases des pions qui attaquent la case
+        targets[square] - cases attaquées par le pion posé sur la case
+        safe_mask - bitboard des cases vides attaquées par aucun pion (coups légaux d'Isolation)
+        safe_masks[player] - bitboard des cases vides non attaquées par les pions adverses
+    les attaques suivent les tables de déplacements (plateaux 8x8, sans les règles de camps du katerenga)
+    """
+    def __init__(self, board: Union[List[List[List[Optional[int]]]], BitBoard]) -> None:
+        """
+        procédure : construit la carte des attaques d'une position
+        params :
+            board - plateau de jeu en listes imbriquées ou plateau compact (copié)
+        """
+        self.compact: BitBoard = board.copy() if isinstance(board, BitBoard) else BitBoard.from_board(board)
+        self.tables = get_move_tables(self.compact)
+        square_count = self.compact.size * self.compact.size
+        self.counts: List[List[int]] = [[0] * square_count, [0] * square_count]
+        self.attackers: List[set] = [set() for _ in range(square_count)]
+        self.targets: Dict[int, List[int]] = {}
+        # cases jouables : colorées (ni bord gris ni camp)
+        self.playable: int = 0
+        for cell_type in range(4):
+            self.playable |= self.compact.colors[cell_type]
+        self.safe_mask: int = self.playable & ~self.compact.occupied
+        self.safe_masks: List[int] = [self.safe_mask, self.safe_mask]
+        for player in (0, 1):
+            for square in self.compact.pieces(player):
+                self._add_attacks(square, player)
+
+    def _refresh(self, square: int) -> None:
+        """
+        procédure : recalcule l'appartenance d'une case aux masques des cases sûres
+        params :
+            square - index de la case
+        """
+        bit = 1 << square
+        empty = self.playable & ~self.compact.occupied & bit
+        threat_0, threat_1 = self.counts[0][square], self.counts[1][square]
+        self.safe_mask = self.safe_mask | bit if empty and not threat_0 and not threat_1 else self.safe_mask & ~bit
+        self.safe_masks[0] = self.safe_masks[0] | bit if empty and not threat_1 else self.safe_masks[0] & ~bit
+        self.safe_masks[1] = self.safe_masks[1] | bit if empty and not threat_0 else self.safe_masks[1] & ~bit
+
+    def _add_attacks(self, square: int, player: int) -> None:
+        """
+        procédure : enregistre les attaques du pion posé sur une case
+        params :
+            square - index de la case du pion
+            player - propriétaire du pion
+        """
+        targets = self.tables.attacks(square, self.compact.occupied)
+        self.targets[square] = targets
+        counts = self.counts[player]
+        for target in targets:
+            counts[target] += 1
+            self.attackers[target].add(square)
+            self._refresh(target)
+
+    def _remove_attacks(self, square: int, player: int) -> None:
+        """
+        procédure : retire les attaques du pion posé sur une case
+        params :
+            square - index de la case du pion
+            player - propriétaire du pion
+        """
+        counts = self.counts[player]
+        for target in self.targets.pop(square):
+            counts[target] -= 1
+            self.attackers[target].discard(square)
+            self._refresh(target)
+
+    def _blocked_sliders(self, square: int) -> List[Tuple[int, int]]:
+        """
+        fonction : pions glissants dont un rayon passe par une case (leurs attaques changent si elle change)
+        params :
+            square - index de la case
+        retour : liste des (case, joueur) des pions concernés
+        """
+        return [(attacker, self.compact.player_at(attacker)) for attacker in self.attackers[square] if self.tables.rays[attacker]]
+
+    def place(self, row: int, col: int, player: int) -> None:
+        """
+        procédure : pose un pion et met à jour uniquement les attaques touchées
+        params :
+            row - ligne de la case (vide)
+            col - colonne de la case (vide)
+            player - propriétaire du pion (0 ou 1)
+        """
+        square = self.compact.index(row, col)
+        sliders = self._blocked_sliders(square)
+        for slider, owner in sliders:
+            self._remove_attacks(slider, owner)
+        self.compact.place(square, player)
+        self._refresh(square)
+        for slider, owner in sliders:
+            self._add_attacks(slider, owner)
+        self._add_attacks(square, player)
+
+    def remove(self, row: int, col: int) -> None:
+        """
+        procédure : retire un pion et met à jour uniquement les attaques touchées
+        params :
+            row - ligne de la case (occupée)
+            col - colonne de la case (occupée)
+        """
+        square = self.compact.index(row, col)
+        player = self.compact.player_at(square)
+        sliders = self._blocked_sliders(square)
+        for slider, owner in sliders:
+            self._remove_attacks(slider, owner)
+        self._remove_attacks(square, player)
+        self.compact.remove(square)
+        self._refresh(square)
+        for slider, owner in sliders:
+            self._add_attacks(slider, owner)
+
+    def is_threatened(self, row: int, col: int, current_player: int, check_all_pieces: bool = False) -> bool:
+        """
+        fonction : vérifie en O(1) si une case est attaquée
+        params :
+            row - ligne de la case
+            col - colonne de la case
+            current_player - joueur actuel (0 ou 1)
+            check_all_pieces - si True, compte aussi les pions du joueur actuel
+        retour : True si au moins un pion concerné attaque la case
+        """
+        square = self.compact.index(row, col)
+        if check_all_pieces:
+            return self.counts[0][square] + self.counts[1][square] > 0
+        return self.counts[1 - current_player][square] > 0
+
+    def safe_squares_mask(self, current_player: int, check_all_pieces: bool = False) -> int:
+        """
+        fonction : bitboard des cases vides non menacées
+        params :
+            current_player - joueur actuel (0 ou 1)
+            check_all_pieces - si True, exclut aussi les cases attaquées par les pions du joueur actuel
+        retour : entier dont les bits à 1 sont les cases où le joueur peut se placer
+        """
+        return self.safe_mask if check_all_pieces else self.safe_masks[current_player]
+
+    def safe_squares(self, current_player: int, check_all_pieces: bool = False) -> List[Tuple[int, int]]:
+        """
+        fonction : liste les cases vides non menacées
+        params :
+            current_player - joueur actuel (0 ou 1)
+            check_all_pieces - si True, exclut aussi les cases attaquées par les pions du joueur actuel
+        retour : liste des positions (row, col), dans l'ordre du plateau
+        """
+        mask = self.safe_squares_mask(current_player, check_all_pieces)
+        squares = []
+        while mask:
+            low_bit = mask & -mask
+            squares.append(self.compact.position(low_bit.bit_length() - 1))
+            mask ^= low_bit
+        return squares
+
+    def matches(self, board: List[List[List[Optional[int]]]]) -> bool:
+        """
+        fonction : vérifie que la carte correspond toujours au plateau (chargement, état réseau)
+        params :
+            board - plateau de jeu
+        retour : True si l'occupation des deux joueurs est identique
+        """
+        return BitBoard.from_board(board).occupancy == self.compact.occupancy
+
+def is_threatened(board: List[List[List[Optional[int]]]], row: int, col: int, current_player: int, check_all_pieces: bool = False, attack_map: Optional[AttackMap] = None) -> bool:
     """
     fonction : vérifie si une case est menacée par un pion adverse
     params :
@@ -11,9 +182,13 @@ def is_threatened(board: List[List[List[Optional[int]]]], row: int, col: int, cu
         col - colonne de la case à vérifier
         current_player - joueur actuel (0 ou 1)
         check_all_pieces - si True, vérifie les menaces de tous les pions (y compris amis)
+        attack_map - carte des attaques synchronisée avec le plateau, interrogée en O(1) si fournie
     retour : bool indiquant si la case est menacée
     """
-    Logger.game("Captures", f"Checking if cell ({row},{col}) is threatened for player {current_player}")
+    if attack_map is not None:
+        return attack_map.is_threatened(row, col, current_player, check_all_pieces)
+
+    Logger.move("Captures", "Checking if cell (%s,%s) is threatened for player %s", row, col, current_player)
     
     for i in range(len(board)):
         for j in range(len(board[i])):
@@ -22,28 +197,32 @@ def is_threatened(board: List[List[List[Optional[int]]]], row: int, col: int, cu
                 # sinon, vérifie uniquement les pions adverses
                 if check_all_pieces or board[i][j][0] != current_player:
                     if available_move(board, i, j, row, col):
-                        Logger.warning("Captures", f"Cell ({row},{col}) is threatened by piece at ({i},{j})")
+                        Logger.move("Captures", "Cell (%s,%s) is threatened by piece at (%s,%s)", row, col, i, j)
                         return True
                     
-    Logger.success("Captures", f"Cell ({row},{col}) is not threatened")
+    Logger.move("Captures", "Cell (%s,%s) is not threatened", row, col)
     return False
 
-def has_valid_move(board: List[List[List[Optional[int]]]], current_player: int, check_all_pieces: bool = False) -> bool:
+def has_valid_move(board: List[List[List[Optional[int]]]], current_player: int, check_all_pieces: bool = False, attack_map: Optional[AttackMap] = None) -> bool:
     """
     fonction : vérifie s'il existe des cases non menacées pour placer un pion
     params :
         board - plateau de jeu
         current_player - joueur actuel (0 ou 1)
         check_all_pieces - si True, vérifie les menaces de tous les pions (comme pour Isolation)
+        attack_map - carte des attaques synchronisée avec le plateau, interrogée en O(1) si fournie
     retour : bool indiquant si des coups sont possibles
     """
-    Logger.game("Captures", f"Checking for valid moves for player {current_player}")
+    if attack_map is not None:
+        return attack_map.safe_squares_mask(current_player, check_all_pieces) != 0
+
+    Logger.move("Captures", "Checking for valid moves for player %s", current_player)
     
     for i in range(len(board)):
         for j in range(len(board[i])):
             if board[i][j][0] is None and not is_threatened(board, i, j, current_player, check_all_pieces):
-                Logger.success("Captures", f"Found valid move at ({i},{j}) for player {current_player}")
+                Logger.move("Captures", "Found valid move at (%s,%s) for player %s", i, j, current_player)
                 return True
                 
-    Logger.warning("Captures", f"No valid moves found for player {current_player}")
+    Logger.move("Captures", "No valid moves found for player %s", current_player)
     return False
\ No newline at end of file
@@ -1,287 +1,334 @@
 from typing import List, Tuple, Optional, Dict
-import random
 import time
 import math 
-from src.moves import available_move
+from src.bitboard import BitBoard
+from src.move_tables import get_move_tables
+from src.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND, NO_MOVE
+from src.zobrist import Position
+from src.congress.connectivity import ConnectivityTracker
+from src.parallel import ParallelSearch, merge_root_results
+from src.ponder import PonderResult, PonderStats
 from src.utils.logger import Logger
-from copy import deepcopy 
+
+# score d'une victoire dans la recherche (diminué de la distance à la racine pour préférer les victoires rapides)
+WIN_SCORE = 100000.0
+
+class _SearchTimeout(Exception):
+    """
+    classe : interrompt la recherche quand le temps de réflexion est écoulé
+    """
 
 class CongressBot:
     """
     classe : bot pour le jeu de Congress
     """
-    def __init__(self, game):
+    def __init__(self, game, tt_size_mb: float = 4, tt_policy: str = "depth", workers: int = 1, player: int = 1):
         """
         procédure : initialise une nouvelle instance de bot pour Congress
         params :
             game - instance du jeu Congress
+            tt_size_mb - taille de la table de transposition en mégaoctets
+            tt_policy - politique de remplacement de la table ("depth" ou "always")
+            workers - nombre de processus de recherche (1 : recherche dans le processus du jeu)
+            player - joueur contrôlé par le bot (1 en partie contre le bot, 0 ou 1 dans l'arène)
         """
         self.game = game
-        self.player = 1 # le bot est toujours le joueur 1 (blanc) (index 1 mais joueur 2)
-        self.opponent = 0 # l'adversaire est le joueur 0 (noir) (index 0 mais joueur 1)
-        self.move_history = [] # historique pour éviter répétitions simples
-        self.max_history = 5 # taille max de l'historique
-        self.max_depth = 2 # profondeur de recherche minimax (limitée pour performance)
+        self.player = player # joueur 1 (blanc) en partie contre le bot (index 1 mais joueur 2)
+        self.opponent = 1 - player # joueur 0 (noir) en partie contre le bot (index 0 mais joueur 1)
+        self.position_counts: Dict[int, int] = {} # nombre d'apparitions de chaque position (hachage de Zobrist)
+        self.repetition_penalty = 100 # pénalité par apparition précédente de la position obtenue
+        self.max_depth = 6 # profondeur maximale de l'approfondissement itératif
         self.max_time = 3.0 # temps max de réflexion en secondes
+        self.transposition_table = TranspositionTable(tt_size_mb, tt_policy) # mémoire fixe pour toute la partie
+        self.principal_variation: List[int] = [] # meilleure suite de coups de la dernière itération terminée
+        self.tt_size_mb = tt_size_mb
+        self.parallel = ParallelSearch(workers) if workers > 1 else None # coups de la racine répartis entre processus
+        self._cancelled = False # demande d'arrêt venue du fil de rendu
+        self._ponder: Optional[PonderResult] = None # réflexion préparée pendant le tour de l'adversaire
+        self.ponder_stats = PonderStats("CongressBot")
         Logger.bot("CongressBot", "Bot initialized")
 
     def get_move(self) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
-        fonction : détermine le meilleur coup à jouer en utilisant une évaluation simple
-                  (pas de minimax pour l'instant pour la performance/simplicité)
+        fonction : détermine le meilleur coup par une recherche alpha-beta (negamax) en approfondissement itératif,
+                  limitée par max_depth et max_time
 
         retour:
             tuple: ((from_row, from_col), (to_row, to_col)) ou None si aucun coup
         """
         start_time = time.time()
-        possible_moves = self._get_all_possible_moves() # récupère tous les coups possibles
-        
-        if not possible_moves: # si aucun coup n'est possible
+        self._cancelled = False
+        position = self.game.board.to_position(self.player) # position hachée, le bot a le trait
+        self.position_counts[position.hash] = self.position_counts.get(position.hash, 0) + 1
+        self._tables = get_move_tables(position.board)
+
+        root_moves = self._compact_moves(position.board, self.player)
+        if not root_moves: # si aucun coup n'est possible
             Logger.warning("CongressBot", "No valid moves found")
             return None
-            
-        scored_moves = [] # liste pour stocker les coups évalués
-        board = self.game.board.board 
-        
-        Logger.bot("CongressBot", f"Evaluating {len(possible_moves)} possible moves")
-        
-        # évalue chaque coup possible
-        for from_pos, to_pos in possible_moves:
-            # simule le coup sur une copie temporaire pour évaluation
-            temp_board = deepcopy(board) # copie du tableau pour pouvoir le modifier sans affecter le tableau principal
-            from_row, from_col = from_pos
-            to_row, to_col = to_pos
-            
-            # exécute le coup sur la copie
-            temp_board[to_row][to_col][0] = temp_board[from_row][from_col][0]
-            temp_board[from_row][from_col][0] = None
-            
-            # calcule le score de la position résultante
-            score = self._evaluate_position(temp_board)
-            
-            # pénalise les coups répétitifs (aller-retour simple)
-            if len(self.move_history) > 0: # si l'historique n'est pas vide
-                last_from, last_to = self.move_history[-1]
-                if to_pos == last_from and from_pos == last_to:
-                    score -= 150 # forte pénalité pour annuler le dernier coup
-            
-            # pénalise les coups joués récemment (pour éviter cycles simples)
-            history_penalty = self.move_history.count((from_pos, to_pos)) # compte le nombre de fois que le coup a été joué
-            if history_penalty > 0: # si le coup a été joué plusieurs fois
-                 score -= 50 * history_penalty # pénalise le coup
-            
-            scored_moves.append((score, from_pos, to_pos)) # ajoute le coup à la liste des coups évalués
-        
-        # trie les coups par score décroissant
-        scored_moves.sort(key=lambda x: x[0], reverse=True) # trie les coups par score décroissant
-        
-        # sélection du meilleur coup avec une part d\'aléatoire
-        if not scored_moves: # si aucun coup n'est possible
-             Logger.warning("CongressBot", "No moves left after scoring")
-             return None 
 
-        top_n = min(3, len(scored_moves)) # considère les 3 meilleurs coups
-        top_moves = scored_moves[:top_n] # récupère les 3 meilleurs coups
-        
-        # probabilité plus élevée de choisir le meilleur coup absolu
-        if random.random() < 0.8 or len(top_moves) == 1: # si la probabilité est inférieure à 0.8 ou si il n'y a qu'un seul coup
-            best_score, best_from, best_to = top_moves[0] # choisit le meilleur coup
-        else: # sinon, choisit aléatoirement parmi les 3 meilleurs coups
-            # sinon, choisir aléatoirement parmi les 3 meilleurs
-            best_score, best_from, best_to = random.choice(top_moves)
-            
+        pondered = self.ponder_stats.check(self._ponder, position.hash, self.max_time)
+        self._ponder = None
+        if pondered is not None and pondered.results and (pondered.completed or pondered.elapsed >= self.max_time):
+            results = pondered.results # prédiction réussie et recherche déjà suffisante : réponse immédiate
+        else:
+            # le temps passé sur cette position pendant le tour de l'adversaire est décompté du budget
+            search_start = start_time - (min(pondered.elapsed, self.max_time) if pondered is not None else 0.0)
+            if self.parallel is not None and len(root_moves) > 1:
+                results = self._parallel_search(position, root_moves, search_start)
+            else:
+                results = self._iterative_deepening(position, root_moves, search_start)
+            if pondered is not None and pondered.results and (not results or pondered.results[-1][0] > results[-1][0]):
+                results = pondered.results # la réflexion anticipée est allée plus profond
+
+        if results:
+            depth_reached, best_score, self.principal_variation, _ = results[-1]
+            best_move = self.principal_variation[0]
+        else:
+            best_move, best_score, depth_reached = root_moves[0], -math.inf, 0 # repli si la première itération n'a pas eu le temps de finir
+
+        from_square, to_square = best_move >> 6, best_move & 63
+        best_from, best_to = position.board.position(from_square), position.board.position(to_square)
         elapsed_time = time.time() - start_time # temps d'exécution des calculs du bot
-        Logger.bot("CongressBot", f"Selected move from {best_from} to {best_to} with score {best_score:.2f} in {elapsed_time:.2f}s")
-        
-        # enregistre le coup dans l'historique
-        self.move_history.append((best_from, best_to)) # ajoute le coup à l'historique
-        if len(self.move_history) > self.max_history: # si l'historique est trop long
-            self.move_history.pop(0) # supprime le premier coup de l'historique
-            
+        stats = self.transposition_table.stats()
+        Logger.bot("CongressBot", "Selected move from %s to %s with score %.2f at depth %s (%s nodes, TT hit rate %.0f%%) in %.2fs",
+                   best_from, best_to, best_score, depth_reached, self._nodes, stats['hit_rate'] * 100, elapsed_time)
+
+        # enregistre la position obtenue pour détecter les répétitions
+        undo = position.make_move(from_square, to_square)
+        self.position_counts[position.hash] = self.position_counts.get(position.hash, 0) + 1
+        position.unmake_move(undo)
+
         return (best_from, best_to) # retourne le meilleur coup
-    
-    def _evaluate_position(self, board: List[List[List]]) -> float:
+
+    def cancel(self) -> None:
+        """
+        procédure : interrompt la recherche en cours (appelée depuis un autre fil), qui garde la dernière profondeur terminée
+        """
+        self._cancelled = True
+
+    def ponder(self, position: Position) -> None:
         """
-        fonction : évalue la position actuelle du plateau pour le bot
+        procédure : réflexion sur le temps de l'adversaire : prédit sa réponse (variation principale, sinon table de
+                  transposition) puis cherche le coup du bot dans la position obtenue jusqu'à l'annulation (cancel) ;
+                  get_move reprend ce résultat si l'adversaire joue le coup prédit
 
         params:
-            board: état du plateau à évaluer
+            position: position après le coup du bot, l'adversaire a le trait (instantané pris sur le fil de rendu)
+        """
+        start_time = time.time()
+        self._cancelled = False
+        self._ponder = None
+        self._tables = get_move_tables(position.board)
+        replies = self._compact_moves(position.board, position.turn)
+        if not replies:
+            return
+        predicted = self.principal_variation[1] if len(self.principal_variation) > 1 else NO_MOVE
+        if predicted not in replies:
+            predicted = self.transposition_table.best_move(position.hash)
+        if predicted not in replies:
+            predicted = replies[0]
+        position.make_move(predicted >> 6, predicted & 63)
+        root_moves = self._compact_moves(position.board, self.player)
+        if not root_moves:
+            return
+        results = self._iterative_deepening(position, root_moves, start_time, time_limit=math.inf)
+        self._ponder = PonderResult(predicted, position.hash, results, time.time() - start_time, not self._cancelled)
+        Logger.bot("CongressBot", "Pondered reply %s to %s up to depth %s", position.board.position(predicted >> 6),
+                   position.board.position(predicted & 63), results[-1][0] if results else 0)
+
+    def _iterative_deepening(self, position: Position, root_moves: List[int], start_time: float,
+                             stop_on_loss: bool = True, time_limit: Optional[float] = None) -> List[Tuple[int, float, List[int], int]]:
+        """
+        fonction : approfondissement itératif limité à certains coups de la racine
+
+        params:
+            position: position compacte, le bot a le trait (non modifiée)
+            root_moves: coups de la racine à examiner
+            start_time: début de la réflexion (le temps est compté à partir de cet instant)
+            stop_on_loss: si False, continue après une défaite forcée (un sous-ensemble perdant ne décide pas du coup)
+            time_limit: temps de réflexion en secondes (None : max_time, math.inf : jusqu'à l'annulation)
 
         retour:
-            float: score de la position (positif = avantage bot)
+            list: (profondeur, score, variation principale, noeuds) pour chaque itération terminée
         """
-        # vérification de victoire / défaite immédiate
-        if self._check_connected_pieces(board, self.player):
-            return math.inf # victoire
-        if self._check_connected_pieces(board, self.opponent):
-            return -math.inf # défaite
-        
-        # évaluation basée sur la connectivité et d'autres heuristiques
-        bot_score = self._calculate_connectivity_score(board, self.player)
-        opponent_score = self._calculate_connectivity_score(board, self.opponent)
-        
-        # score final = avantage de connectivité du bot - léger désavantage pour l'adversaire
-        return bot_score - opponent_score * 0.8
-    
-    def _calculate_connectivity_score(self, board: List[List[List]], player: int) -> float:
+        self._tables = get_move_tables(position.board)
+        self._root_moves = root_moves
+        self._deadline = start_time + (self.max_time if time_limit is None else time_limit)
+        self._nodes = 0
+        self.transposition_table.new_search()
+        self.principal_variation = []
+        results = []
+
+        for depth in range(1, self.max_depth + 1):
+            line: List[int] = []
+            try:
+                # recherche sur une copie : une itération interrompue laisse la copie dans un état intermédiaire
+                search_position = position.copy()
+                self._tracker = ConnectivityTracker(search_position.board)
+                score = self._negamax(search_position, depth, -math.inf, math.inf, 0, True, line)
+            except _SearchTimeout:
+                Logger.bot("CongressBot", "Time budget reached during depth %s", depth)
+                break
+            self.principal_variation = line
+            results.append((depth, score, line, self._nodes))
+            if score >= WIN_SCORE - self.max_depth or (stop_on_loss and score <= -WIN_SCORE + self.max_depth):
+                break # victoire ou défaite forcée trouvée, inutile d'aller plus loin
+        return results
+
+    def _parallel_search(self, position: Position, root_moves: List[int], start_time: float) -> List[Tuple[int, float, List[int], int]]:
         """
-        fonction : calcule un score basé sur la connectivité des pièces d'un joueur
+        fonction : répartit les coups de la racine entre les processus puis fusionne leurs résultats
 
         params:
-            board: état du plateau
-            player: identifiant du joueur (0 ou 1)
+            position: position compacte, le bot a le trait
+            root_moves: coups de la racine
+            start_time: début de la réflexion (horloge partagée par les processus de la machine)
 
         retour:
-            float: score de connectivité pour ce joueur
+            list: résultats fusionnés au format de _iterative_deepening (voir merge_root_results)
         """
-        score = 0.0 # score de connectivité
-        pieces = [] # liste des pièces du joueur
-        for r in range(8): # parcourt toutes les cases du plateau
-            for c in range(8):
-                if board[r][c][0] == player:
-                    pieces.append((r, c)) # ajoute la pièce à la liste
-        
-        if not pieces: # si aucune pièce n'est trouvée
-            return 0.0 # retourne 0
-
-        # bonus pour les paires adjacentes (indicateur simple de regroupement)
-        adjacent_pairs = 0 # nombre de paires adjacentes
-        for r, c in pieces: # parcourt toutes les pièces
-            # vérifier voisin de droite
-            if c < 7 and board[r][c+1][0] == player: # si le voisin de droite est le joueur
-                adjacent_pairs += 1 # ajoute 1 au nombre de paires adjacentes
-            # vérifier voisin du bas
-            if r < 7 and board[r+1][c][0] == player: # si le voisin du bas est le joueur
-                adjacent_pairs += 1 # ajoute 1 au nombre de paires adjacentes
-        # normalisé par le nombre possible de paires max (approximatif)
-        score += (adjacent_pairs / (len(pieces) * 2 if pieces else 1)) * 50 # ajoute le score de connectivité
-        
-        # bonus pour la proximité au centre
-        center_proximity = 0 # score de proximité au centre
-        for r, c in pieces: 
-            # distance de Manhattan au centre (3.5, 3.5)
-            dist = abs(r - 3.5) + abs(c - 3.5)
-            # score inversement proportionnel à la distance (max = 7)
-            center_proximity += (7 - dist)
-        # normalisé par la proximité max possible
-        score += (center_proximity / (len(pieces) * 7 if pieces else 1)) * 20
-        
-        # bonus pour la taille du plus grand groupe connecté
-        largest_group_size = self._find_largest_group(board, player, pieces)
-        # score proportionnel à la fraction des pièces dans le plus grand groupe
-        if pieces:
-            score += (largest_group_size / len(pieces)) * 100
-        
-        return score
-    
-    def _find_largest_group(self, board: List[List[List]], player: int, pieces: List[Tuple[int, int]]) -> int:
+        data = position.board.serialize()
+        jobs = [(data, chunk, start_time, self.max_depth, self.max_time, self.position_counts, self.repetition_penalty,
+                 self.tt_size_mb / self.parallel.workers, self.player) for chunk in self.parallel.split(root_moves)]
+        worker_results = self.parallel.run(search_root_moves, jobs)
+        merged = merge_root_results(worker_results, WIN_SCORE - self.max_depth)
+        self._nodes = merged[-1][3] if merged else 0
+        Logger.bot("CongressBot", "Merged %s search processes at depth %s", len(worker_results), merged[-1][0] if merged else 0)
+        return merged
+
+    def _negamax(self, position: Position, depth: int, alpha: float, beta: float, ply: int, on_pv: bool, line: List[int]) -> float:
         """
-        fonction : trouve la taille du plus grand groupe de pièces connectées orthogonalement
+        fonction : recherche alpha-beta au format negamax avec coups joués et annulés en place
 
         params:
-            board: état du plateau
-            player: identifiant du joueur
-            pieces: liste des coordonnées (r, c) des pièces du joueur
+            position: position compacte (modifiée puis restaurée)
+            depth: profondeur restante
+            alpha, beta: fenêtre de recherche du point de vue du joueur qui a le trait
+            ply: distance à la racine
+            on_pv: True si la position suit la variation principale de l'itération précédente
+            line: liste remplie avec la meilleure suite de coups trouvée depuis cette position
 
         retour:
-            int: taille du plus grand groupe trouvé
+            float: score du point de vue du joueur qui a le trait
         """
-        if not pieces:
-            return 0
-            
-        visited = set() # ensemble pour suivre les pièces déjà visitées
-        max_size = 0 # taille du plus grand groupe trouvé
-        
-        for r_start, c_start in pieces: # parcourt toutes les pièces
-            if (r_start, c_start) not in visited: # si la pièce n'a pas été visitée
-                current_group_size = 0 # taille du groupe actuel
-                stack = [(r_start, c_start)] # utiliser une pile pour DFS
-                group_nodes = set() # suivi des nœuds dans ce groupe spécifique
-                
-                while stack:
-                    r, c = stack.pop() # récupère la pièce à visiter
-                    if (r, c) not in visited: # si la pièce n'a pas été visitée
-                        visited.add((r, c)) # ajoute la pièce à l'ensemble des pièces visitées
-                        group_nodes.add((r,c)) # ajoute la pièce au groupe
-                        current_group_size += 1 # ajoute 1 à la taille du groupe
-                        
-                        # explorer les voisins orthogonaux
-                        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                            nr, nc = r + dr, c + dc # récupère les coordonnées du voisin
-                            if (0 <= nr < 8 and 0 <= nc < 8 and # si le voisin est dans le plateau
-                                board[nr][nc][0] == player and # si le voisin est le joueur
-                                (nr, nc) not in visited): # si le voisin n'a pas été visité
-                                stack.append((nr, nc)) # ajoute le voisin à la pile
-                
-                max_size = max(max_size, current_group_size) # met à jour la taille du plus grand groupe
-        
-        return max_size
-    
-    def _check_connected_pieces(self, board: List[List[List]], player: int) -> bool:
+        self._nodes += 1
+        if not self._nodes & 1023 and (self._cancelled or time.time() > self._deadline):
+            raise _SearchTimeout()
+
+        key = position.hash
+        tt_move = NO_MOVE
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            entry_depth, flag, entry_score, tt_move = entry
+            if ply > 0 and entry_depth >= depth:
+                if flag == EXACT or (flag == LOWER_BOUND and entry_score >= beta) or (flag == UPPER_BOUND and entry_score <= alpha):
+                    return entry_score
+
+        if depth == 0:
+            score = self._evaluate_tracker(self._tracker)
+            score = max(-WIN_SCORE, min(WIN_SCORE, score)) # les victoires valent ±inf dans l'évaluation
+            return score if position.turn == self.player else -score
+
+        moves = list(self._root_moves) if ply == 0 else self._compact_moves(position.board, position.turn)
+        if not moves:
+            return -WIN_SCORE + ply # aucun coup : le joueur qui a le trait a perdu
+
+        # tri : coup de la variation principale, puis meilleur coup de la table de transposition
+        pv_move = self.principal_variation[ply] if on_pv and ply < len(self.principal_variation) else NO_MOVE
+        for preferred in (tt_move, pv_move):
+            if preferred != NO_MOVE and preferred in moves:
+                moves.remove(preferred)
+                moves.insert(0, preferred)
+
+        original_alpha = alpha
+        best_score = -math.inf
+        best_move = NO_MOVE
+        for move in moves:
+            child_line: List[int] = []
+            mover = position.turn
+            undo = position.make_move(move >> 6, move & 63)
+            self._tracker.moved(move >> 6, move & 63, mover)
+            if self._tracker.is_connected(mover):
+                score = WIN_SCORE - ply - 1 # le coup relie toutes les pièces : victoire immédiate
+            else:
+                score = -self._negamax(position, depth - 1, -beta, -alpha, ply + 1, on_pv and move == pv_move, child_line)
+            if ply == 0:
+                # pénalise les coups qui reproduisent une position déjà rencontrée (évite les cycles)
+                score -= self.repetition_penalty * self.position_counts.get(position.hash, 0)
+            self._tracker.undo()
+            position.unmake_move(undo)
+
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    line[:] = [move] + child_line
+            if alpha >= beta:
+                break # coupure beta
+
+        if not line:
+            line.append(best_move) # aucun coup n'a dépassé alpha : garde quand même le meilleur
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.transposition_table.store(key, depth, flag, best_score, best_move)
+        return best_score
+
+    def _compact_moves(self, compact: BitBoard, player: int) -> List[int]:
         """
-        fonction : vérifie si *toutes* les pièces d'un joueur sont connectées en un seul groupe
+        fonction : coups d'un joueur sur le plateau compact, encodés from_square * 64 + to_square
 
         params:
-            board: état du plateau
-            player: identifiant du joueur
+            compact: plateau compact 8x8
+            player: identifiant du joueur (0 ou 1)
 
         retour:
-            bool: True si toutes les pièces sont connectées, False sinon
+            list: coups encodés (destinations vides uniquement : pas de capture au congress)
         """
-        pieces = [] # liste des pièces du joueur
-        for i in range(8): # parcourt toutes les cases du plateau
-            for j in range(8):
-                if board[i][j][0] == player: # si la case est occupée par le joueur
-                    pieces.append((i, j)) # ajoute la pièce à la liste
-        
-        total_pieces = len(pieces) # nombre total de pièces du joueur
-        if total_pieces <= 1: # 0 ou 1 pièce sont considérées comme connectées
-            return True 
-        
-        # utilise la recherche du plus grand groupe
-        largest_group = self._find_largest_group(board, player, pieces)
-        
-        # si la taille du plus grand groupe égale le nombre total de pièces, elles sont toutes connectées
-        return largest_group == total_pieces
-    
-    def _get_all_possible_moves(self) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        occupied = compact.occupied
+        attacks = self._tables.attacks
+        return [square << 6 | target for square in compact.pieces(player)
+                for target in attacks(square, occupied) if not occupied >> target & 1]
+
+    def _evaluate_tracker(self, tracker: ConnectivityTracker) -> float:
         """
-        fonction : récupère tous les coups valides possibles pour le bot (joueur 1)
+        fonction : évalue la position pour le bot à partir du suivi incrémental de connectivité (O(1))
+
+        params:
+            tracker: suivi de connectivité de la position
 
         retour:
-            list: liste de tuples ((from_row, from_col), (to_row, to_col))
+            float: score de la position (positif = avantage bot)
         """
-        moves = []
-        board = self.game.board.board
-        
-        for r_from in range(8):
-            for c_from in range(8):
-                if board[r_from][c_from][0] == self.player: # si c'est une pièce du bot
-                    # vérifier toutes les destinations possibles
-                    for r_to in range(8):
-                        for c_to in range(8):
-                            # la destination doit être vide
-                            if board[r_to][c_to][0] is None:
-                                try:
-                                    # utilise la fonction de validation du jeu
-                                    if available_move(board, r_from, c_from, r_to, c_to):
-                                        moves.append(((r_from, c_from), (r_to, c_to)))
-                                except (ValueError, IndexError) as e:
-                                    # ignorer les erreurs potentielles de available_move si coordonnées invalides (ne devrait pas arriver)
-                                    Logger.warning("CongressBot", f"Error in available_move check: {e}")
-                                    continue
-        
-        return moves
+        if tracker.group_counts[self.player] <= 1:
+            return math.inf # victoire
+        if tracker.group_counts[self.opponent] <= 1:
+            return -math.inf # défaite
+        return tracker.connectivity_score(self.player) - tracker.connectivity_score(self.opponent) * 0.8
 
     def make_move(self) -> bool:
         """
-        procédure : choisit et exécute le meilleur coup trouvé sur le plateau de jeu réel
+        procédure : choisit et exécute le meilleur coup trouvé sur le plateau de jeu réel (réflexion dans le fil appelant)
 
         retour:
             bool: True si un coup a été joué, False si aucun coup n'était possible ou si le bot a gagné
         """
-        best_move = self.get_move()
-        
+        return self.apply_move(self.get_move())
+
+    def apply_move(self, best_move: Optional[Tuple[Tuple[int, int], Tuple[int, int]]]) -> bool:
+        """
+        procédure : exécute sur le plateau de jeu réel le coup calculé par get_move
+
+        params:
+            best_move: ((from_row, from_col), (to_row, to_col)) ou None
+
+        retour:
+            bool: True si un coup a été joué, False si aucun coup n'était possible
+        """
         if best_move is None:
             Logger.warning("CongressBot", "No valid moves available to make")
             return False # indique qu'aucun coup n'a été joué
@@ -293,10 +340,35 @@ class CongressBot:
         board[to_row][to_col][0] = board[from_row][from_col][0]
         board[from_row][from_col][0] = None
         
-        # note: le rendu est géré par la classe Game après le retour de make_move
+        # note: le rendu est géré par la classe Game après le retour de apply_move
         # note: la vérification de victoire est aussi gérée par la classe Game
         
-        # ajout d'un petit délai artificiel pour que le joueur puisse voir le mouvement
-        time.sleep(0.2)
-        
         return True # indique qu'un coup a été joué
+
+def search_root_moves(data: bytes, root_moves: List[int], start_time: float, max_depth: int, max_time: float,
+                      position_counts: Dict[int, int], repetition_penalty: int,
+                      tt_size_mb: float, player: int = 1) -> List[Tuple[int, float, List[int], int]]:
+    """
+    fonction : recherche exécutée dans un processus de ParallelSearch sur une partie des coups de la racine
+
+    params:
+        data: plateau compact sérialisé (BitBoard.serialize), le bot a le trait
+        root_moves: coups de la racine attribués au processus
+        start_time: début de la réflexion dans le processus du jeu
+        max_depth: profondeur maximale
+        max_time: temps de réflexion en secondes
+        position_counts: positions déjà rencontrées (pénalité de répétition)
+        repetition_penalty: pénalité par apparition précédente
+        tt_size_mb: taille de la table de transposition du processus
+        player: joueur contrôlé par le bot
+
+    retour:
+        list: résultats de CongressBot._iterative_deepening
+    """
+    bot = CongressBot(None, tt_size_mb, player=player)
+    bot.max_depth = max_depth
+    bot.max_time = max_time
+    bot.position_counts = position_counts
+    bot.repetition_penalty = repetition_penalty
+    position = Position(BitBoard.deserialize(data), bot.player)
+    return bot._iterative_deepening(position, root_moves, start_time, stop_on_loss=False)
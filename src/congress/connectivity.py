@@ -0,0 +1,104 @@
+from typing import List, Tuple
+from src.bitboard import BitBoard
+
+# proximité au centre (3.5, 3.5) de chaque case du plateau 8x8 : 7 - distance de Manhattan
+CENTER_PROXIMITY = [7 - (abs(square // 8 - 3.5) + abs(square % 8 - 3.5)) for square in range(64)]
+# voisins orthogonaux de chaque case du plateau 8x8 (sans passer d'un bord à l'autre)
+NEIGHBORS = [
+    sum(1 << ((row + d_row) * 8 + col + d_col) for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1))
+        if 0 <= row + d_row < 8 and 0 <= col + d_col < 8)
+    for row, col in (divmod(square, 8) for square in range(64))
+]
+
+class ConnectivityTracker:
+    """
+    classe : suivi incrémental de la connectivité des pièces du congress
+    structure (une valeur par joueur) :
+        piece_counts - nombre de pièces
+        adjacent_pairs - paires de pièces orthogonalement voisines
+        center_sums - somme des proximités au centre
+        largest_groups - taille du plus grand groupe connecté
+        group_counts - nombre de groupes connectés (1 : toutes les pièces sont reliées)
+    les paires et la somme au centre sont mises à jour en O(1) ; les groupes du seul joueur qui a bougé
+    sont recalculés par diffusion sur les bits (une union-find ne sait pas séparer un groupe quand une pièce part)
+    """
+    __slots__ = ("compact", "piece_counts", "adjacent_pairs", "center_sums", "largest_groups", "group_counts", "_history")
+
+    def __init__(self, compact: BitBoard) -> None:
+        """
+        procédure : calcule l'état complet une seule fois
+        params :
+            compact - plateau compact 8x8 suivi (partagé avec la position qui joue les coups)
+        """
+        self.compact: BitBoard = compact
+        self.piece_counts: List[int] = [0, 0]
+        self.adjacent_pairs: List[int] = [0, 0]
+        self.center_sums: List[float] = [0.0, 0.0]
+        self.largest_groups: List[int] = [0, 0]
+        self.group_counts: List[int] = [0, 0]
+        self._history: List[Tuple[int, int, float, int, int]] = []
+        for player in (0, 1):
+            own = compact.occupancy[player]
+            self.piece_counts[player] = own.bit_count()
+            self.adjacent_pairs[player] = (own & (own >> 1) & 0x7F7F7F7F7F7F7F7F).bit_count() + (own & (own >> 8)).bit_count()
+            self.center_sums[player] = sum(CENTER_PROXIMITY[square] for square in compact.pieces(player))
+            self._update_groups(player)
+
+    def _update_groups(self, player: int) -> None:
+        """
+        procédure : recalcule le nombre de groupes et la taille du plus grand groupe d'un joueur
+        params :
+            player - joueur (0 ou 1)
+        """
+        groups = self.compact.groups(player)
+        self.group_counts[player] = len(groups)
+        self.largest_groups[player] = max((group.bit_count() for group in groups), default=0)
+
+    def moved(self, from_square: int, to_square: int, player: int) -> None:
+        """
+        procédure : met à jour le suivi après le déplacement d'une pièce (plateau compact déjà modifié)
+        params :
+            from_square - case de départ
+            to_square - case d'arrivée
+            player - propriétaire de la pièce
+        """
+        self._history.append((player, self.adjacent_pairs[player], self.center_sums[player],
+                              self.largest_groups[player], self.group_counts[player]))
+        # pièces du joueur sans la pièce déplacée : la pièce perd ses voisins de départ et gagne ceux d'arrivée
+        others = self.compact.occupancy[player] & ~(1 << to_square)
+        self.adjacent_pairs[player] += (NEIGHBORS[to_square] & others).bit_count() - (NEIGHBORS[from_square] & others).bit_count()
+        self.center_sums[player] += CENTER_PROXIMITY[to_square] - CENTER_PROXIMITY[from_square]
+        self._update_groups(player)
+
+    def undo(self) -> None:
+        """
+        procédure : restaure l'état précédant le dernier déplacement suivi
+        """
+        player, pairs, center_sum, largest_group, group_count = self._history.pop()
+        self.adjacent_pairs[player] = pairs
+        self.center_sums[player] = center_sum
+        self.largest_groups[player] = largest_group
+        self.group_counts[player] = group_count
+
+    def is_connected(self, player: int) -> bool:
+        """
+        fonction : condition de victoire du congress
+        params :
+            player - joueur (0 ou 1)
+        retour : True si le joueur a des pièces et qu'elles forment un seul groupe
+        """
+        return self.group_counts[player] == 1
+
+    def connectivity_score(self, player: int) -> float:
+        """
+        fonction : score de connectivité (paires adjacentes, proximité au centre, plus grand groupe)
+        params :
+            player - joueur (0 ou 1)
+        retour : score pondéré sur le nombre de pièces (0 si le joueur n'a plus de pièce)
+        """
+        piece_count = self.piece_counts[player]
+        if not piece_count:
+            return 0.0
+        return ((self.adjacent_pairs[player] / (piece_count * 2)) * 50
+                + (self.center_sums[player] / (piece_count * 7)) * 20
+                + (self.largest_groups[player] / piece_count) * 100)
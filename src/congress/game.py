@@ -1,28 +1,33 @@
-from typing import Dict, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple, List
 import pygame
 from src.board import Board
+from src.bitboard import BitBoard
 from src.windows.render.render import Render
 from src.saves import save_game
 from src.moves import available_move
 from src.network.client.game_base import GameBase
 from src.utils.logger import Logger
 from src.congress.bot import CongressBot
+from src.congress.connectivity import ConnectivityTracker
 
 class Game(GameBase):
     """
     classe : gère une partie de Congress
     """
-    def __init__(self, game_save, quadrants, game_mode="Solo"):
+    def __init__(self, game_save, quadrants, game_mode="Solo", headless=False):
         """
         procédure : initialise une nouvelle partie de Congress
         params :
             game_save - sauvegarde de jeu existante ou None
             quadrants - configuration des quadrants initiaux
             game_mode - mode de jeu ("Solo", "Bot", "Network")
+            headless - si True, la partie tourne sans affichage (aucune fenêtre, événements diffusés aux abonnés)
         """
         super().__init__(game_save, quadrants, game_mode, player_name="player", game_type="congress") # on initialise la GameBase
         self.board = Board(quadrants, 2)
-        self.render = Render(game=self)
+        self.render = None if headless else Render(game=self)
+        self.connectivity = None # suivi incrémental de la connectivité des pièces, mis à jour à chaque coup
+        self.on_board_loaded()
         self.round_turn = 0 # le tour de jeu commence à 0 (joueur 1) 
         self.selected_piece = None # aucune pièce sélectionnée par défaut
         self.game_mode = game_mode # mode de jeu
@@ -32,8 +37,7 @@ class Game(GameBase):
             Logger.game("Game", "Congress bot mode initialized")
 
         if self.is_network_game:
-            if self.render:
-                self.render.edit_info_label("Waiting for another player...")
+            self.notify_info("Waiting for another player...")
 
     def on_network_action(self, action_data: Dict) -> bool:
         """
@@ -47,23 +51,17 @@ class Game(GameBase):
             Logger.error("Game", "Received empty action data")
             return False
             
-        board_state = action_data.get("board_state")
-        if not board_state or "board" not in board_state or "round_turn" not in board_state: # vérifie si l'état du plateau est complet et valide
-            Logger.error("Game", f"Received incomplete or invalid board state: {board_state}")
-            return False
-        
-            
-        # applique l'état reçu directement en utilisant la méthode de la classe de base
-        if not self.update_board_from_state(board_state):
-            Logger.error("Game", "Failed to apply received board state in on_network_action.")
+        # applique le coup reçu ou l'instantané en utilisant la méthode de la classe de base
+        if not self.apply_network_action(action_data):
+            Logger.error("Game", "Failed to apply received action in on_network_action.")
             return False 
 
-        Logger.info("Game Congress", f"Applied board state. Current turn: {self.round_turn}")
+        Logger.info("Game Congress", f"Applied network action. Current turn: {self.round_turn}")
         
         save_game(self) # sauvegarde le jeu en local 
          
         # informe le renderer qu'une mise à jour est nécessaire
-        self.render.needs_render = True
+        self.notify_board_changed()
         
         # détermine qui a joué en dernier
         player_who_just_moved = 1 - self.round_turn
@@ -84,8 +82,7 @@ class Game(GameBase):
                     winner_text = "BOT WON THE GAME !" # affiche le texte de fin de jeu
                 else:
                     winner_text = f"PLAYER {winner + 1} WON THE GAME !"
-                self.render.show_end_popup(winner_text) # affiche la popup de fin de jeu
-                self.render.end_game_waiting_input = True
+                self.notify_game_over(winner_text, wait_for_input=True) # affiche la popup de fin de jeu
                 return False
         
         # vérifie si le joueur qui a joué en dernier a gagné
@@ -95,24 +92,59 @@ class Game(GameBase):
                 winner_text = "BOT WON THE GAME !"
             else:
                 winner_text = f"PLAYER {player_who_just_moved + 1} WON THE GAME !"
-            self.render.show_end_popup(winner_text)
-            self.render.end_game_waiting_input = True
+            self.notify_game_over(winner_text, wait_for_input=True)
             return False
 
         # met à jour le message de statut en fonction du tour
         if self.is_network_game:
             if self.is_my_turn: 
-                if self.render:
-                    self.render.edit_info_label(f"Your turn (Player {self.player_number})")
+                self.notify_info(f"Your turn (Player {self.player_number})")
             else:
                 other_player_number = 1 if self.round_turn == 0 else 2
-                if self.render:
-                    self.render.edit_info_label(f"Player {other_player_number}'s turn")
+                self.notify_info(f"Player {other_player_number}'s turn")
         else:
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
             
         return True # le jeu continue
 
+    def on_board_loaded(self) -> None:
+        """
+        procédure : reconstruit le suivi de connectivité depuis le plateau (création, sauvegarde chargée, état reçu)
+        """
+        compact = BitBoard(8) # seules les pièces des deux joueurs sont suivies
+        for i in range(8):
+            for j in range(8):
+                if self.board.board[i][j][0] in (0, 1):
+                    compact.place(i * 8 + j, self.board.board[i][j][0])
+        self.connectivity = ConnectivityTracker(compact)
+
+    def _track_move(self, from_row: int, from_col: int, to_row: int, to_col: int) -> None:
+        """
+        procédure : reporte dans le suivi de connectivité un déplacement déjà joué sur le plateau
+        params :
+            from_row, from_col - case de départ
+            to_row, to_col - case d'arrivée
+        """
+        tracker = getattr(self, 'connectivity', None)
+        if tracker is None: # partie créée sans __init__ : le suivi est construit à la première vérification
+            return
+        from_square, to_square = from_row * 8 + from_col, to_row * 8 + to_col
+        player = tracker.compact.player_at(from_square)
+        if player is None: # plateau remplacé hors des chemins du jeu : suivi reconstruit
+            self.on_board_loaded()
+            return
+        tracker.compact.move(from_square, to_square)
+        tracker.moved(from_square, to_square, player)
+
+    def _on_network_move(self, player: int, move: Tuple[int, ...]) -> None:
+        """
+        procédure : suit le coup réseau de l'adversaire rejoué sur le plateau
+        params :
+            player - joueur qui a joué le coup
+            move - (from_row, from_col, to_row, to_col)
+        """
+        self._track_move(*move)
+
     def check_connected_pieces(self, player: int) -> bool:
         """
         fonction : vérifie si tous les pions d'un joueur sont connectés orthogonalement
@@ -120,55 +152,27 @@ class Game(GameBase):
             player - l'identifiant du joueur (0 ou 1)
         retour : True si les pions sont connectés, False sinon
         """
-        start_pos = None
-        pieces = []
-        
-        # collecte des positions de toutes les pièces du joueur
-        for i in range(8):
-            for j in range(8):
-                if self.board.board[i][j][0] == player:
-                    pieces.append((i, j))
-                    if start_pos is None:
-                        start_pos = (i, j) # point de départ pour le parcours
+        if getattr(self, 'connectivity', None) is None:
+            self.on_board_loaded()
+        # groupes tenus à jour à chaque coup par le suivi incrémental, sans parcourir le plateau
+        tracker = self.connectivity
+        compact = tracker.compact
+        piece_count = tracker.piece_counts[player]
         
         # si le joueur n'a pas de pièces, ils ne sont pas connectés (ou jeu fini)
-        if not start_pos:
+        if not piece_count:
             Logger.warning("Game Congress", f"Player {player + 1} has no pieces on the board!")
             return False
         
-        # si le joueur n'a qu'une seule pièce, elle est techniquement connectée
-        if len(pieces) == 1:
-            Logger.success("Game Congress", f"Player {player + 1} has only one piece, which is connected by default!")
-            return True
-        
-        visited = set()
-        stack = [start_pos]
-        
-        # parcours en profondeur (DFS) pour trouver toutes les pièces connectées
-        while stack: # tant que la pile n'est pas vide 
-            current = stack.pop() # récupère la pièce à visiter
-            if current not in visited: # si la pièce n'a pas été visitée
-                visited.add(current) # ajoute la pièce à l'ensemble des pièces visitées
-                row, col = current
-                
-                directions = [(0, 1), (1, 0), (0, -1), (-1, 0)] # mouvements orthogonaux
-                for dr, dc in directions:
-                    new_row, new_col = row + dr, col + dc
-                    # vérifie les limites et si la case voisine appartient au joueur et n'a pas été visitée
-                    if (0 <= new_row < 8 and 0 <= new_col < 8 and 
-                        self.board.board[new_row][new_col][0] == player and 
-                        (new_row, new_col) not in visited):
-                        stack.append((new_row, new_col))
-        
-        # si le nombre de pièces visitées égale le nombre total de pièces, elles sont toutes connectées
-        connected = len(visited) == len(pieces)
+        connected = tracker.is_connected(player)
         
-        Logger.game("Game Congress", f"Player {player + 1} has {len(pieces)} pieces, {len(visited)} connected")
+        Logger.game("Game Congress", f"Player {player + 1} has {piece_count} pieces, {tracker.largest_groups[player]} in the largest group")
         if not connected:
-            unconnected = [p for p in pieces if p not in visited]
+            first_group = compact.group_of(next(compact.pieces(player)), player)
+            unconnected = [compact.position(square) for square in compact.pieces(player) if not first_group >> square & 1]
             Logger.warning("Game Congress", f"Unconnected pieces: {unconnected}")
         else:
-            Logger.success("Game Congress", f"Player {player + 1} has all {len(pieces)} pieces connected!")
+            Logger.success("Game Congress", f"Player {player + 1} has all {piece_count} pieces connected!")
         
         return connected
 
@@ -182,14 +186,14 @@ class Game(GameBase):
         """
         if self.is_network_game:
             if not self.game_started:
-                self.render.edit_info_label("Waiting for another player...")
+                self.notify_info("Waiting for another player...")
                 return True
             if not self.can_play(): # vérifie si le joueur peut jouer
-                self.render.edit_info_label(f"Waiting for Player {2 if self.player_number == 1 else 1}")
+                self.notify_info(f"Waiting for Player {2 if self.player_number == 1 else 1}")
                 return True
 
         if self.game_mode == "Bot" and self.round_turn == 1: # si le mode de jeu est Bot et que c'est le tour du bot
-            self.render.edit_info_label("C'est le tour du bot, veuillez patienter...") # affiche le message de statut
+            self.notify_info("C'est le tour du bot, veuillez patienter...") # affiche le message de statut
             return True
 
         if not hasattr(self, 'selected_piece') or self.selected_piece is None:
@@ -204,20 +208,20 @@ class Game(GameBase):
             if cell[0] is not None and cell[0] == player_index_to_select:
                 # vérification supplémentaire pour le mode réseau : s'assurer que c'est bien le tour de ce joueur
                 if self.is_network_game and not self.is_my_turn:
-                    self.render.edit_info_label(f"Waiting for Player {2 if self.player_number == 1 else 1}")
+                    self.notify_info(f"Waiting for Player {2 if self.player_number == 1 else 1}")
                     return True # pas notre tour, même si on a cliqué sur notre pièce
                     
                 self.selected_piece = (row, col)
-                self.render.edit_info_label("Select destination")
-                self.render.needs_render = True # redessine pour montrer la sélection
+                self.notify_info("Select destination")
+                self.notify_board_changed() # redessine pour montrer la sélection
                 return True
             elif cell[0] is not None:
                  # clic sur une pièce adverse ou une case vide lors de la tentative de sélection
-                self.render.edit_info_label("Select your own piece")
+                self.notify_info("Select your own piece")
                 return True
             else:
                 # clic sur une case vide lors de la tentative de sélection
-                self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn") # ou message de statut réseau
+                self.notify_info(f"Player {self.round_turn + 1}'s turn") # ou message de statut réseau
                 return True
         else:
             # cas : déplacement d'une pièce sélectionnée
@@ -227,28 +231,29 @@ class Game(GameBase):
             # annuler la sélection si on clique sur la même pièce
             if (row, col) == (old_row, old_col):
                  self.selected_piece = None
-                 self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
-                 self.render.needs_render = True # redessine pour enlever la surbrillance
+                 self.notify_info(f"Player {self.round_turn + 1}'s turn")
+                 self.notify_board_changed() # redessine pour enlever la surbrillance
                  return True
 
             # vérifier si la case de destination est occupée
             if cell[0] is not None:
                 self.selected_piece = None
-                self.render.edit_info_label("Cannot move to an occupied cell")
-                self.render.needs_render = True # redessine pour enlever la surbrillance
+                self.notify_info("Cannot move to an occupied cell")
+                self.notify_board_changed() # redessine pour enlever la surbrillance
                 return True
             
             # vérifier si le mouvement est valide selon les règles du jeu
             if not available_move(self.board.board, old_row, old_col, row, col):
                 self.selected_piece = None
-                self.render.edit_info_label("Invalid move")
-                self.render.needs_render = True # redessine pour enlever la surbrillance
+                self.notify_info("Invalid move")
+                self.notify_board_changed() # redessine pour enlever la surbrillance
                 return True
 
             # execution du mouvement
             if self.is_network_game:
                   self.board.board[row][col][0] = self.board.board[old_row][old_col][0]
                   self.board.board[old_row][old_col][0] = None
+                  self._track_move(old_row, old_col, row, col)
                   self.selected_piece = None
                   
                   # vérification de victoire immédiate après le mouvement local
@@ -258,8 +263,7 @@ class Game(GameBase):
                           winner_text = "BOT WON THE GAME !"
                       else:
                           winner_text = f"PLAYER {player_who_moved + 1} WON THE GAME !"
-                      self.render.show_end_popup(winner_text)
-                      self.render.end_game_waiting_input = True
+                      self.notify_game_over(winner_text, wait_for_input=True)
                       
                       self.send_network_action({
                           "from_row": old_row,
@@ -273,7 +277,7 @@ class Game(GameBase):
                       return False
 
                   # si pas de victoire, informer le renderer et envoyer l'action normalement
-                  self.render.needs_render = True
+                  self.notify_board_changed()
                   self.send_network_action({
                       "from_row": old_row,
                       "from_col": old_col,
@@ -285,6 +289,7 @@ class Game(GameBase):
             # execution pour jeu Solo ou contre Bot
             self.board.board[row][col][0] = self.board.board[old_row][old_col][0]
             self.board.board[old_row][old_col][0] = None
+            self._track_move(old_row, old_col, row, col)
             player_who_moved = self.round_turn
             self.selected_piece = None
 
@@ -294,14 +299,13 @@ class Game(GameBase):
                     winner_text = "BOT WON THE GAME !"
                 else:
                     winner_text = f"PLAYER {player_who_moved + 1} WON THE GAME !"
-                self.render.show_end_popup(winner_text)
-                self.render.end_game_waiting_input = True
+                self.notify_game_over(winner_text, wait_for_input=True)
                 return False
 
             self.round_turn = 1 - self.round_turn # changement de tour
             save_game(self)
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
-            self.render.needs_render = True
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
+            self.notify_board_changed()
 
             # si c'est au tour du bot, déclenche son action après un court délai
             if self.game_mode == "Bot" and self.round_turn == 1:
@@ -314,8 +318,7 @@ class Game(GameBase):
                     winner_text = "BOT WON THE GAME !"
                 else:
                     winner_text = f"PLAYER {player_who_moved + 1} WON THE GAME !"
-                self.render.show_end_popup(winner_text)
-                self.render.end_game_waiting_input = True
+                self.notify_game_over(winner_text, wait_for_input=True)
                 
                 if self.game_mode == "Network":
                     self.send_network_action({
@@ -331,13 +334,33 @@ class Game(GameBase):
 
             return True # clic géré, le jeu continue
     
-    def _bot_play(self) -> bool:
+    def _bot_think(self) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
-        procédure : exécute le tour du bot
+        fonction : calcule le coup du bot (exécutée sur le fil du bot, le jeu n'est pas modifié)
+        retour : ((from_row, from_col), (to_row, to_col)) ou None
+        """
+        return self.bot.get_move()
+
+    def _bot_ponder(self) -> Callable[[], None]:
+        """
+        fonction : prépare la réflexion du bot pendant le tour du joueur (instantané du plateau pris sur le fil de rendu)
+        retour : fonction exécutée sur le fil du bot jusqu'à l'annulation
+        """
+        position = self.board.to_position(0) # le joueur a le trait
+        return lambda: self.bot.ponder(position)
+
+    def _bot_apply(self, move: Optional[Tuple[Tuple[int, int], Tuple[int, int]]]) -> bool:
+        """
+        procédure : applique le coup calculé par le bot (fil de rendu)
+        params :
+            move - coup retourné par _bot_think
         retour : True si le bot a joué avec succès, False sinon
         """
         try:
-            if self.bot.make_move(): # la logique du bot met à jour le plateau
+            if self.bot.apply_move(move): # la logique du bot met à jour le plateau
+                (from_row, from_col), (to_row, to_col) = move
+                self._track_move(from_row, from_col, to_row, to_col)
+                self.notify_move(list(move)) # mise en évidence du coup joué
                 player_who_moved = 1 # le bot est toujours le joueur 1
                 # vérifie si le bot a gagné après son mouvement
                 if self.check_connected_pieces(player_who_moved):
@@ -345,29 +368,29 @@ class Game(GameBase):
                         winner_text = "BOT WON THE GAME !"
                     else:
                         winner_text = f"PLAYER {player_who_moved + 1} WON THE GAME !"
-                    self.render.show_end_popup(winner_text)
+                    self.notify_game_over(winner_text)
                     self.cleanup()
                 else:
                     self.round_turn = 0  # retour au tour du joueur 0
-                    self.render.edit_info_label("Player 1's turn")
+                    self.notify_info("Player 1's turn")
                     save_game(self)
                 return True # mouvement réussi
             else:
-                self.render.show_end_popup("PLAYER 1 WON THE GAME !")
+                self.notify_game_over("PLAYER 1 WON THE GAME !")
                 self.cleanup()
             return True # mouvement réussi
         except Exception as e:
             Logger.error("Game", f"Error during bot play: {str(e)}")
-            self.render.edit_info_label(f"Error during bot play: {str(e)}")
+            self.notify_info(f"Error during bot play: {str(e)}")
             self.round_turn = 0 # assure que le contrôle revient au joueur
-            self.render.edit_info_label("Player 1's turn")
+            self.notify_info("Player 1's turn")
             return False # indique que le mouvement a échoué
 
     def load_game(self) -> None:
         """
         procédure : lance la boucle principale de rendu et d'événements du jeu
         """
-        self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
+        self.notify_info(f"Player {self.round_turn + 1}'s turn")
         self.render.run_game_loop()
         self.cleanup()
 
@@ -0,0 +1,247 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.bitboard import BitBoard
+from src.board import Board
+from src.captures import AttackMap
+from src.move_tables import KATERENGA_TARGET_CAMPS
+from src.moves import generate_moves
+
+# numéro de chaque jeu (même numérotation que Board)
+GAME_TYPES = {"katerenga": 0, "isolation": 1, "congress": 2}
+
+Move = Tuple[int, ...]
+Cell = Tuple[int, int]
+
+def layout_quadrants(quadrants_config: Dict[str, List[List[List[Optional[int]]]]], names: Sequence[str],
+                     rotations: Sequence[int]) -> List[List[List[List[Optional[int]]]]]:
+    """
+    fonction : construit les quatre quadrants d'une disposition à partir de configs/quadrants.json
+    params :
+        quadrants_config - configuration chargée par ConfigLoader
+        names - noms des quatre quadrants
+        rotations - nombre de quarts de tour à droite de chaque quadrant
+    retour : quadrants tournés (copies indépendantes de la configuration)
+    """
+    quadrants = []
+    for name, rotation in zip(names, rotations):
+        quadrant = [[list(cell) for cell in row] for row in quadrants_config[name]]
+        for _ in range(rotation):
+            quadrant = [list(row) for row in zip(*quadrant[::-1])] # quart de tour à droite
+        quadrants.append(quadrant)
+    return quadrants
+
+class GameObserver:
+    """
+    classe : interface des abonnés aux événements d'une partie (affichage, journal, analyse...)
+    les méthodes ne font rien par défaut : un abonné ne redéfinit que les événements qui l'intéressent
+    """
+    def on_info(self, text: str) -> None:
+        """
+        procédure : message d'information pour le joueur (tour, erreur, attente...)
+        params :
+            text - message
+        """
+
+    def on_move(self, cells: Sequence[Cell]) -> None:
+        """
+        procédure : un coup vient d'être joué
+        params :
+            cells - cases touchées par le coup (départ puis arrivée, ou case posée)
+        """
+
+    def on_board_changed(self) -> None:
+        """
+        procédure : l'état de la partie a changé et doit être affiché de nouveau
+        """
+
+    def on_game_over(self, text: str, wait_for_input: bool = False) -> None:
+        """
+        procédure : fin de la partie
+        params :
+            text - annonce du gagnant
+            wait_for_input - True si l'affichage doit attendre une action du joueur avant de se fermer (partie réseau)
+        """
+
+class Observable:
+    """
+    classe : diffuse les événements d'une partie à ses abonnés (GameObserver)
+    la logique de jeu n'appelle que les méthodes notify_*, sans connaître l'affichage
+    """
+    def subscribe(self, observer: GameObserver) -> None:
+        """
+        procédure : abonne un observateur aux événements de la partie
+        params :
+            observer - abonné à ajouter
+        """
+        observers = self._get_observers()
+        if observer not in observers:
+            observers.append(observer)
+
+    def unsubscribe(self, observer: GameObserver) -> None:
+        """
+        procédure : désabonne un observateur
+        params :
+            observer - abonné à retirer
+        """
+        observers = self._get_observers()
+        if observer in observers:
+            observers.remove(observer)
+
+    def _get_observers(self) -> List[GameObserver]:
+        """
+        fonction : liste des abonnés, créée à la première utilisation (aucun constructeur à appeler)
+        retour : liste des abonnés
+        """
+        observers = self.__dict__.get("_observers")
+        if observers is None:
+            observers = self.__dict__["_observers"] = []
+        return observers
+
+    def notify_info(self, text: str) -> None:
+        """
+        procédure : diffuse un message d'information
+        params :
+            text - message
+        """
+        for observer in list(self._get_observers()):
+            observer.on_info(text)
+
+    def notify_move(self, cells: Sequence[Cell]) -> None:
+        """
+        procédure : diffuse le coup qui vient d'être joué
+        params :
+            cells - cases touchées par le coup
+        """
+        for observer in list(self._get_observers()):
+            observer.on_move(cells)
+
+    def notify_board_changed(self) -> None:
+        """
+        procédure : diffuse un changement de l'état de la partie
+        """
+        for observer in list(self._get_observers()):
+            observer.on_board_changed()
+
+    def notify_game_over(self, text: str, wait_for_input: bool = False) -> None:
+        """
+        procédure : diffuse la fin de la partie
+        params :
+            text - annonce du gagnant
+            wait_for_input - True si l'affichage doit attendre une action du joueur
+        """
+        for observer in list(self._get_observers()):
+            observer.on_game_over(text, wait_for_input)
+
+def has_won(game_type: int, board: List[List[List[Optional[int]]]], player: int, first_turn: bool = False,
+            locked_pieces: Sequence[Cell] = (), attack_map: Optional[AttackMap] = None) -> bool:
+    """
+    fonction : vérifie la fin de partie après le coup d'un joueur, règles communes à l'interface et aux simulations
+    params :
+        game_type - numéro du jeu (voir GAME_TYPES)
+        board - plateau après le coup
+        player - joueur qui vient de jouer
+        first_turn - True pendant le premier tour (katerenga)
+        locked_pieces - pièces bloquées dans les camps (katerenga)
+        attack_map - carte des attaques synchronisée avec le plateau (isolation, None : reconstruite)
+    retour : True si le joueur a gagné
+    """
+    opponent = 1 - player
+    if game_type == GAME_TYPES["isolation"]:
+        attack_map = attack_map if attack_map is not None else AttackMap(board)
+        return not attack_map.safe_squares(opponent, check_all_pieces=True) # l'adversaire ne peut plus poser de tour
+    if game_type == GAME_TYPES["katerenga"]:
+        locked = {tuple(cell) for cell in locked_pieces}
+        if all(board[row][col][0] == player or (row, col) in locked for row, col in KATERENGA_TARGET_CAMPS[player]):
+            return True # les deux camps adverses sont occupés
+        return next(generate_moves(board, opponent, first_turn, list(locked)), None) is None
+    if len(BitBoard.from_board(board).groups(player)) == 1:
+        return True # toutes les pièces sont reliées
+    return next(generate_moves(board, opponent, captures=False), None) is None
+
+def play_move(game_type: int, board: List[List[List[Optional[int]]]], player: int, move: Move,
+              locked_pieces: Optional[List[Cell]] = None, attack_map: Optional[AttackMap] = None) -> List[Cell]:
+    """
+    fonction : applique un coup au plateau, captures et verrous compris (règles communes aux parties locales et réseau)
+    params :
+        game_type - numéro du jeu (voir GAME_TYPES)
+        board - plateau modifié en place
+        player - joueur qui joue
+        move - (from_row, from_col, to_row, to_col) au katerenga et au congress, (row, col) à l'isolation
+        locked_pieces - pièces bloquées dans les camps, complétée en place (katerenga)
+        attack_map - carte des attaques mise à jour en place (isolation, optionnelle)
+    retour : cases modifiées par le coup
+    """
+    if game_type == GAME_TYPES["isolation"]:
+        row, col = move
+        board[row][col][0] = player
+        if attack_map is not None:
+            attack_map.place(row, col, player)
+        return [(row, col)]
+    from_row, from_col, to_row, to_col = move
+    board[to_row][to_col][0] = player # une pièce adverse sur la case d'arrivée est capturée
+    board[from_row][from_col][0] = None
+    if game_type == GAME_TYPES["katerenga"] and locked_pieces is not None and (to_row, to_col) in KATERENGA_TARGET_CAMPS[player]:
+        locked_pieces.append((to_row, to_col)) # bloque la pièce dans le camp
+    return [(from_row, from_col), (to_row, to_col)]
+
+class GameState(Observable):
+    """
+    classe : état d'une partie sans interface graphique, appliquant les règles des trois jeux
+    expose les attributs lus par les bots (board, round_turn, first_turn, locked_pieces) sans Render ni pygame ;
+    l'affichage, s'il existe, s'abonne aux événements (voir GameObserver)
+    """
+    def __init__(self, game_type: int, quadrants: List[List[List[List[Optional[int]]]]]) -> None:
+        """
+        procédure : met en place le plateau de départ
+        params :
+            game_type - numéro du jeu (voir GAME_TYPES)
+            quadrants - les quatre quadrants de la disposition
+        """
+        self.game_type: int = game_type
+        self.board: Board = Board(quadrants, game_type)
+        self.round_turn: int = 0
+        self.first_turn: bool = True
+        self.locked_pieces: List[Cell] = []
+        self.attack_map: Optional[AttackMap] = AttackMap(self.board.board) if game_type == GAME_TYPES["isolation"] else None
+
+    def legal_moves(self) -> List[Move]:
+        """
+        fonction : coups légaux du joueur qui a le trait
+        retour : (from_row, from_col, to_row, to_col) au katerenga et au congress, (row, col) à l'isolation
+        """
+        if self.attack_map is not None:
+            return self.attack_map.safe_squares(self.round_turn, check_all_pieces=True)
+        if self.game_type == GAME_TYPES["congress"]:
+            return list(generate_moves(self.board.board, self.round_turn, captures=False))
+        return list(generate_moves(self.board.board, self.round_turn, self.first_turn, self.locked_pieces))
+
+    def apply_move(self, move: Move) -> Optional[int]:
+        """
+        fonction : joue un coup légal du joueur qui a le trait, passe le trait et prévient les abonnés
+        params :
+            move - coup au format de legal_moves
+        retour : joueur gagnant si la partie est terminée, None sinon
+        """
+        player = self.round_turn
+        cells = play_move(self.game_type, self.board.board, player, move, self.locked_pieces, self.attack_map)
+
+        self.round_turn = 1 - player
+        if self.first_turn and self.round_turn == 0:
+            self.first_turn = False # fin du premier tour
+        winner = self.winner(player)
+        self.notify_move(cells)
+        if winner is not None:
+            self.notify_game_over(f"PLAYER {winner + 1} WON THE GAME !")
+        else:
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
+        return winner
+
+    def winner(self, player: int) -> Optional[int]:
+        """
+        fonction : vérifie la fin de partie après le coup d'un joueur (voir has_won)
+        params :
+            player - joueur qui vient de jouer
+        retour : joueur gagnant ou None
+        """
+        if has_won(self.game_type, self.board.board, player, self.first_turn, self.locked_pieces, self.attack_map):
+            return player
+        return None
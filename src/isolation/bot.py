@@ -1,71 +1,98 @@
-import random
 from typing import List, Tuple, Optional, Dict, Set
+import math
 import time
-from src.captures import is_threatened, has_valid_move
+from src.captures import AttackMap
+from src.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND, NO_MOVE
+from src.zobrist import get_zobrist_keys
+from src.isolation.solver import IsolationSolver
+from src.bitboard import BitBoard
+from src.parallel import ParallelSearch, merge_root_results
+from src.ponder import PonderResult, PonderStats
+from src.utils.logger import Logger
+
+# score d'une victoire dans la recherche (diminué de la distance à la racine pour préférer les victoires rapides)
+WIN_SCORE = 1000.0
+# part du temps de réflexion accordée au solveur de fin de partie avant de revenir à la recherche alpha-beta
+SOLVER_TIME_SHARE = 0.5
+
+class _SearchTimeout(Exception):
+    """
+    classe : interrompt la recherche quand le temps de réflexion est écoulé
+    """
 
 class IsolationBot:
     """
     classe : bot pour le jeu d'Isolation
     """
-    def __init__(self, player_id: int):
+    def __init__(self, player_id: int, tt_size_mb: float = 4, tt_policy: str = "depth", endgame_threshold: int = 20,
+                 workers: int = 1):
         """
         procédure : initialise le bot pour le jeu d'Isolation
         params :
             player_id - l'identifiant du joueur (1 ou 2)
+            tt_size_mb - taille de la table de transposition en mégaoctets
+            tt_policy - politique de remplacement de la table ("depth" ou "always")
+            endgame_threshold - nombre de cases libres à partir duquel la fin de partie est résolue exactement
+            workers - nombre de processus de recherche (1 : recherche dans le processus du jeu)
         """
         self.player_id = player_id - 1 
         self.opponent_id = 1 - self.player_id
         self.time_limit = 1.0
+        self.transposition_table = TranspositionTable(tt_size_mb, tt_policy) # mémoire fixe pour toute la partie
+        self.solver = IsolationSolver(endgame_threshold)
+        self.tt_size_mb = tt_size_mb
+        self.parallel = ParallelSearch(workers) if workers > 1 else None # cases de la racine réparties entre processus
+        self._cancelled = False # demande d'arrêt venue du fil de rendu
+        self._ponder: Optional[PonderResult] = None # réflexion préparée pendant le tour de l'adversaire
+        self.ponder_stats = PonderStats("IsolationBot")
 
-    def get_valid_moves(self, board: List[List[List]]) -> List[Tuple[int, int]]:
+    def get_valid_moves(self, board: List[List[List]], attack_map: Optional[AttackMap] = None) -> List[Tuple[int, int]]:
         """
         fonction : trouve tous les coups valides pour un joueur
         params :
             board - plateau de jeu
+            attack_map - carte des attaques du plateau, construite si None
         retour : liste des positions valides
         """
-        valid_moves = []
-        rows = len(board)
-        cols = len(board[0]) if rows > 0 else 0
-        
-        for i in range(rows):
-            for j in range(cols):
-                if board[i][j][0] is None and not is_threatened(board, i, j, self.player_id, check_all_pieces=True):
-                    valid_moves.append((i, j))
-        
-        return valid_moves
+        if attack_map is None:
+            attack_map = AttackMap(board)
+        return attack_map.safe_squares(self.player_id, check_all_pieces=True)
 
-    def evaluate_move(self, board: List[List[List]], move: Tuple[int, int]) -> int:
+    def evaluate_move(self, board: List[List[List]], move: Tuple[int, int], attack_map: Optional[AttackMap] = None) -> int:
         """
         fonction : évalue un coup en calculant combien de coups seront disponibles pour l'adversaire
         params :
             board - plateau de jeu
             move - coup à évaluer (row, col)
+            attack_map - carte des attaques du plateau, construite si None (restaurée après l'évaluation)
         retour : score du coup (plus petit = meilleur)
         """
+        if attack_map is None:
+            attack_map = AttackMap(board)
         row, col = move
-        board[row][col][0] = self.player_id
-        
-        opponent_moves = 0
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j][0] is None and not is_threatened(board, i, j, self.opponent_id, check_all_pieces=True):
-                    opponent_moves += 1
-        
-        board[row][col][0] = None
+        attack_map.place(row, col, self.player_id)
+        opponent_moves = attack_map.safe_squares_mask(self.opponent_id, check_all_pieces=True).bit_count()
+        attack_map.remove(row, col)
         
         return -opponent_moves
 
-    def get_move(self, board: List[List[List]]) -> Optional[Tuple[int, int]]:
+    def get_move(self, board: List[List[List]], attack_map: Optional[AttackMap] = None) -> Optional[Tuple[int, int]]:
         """
-        fonction : détermine le meilleur coup à jouer
+        fonction : détermine le meilleur coup par une recherche alpha-beta en approfondissement itératif
         params :
             board - plateau de jeu
-        retour : position (row, col) du meilleur coup, ou None s'il n'y a pas de coup valide
+            attack_map - carte des attaques synchronisée avec le plateau, construite si None
+        retour : position (row, col) du meilleur coup de la dernière profondeur terminée, ou None s'il n'y a pas de coup valide
         """
         start_time = time.time()
+        self._cancelled = False
+        if attack_map is None:
+            attack_map = AttackMap(board)
+        self._keys = get_zobrist_keys(attack_map.compact.size)
+        pondered = self.ponder_stats.check(self._ponder, self._occupancy_key(attack_map), self.time_limit)
+        self._ponder = None
         
-        valid_moves = self.get_valid_moves(board)
+        valid_moves = self.get_valid_moves(board, attack_map)
         
         if not valid_moves:
             return None
@@ -73,15 +100,269 @@ class IsolationBot:
         if len(valid_moves) == 1:
             return valid_moves[0]
         
-        evaluated_moves = []
-        for move in valid_moves:
-            score = self.evaluate_move(board, move)
-            evaluated_moves.append((move, score))
-            
-            if time.time() - start_time > self.time_limit:
+        # fin de partie : résolution exacte au lieu de la recherche heuristique, sur une part du temps de réflexion
+        if self.solver.can_solve(attack_map):
+            solved = self.solver.solve(attack_map, start_time + self.time_limit * SOLVER_TIME_SHARE, lambda: self._cancelled)
+            if solved is not None:
+                return attack_map.compact.position(solved[1])
+            # résolution interrompue : la recherche alpha-beta dispose du reste du temps
+        
+        root_squares = [attack_map.compact.index(row, col) for row, col in valid_moves]
+        if pondered is not None and pondered.results and (pondered.completed or pondered.elapsed >= self.time_limit):
+            results = pondered.results # prédiction réussie et recherche déjà suffisante : réponse immédiate
+        else:
+            # le temps passé sur cette position pendant le tour de l'adversaire est décompté du budget
+            search_start = start_time - (min(pondered.elapsed, self.time_limit) if pondered is not None else 0.0)
+            if self.parallel is not None:
+                results = self._parallel_search(attack_map, root_squares, search_start)
+            else:
+                results = self._iterative_deepening(attack_map, root_squares, search_start)
+            if pondered is not None and pondered.results and (not results or pondered.results[-1][0] > results[-1][0]):
+                results = pondered.results # la réflexion anticipée est allée plus profond
+        if results:
+            depth_reached, best_score, best_square, _ = results[-1]
+        else:
+            best_square, best_score, depth_reached = root_squares[0], None, 0 # repli si la première itération n'a pas eu le temps de finir
+        
+        Logger.bot("IsolationBot", "Selected %s with score %s at depth %s (%s nodes) in %.2fs",
+                   attack_map.compact.position(best_square), best_score, depth_reached, self._nodes, time.time() - start_time)
+        return attack_map.compact.position(best_square)
+
+    def cancel(self) -> None:
+        """
+        procédure : interrompt la recherche en cours (appelée depuis un autre fil), qui garde la dernière profondeur terminée
+        """
+        self._cancelled = True
+
+    def ponder(self, attack_map: AttackMap) -> None:
+        """
+        procédure : réflexion sur le temps de l'adversaire : prédit sa case (table de transposition, sinon moindre mobilité
+                    laissée au bot) puis cherche le coup du bot dans la position obtenue jusqu'à l'annulation (cancel) ;
+                    get_move reprend ce résultat si l'adversaire joue la case prédite
+        params :
+            attack_map - carte des attaques après le coup du bot, l'adversaire a le trait (instantané pris sur le fil de rendu)
+        """
+        start_time = time.time()
+        self._cancelled = False
+        self._ponder = None
+        self._keys = get_zobrist_keys(attack_map.compact.size)
+        replies = self._ordered_moves(attack_map, self.opponent_id, self.transposition_table.best_move(self._occupancy_key(attack_map)))
+        if not replies:
+            return
+        row, col = divmod(replies[0], attack_map.compact.size)
+        attack_map.place(row, col, self.opponent_id)
+        valid_moves = self.get_valid_moves(None, attack_map)
+        if len(valid_moves) <= 1 or self.solver.can_solve(attack_map):
+            return # coup immédiat dans get_move : rien à préparer
+        root_squares = [attack_map.compact.index(r, c) for r, c in valid_moves]
+        results = self._iterative_deepening(attack_map, root_squares, start_time, time_limit=math.inf)
+        self._ponder = PonderResult(replies[0], self._occupancy_key(attack_map), results, time.time() - start_time, not self._cancelled)
+        Logger.bot("IsolationBot", "Pondered reply %s up to depth %s", (row, col), results[-1][0] if results else 0)
+
+    def _iterative_deepening(self, attack_map: AttackMap, root_squares: List[int], start_time: float,
+                             stop_on_loss: bool = True, time_limit: Optional[float] = None) -> List[Tuple[int, float, int, int]]:
+        """
+        fonction : approfondissement itératif limité à certaines cases de la racine
+        params :
+            attack_map - carte des attaques de la position (non modifiée)
+            root_squares - index des cases de la racine à examiner
+            start_time - début de la réflexion (le temps est compté à partir de cet instant)
+            stop_on_loss - si False, continue après une défaite forcée (un sous-ensemble perdant ne décide pas du coup)
+            time_limit - temps de réflexion en secondes (None : self.time_limit, math.inf : jusqu'à l'annulation)
+        retour : (profondeur, score, case du meilleur coup, noeuds) pour chaque itération terminée
+        """
+        self._deadline = start_time + (self.time_limit if time_limit is None else time_limit)
+        self._nodes = 0
+        self._keys = get_zobrist_keys(attack_map.compact.size)
+        self.transposition_table.new_search()
+        root_key = self._occupancy_key(attack_map)
+        root_set = set(root_squares)
+        results = []
+        
+        for depth in range(1, attack_map.safe_mask.bit_count() + 1):
+            try:
+                # recherche sur une copie : une itération interrompue laisse la copie dans un état intermédiaire
+                score, square = self._search_root(AttackMap(attack_map.compact), depth, root_key, root_set)
+            except _SearchTimeout:
                 break
+            results.append((depth, score, square, self._nodes))
+            if score >= WIN_SCORE - depth or (stop_on_loss and score <= -WIN_SCORE + depth):
+                break # issue forcée trouvée
+        return results
+
+    def _parallel_search(self, attack_map: AttackMap, root_squares: List[int], start_time: float) -> List[Tuple[int, float, int, int]]:
+        """
+        fonction : répartit les cases de la racine entre les processus puis fusionne leurs résultats
+        params :
+            attack_map - carte des attaques de la position
+            root_squares - index des cases de la racine
+            start_time - début de la réflexion (horloge partagée par les processus de la machine)
+        retour : résultats fusionnés au format de _iterative_deepening (voir merge_root_results)
+        """
+        data = attack_map.compact.serialize()
+        # tri préalable : chaque processus reçoit une part des coups les plus prometteurs
+        root_set = set(root_squares)
+        ordered = [square for square in self._ordered_moves(attack_map, self.player_id, NO_MOVE) if square in root_set]
+        jobs = [(data, chunk, start_time, self.time_limit, self.player_id, self.tt_size_mb / self.parallel.workers)
+                for chunk in self.parallel.split(ordered)]
+        worker_results = self.parallel.run(search_root_squares, jobs)
+        merged = merge_root_results(worker_results, WIN_SCORE - len(root_squares))
+        self._nodes = merged[-1][3] if merged else 0
+        Logger.bot("IsolationBot", "Merged %s search processes at depth %s", len(worker_results), merged[-1][0] if merged else 0)
+        return merged
+
+    def _occupancy_key(self, attack_map: AttackMap) -> int:
+        """
+        fonction : clé de Zobrist de l'occupation seule
+        les attaques ne dépendent pas du propriétaire des tours et les deux joueurs ont les mêmes coups,
+        donc la valeur d'une position pour le joueur qui a le trait ne dépend que des cases occupées
+        params :
+            attack_map - carte des attaques de la position
+        retour : hachage 64 bits
+        """
+        key = 0
+        occupied = attack_map.compact.occupied
+        while occupied:
+            low_bit = occupied & -occupied
+            key ^= self._keys.pieces[0][low_bit.bit_length() - 1]
+            occupied ^= low_bit
+        return key
+
+    def _ordered_moves(self, attack_map: AttackMap, player: int, tt_move: int) -> List[int]:
+        """
+        fonction : trie les coups légaux, en premier le coup de la table puis ceux qui laissent le moins de cases libres
+        (toutes les cases légales sont non menacées : l'ordre se fait donc sur la mobilité laissée à l'adversaire)
+        params :
+            attack_map - carte des attaques de la position
+            player - joueur qui a le trait
+            tt_move - coup de la table de transposition ou NO_MOVE
+        retour : liste des index de cases
+        """
+        scored = []
+        safe = attack_map.safe_mask
+        size = attack_map.compact.size
+        while safe:
+            low_bit = safe & -safe
+            square = low_bit.bit_length() - 1
+            safe ^= low_bit
+            row, col = divmod(square, size)
+            attack_map.place(row, col, player)
+            scored.append((attack_map.safe_mask.bit_count(), square))
+            attack_map.remove(row, col)
+        scored.sort()
+        moves = [square for _, square in scored]
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves
+
+    def _search_root(self, attack_map: AttackMap, depth: int, key: int, root_squares: Set[int]) -> Tuple[float, int]:
+        """
+        fonction : itération de la recherche à la racine
+        params :
+            attack_map - copie de la carte des attaques (modifiée puis restaurée)
+            depth - profondeur de l'itération
+            key - clé de la position
+            root_squares - cases de la racine à examiner
+        retour : (score, case du meilleur coup)
+        """
+        alpha, beta = -math.inf, math.inf
+        best_score, best_square = -math.inf, NO_MOVE
+        size = attack_map.compact.size
+        for square in self._ordered_moves(attack_map, self.player_id, self.transposition_table.best_move(key)):
+            if square not in root_squares:
+                continue
+            row, col = divmod(square, size)
+            attack_map.place(row, col, self.player_id)
+            score = -self._negamax(attack_map, depth - 1, -beta, -alpha, 1, self.opponent_id, key ^ self._keys.pieces[0][square])
+            attack_map.remove(row, col)
+            if score > best_score:
+                best_score, best_square = score, square
+                alpha = max(alpha, score)
+        self.transposition_table.store(key, depth, EXACT, best_score, best_square)
+        return best_score, best_square
+
+    def _negamax(self, attack_map: AttackMap, depth: int, alpha: float, beta: float, ply: int, player: int, key: int) -> float:
+        """
+        fonction : recherche alpha-beta au format negamax, poses et retraits en place sur la carte des attaques
+        params :
+            attack_map - carte des attaques (modifiée puis restaurée)
+            depth - profondeur restante
+            alpha, beta - fenêtre de recherche du point de vue du joueur qui a le trait
+            ply - distance à la racine
+            player - joueur qui a le trait
+            key - clé de la position
+        retour : score du point de vue du joueur qui a le trait
+        """
+        self._nodes += 1
+        if not self._nodes & 1023 and (self._cancelled or time.time() > self._deadline):
+            raise _SearchTimeout()
         
-        evaluated_moves.sort(key=lambda x: x[1], reverse=True)
+        safe = attack_map.safe_mask
+        if not safe:
+            return -WIN_SCORE + ply # aucune case libre : le joueur qui a le trait a perdu
+        if depth == 0:
+            return safe.bit_count() # heuristique de mobilité : cases encore disponibles
         
-        top_moves = [move for move, _ in evaluated_moves[:min(3, len(evaluated_moves))]]
-        return random.choice(top_moves)
\ No newline at end of file
+        tt_move = NO_MOVE
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            entry_depth, flag, entry_score, tt_move = entry
+            if entry_depth >= depth:
+                if flag == EXACT or (flag == LOWER_BOUND and entry_score >= beta) or (flag == UPPER_BOUND and entry_score <= alpha):
+                    return entry_score
+        
+        original_alpha = alpha
+        best_score, best_square = -math.inf, NO_MOVE
+        size = attack_map.compact.size
+        moves = self._ordered_moves(attack_map, player, tt_move) if depth > 1 else self._safe_list(safe)
+        for square in moves:
+            row, col = divmod(square, size)
+            attack_map.place(row, col, player)
+            score = -self._negamax(attack_map, depth - 1, -beta, -alpha, ply + 1, 1 - player, key ^ self._keys.pieces[0][square])
+            attack_map.remove(row, col)
+            if score > best_score:
+                best_score, best_square = score, square
+                alpha = max(alpha, score)
+            if alpha >= beta:
+                break # coupure beta
+        
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.transposition_table.store(key, depth, flag, best_score, best_square)
+        return best_score
+
+    def _safe_list(self, safe: int) -> List[int]:
+        """
+        fonction : liste les cases d'un bitboard
+        params :
+            safe - bitboard des cases libres
+        retour : index des cases, dans l'ordre du plateau
+        """
+        squares = []
+        while safe:
+            low_bit = safe & -safe
+            squares.append(low_bit.bit_length() - 1)
+            safe ^= low_bit
+        return squares
+
+def search_root_squares(data: bytes, root_squares: List[int], start_time: float, time_limit: float,
+                        player_id: int, tt_size_mb: float) -> List[Tuple[int, float, int, int]]:
+    """
+    fonction : recherche exécutée dans un processus de ParallelSearch sur une partie des cases de la racine
+    params :
+        data - plateau compact sérialisé (BitBoard.serialize)
+        root_squares - index des cases de la racine attribuées au processus
+        start_time - début de la réflexion dans le processus du jeu
+        time_limit - temps de réflexion en secondes
+        player_id - joueur qui a le trait (0 ou 1)
+        tt_size_mb - taille de la table de transposition du processus
+    retour : résultats de IsolationBot._iterative_deepening
+    """
+    bot = IsolationBot(player_id + 1, tt_size_mb)
+    bot.time_limit = time_limit
+    return bot._iterative_deepening(AttackMap(BitBoard.deserialize(data)), root_squares, start_time, stop_on_loss=False)
@@ -1,8 +1,8 @@
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 import pygame
 from src.board import Board
 from src.windows.render.render import Render
-from src.captures import is_threatened, has_valid_move
+from src.captures import AttackMap, is_threatened, has_valid_move
 from src.saves import save_game
 from src.network.client.game_base import GameBase
 from src.utils.logger import Logger
@@ -12,27 +12,38 @@ class Game(GameBase):
     """
     classe : gère une partie d'Isolation
     """
-    def __init__(self, game_save, quadrants, game_mode="Solo"):
+    def __init__(self, game_save, quadrants, game_mode="Solo", headless=False):
         """
         procédure : initialise une nouvelle partie d'Isolation
         params :
             game_save - sauvegarde de jeu existante ou None
             quadrants - configuration des quadrants initiaux
             game_mode - mode de jeu ("Solo", "Bot", "Network")
+            headless - si True, la partie tourne sans affichage (aucune fenêtre, événements diffusés aux abonnés)
         """
         super().__init__(game_save, quadrants, game_mode, player_name="player", game_type="isolation")
         self.board = Board(quadrants, 1)
-        self.render = Render(game=self)
+        self.attack_map: Optional[AttackMap] = None # construite à la première utilisation
+        self.render = None if headless else Render(game=self)
         self.round_turn = 0
         
         self.bot = None
         if game_mode == "Bot":
-            self.bot = IsolationBot(player_id=2) 
-            self.render.edit_info_label("Player 1's turn - Place your tower")
+            self.bot = IsolationBot(player_id=2)
+            self.notify_info("Player 1's turn - Place your tower")
         
         if self.is_network_game:
-            if self.render:
-                self.render.edit_info_label("Waiting for another player...")
+            self.notify_info("Waiting for another player...")
+
+    def get_attack_map(self) -> AttackMap:
+        """
+        fonction : retourne la carte des attaques, reconstruite si le plateau a changé sans elle (chargement, état réseau)
+        retour : carte des attaques synchronisée avec le plateau
+        """
+        attack_map = getattr(self, "attack_map", None)
+        if attack_map is None or not attack_map.matches(self.board.board):
+            self.attack_map = attack_map = AttackMap(self.board.board)
+        return attack_map
 
     def on_network_action(self, action_data: Dict) -> bool:
         """
@@ -46,43 +57,35 @@ class Game(GameBase):
             Logger.error("Game", "Received empty action data")
             return False
             
-        board_state = action_data.get("board_state")
-        if not board_state or "board" not in board_state or "round_turn" not in board_state:
-            Logger.error("Game", f"Received incomplete or invalid board state: {board_state}")
-            return False
-            
-        # applique l'état reçu directement en utilisant la méthode de la classe de base
-        if not self.update_board_from_state(board_state):
-            Logger.error("Game", "Failed to apply received board state in on_network_action.")
+        # applique le coup reçu ou l'instantané en utilisant la méthode de la classe de base
+        if not self.apply_network_action(action_data):
+            Logger.error("Game", "Failed to apply received action in on_network_action.")
             return False 
         
-        Logger.info("Game Isolation", f"Applied board state. Current turn: {self.round_turn}")
+        Logger.info("Game Isolation", f"Applied network action. Current turn: {self.round_turn}")
         
         save_game(self)
-        self.render.needs_render = True
+        self.notify_board_changed()
         
 
         # verifie si le joueur qui a joué en dernier a gagné
-        if not has_valid_move(self.board.board, self.round_turn, check_all_pieces=True):
+        if not has_valid_move(self.board.board, self.round_turn, check_all_pieces=True, attack_map=self.get_attack_map()):
             if self.round_turn == 0:
                 winner_text = "PLAYER 2 WON THE GAME !"
             else:
                 winner_text = "PLAYER 1 WON THE GAME !"
-            self.render.show_end_popup(winner_text)
-            self.render.end_game_waiting_input = True
+            self.notify_game_over(winner_text, wait_for_input=True)
             return False
 
         # met à jour le message de statut en fonction du tour
         if self.is_network_game:
             if self.is_my_turn: 
-                if self.render:
-                    self.render.edit_info_label(f"Your turn (Player {self.player_number}) - Place tower")
+                self.notify_info(f"Your turn (Player {self.player_number}) - Place tower")
             else:
                 other_player_number = 1 if self.round_turn == 0 else 2
-                if self.render:
-                    self.render.edit_info_label(f"Player {other_player_number}'s turn - Place tower")
+                self.notify_info(f"Player {other_player_number}'s turn - Place tower")
         else:
-             self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn - Place your tower")
+             self.notify_info(f"Player {self.round_turn + 1}'s turn - Place your tower")
             
         return True # le jeu continue
 
@@ -97,41 +100,47 @@ class Game(GameBase):
         # gestion des tours en mode réseau
         if self.is_network_game:
             if not self.game_started:
-                self.render.edit_info_label("Waiting for another player...")
+                self.notify_info("Waiting for another player...")
                 return True
             if not self.can_play():
-                self.render.edit_info_label(f"Waiting for Player {2 if self.player_number == 1 else 1}") 
+                self.notify_info(f"Waiting for Player {2 if self.player_number == 1 else 1}") 
                 return True
 
+        # le joueur attend la fin de la réflexion du bot
+        if self.game_mode == "Bot" and self.round_turn == 1:
+            self.notify_info("Bot is thinking...")
+            return True
+
         # vérification des limites du plateau
         if row >= len(self.board.board) or col >= len(self.board.board[0]):
-            self.render.edit_info_label("Invalid move: out of bounds")
+            self.notify_info("Invalid move: out of bounds")
             return True
 
         cell = self.board.board[row][col]
 
         # vérification si la case est déjà occupée
         if cell[0] is not None:
-            self.render.edit_info_label("This cell is already occupied")
+            self.notify_info("This cell is already occupied")
             return True
 
         # vérification si la case est menacée
         current_player = 0 if self.player_number == 1 else 1 if self.is_network_game else self.round_turn
-        if is_threatened(self.board.board, row, col, current_player, check_all_pieces=True):
-            self.render.edit_info_label("This cell is threatened by an enemy tower")
+        attack_map = self.get_attack_map()
+        if is_threatened(self.board.board, row, col, current_player, check_all_pieces=True, attack_map=attack_map):
+            self.notify_info("This cell is threatened by an enemy tower")
             return True
 
         # gestion du clic en mode réseau (envoi avant mise à jour locale)
         if self.is_network_game:
             self.board.board[row][col][0] = current_player # mise à jour locale pour feedback visuel
-            self.render.needs_render = True # déclenche l'affichage immédiat après la mise à jour locale
+            attack_map.place(row, col, current_player)
+            self.notify_board_changed() # déclenche l'affichage immédiat après la mise à jour locale
             
             # vérifie si ce coup a causé une victoire avant d'envoyer l'action
-            if not has_valid_move(self.board.board, 1 - current_player, check_all_pieces=True):
+            if not has_valid_move(self.board.board, 1 - current_player, check_all_pieces=True, attack_map=attack_map):
                 # c'est un coup gagnant - l'adversaire n'a plus de coups valides
                 winner_text = f"PLAYER {current_player + 1} WON THE GAME !"
-                self.render.show_end_popup(winner_text)
-                self.render.end_game_waiting_input = True
+                self.notify_game_over(winner_text, wait_for_input=True)
                     
                 self.send_network_action({
                     "row": row,
@@ -151,74 +160,94 @@ class Game(GameBase):
 
         # execution du mouvement en mode solo ou bot
         self.board.board[row][col][0] = self.round_turn
+        attack_map.place(row, col, self.round_turn)
         player_who_moved = self.round_turn
         self.round_turn = 1 - self.round_turn # changement de tour
         save_game(self) # sauvegarde après chaque coup valide
         
-        self.render.needs_render = True
+        self.notify_board_changed()
         
         # vérification de la fin de partie pour le joueur suivant
         Logger.game("Game Isolation", f"Checking if Player {self.round_turn + 1} has valid moves")
-        if not has_valid_move(self.board.board, self.round_turn, check_all_pieces=True):
+        if not has_valid_move(self.board.board, self.round_turn, check_all_pieces=True, attack_map=attack_map):
             if self.game_mode == "Bot" and player_who_moved == 1:
                 winner_text = "BOT WON THE GAME !"
             else:
                 winner_text = f"PLAYER {player_who_moved + 1} WON THE GAME !"
-            self.render.show_end_popup(winner_text)
+            self.notify_game_over(winner_text)
             return False
 
         # gestion du tour du bot
         if self.round_turn == 1 and self.game_mode == "Bot":
-            self.render.edit_info_label("Bot is thinking...")
+            self.notify_info("Bot is thinking...")
             pygame.time.set_timer(pygame.USEREVENT, 10) # délai pour l'action du bot
             self._bot_timer_set = True
         else:
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn - Place your tower")
+            self.notify_info(f"Player {self.round_turn + 1}'s turn - Place your tower")
             
         return True # le jeu continue
 
-    def _bot_play(self) -> bool:
+    def _bot_think(self) -> Optional[Tuple[int, int]]:
         """
-        procédure : exécute le tour du bot
+        fonction : calcule le coup du bot (exécutée sur le fil du bot, le jeu n'est pas modifié)
+        retour : position (row, col) de la tour du bot ou None
+        """
+        return self.bot.get_move(self.board.board, AttackMap(self.board.board)) # carte propre au fil du bot
+
+    def _bot_ponder(self) -> Callable[[], None]:
+        """
+        fonction : prépare la réflexion du bot pendant le tour du joueur (instantané du plateau pris sur le fil de rendu)
+        retour : fonction exécutée sur le fil du bot jusqu'à l'annulation
+        """
+        attack_map = AttackMap(self.board.board)
+        return lambda: self.bot.ponder(attack_map)
+
+    def _bot_apply(self, bot_move: Optional[Tuple[int, int]]) -> bool:
+        """
+        procédure : applique le coup calculé par le bot (fil de rendu)
+        params :
+            bot_move - coup retourné par _bot_think
         retour : True si le bot a joué avec succès, False sinon
         """
         try:
-            bot_move = self.bot.get_move(self.board.board)
+            attack_map = self.get_attack_map()
             if bot_move is None:
                 if self.game_mode == "Bot":
                     winner_text = "BOT WON THE GAME !"
                 else:
                     winner_text = "PLAYER 1 WON THE GAME !"
-                self.render.show_end_popup(winner_text)
+                self.notify_game_over(winner_text)
                 return False
                 
             bot_row, bot_col = bot_move
             self.board.board[bot_row][bot_col][0] = self.round_turn # placement de la tour du bot
+            attack_map.place(bot_row, bot_col, self.round_turn)
+            self.notify_move([bot_move]) # mise en évidence de la tour posée
             player_who_moved = self.round_turn
             self.round_turn = 1 - self.round_turn # retour au tour du joueur humain
             save_game(self)
             
             Logger.game("Game Isolation", f"Checking if Player {self.round_turn + 1} has valid moves after bot's move")
-            if not has_valid_move(self.board.board, self.round_turn, check_all_pieces=True):
+            if not has_valid_move(self.board.board, self.round_turn, check_all_pieces=True, attack_map=attack_map):
                 if self.game_mode == "Bot" and player_who_moved == 1:
                     winner_text = "BOT WON THE GAME !"
                 else:
                     winner_text = f"PLAYER {player_who_moved + 1} WON THE GAME !"
-                self.render.show_end_popup(winner_text)
+                self.notify_game_over(winner_text)
                 return False
             
-            self.render.edit_info_label("Player 1's turn - Place your tower") # mise à jour du message
+            self.notify_info("Player 1's turn - Place your tower") # mise à jour du message
             return True
         except Exception as e:
             Logger.error("Game", f"Bot error: {str(e)}")
-            self.render.edit_info_label(f"Bot error: {str(e)}") # affiche l'erreur dans le jeu
+            self.notify_info(f"Bot error: {str(e)}") # affiche l'erreur dans le jeu
             return False # indique un échec
 
     def load_game(self) -> None:
         """
         procédure : lance la boucle principale du jeu
         """
-        self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn - Place your tower")
+        self.notify_info(f"Player {self.round_turn + 1}'s turn - Place your tower")
         self.render.run_game_loop()
         if getattr(self.render, "end_popup_action", None) == "play_again":
             from src.windows.selector import Selector
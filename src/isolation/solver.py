@@ -0,0 +1,135 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import math
+import time
+from src.captures import AttackMap
+from src.move_tables import get_move_tables
+from src.zobrist import get_zobrist_keys
+from src.utils.logger import Logger
+
+class _SolveTimeout(Exception):
+    """
+    classe : interrompt la résolution quand le temps est écoulé ou que la réflexion est annulée
+    """
+
+class IsolationSolver:
+    """
+    classe : résolution exacte des fins de partie d'Isolation
+    principe :
+        une position ne dépend que des cases occupées (les attaques ignorent le propriétaire des tours)
+        poser une tour sur une case libre ne coupe aucun rayon existant (sinon la case serait menacée),
+        donc une case qui n'est plus libre ne le redevient jamais : l'état se réduit au bitboard des cases libres
+        le joueur qui n'a plus de case libre à son tour a perdu
+    les sous-positions résolues sont mémorisées par hachage de Zobrist de l'occupation
+    la résolution s'arrête à l'échéance ou à l'annulation : l'appelant reprend alors la recherche heuristique
+    """
+    def __init__(self, threshold: int = 20, max_entries: int = 500000) -> None:
+        """
+        procédure : initialise le solveur
+        params :
+            threshold - nombre de cases libres à partir duquel le solveur remplace la recherche heuristique
+            max_entries - nombre maximal de positions mémorisées (le cache est vidé au-delà)
+        """
+        self.threshold: int = threshold
+        self.max_entries: int = max_entries
+        self.cache: Dict[int, bool] = {}
+        self.nodes: int = 0
+        self._deadline: float = math.inf
+        self._cancelled: Callable[[], bool] = lambda: False
+
+    def can_solve(self, attack_map: AttackMap) -> bool:
+        """
+        fonction : vérifie si la position est assez petite pour être résolue
+        params :
+            attack_map - carte des attaques de la position
+        retour : True si le nombre de cases libres ne dépasse pas le seuil
+        """
+        return attack_map.safe_mask.bit_count() <= self.threshold
+
+    def solve(self, attack_map: AttackMap, deadline: float = math.inf,
+              cancelled: Optional[Callable[[], bool]] = None) -> Optional[Tuple[bool, Optional[int]]]:
+        """
+        fonction : résout la position pour le joueur qui a le trait
+        params :
+            attack_map - carte des attaques de la position (non modifiée)
+            deadline - instant (time.time()) au-delà duquel la résolution est abandonnée
+            cancelled - fonction qui indique si la réflexion a été annulée (lue depuis le fil de la résolution)
+        retour : (True si le joueur gagne, case à jouer ou None s'il n'y a aucune case libre),
+                 ou None si la résolution a été interrompue (échéance ou annulation)
+                 en position perdue, la case choisie est celle qui laisse le plus de cases libres
+        """
+        compact = attack_map.compact
+        self._tables = get_move_tables(compact)
+        self._keys = get_zobrist_keys(compact.size).pieces[0]
+        self._deadline = deadline
+        self._cancelled = cancelled if cancelled is not None else lambda: False
+        self.nodes = 0
+
+        occupied = compact.occupied
+        safe = attack_map.safe_mask
+        key = 0
+        remaining = occupied
+        while remaining:
+            low_bit = remaining & -remaining
+            key ^= self._keys[low_bit.bit_length() - 1]
+            remaining ^= low_bit
+
+        best_square, best_remaining = None, -1
+        try:
+            for square, child_safe in self._children(occupied, safe):
+                if not child_safe or not self._wins(occupied | 1 << square, child_safe, key ^ self._keys[square]):
+                    Logger.bot("IsolationSolver", "Winning move found on square %s (%s nodes, %s cached)", square, self.nodes, len(self.cache))
+                    return True, square
+                if child_safe.bit_count() > best_remaining:
+                    best_square, best_remaining = square, child_safe.bit_count()
+        except _SolveTimeout:
+            # les positions déjà mémorisées sont exactes et restent utiles au tour suivant
+            Logger.bot("IsolationSolver", "Solve interrupted after %s nodes (%s cached)", self.nodes, len(self.cache))
+            return None
+        Logger.bot("IsolationSolver", "Position is lost (%s nodes, %s cached)", self.nodes, len(self.cache))
+        return False, best_square
+
+    def _children(self, occupied: int, safe: int) -> List[Tuple[int, int]]:
+        """
+        fonction : liste les coups d'une position, ceux qui laissent le moins de cases libres en premier
+        params :
+            occupied - bitboard des cases occupées
+            safe - bitboard des cases libres
+        retour : liste des (case jouée, cases libres restantes)
+        """
+        children = []
+        remaining = safe
+        while remaining:
+            low_bit = remaining & -remaining
+            square = low_bit.bit_length() - 1
+            remaining ^= low_bit
+            attacked = 0
+            for target in self._tables.attacks(square, occupied):
+                attacked |= 1 << target
+            children.append((square, safe & ~low_bit & ~attacked))
+        children.sort(key=lambda child: child[1].bit_count())
+        return children
+
+    def _wins(self, occupied: int, safe: int, key: int) -> bool:
+        """
+        fonction : recherche exacte mémorisée
+        params :
+            occupied - bitboard des cases occupées
+            safe - bitboard des cases libres (non vide)
+            key - hachage de Zobrist de l'occupation
+        retour : True si le joueur qui a le trait gagne
+        """
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        self.nodes += 1
+        if not self.nodes & 1023 and (time.time() > self._deadline or self._cancelled()):
+            raise _SolveTimeout()
+        result = False
+        for square, child_safe in self._children(occupied, safe):
+            if not child_safe or not self._wins(occupied | 1 << square, child_safe, key ^ self._keys[square]):
+                result = True
+                break
+        if len(self.cache) >= self.max_entries:
+            self.cache.clear() # mémoire bornée, y compris pendant une seule résolution
+        self.cache[key] = result
+        return result
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple, List
 import pygame
 from src.board import Board
 from src.windows.render.render import Render
@@ -6,6 +6,7 @@ from src.utils.theme_manager import ThemeManager
 from src.captures import has_valid_move
 from src.saves import save_game
 from src.moves import available_move
+from src.game_state import has_won
 from src.network.client.game_base import GameBase
 from src.utils.logger import Logger
 from src.katerenga.bot import KaterengaBot
@@ -14,17 +15,18 @@ class Game(GameBase):
     """
     classe : gère une partie de Katerenga
     """
-    def __init__(self, game_save, quadrants, game_mode="Solo"):
+    def __init__(self, game_save, quadrants, game_mode="Solo", headless=False):
         """
         procédure : initialise une nouvelle partie de Katerenga
         params :
             game_save - sauvegarde de jeu existante ou None
             quadrants - configuration des quadrants initiaux
             game_mode - mode de jeu ("Solo", "Bot", "Network")
+            headless - si True, la partie tourne sans affichage (aucune fenêtre, événements diffusés aux abonnés)
         """
         super().__init__(game_save, quadrants, game_mode, player_name="player", game_type="katerenga")
         self.board = Board(quadrants, 0)
-        self.render = Render(game=self)
+        self.render = None if headless else Render(game=self)
         self.round_turn = 0
         self.first_turn = True
         self.selected_piece = None
@@ -40,8 +42,7 @@ class Game(GameBase):
             Logger.game("Game", "Katerenga bot mode initialized")
 
         if self.is_network_game:
-            if self.render:
-                self.render.edit_info_label("Waiting for another player...")
+            self.notify_info("Waiting for another player...")
 
     def on_network_action(self, action_data: Dict) -> bool:
         """
@@ -55,33 +56,15 @@ class Game(GameBase):
             Logger.error("Game", "Received empty action data")
             return False
         
-        board_state = action_data.get("board_state")
-        if not board_state or "board" not in board_state or "round_turn" not in board_state or "first_turn" not in board_state:
-            Logger.error("Game", f"Received incomplete or invalid board state: {board_state}")
-            return False
-        
-        # vérifie que locked_pieces est présent dans le board_state
-        if "locked_pieces" not in board_state:
-            Logger.warning("Game Katerenga", "Received board state without locked_pieces information")
-            board_state["locked_pieces"] = []  # assure un état par défaut
-        
-        # applique l'état reçu directement
-        if not self.update_board_from_state(board_state):
-             Logger.error("Game", "Failed to apply received board state in on_network_action.")
+        # applique le coup reçu (captures, verrous et fin du premier tour déduits par les règles) ou l'instantané
+        if not self.apply_network_action(action_data):
+             Logger.error("Game", "Failed to apply received action in on_network_action.")
              return False # indique un échec
         
-        Logger.info("Game Katerenga", f"Applied board state. Current turn: {self.round_turn}, First turn: {self.first_turn}, Locked pieces: {self.locked_pieces}")
-
-        # fin du premier tour ? (Après que J2 (index 1) ait joué et que le tour revienne à J1 (index 0))
-        if self.first_turn and self.round_turn == 0:
-            self.first_turn = False
-            Logger.info("Game Katerenga", "First turn completed.")
-
-        # l'état du plateau reçu *devrait* refléter l'état *après* le coup de l'adversaire,
-        # y compris les captures et les verrous. Pas besoin de réappliquer la logique de mouvement ici.
+        Logger.info("Game Katerenga", f"Applied network action. Current turn: {self.round_turn}, First turn: {self.first_turn}, Locked pieces: {self.locked_pieces}")
 
         save_game(self)
-        self.render.needs_render = True
+        self.notify_board_changed()
         
         # détermine qui a joué en dernier en fonction du nouveau round_turn et notre numéro de joueur
         # ajuster en fonction du joueur local
@@ -92,21 +75,19 @@ class Game(GameBase):
         Logger.game("Game Katerenga", f"Checking victory condition for Player {player_who_just_moved + 1}")
         if self.check_win(player_who_just_moved):
             Logger.success("Game Katerenga", f"Game over! Player {player_who_just_moved + 1} wins!")
-            self.render.show_end_popup(f"Player {player_who_just_moved + 1} wins!")
+            self.notify_game_over(f"Player {player_who_just_moved + 1} wins!")
             return False # la partie est terminée
         
         # met à jour le message de statut en fonction du tour
         if self.is_network_game:
             if self.is_my_turn: # is_my_turn doit avoir été mis à jour par les gestionnaires de GameBase
-                if self.render:
-                    self.render.edit_info_label(f"Your turn (Player {self.player_number})")
+                self.notify_info(f"Your turn (Player {self.player_number})")
             else:
                 other_player = 1 if self.player_number == 2 else 2  # numéro de joueur opposé
-                if self.render:
-                    self.render.edit_info_label(f"Player {other_player}'s turn")
+                self.notify_info(f"Player {other_player}'s turn")
         else:
             # fallback pour le contexte non réseau, bien que cette fonction principalement gère le réseau
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
 
         return True # le jeu continue
 
@@ -114,7 +95,7 @@ class Game(GameBase):
         """
         procédure : lance la boucle principale de rendu et d'événements du jeu
         """
-        self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
+        self.notify_info(f"Player {self.round_turn + 1}'s turn")
         self.render.run_game_loop()
         self.cleanup()
 
@@ -125,63 +106,18 @@ class Game(GameBase):
             player - l'identifiant du joueur (0 ou 1)
         retour : True si le joueur a gagné, False sinon
         """
-        opponent = 1 - player
-        # définition des camps adverses en fonction du joueur
-        opponent_camps = [(9, 0), (9, 9)] if player == 0 else [(0, 9), (0, 0)]
-        
-        # Normaliser les coordonnées pour la comparaison
-        normalized_locked = []
-        for pos in self.locked_pieces:
-            if isinstance(pos, list):
-                normalized_locked.append(tuple(pos))
-            else:
-                normalized_locked.append(pos)
-        
-        Logger.game("Game Katerenga", f"Checking win for player {player+1}. Opponent camps: {opponent_camps}, Locked pieces: {normalized_locked}")
-
-        # condition 1: occupation des deux camps adverses
-        camps_occupied = []
-        for camp in opponent_camps:
-            if self.board.board[camp[0]][camp[1]][0] == player or camp in normalized_locked:
-                camps_occupied.append(camp)
-        
-        if len(camps_occupied) == 2:
-            if self.game_mode == "Bot" and player == 1:
-                winner_text = "BOT WON THE GAME !"
-            else:
-                winner_text = f"PLAYER {player + 1} WON THE GAME !"
-            self.render.show_end_popup(winner_text)
-            return True
+        Logger.game("Game Katerenga", f"Checking win for player {player+1}. Locked pieces: {self.locked_pieces}")
 
-        # condition 2: l'adversaire ne peut plus bouger
-        opponent_has_moves = False
-        for row in range(10):  
-            if opponent_has_moves:
-                break
-            for col in range(10):
-                if self.board.board[row][col][0] == opponent:
-                    # recherche d'au moins un mouvement valide pour l'adversaire
-                    for dest_row in range(10):
-                        for dest_col in range(10):
-                            if (self.board.board[dest_row][dest_col][0] is None or 
-                                self.board.board[dest_row][dest_col][0] != opponent): # case vide ou occupée par le joueur courant
-                                if available_move(self.board.board, row, col, dest_row, dest_col):
-                                    opponent_has_moves = True
-                                    break # mouvement trouvé, pas besoin de chercher plus
-                        if opponent_has_moves:
-                            break
-                if opponent_has_moves:
-                    break
+        # occupation des deux camps adverses ou adversaire sans coup (règles partagées avec GameState)
+        if not has_won(0, self.board.board, player, self.first_turn, self.locked_pieces):
+            return False # aucune condition de victoire remplie
 
-        if not opponent_has_moves:
-            if self.game_mode == "Bot" and player == 1:
-                winner_text = "BOT WON THE GAME !"
-            else:
-                winner_text = f"PLAYER {player + 1} WON THE GAME !"
-            self.render.show_end_popup(winner_text)
-            return True
-
-        return False # aucune condition de victoire remplie
+        if self.game_mode == "Bot" and player == 1:
+            winner_text = "BOT WON THE GAME !"
+        else:
+            winner_text = f"PLAYER {player + 1} WON THE GAME !"
+        self.notify_game_over(winner_text)
+        return True
 
     def capture_piece(self, row: int, col: int) -> None:
         """
@@ -203,14 +139,14 @@ class Game(GameBase):
         # gestion des tours en mode réseau ou bot
         if self.is_network_game:
             if not self.game_started:
-                self.render.edit_info_label("Waiting for another player...")
+                self.notify_info("Waiting for another player...")
                 return True
             if not self.can_play():
-                self.render.edit_info_label(f"Waiting for Player {2 if self.player_number == 1 else 1}")
+                self.notify_info(f"Waiting for Player {2 if self.player_number == 1 else 1}")
                 return True
                 
         if self.game_mode == "Bot" and self.round_turn == 1:
-            self.render.edit_info_label("C'est le tour du bot, veuillez patienter...")
+            self.notify_info("C'est le tour du bot, veuillez patienter...")
             return True
 
         cell = self.board.board[row][col]
@@ -232,24 +168,24 @@ class Game(GameBase):
             if cell[0] is not None and cell[0] == player_index_to_select and (row, col) not in opponent_camps:
                 # vérification supplémentaire pour le mode réseau : s'assurer que c'est bien le tour de ce joueur
                 if self.is_network_game and not self.is_my_turn:
-                    self.render.edit_info_label(f"Waiting for Player {2 if self.player_number == 1 else 1}")
+                    self.notify_info(f"Waiting for Player {2 if self.player_number == 1 else 1}")
                     return True # pas notre tour, même si on a cliqué sur notre pièce
                     
                 self.selected_piece = (row, col)
-                self.render.edit_info_label("Select destination")
-                self.render.needs_render = True
+                self.notify_info("Select destination")
+                self.notify_board_changed()
                 return True
             elif cell[0] is not None and cell[0] == player_index_to_select and (row, col) in opponent_camps:
                 # clic sur une pièce du joueur mais dans un camp adverse - ne pas sélectionner
-                self.render.edit_info_label("Cannot move piece from opponent's camp")
+                self.notify_info("Cannot move piece from opponent's camp")
                 return True
             elif cell[0] is not None:
                 # clic sur une pièce adverse ou une case vide
-                self.render.edit_info_label("Select your own piece")
+                self.notify_info("Select your own piece")
                 return True
             else:
                 # clic sur une case vide
-                self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn") # ou message de statut réseau
+                self.notify_info(f"Player {self.round_turn + 1}'s turn") # ou message de statut réseau
                 return True
 
         # cas 2: une pièce est déjà sélectionnée
@@ -258,7 +194,7 @@ class Game(GameBase):
         # déselectionner si on clique sur la même pièce
         if (row, col) == (old_row, old_col):
             self.selected_piece = None
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
             return True
             
         # déterminer les camps adverses en fonction du joueur
@@ -269,13 +205,13 @@ class Game(GameBase):
         # empêcher le déplacement vers les cases grises (sur le bord) sauf si c'est un camp adverse
         if is_edge and (row, col) not in opponent_camps:
             self.selected_piece = None
-            self.render.edit_info_label("Cannot move to gray edge cells except opponent camps")
+            self.notify_info("Cannot move to gray edge cells except opponent camps")
             return True
 
         # verification de la validité du mouvement
         if not available_move(self.board.board, old_row, old_col, row, col):
             self.selected_piece = None
-            self.render.edit_info_label("Invalid move")
+            self.notify_info("Invalid move")
             return True
         
         # gestion de la capture
@@ -287,12 +223,12 @@ class Game(GameBase):
             else:
                 # pas de capture au premier tour
                 self.selected_piece = None
-                self.render.edit_info_label("No capture allowed on first turn")
+                self.notify_info("No capture allowed on first turn")
                 return True
         elif cell[0] is not None and cell[0] == current_player_index:
              # impossible de se déplacer sur une case alliée
              self.selected_piece = None
-             self.render.edit_info_label("Cannot move to an occupied friendly cell")
+             self.notify_info("Cannot move to an occupied friendly cell")
              return True
         
         # execution du mouvement et vérification de victoire
@@ -321,7 +257,6 @@ class Game(GameBase):
                      Logger.game("Game", f"Local feedback: Piece locked at ({row}, {col}) for player {current_player_who_moved + 1}")
 
             # vérification de la victoire locale
-            normalized_locked_pieces = [[x, y] for x, y in self.locked_pieces] if self.locked_pieces else []
             opponent_player_who_moved = 0 if current_player_who_moved == 1 else 1
             is_win = (self.check_win(current_player_who_moved) or self.check_win(opponent_player_who_moved))
             
@@ -329,16 +264,14 @@ class Game(GameBase):
                 "from_row": old_row,
                 "from_col": old_col,
                 "to_row": row,
-                "to_col": col,
-                "capture_made": capture_made,
-                "locked_pieces": normalized_locked_pieces
-            })
+                "to_col": col
+            }) # la capture et le verrou sont déduits par l'adversaire
             
             if is_win:
                 winner = f"Player {current_player_who_moved + 1}"
                 Logger.success("Game Katerenga", f"Game Over! {winner} wins! (Detected locally)")
-                self.render.edit_info_label(f"Game Over! {winner} wins!")
-                self.render.show_end_popup(f"{winner} WON THE GAME !")
+                self.notify_info(f"Game Over! {winner} wins!")
+                self.notify_game_over(f"{winner} WON THE GAME !")
                 return False
                 
             return True  # le jeu continue
@@ -356,7 +289,7 @@ class Game(GameBase):
             is_win = self.check_win(self.round_turn)
             if is_win: 
                 Logger.success("Game Katerenga", f"Game over! Player {self.round_turn + 1} wins!")
-                self.render.show_end_popup(f"Player {self.round_turn + 1} wins!")
+                self.notify_game_over(f"Player {self.round_turn + 1} wins!")
         else:
             # mouvement normal
             self.board.board[row][col][0] = self.board.board[old_row][old_col][0]
@@ -366,14 +299,14 @@ class Game(GameBase):
             is_win = self.check_win(self.round_turn)
             if is_win: 
                 Logger.success("Game Katerenga", f"Game over! Player {self.round_turn + 1} wins!")
-                self.render.show_end_popup(f"Player {self.round_turn + 1} wins!")
+                self.notify_game_over(f"Player {self.round_turn + 1} wins!")
 
         # après un mouvement réussi
         if move_made and not is_win:
             self.round_turn = 1 - self.round_turn # changement de tour
             if self.first_turn and self.round_turn == 0:
                 self.first_turn = False # fin du premier tour
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
             save_game(self) # sauvegarde après le coup
 
             # déclenchement du tour du bot si nécessaire
@@ -383,45 +316,63 @@ class Game(GameBase):
                 
         elif move_made and is_win:
             save_game(self)
-            self.render.needs_render = True
+            self.notify_board_changed()
 
         if not is_win: # si le jeu n'est pas fini, on rafraîchit après toutes les opérations
-             self.render.needs_render = True 
+             self.notify_board_changed() 
 
         return True # le jeu continue (sauf si is_win est True et traité ci-dessus)
 
-    def _bot_play(self) -> bool:
+    def _bot_think(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        fonction : calcule le coup du bot (exécutée sur le fil du bot, le jeu n'est pas modifié)
+        retour : (ligne de départ, colonne de départ, ligne d'arrivée, colonne d'arrivée) ou None
+        """
+        return self.bot.choose_move()
+
+    def _bot_ponder(self) -> Callable[[], None]:
+        """
+        fonction : prépare la réflexion du bot pendant le tour du joueur (instantané du plateau pris sur le fil de rendu)
+        retour : fonction exécutée sur le fil du bot jusqu'à l'annulation
+        """
+        position = self.board.to_position(0, self.first_turn, self.locked_pieces) # le joueur a le trait
+        return lambda: self.bot.ponder(position)
+
+    def _bot_apply(self, move: Optional[Tuple[int, int, int, int]]) -> bool:
         """
-        procédure : exécute le tour du bot
+        procédure : applique le coup calculé par le bot (fil de rendu)
+        params :
+            move - coup retourné par _bot_think
         retour : True si le bot a joué avec succès, False si erreur ou fin de partie
         """
         try:
-            Logger.game("Game", "Bot starting its move")
-            move_successful = self.bot.make_move() # la logique du bot met à jour le plateau et vérifie la victoire
+            Logger.game("Game", "Bot playing its move")
+            move_successful = self.bot.apply_move(move) # la logique du bot met à jour le plateau et vérifie la victoire
             
             if not move_successful:
                 if self.game_mode == "Bot":
                     winner_text = "BOT WON THE GAME !"
                 else:
                     winner_text = f"PLAYER 1 WON THE GAME !"
-                self.render.show_end_popup(winner_text)
+                self.notify_game_over(winner_text)
                 self.cleanup()
                 return False
             else:
-                if not self.render.running:
+                if self.render is not None and not self.render.running:
                     if self.game_mode == "Bot":
                         winner_text = "BOT WON THE GAME !"
                     else:
                         winner_text = f"PLAYER 2 WON THE GAME !"
-                    self.render.show_end_popup(winner_text)
+                    self.notify_game_over(winner_text)
                     save_game(self)
-                return False
+                    return False
+                return True # coup joué, la partie continue
         except Exception as e:
             Logger.error("Game", f"Error during bot play: {str(e)}")
-            self.render.edit_info_label(f"Error during bot play: {str(e)}")
+            self.notify_info(f"Error during bot play: {str(e)}")
             self.round_turn = 0 # redonne la main au joueur en cas d'erreur
-            self.render.edit_info_label(f"Player {self.round_turn + 1}'s turn")
-            self.render.needs_render = True
+            self.notify_info(f"Player {self.round_turn + 1}'s turn")
+            self.notify_board_changed()
             return False
 
     def get_board_state(self) -> Dict:
@@ -0,0 +1,482 @@
+from typing import Dict, List, Optional, Tuple
+import math
+import random
+import time
+from src.move_tables import KATERENGA_TARGET_CAMPS, MoveTables, get_move_tables
+from src.zobrist import Position
+from src.bitboard import BitBoard
+from src.parallel import ParallelSearch
+from src.ponder import PonderResult, PonderStats
+from src.utils.logger import Logger
+
+# politiques de simulation disponibles
+PLAYOUT_POLICIES = ("random", "heuristic")
+# constante d'exploration de la formule UCT (racine de 2)
+DEFAULT_EXPLORATION = 1.41
+# les coups sont encodés (case de départ << 7) | case d'arrivée (100 cases < 128)
+MOVE_SHIFT = 7
+MOVE_MASK = (1 << MOVE_SHIFT) - 1
+# itérations maximales d'une réflexion sur le temps de l'adversaire (borne la mémoire de l'arbre)
+PONDER_MAX_ITERATIONS = 200000
+
+def encode_move(from_square: int, to_square: int) -> int:
+    """
+    fonction : encode un déplacement en entier
+    params :
+        from_square - index de la case de départ
+        to_square - index de la case d'arrivée
+    retour : coup encodé
+    """
+    return from_square << MOVE_SHIFT | to_square
+
+def decode_move(move: int) -> Tuple[int, int]:
+    """
+    fonction : décode un coup encodé par encode_move
+    params :
+        move - coup encodé
+    retour : (case de départ, case d'arrivée)
+    """
+    return move >> MOVE_SHIFT, move & MOVE_MASK
+
+def legal_moves(position: Position, tables: MoveTables) -> List[int]:
+    """
+    fonction : coups légaux du joueur qui a le trait, sur le plateau compact (mêmes règles que generate_moves)
+    params :
+        position - position courante
+        tables - tables de déplacements de la disposition
+    retour : liste des coups encodés
+    """
+    compact = position.board
+    player = position.turn
+    own = compact.occupancy[player]
+    occupied = own | compact.occupancy[1 - player]
+    forbidden = occupied if position.first_turn else own
+    cells = compact.cells
+    moves = []
+    for square in compact.pieces(player):
+        if cells[square] > 3 or position.locked >> square & 1:
+            continue # pièce verrouillée dans un camp
+        base = square << MOVE_SHIFT
+        for target in tables.jumps[square]:
+            if not forbidden >> target & 1:
+                moves.append(base | target)
+        for ray in tables.rays[square]:
+            for target in ray:
+                if not forbidden >> target & 1:
+                    moves.append(base | target)
+                if occupied >> target & 1:
+                    break
+        for camp in tables.camp_targets[player][square]:
+            if not forbidden >> camp & 1:
+                moves.append(base | camp)
+    return moves
+
+def camp_mask(player: int) -> int:
+    """
+    fonction : bitboard des deux camps que le joueur doit occuper
+    params :
+        player - joueur (0 ou 1)
+    retour : bitboard des camps adverses sur le plateau 10x10
+    """
+    return sum(1 << (row * 10 + col) for row, col in KATERENGA_TARGET_CAMPS[player])
+
+CAMP_MASKS = (camp_mask(0), camp_mask(1))
+
+class MCTSNode:
+    """
+    classe : noeud de l'arbre de recherche Monte Carlo
+    structure :
+        move - coup encodé qui mène au noeud (None pour la racine)
+        player - joueur qui a joué ce coup
+        hash - hachage de Zobrist de la position atteinte (réutilisation de l'arbre)
+        children - noeuds déjà développés
+        untried - coups pas encore développés (None tant que la position n'a pas été visitée)
+        visits, wins - statistiques du point de vue de player
+    """
+    __slots__ = ("move", "player", "hash", "parent", "children", "untried", "visits", "wins", "terminal")
+
+    def __init__(self, move: Optional[int], player: int, position_hash: int, parent: Optional["MCTSNode"] = None) -> None:
+        """
+        procédure : crée un noeud vide
+        params :
+            move - coup encodé menant au noeud
+            player - joueur qui a joué le coup
+            position_hash - hachage de la position atteinte
+            parent - noeud parent
+        """
+        self.move: Optional[int] = move
+        self.player: int = player
+        self.hash: int = position_hash
+        self.parent: Optional[MCTSNode] = parent
+        self.children: List[MCTSNode] = []
+        self.untried: Optional[List[int]] = None
+        self.visits: int = 0
+        self.wins: float = 0.0
+        self.terminal: Optional[int] = None # vainqueur si la position est finale
+
+    def select_child(self, exploration: float) -> "MCTSNode":
+        """
+        fonction : choisit l'enfant qui maximise la formule UCT
+        params :
+            exploration - constante d'exploration
+        retour : enfant choisi
+        """
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+class MCTS:
+    """
+    classe : recherche arborescente Monte Carlo (sélection UCT) pour le katerenga
+    les simulations sont jouées sur une copie compacte de la position (Position et tables de déplacements),
+    l'arbre est conservé d'un tour à l'autre et repris au noeud de la position courante
+    """
+    def __init__(self, iterations: Optional[int] = None, time_limit: Optional[float] = 1.5,
+                 exploration: float = DEFAULT_EXPLORATION, playout_policy: str = "heuristic",
+                 max_playout_moves: int = 80, seed: Optional[int] = None, workers: int = 1) -> None:
+        """
+        procédure : configure la recherche
+        params :
+            iterations - nombre maximal d'itérations par coup (None : pas de limite)
+            time_limit - temps de réflexion maximal en secondes (None : pas de limite)
+            exploration - constante d'exploration de la formule UCT
+            playout_policy - "random" (coups uniformes) ou "heuristic" (camps, captures et avancée privilégiés)
+            max_playout_moves - nombre de coups au-delà duquel une simulation est arrêtée et évaluée
+            seed - graine du générateur aléatoire (parties reproductibles)
+            workers - nombre de processus (au-delà de 1 : un arbre par processus, parallélisation à la racine)
+        """
+        if playout_policy not in PLAYOUT_POLICIES:
+            raise ValueError(f"Unknown playout policy: {playout_policy}")
+        if iterations is None and time_limit is None:
+            raise ValueError("MCTS needs an iteration or a time budget")
+        self.iterations: Optional[int] = iterations
+        self.time_limit: Optional[float] = time_limit
+        self.exploration: float = exploration
+        self.playout_policy: str = playout_policy
+        self.max_playout_moves: int = max_playout_moves
+        self.rng: random.Random = random.Random(seed)
+        self.root: Optional[MCTSNode] = None
+        self.last_stats: Dict[str, float] = {}
+        self.parallel: Optional[ParallelSearch] = ParallelSearch(workers) if workers > 1 else None
+        self._cancelled: bool = False # demande d'arrêt venue du fil de rendu
+        self._ponder: Optional[PonderResult] = None # réflexion préparée pendant le tour de l'adversaire
+        self.ponder_stats: PonderStats = PonderStats("MCTS")
+
+    def cancel(self) -> None:
+        """
+        procédure : interrompt la recherche en cours (appelée depuis un autre fil), qui choisit parmi les coups déjà explorés
+        """
+        self._cancelled = True
+
+    def reset(self) -> None:
+        """
+        procédure : oublie l'arbre conservé (nouvelle partie)
+        """
+        self.root = None
+
+    def _find_root(self, position: Position) -> MCTSNode:
+        """
+        fonction : reprend le sous-arbre de la position courante s'il existe, sinon crée une racine
+        params :
+            position - position courante
+        retour : racine de la recherche
+        """
+        candidates = [self.root] if self.root is not None else []
+        if self.root is not None:
+            candidates += self.root.children # la position courante suit en général le coup de l'adversaire
+        for node in candidates:
+            if node.hash == position.hash:
+                node.parent = None # libère le reste de l'ancien arbre
+                return node
+        return MCTSNode(None, 1 - position.turn, position.hash)
+
+    def search(self, position: Position) -> Optional[int]:
+        """
+        fonction : cherche le meilleur coup du joueur qui a le trait
+        params :
+            position - position courante (non modifiée)
+        retour : coup encodé le plus visité, ou None si aucun coup n'est possible
+        """
+        self._cancelled = False
+        if self.parallel is not None:
+            return self._parallel_search(position)
+        tables = get_move_tables(position.board)
+        root = self._find_root(position)
+        reused_visits = root.visits
+        if root.untried is None:
+            root.untried = legal_moves(position, tables)
+        if not root.children and not root.untried:
+            self.root = None
+            return None
+
+        time_limit, iterations = self.time_limit, self.iterations
+        budget = time_limit if time_limit is not None else math.inf
+        pondered = self.ponder_stats.check(self._ponder, root.hash, budget)
+        self._ponder = None
+        if pondered is not None:
+            # prédiction réussie : l'effort de la réflexion anticipée sur ce sous-arbre est décompté du budget
+            if time_limit is not None:
+                time_limit = max(0.0, time_limit - pondered.elapsed)
+            if iterations is not None:
+                iterations = max(1, iterations - reused_visits)
+        iteration, playouts, playout_time, elapsed = self._grow(root, position, tables, time_limit, iterations)
+        best = max(root.children, key=lambda child: child.visits)
+        self.root = best # la prochaine recherche repart de ce sous-arbre
+        best.parent = None
+        self._record_stats(iteration, playouts, playouts / playout_time if playout_time else 0.0, elapsed,
+                           reused_visits, best.visits, best.wins)
+        return best.move
+
+    def ponder(self, position: Position) -> None:
+        """
+        procédure : réflexion sur le temps de l'adversaire : fait grandir l'arbre de sa position jusqu'à l'annulation (cancel) ;
+        la réponse la plus visitée est la prédiction, search reprend son sous-arbre si l'adversaire la joue
+        (sans effet avec plusieurs processus : les arbres y sont recréés à chaque coup)
+        params :
+            position - position après le coup du bot, l'adversaire a le trait (instantané pris sur le fil de rendu)
+        """
+        self._cancelled = False
+        self._ponder = None
+        if self.parallel is not None:
+            return
+        tables = get_move_tables(position.board)
+        root = self._find_root(position)
+        if root.untried is None:
+            root.untried = legal_moves(position, tables)
+        if root.terminal is not None or (not root.children and not root.untried):
+            return
+        iteration, _, _, elapsed = self._grow(root, position, tables, None, PONDER_MAX_ITERATIONS)
+        self.root = root
+        predicted = max(root.children, key=lambda child: child.visits)
+        # effort consacré à la réponse prédite : part de ses visites dans la réflexion
+        self._ponder = PonderResult(predicted.move, predicted.hash, [], elapsed * predicted.visits / max(1, root.visits), not self._cancelled)
+        Logger.bot("MCTS", "Pondered %s iterations in %.2fs, predicted reply visited %s times", iteration, elapsed, predicted.visits)
+
+    def _grow(self, root: MCTSNode, position: Position, tables: MoveTables,
+              time_limit: Optional[float], iterations: Optional[int]) -> Tuple[int, int, float, float]:
+        """
+        fonction : fait grandir l'arbre depuis la racine jusqu'à épuisement du budget
+        params :
+            root - racine (statistiques mises à jour)
+            position - position de la racine (non modifiée)
+            tables - tables de déplacements
+            time_limit - temps disponible en secondes (None : pas de limite de temps)
+            iterations - nombre d'itérations (None : pas de limite d'itérations)
+        retour : (itérations, simulations, temps passé en simulation, durée totale)
+        """
+        start_time = time.perf_counter()
+        iteration = 0
+        playout_time = 0.0
+        playouts = 0
+        while iterations is None or iteration < iterations:
+            # au moins une itération, puis arrêt sur annulation ou temps écoulé (vérifié toutes les 16 itérations)
+            if iteration and (self._cancelled or (time_limit is not None and iteration & 15 == 0
+                                                  and time.perf_counter() - start_time >= time_limit)):
+                break
+            iteration += 1
+            state = position.copy()
+            node = root
+
+            # sélection : descente UCT tant que le noeud est entièrement développé
+            while node.terminal is None and not node.untried and node.children:
+                node = node.select_child(self.exploration)
+                state.make_move(*decode_move(node.move))
+
+            # développement : ajout d'un enfant pour un coup non essayé
+            if node.terminal is None and node.untried:
+                move = node.untried.pop(self.rng.randrange(len(node.untried)))
+                player = state.turn
+                state.make_move(*decode_move(move))
+                child = MCTSNode(move, player, state.hash, node)
+                node.children.append(child)
+                child.terminal = self._winner(state, tables, player)
+                if child.terminal == player:
+                    # coup décisif : le joueur qui a le trait le jouera toujours, les autres coups sont abandonnés
+                    node.children = [child]
+                    node.untried = []
+                elif child.terminal is None:
+                    child.untried = legal_moves(state, tables)
+                node = child
+
+            # simulation
+            if node.terminal is not None:
+                winner = node.terminal
+            else:
+                playout_start = time.perf_counter()
+                winner = self._playout(state, tables)
+                playout_time += time.perf_counter() - playout_start
+                playouts += 1
+
+            # rétropropagation : winner est un joueur, ou None pour une simulation arrêtée (nulle)
+            while node is not None:
+                node.visits += 1
+                if winner is None:
+                    node.wins += 0.5
+                elif winner == node.player:
+                    node.wins += 1.0
+                node = node.parent
+        return iteration, playouts, playout_time, time.perf_counter() - start_time
+
+    def _parallel_search(self, position: Position) -> Optional[int]:
+        """
+        fonction : parallélisation à la racine : un arbre indépendant par processus, visites des coups de la racine additionnées
+        (les arbres restent dans les processus : pas de réutilisation entre les tours dans ce mode)
+        params :
+            position - position courante (non modifiée)
+        retour : coup encodé le plus visité au total, ou None si aucun coup n'est possible
+        """
+        self.root = None
+        if not legal_moves(position, get_move_tables(position.board)):
+            return None
+        start_time = time.time()
+        data = position.board.serialize()
+        jobs = [(data, position.turn, position.first_turn, position.locked, start_time, self.iterations, self.time_limit,
+                 self.exploration, self.playout_policy, self.max_playout_moves, self.rng.getrandbits(32))
+                for _ in range(self.parallel.workers)]
+        merged: Dict[int, List[float]] = {}
+        iterations = playouts = 0
+        playouts_per_second = 0.0
+        for children, (worker_iterations, worker_playouts, playout_time, _) in self.parallel.run(root_statistics, jobs):
+            for move, (visits, wins) in children.items():
+                totals = merged.setdefault(move, [0, 0.0])
+                totals[0] += visits
+                totals[1] += wins
+            iterations += worker_iterations
+            playouts += worker_playouts
+            playouts_per_second += worker_playouts / playout_time if playout_time else 0.0 # débit cumulé des processus
+        best_move, (best_visits, best_wins) = max(merged.items(), key=lambda item: item[1][0])
+        self._record_stats(iterations, playouts, playouts_per_second, time.time() - start_time, 0, best_visits, best_wins)
+        return best_move
+
+    def _record_stats(self, iterations: int, playouts: int, playouts_per_second: float, elapsed: float,
+                      reused_visits: int, best_visits: int, best_wins: float) -> None:
+        """
+        procédure : enregistre et affiche les statistiques de la dernière recherche
+        params :
+            iterations - itérations effectuées
+            playouts - simulations jouées
+            playouts_per_second - débit de simulation
+            elapsed - durée de la recherche en secondes
+            reused_visits - visites reprises de l'arbre du tour précédent
+            best_visits, best_wins - statistiques du coup choisi
+        """
+        self.last_stats = {
+            "iterations": iterations,
+            "playouts": playouts,
+            "elapsed": elapsed,
+            "playouts_per_second": playouts_per_second,
+            "iterations_per_second": iterations / elapsed if elapsed else 0.0,
+            "reused_visits": reused_visits,
+            "best_visits": best_visits,
+            "best_win_rate": best_wins / best_visits if best_visits else 0.0
+        }
+        Logger.bot("MCTS", "%s iterations in %.2fs (%.0f playouts/s, %s visits reused), best move visited %s times "
+                           "with win rate %.2f", iterations, elapsed, playouts_per_second, reused_visits, best_visits,
+                   self.last_stats['best_win_rate'])
+
+    def _winner(self, position: Position, tables: MoveTables, player: int) -> Optional[int]:
+        """
+        fonction : vainqueur après le coup d'un joueur (mêmes conditions que Game.check_win)
+        params :
+            position - position après le coup, trait à l'adversaire
+            tables - tables de déplacements
+            player - joueur qui vient de jouer
+        retour : joueur gagnant, ou None si la partie continue
+        """
+        camps = CAMP_MASKS[player]
+        if position.board.occupancy[player] & camps == camps:
+            return player # les deux camps adverses sont occupés
+        if not legal_moves(position, tables):
+            return player # l'adversaire est bloqué
+        return None
+
+    def _playout(self, position: Position, tables: MoveTables) -> Optional[int]:
+        """
+        fonction : joue une partie jusqu'à la fin ou jusqu'à la limite de coups
+        params :
+            position - copie de travail (modifiée)
+            tables - tables de déplacements
+        retour : joueur gagnant, ou None si la simulation a été arrêtée
+        """
+        rng = self.rng
+        heuristic = self.playout_policy == "heuristic"
+        for _ in range(self.max_playout_moves):
+            moves = legal_moves(position, tables)
+            player = position.turn
+            if not moves:
+                return 1 - player # le joueur qui a le trait est bloqué
+            if heuristic:
+                move = self._heuristic_choice(position, moves, player)
+            else:
+                move = moves[rng.randrange(len(moves))]
+            position.make_move(*decode_move(move))
+            camps = CAMP_MASKS[player]
+            if position.board.occupancy[player] & camps == camps:
+                return player
+        return self._adjudicate(position)
+
+    def _heuristic_choice(self, position: Position, moves: List[int], player: int) -> int:
+        """
+        fonction : politique de simulation légère : entrée dans un camp, sinon meilleur de trois coups tirés au hasard
+        params :
+            position - position courante
+            moves - coups légaux
+            player - joueur qui a le trait
+        retour : coup encodé choisi
+        """
+        camps = CAMP_MASKS[player]
+        for move in moves:
+            if camps >> (move & MOVE_MASK) & 1:
+                return move
+        rng = self.rng
+        enemy = position.board.occupancy[1 - player]
+        # ligne d'arrivée : 9 pour le joueur 0, 0 pour le joueur 1
+        direction = 1 if player == 0 else -1
+        best_move, best_value = moves[0], -100
+        for _ in range(3):
+            move = moves[rng.randrange(len(moves))]
+            from_square, to_square = decode_move(move)
+            value = (to_square // 10 - from_square // 10) * direction + (3 if enemy >> to_square & 1 else 0)
+            if value > best_value:
+                best_move, best_value = move, value
+        return best_move
+
+    def _adjudicate(self, position: Position) -> Optional[int]:
+        """
+        fonction : départage une simulation arrêtée à la limite de coups
+        params :
+            position - position finale de la simulation
+        retour : joueur avec nettement plus de pièces et de camps occupés, ou None (nulle)
+        """
+        scores = []
+        for player in (0, 1):
+            own = position.board.occupancy[player]
+            scores.append(own.bit_count() + 2 * (own & CAMP_MASKS[player]).bit_count())
+        if scores[0] >= scores[1] + 2:
+            return 0
+        if scores[1] >= scores[0] + 2:
+            return 1
+        return None
+
+def root_statistics(data: bytes, turn: int, first_turn: bool, locked: int, start_time: float,
+                    iterations: Optional[int], time_limit: Optional[float], exploration: float, playout_policy: str,
+                    max_playout_moves: int, seed: int) -> Tuple[Dict[int, Tuple[int, float]], Tuple[int, int, float, float]]:
+    """
+    fonction : recherche exécutée dans un processus de ParallelSearch sur un arbre indépendant
+    params :
+        data - plateau compact sérialisé (BitBoard.serialize)
+        turn, first_turn, locked - reste de l'état de la position
+        start_time - début de la réflexion dans le processus du jeu (time.time)
+        iterations, time_limit, exploration, playout_policy, max_playout_moves - réglages de MCTS
+        seed - graine propre au processus
+    retour : (visites et victoires de chaque coup de la racine, compteurs de MCTS._grow)
+    """
+    search = MCTS(iterations, time_limit, exploration, playout_policy, max_playout_moves, seed)
+    position = Position(BitBoard.deserialize(data), turn, first_turn, locked)
+    tables = get_move_tables(position.board)
+    root = MCTSNode(None, 1 - turn, position.hash)
+    root.untried = legal_moves(position, tables)
+    # le temps de démarrage du processus est décompté du budget
+    remaining = None if time_limit is None else max(0.0, time_limit - (time.time() - start_time))
+    counters = search._grow(root, position, tables, remaining, iterations)
+    return {child.move: (child.visits, child.wins) for child in root.children}, counters
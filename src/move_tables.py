@@ -0,0 +1,156 @@
+from typing import Dict, List, Tuple
+from src.bitboard import BitBoard
+from src.utils.logger import Logger
+
+# décalages des déplacements par type de case (voir src/moves.py)
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+KNIGHT_OFFSETS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+KING_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# camps du katerenga (plateau 10x10) : camps à atteindre par chaque joueur
+KATERENGA_TARGET_CAMPS = {0: ((9, 0), (9, 9)), 1: ((0, 0), (0, 9))}
+# lignes depuis lesquelles chaque joueur peut entrer dans un camp adverse
+KATERENGA_CAMP_ROWS = {0: (8, 9), 1: (0, 1)}
+
+class MoveTables:
+    """
+    classe : tables de déplacements précalculées pour une disposition de couleurs donnée
+    structure :
+        rays[square] - rayons glissants (tour, fou) déjà coupés à la première case rouge/jaune incluse
+        jumps[square] - cases atteignables par saut (cavalier, roi)
+        camp_targets[player][square] - camps adverses atteignables depuis la case (katerenga uniquement)
+    les cases grises et les camps du katerenga ne figurent jamais dans rays ni jumps
+    """
+    def __init__(self, compact: BitBoard) -> None:
+        """
+        procédure : précalcule les tables pour la disposition du plateau compact donné
+        params :
+            compact - plateau compact dont seule la couche des couleurs est utilisée
+        """
+        self.size: int = compact.size
+        square_count = self.size * self.size
+        self.rays: List[Tuple[Tuple[int, ...], ...]] = [()] * square_count
+        self.jumps: List[Tuple[int, ...]] = [()] * square_count
+        self.camp_targets: Dict[int, List[Tuple[int, ...]]] = {0: [()] * square_count, 1: [()] * square_count}
+
+        for square in range(square_count):
+            row, col = divmod(square, self.size)
+            match compact.cell_type(square):
+                case 0:
+                    self.rays[square] = self._build_rays(compact, row, col, ROOK_DIRECTIONS, 0)
+                case 1:
+                    self.jumps[square] = self._build_jumps(compact, row, col, KNIGHT_OFFSETS)
+                case 2:
+                    self.jumps[square] = self._build_jumps(compact, row, col, KING_OFFSETS)
+                case 3:
+                    self.rays[square] = self._build_rays(compact, row, col, BISHOP_DIRECTIONS, 3)
+
+        if self.size == 10:
+            for player in (0, 1):
+                camps = tuple(row * self.size + col for row, col in KATERENGA_TARGET_CAMPS[player])
+                for row in KATERENGA_CAMP_ROWS[player]:
+                    for col in range(1, self.size - 1):
+                        self.camp_targets[player][row * self.size + col] = camps
+
+    def _is_destination(self, compact: BitBoard, row: int, col: int) -> bool:
+        """
+        fonction : vérifie qu'une case peut être atteinte par un déplacement géométrique
+        params :
+            compact - plateau compact
+            row - ligne de la case
+            col - colonne de la case
+        retour : True si la case est sur le plateau et colorée (ni bord gris ni camp)
+        """
+        if not (0 <= row < self.size and 0 <= col < self.size):
+            return False
+        cell_type = compact.cell_type(row * self.size + col)
+        return cell_type is not None and cell_type <= 3
+
+    def _build_rays(self, compact: BitBoard, row: int, col: int, directions: Tuple[Tuple[int, int], ...], stop_type: int) -> Tuple[Tuple[int, ...], ...]:
+        """
+        fonction : construit les rayons d'une pièce glissante
+        params :
+            compact - plateau compact
+            row - ligne de départ
+            col - colonne de départ
+            directions - directions de glissement
+            stop_type - type de case sur lequel le glissement s'arrête (0 : rouge, 3 : jaune)
+        retour : tuple de rayons, chaque rayon étant le tuple ordonné des cases traversées
+        """
+        rays = []
+        for d_row, d_col in directions:
+            ray = []
+            r, c = row + d_row, col + d_col
+            while self._is_destination(compact, r, c):
+                ray.append(r * self.size + c)
+                # on doit s'arrêter à la première case de la couleur de la pièce
+                if compact.cell_type(r * self.size + c) == stop_type:
+                    break
+                r, c = r + d_row, c + d_col
+            if ray:
+                rays.append(tuple(ray))
+        return tuple(rays)
+
+    def _build_jumps(self, compact: BitBoard, row: int, col: int, offsets: Tuple[Tuple[int, int], ...]) -> Tuple[int, ...]:
+        """
+        fonction : construit la liste des sauts d'une pièce
+        params :
+            compact - plateau compact
+            row - ligne de départ
+            col - colonne de départ
+            offsets - décalages (cavalier ou roi)
+        retour : tuple des cases atteignables
+        """
+        return tuple((row + d_row) * self.size + (col + d_col) for d_row, d_col in offsets
+                     if self._is_destination(compact, row + d_row, col + d_col))
+
+    def attacks(self, square: int, occupied: int) -> List[int]:
+        """
+        fonction : cases atteintes par la pièce d'une case, en incluant la première pièce bloquante
+        params :
+            square - index de la case de départ
+            occupied - bitboard de toutes les cases occupées
+        retour : liste des cases attaquées (sans tenir compte du propriétaire des pièces)
+        """
+        targets = list(self.jumps[square])
+        for ray in self.rays[square]:
+            for target in ray:
+                targets.append(target)
+                if occupied >> target & 1:
+                    break
+        return targets
+
+    def destinations(self, square: int, player: int, compact: BitBoard) -> List[int]:
+        """
+        fonction : destinations d'une pièce (recherche dans la table puis contrôle de l'occupation)
+        params :
+            square - index de la case de départ
+            player - propriétaire de la pièce (0 ou 1)
+            compact - plateau compact courant
+        retour : liste des cases d'arrivée, captures comprises, hors cases alliées
+        """
+        own = compact.occupancy[player]
+        occupied = own | compact.occupancy[1 - player]
+        targets = [target for target in self.attacks(square, occupied) if not own >> target & 1]
+        for camp in self.camp_targets[player][square]:
+            if not own >> camp & 1:
+                targets.append(camp)
+        return targets
+
+_TABLES_CACHE: Dict[bytes, MoveTables] = {}
+
+def get_move_tables(compact: BitBoard) -> MoveTables:
+    """
+    fonction : retourne les tables de déplacements d'une disposition, calculées une seule fois par disposition
+    params :
+        compact - plateau compact (la clé de cache est sa couche des types de case)
+    retour : tables de déplacements partagées
+    """
+    key = bytes(compact.cells)
+    tables = _TABLES_CACHE.get(key)
+    if tables is None:
+        Logger.board("MoveTables", "Building move tables for a new %sx%s layout", compact.size, compact.size)
+        tables = MoveTables(compact)
+        _TABLES_CACHE[key] = tables
+    return tables
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from src.bitboard import BitBoard
+from src.move_tables import get_move_tables
 from src.utils.logger import Logger
 
 def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int, dRow: int, dCol: int) -> bool:
@@ -12,13 +14,13 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
         dCol - colonne d'arrivée
     retour : bool indiquant si le déplacement est valide
     """
-    Logger.move("Moves", f"Checking move from ({iRow},{iCol}) to ({dRow},{dCol})")
+    Logger.move("Moves", "Checking move from (%s,%s) to (%s,%s)", iRow, iCol, dRow, dCol)
     
     initial = board[iRow][iCol]
     destination = board[dRow][dCol]
     
     if destination[0] is not None and destination[0] == initial[0]:
-        Logger.warning("Moves", f"Invalid move: destination cell ({dRow},{dCol}) is occupied by your own piece")
+        Logger.move("Moves", "Invalid move: destination cell (%s,%s) is occupied by your own piece", dRow, dCol)
         return False
     
     if len(board) == 10: # katerenga uniquement (vérification mauvaise à long terme si on ajoute d'autres jeux, ça serait mieux de passer l'objet de board pour faire board.game_number)
@@ -28,7 +30,7 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
         # vérification des cases grises (bord du plateau)
         is_edge = (dRow == 0 or dRow == 9 or dCol == 0 or dCol == 9)
         if is_edge and (dRow, dCol) not in camps:
-            Logger.warning("Moves", "Invalid move: cannot move to gray edge cells except opponent camps")
+            Logger.move("Moves", "Invalid move: cannot move to gray edge cells except opponent camps")
             return False
 
         # verifie si la pièce de départ est dans un camp adverse
@@ -43,7 +45,7 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
                 
             # si le camp appartient au joueur adverse de la pièce, le mouvement est invalide
             if camp_player is not None and camp_player != player:
-                Logger.warning("Moves", "Invalid move: cannot move pieces out of opponent camps")
+                Logger.move("Moves", "Invalid move: cannot move pieces out of opponent camps")
                 return False
 
         # vérification spéciale pour le déplacement vers un camp adverse
@@ -61,20 +63,20 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
                     is_on_allowed_line = True
 
             if not is_on_allowed_line:
-                Logger.warning("Moves", "Invalid move: can only access opponent camps from the last two lines")
+                Logger.move("Moves", "Invalid move: can only access opponent camps from the last two lines")
                 return False
 
             if destination[0] is not None and destination[0] == player:
-                Logger.warning("Moves", "Invalid move: camp is occupied by your own piece")
+                Logger.move("Moves", "Invalid move: camp is occupied by your own piece")
                 return False
-            Logger.success("Moves", "Valid move to opponent camp from allowed lines")
+            Logger.move("Moves", "Valid move to opponent camp from allowed lines")
             return True
 
     # si la destination n'est pas un camp, on vérifie les règles de mouvement normales
     match initial[1]:
         case 0:
             if iRow != dRow and iCol != dCol:
-                Logger.warning("Moves", "Invalid Rook move: must move in straight line")
+                Logger.move("Moves", "Invalid Rook move: must move in straight line")
                 return False
                 
             if iRow != dRow:
@@ -85,12 +87,12 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
                 while row != dRow:
                     # s'il y a une pièce sur le chemin
                     if board[row][iCol][0] is not None:
-                        Logger.warning("Moves", f"Invalid Rook move: path blocked at ({row},{iCol})")
+                        Logger.move("Moves", "Invalid Rook move: path blocked at (%s,%s)", row, iCol)
                         return False
                     
                     # si on rencontre une case rouge, on doit s'arrêter à cette case
                     if board[row][iCol][1] == 0:
-                        Logger.warning("Moves", f"Invalid Rook move: must stop at the first red cell at ({row},{iCol})")
+                        Logger.move("Moves", "Invalid Rook move: must stop at the first red cell at (%s,%s)", row, iCol)
                         return False
                     
                     row += step
@@ -103,36 +105,36 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
                 while col != dCol:
                     # s'il y a une pièce sur le chemin
                     if board[iRow][col][0] is not None:
-                        Logger.warning("Moves", f"Invalid Rook move: path blocked at ({iRow},{col})")
+                        Logger.move("Moves", "Invalid Rook move: path blocked at (%s,%s)", iRow, col)
                         return False
                     
                     # si on rencontre une case rouge, on doit s'arrêter à cette case
                     if board[iRow][col][1] == 0:
-                        Logger.warning("Moves", f"Invalid Rook move: must stop at the first red cell at ({iRow},{col})")
+                        Logger.move("Moves", "Invalid Rook move: must stop at the first red cell at (%s,%s)", iRow, col)
                         return False
                     
                     col += step
             
-            Logger.success("Moves", "Valid Rook move")
+            Logger.move("Moves", "Valid Rook move")
             return True
             
         # case verte - déplacement comme un cavalier (Knight)
         case 1:
             valid = (abs(dRow - iRow) == 2 and abs(dCol - iCol) == 1) or \
                    (abs(dRow - iRow) == 1 and abs(dCol - iCol) == 2)
-            Logger.success("Moves", "Valid Knight move") if valid else Logger.warning("Moves", "Invalid Knight move")
+            Logger.move("Moves", "%s Knight move", "Valid" if valid else "Invalid")
             return valid
             
         # case bleue - déplacement comme un roi (King)
         case 2:
             valid = abs(dRow - iRow) <= 1 and abs(dCol - iCol) <= 1
-            Logger.success("Moves", "Valid King move") if valid else Logger.warning("Moves", "Invalid King move")
+            Logger.move("Moves", "%s King move", "Valid" if valid else "Invalid")
             return valid
             
         # case jaune - déplacement comme un fou (Bishop), arrêt à la première case jaune rencontrée
         case 3:
             if abs(dRow - iRow) != abs(dCol - iCol):
-                Logger.warning("Moves", "Invalid Bishop move: must move diagonally")
+                Logger.move("Moves", "Invalid Bishop move: must move diagonally")
                 return False
                 
             step_row = 1 if dRow > iRow else -1
@@ -145,12 +147,12 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
             while row != dRow and col != dCol:
                 # s'il y a une pièce sur le chemin
                 if board[row][col][0] is not None:
-                    Logger.warning("Moves", f"Invalid Bishop move: path blocked at ({row},{col})")
+                    Logger.move("Moves", "Invalid Bishop move: path blocked at (%s,%s)", row, col)
                     return False
                 
                 # si on rencontre une case jaune, on doit s'arrêter à cette case
                 if board[row][col][1] == 3:
-                    Logger.warning("Moves", f"Invalid Bishop move: must stop at the first yellow cell at ({row},{col})")
+                    Logger.move("Moves", "Invalid Bishop move: must stop at the first yellow cell at (%s,%s)", row, col)
                     return False
                 
                 row += step_row
@@ -160,20 +162,64 @@ def available_move(board: List[List[List[Optional[int]]]], iRow: int, iCol: int,
             # vérifier si la destination elle-même est une case jaune
             if destination[1] == 3:
                 # c'est valide de s'arrêter sur une case jaune
-                Logger.success("Moves", "Valid Bishop move")
+                Logger.move("Moves", "Valid Bishop move")
                 return True
             
             row, col = iRow + step_row, iCol + step_col
             while row != dRow and col != dCol:
                 if board[row][col][1] == 3:
-                    Logger.warning("Moves", f"Invalid Bishop move: must stop at the first yellow cell at ({row},{col})")
+                    Logger.move("Moves", "Invalid Bishop move: must stop at the first yellow cell at (%s,%s)", row, col)
                     return False
                 row += step_row
                 col += step_col
             
-            Logger.success("Moves", "Valid Bishop move")
+            Logger.move("Moves", "Valid Bishop move")
             return True
             
-    Logger.error("Moves", f"Invalid cell color: {initial[1]}")
+    Logger.error("Moves", "Invalid cell color: %s", initial[1])
     return False
-                
\ No newline at end of file
+
+
+def generate_moves(board: Union[List[List[List[Optional[int]]]], BitBoard], player: int, first_turn: bool = False,
+                   locked_pieces: Optional[Sequence[Sequence[int]]] = None, captures: bool = True) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    fonction : génère directement les coups légaux d'un joueur en parcourant les rayons et sauts précalculés
+    params :
+        board - plateau de jeu (listes imbriquées ou plateau compact)
+        player - joueur dont on génère les coups (0 ou 1)
+        first_turn - si True, aucune capture n'est autorisée (premier tour du katerenga)
+        locked_pieces - positions (row, col) des pièces verrouillées qui ne peuvent plus bouger
+        captures - si False, seules les cases vides sont des destinations (congress)
+    retour : itérateur de tuples (from_row, from_col, to_row, to_col)
+    règles : mêmes règles que available_move, avec celles appliquées par les jeux :
+        - katerenga : les pièces dans un camp ne bougent plus, seuls les camps adverses sont accessibles
+        - pas de capture au premier tour ni quand captures est False
+    """
+    compact = board if isinstance(board, BitBoard) else BitBoard.from_board(board)
+    tables = get_move_tables(compact)
+    size = compact.size
+    own = compact.occupancy[player]
+    enemy = compact.occupancy[1 - player]
+    occupied = own | enemy
+    # cases interdites comme destination : alliées, et adverses si la capture n'est pas permise
+    forbidden = own if captures and not first_turn else occupied
+    locked = {row * size + col for row, col in locked_pieces} if locked_pieces else set()
+
+    for square in compact.pieces(player):
+        # une pièce dans un camp (type 4 ou 5) est verrouillée
+        if square in locked or compact.cells[square] > 3:
+            continue
+        from_row, from_col = divmod(square, size)
+        for target in tables.jumps[square]:
+            if not forbidden >> target & 1:
+                yield from_row, from_col, target // size, target % size
+        for ray in tables.rays[square]:
+            for target in ray:
+                if not forbidden >> target & 1:
+                    yield from_row, from_col, target // size, target % size
+                if occupied >> target & 1:
+                    break
+        for camp in tables.camp_targets[player][square]:
+            if not forbidden >> camp & 1:
+                yield from_row, from_col, camp // size, camp % size
+
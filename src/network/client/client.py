@@ -6,8 +6,9 @@ from typing import Optional, Callable, Dict, Any, List
 from pathlib import Path
 from src.network.common.packets import (
     PacketType, create_connect_dict, create_game_action_dict, create_chat_send_dict,
-    create_get_game_list_dict
+    create_get_game_list_dict, create_protocol_request_dict, create_sync_request_dict, create_game_state_dict
 )
+from src.network.common.wire import PROTOCOL_BINARY, PROTOCOL_JSON, PROTOCOLS, PacketDecoder, encode_packet
 from src.utils.logger import Logger
 
 class NetworkClient:
@@ -27,7 +28,8 @@ class NetworkClient:
         self.is_my_turn = False # indique si c'est le tour du joueur
         self.opponent_connected = False # indique si un adversaire est connecté
         self.handlers: Dict[str, Callable] = {} # dictionnaire des gestionnaires d'événements
-        self.receive_buffer = b"" # buffer de réception des messages
+        self.decoder = PacketDecoder() # tampon de réception des messages (lignes JSON ou trames binaires)
+        self.protocol = PROTOCOL_JSON # format d'envoi, binaire une fois accepté par le serveur
         Logger.initialize()
 
     def _load_config(self):
@@ -42,12 +44,14 @@ class NetworkClient:
                 config = json.load(f)
                 self.host = config['host']
                 self.port = config['port']
+                self.preferred_protocol = config.get('protocol', PROTOCOL_JSON) # format proposé au serveur
                 Logger.info("NetworkClient", f"Config loaded from {config_path.resolve()}: host={self.host}, port={self.port}")
         except Exception as e:
             Logger.error("NetworkClient", f"Failed to load config: {str(e)}")
             # données brut si le fichier de configuration n'est pas trouvé
             self.host = "127.0.0.1"
             self.port = 5000    
+            self.preferred_protocol = PROTOCOL_JSON
             Logger.warning("NetworkClient", f"Using default config: host={self.host}, port={self.port}")
 
     def connect(self, player_name: str, game_name: str, game_type: str) -> bool:
@@ -72,6 +76,7 @@ class NetworkClient:
             # démarrage du thread de réception des messages *après* la connexion de la socket
             self.listen_thread = threading.Thread(target=self._listen_for_messages, daemon=True)
             self.listen_thread.start()
+            self._negotiate_protocol()
             # envoi du paquet initial CONNECT
             connect_dict = create_connect_dict(player_name, game_name, game_type)
             if not self._send_json(connect_dict):
@@ -142,12 +147,21 @@ class NetworkClient:
         self.game_id = None
         self.player_number = None
         self.opponent_connected = False
-        self.receive_buffer = b"" 
+        self.decoder = PacketDecoder()
+        self.protocol = PROTOCOL_JSON
         self.listen_thread = None
 
+    def _negotiate_protocol(self):
+        """
+        procédure : propose le format binaire au serveur ; les paquets restent en JSON jusqu'à sa réponse
+        (un serveur qui ne connaît pas le paquet PROTOCOL l'ignore et l'échange reste en JSON)
+        """
+        if self.preferred_protocol == PROTOCOL_BINARY:
+            self._send_json(create_protocol_request_dict([PROTOCOL_BINARY, PROTOCOL_JSON]))
+
     def _send_json(self, packet_dict: Dict) -> bool:
         """
-        procédure : envoie un paquet au serveur
+        procédure : envoie un paquet au serveur, en JSON ou en trame binaire selon le format négocié
         params :
             packet - paquet à envoyer
         """
@@ -155,10 +169,9 @@ class NetworkClient:
             Logger.error("NetworkClient", "Cannot send: not connected.")
             return False
         try:
-            json_string = json.dumps(packet_dict) # dumps : convertit un dictionnaire en chaîne de caractères JSON
-            message_to_send = (json_string + '\n').encode('utf-8') # ajout d'un saut de ligne et conversion en bytes
+            message_to_send = encode_packet(packet_dict, self.protocol) # encodage du paquet (ligne JSON ou trame binaire)
             self.socket.sendall(message_to_send) # envoi du message au serveur
-            Logger.info("NetworkClient", f"Sent JSON: {json_string}")
+            Logger.info("NetworkClient", "Sent %s packet (%d bytes): %s", self.protocol, len(message_to_send), packet_dict)
             return True
         except BrokenPipeError:
              Logger.warning("NetworkClient", "Failed to send: Broken pipe (server likely disconnected)")
@@ -182,6 +195,30 @@ class NetworkClient:
         if self._send_json(action_dict): # envoi de l'action au serveur
             Logger.info("NetworkClient", f"Sent game action as Player {self.player_number}: {action}")
         
+    def send_sync_request(self, seq: int):
+        """
+        procédure : demande à l'adversaire un instantané de la partie (coup manqué ou état divergent)
+        params :
+            seq - numéro du dernier coup appliqué localement
+        """
+        if not self.connected or not self.game_id:
+            Logger.error("NetworkClient", "Cannot request snapshot: not in a game")
+            return
+        if self._send_json(create_sync_request_dict(seq)):
+            Logger.info("NetworkClient", f"Requested game snapshot after move {seq}")
+
+    def send_game_state(self, state: Dict[str, Any]):
+        """
+        procédure : envoie un instantané de la partie à l'adversaire (réponse à une demande, hors tour)
+        params :
+            state - instantané (board_state, seq, hash)
+        """
+        if not self.connected or not self.game_id:
+            Logger.error("NetworkClient", "Cannot send snapshot: not in a game")
+            return
+        if self._send_json(create_game_state_dict(state, self.game_id)):
+            Logger.info("NetworkClient", f"Sent game snapshot at move {state.get('seq')}")
+
     def _can_send_action(self) -> bool:
         """
         fonction : vérifie si le client est dans un état où il peut envoyer une action de jeu
@@ -212,21 +249,16 @@ class NetworkClient:
                     self.disconnect("Server closed connection")
                     break 
                 
-                self.receive_buffer += chunk
-                
-                while b'\n' in self.receive_buffer: # traitement du buffer pour les messages complets
-                    message_bytes, self.receive_buffer = self.receive_buffer.split(b'\n', 1) # séparation du message en bytes et mise à jour du buffer
-                    message_string = message_bytes.decode('utf-8').strip() # conversion en chaîne de caractères et suppression des espaces
-                    
-                    if not message_string:
-                        continue 
-                        
-                    Logger.info("NetworkClient", f"Received Raw JSON: {message_string}")
+                try:
+                    packets = self.decoder.feed(chunk) # décodage des paquets complets du tampon
+                except ValueError as e: # le paquet invalide est retiré du tampon, la réception continue
+                    Logger.error("NetworkClient", f"Invalid packet received: {e}")
+                    continue
+
+                for packet_dict, size in packets:
+                    Logger.info("NetworkClient", "Received packet (%d bytes): %s", size, packet_dict)
                     try:
-                        packet_dict = json.loads(message_string) # conversion en dictionnaire
                         self._handle_packet_dict(packet_dict) # traitement du paquet
-                    except json.JSONDecodeError:
-                        Logger.error("NetworkClient", f"Invalid JSON received: {message_string}")
                     except Exception as e:
                         Logger.error("NetworkClient", f"Error handling packet dict: {e}")
                         
@@ -289,6 +321,8 @@ class NetworkClient:
                 PacketType.DISCONNECT: self._handle_disconnect, # Server forcing disconnect
                 PacketType.CHAT_RECEIVE: self._handle_chat_message,
                 PacketType.GAME_LIST: self._handle_game_list,
+                PacketType.PROTOCOL: self._handle_protocol,
+                PacketType.SYNC_REQUEST: self._handle_sync_request,
             }
             
             if packet_type_enum in handlers:
@@ -333,6 +367,10 @@ class NetworkClient:
         Logger.info("NetworkClient", f"Received game state update: {packet_data}")
         self.call_handler("game_state", packet_data)
 
+    def _handle_sync_request(self, packet_data: Dict):
+        Logger.info("NetworkClient", f"Opponent requested a game snapshot: {packet_data}")
+        self.call_handler("sync_request", packet_data)
+
     def _handle_player_disconnected(self, packet_data: Dict):
         message = packet_data.get("message", "Other player disconnected")
         self.opponent_connected = False  # l'adversaire s'est déconnecté
@@ -361,6 +399,15 @@ class NetworkClient:
         Logger.info("NetworkClient", f"Received chat message from Player {player_number} ({sender_name}): {message}")
         self.call_handler("chat_message", packet_data)
 
+    def _handle_protocol(self, packet_data: Dict):
+        """
+        procédure : traite la réponse du serveur à la négociation du format d'échange
+        """
+        protocol = packet_data.get("protocol")
+        if protocol in PROTOCOLS:
+            self.protocol = protocol
+            Logger.info("NetworkClient", f"Server accepted protocol: {protocol}")
+
     def _handle_game_list(self, packet_data: Dict):
         """
         procédure : traite le paquet GAME_LIST
@@ -432,6 +479,7 @@ class NetworkClient:
             
             self.listen_thread = threading.Thread(target=self._listen_for_messages, daemon=True)
             self.listen_thread.start()
+            self._negotiate_protocol()
             
             return True
             
@@ -2,11 +2,18 @@ import pygame
 from src.network.client.client import NetworkClient
 from src.utils.logger import Logger
 from src.saves import save_game
+from src.bot_worker import BotWorker, BOT_MOVE_EVENT
+from src.game_state import GAME_TYPES, Move, Observable, play_move
+from src.windows.render.observer import RenderObserver
 import json
 import random
 from typing import Optional, Dict, List
 
-class GameBase:
+# un coup réseau sur SNAPSHOT_INTERVAL transporte l'état complet du jeu (resynchronisation périodique) ;
+# les autres ne transportent que le coup, rejoué par l'adversaire avec les règles du jeu
+SNAPSHOT_INTERVAL = 16
+
+class GameBase(Observable):
     """
     classe : base commune pour tous les jeux réseau ou locaux
     gère la connexion réseau, l'état de base du jeu et les interactions communes.
@@ -31,15 +38,19 @@ class GameBase:
         self.player_number = None # 1 ou 2 en mode réseau
         self.is_my_turn = False # true si c'est le tour du joueur local en réseau
         self.network_client = None # client réseau
-        self.render = None # référence à l'objet render (doit être défini par la sous-classe)
+        self.render = None # référence à l'objet render (défini par la sous-classe, None pour une partie sans affichage)
         self.selected_piece = None # pièce sélectionnée (utilisé par certaines sous-classes)
         #self.status_message = "" # message affiché à l'utilisateur (plus utilisé merci d'utiliser infobar)
         self.status_color = (0, 0, 0) # couleur du message
         self.game_id = None # id unique de la partie réseau
         self._bot_timer_set = False # flag pour le timer du bot
+        self.bot_worker = BotWorker() # réflexion du bot hors de la boucle de rendu
+        self.ponder_enabled = game_mode == "Bot" # le bot réfléchit aussi pendant le tour du joueur
         self.chat_messages = [] # historique des messages du chat
         self.chat_input = "" # contenu actuel de l'input du chat
         self.chat_active = False # indique si l'input du chat est actuellement actif
+        self.network_seq = 0 # numéro du dernier coup réseau joué ou reçu
+        self.awaiting_snapshot = False # état local divergent : les coups sont bloqués jusqu'à l'instantané demandé
         
         self.game_type = game_type
         
@@ -50,6 +61,32 @@ class GameBase:
                 Logger.warning("GameBase", f"No player name provided for network game, using default: {self.local_player_name}")
             self.setup_network()
 
+    @property
+    def render(self):
+        """
+        fonction : affichage pygame de la partie.
+
+        retour:
+            Render ou None si la partie tourne sans affichage.
+        """
+        return getattr(self, '_render', None)
+
+    @render.setter
+    def render(self, render):
+        """
+        procédure : remplace l'affichage et l'abonne aux événements de la partie.
+
+        params:
+            render: instance de Render, ou None pour une partie sans affichage.
+        """
+        observer = getattr(self, '_render_observer', None)
+        if observer is not None:
+            self.unsubscribe(observer)
+        self._render = render
+        self._render_observer = RenderObserver(render) if render is not None else None
+        if self._render_observer is not None:
+            self.subscribe(self._render_observer)
+
     def setup_network(self):
         """
         procédure : initialise et configure la connexion réseau.
@@ -70,14 +107,12 @@ class GameBase:
         Logger.info("GameBase", f"Connecting to server for game '{game_name}' as player '{self.local_player_name}' (type: {self.game_type})")
         if not self.network_client.connect(self.local_player_name, game_name, self.game_type):
             Logger.error("GameBase", "Failed to connect to the game server")
-            if self.render:
-                self.render.edit_info_label("Connection failed!")
+            self.notify_info("Connection failed!")
             self.cleanup()
             return
             
         Logger.info("GameBase", "Connected to game server, waiting for assignment...")
-        if self.render:
-            self.render.edit_info_label("Connected, waiting for player assignment...")
+        self.notify_info("Connected, waiting for player assignment...")
 
     def _register_network_handlers(self):
         """
@@ -92,6 +127,8 @@ class GameBase:
         self.network_client.register_handler("game_action", self.on_network_action)
         self.network_client.register_handler("player_disconnected", self.on_player_disconnected)
         self.network_client.register_handler("chat_message", self.on_chat_message)
+        self.network_client.register_handler("game_state", self.on_game_state)
+        self.network_client.register_handler("sync_request", self.on_sync_request)
         # ajouter d'autres handlers si nécessaire (ex: "game_over", "chat_message")
 
     def on_player_assignment(self, data: Dict):
@@ -114,18 +151,15 @@ class GameBase:
             else:
                  status += "Waiting for Player 1..."
                  
-            if self.render:
-                self.render.edit_info_label(status)
+            self.notify_info(status)
             Logger.info("GameBase", f"Assigned as Player {self.player_number} in game {self.game_id}. My turn: {self.is_my_turn}")
-            if self.render: self.render.needs_render = True
+            self.notify_board_changed()
         except KeyError as e:
             Logger.error("GameBase", f"Received invalid player assignment data: {data}. Missing key: {e}")
-            if self.render:
-                self.render.edit_info_label("Error receiving player assignment!")
+            self.notify_info("Error receiving player assignment!")
         except Exception as e:
             Logger.error("GameBase", f"Error in on_player_assignment: {e}")
-            if self.render:
-                self.render.edit_info_label("Error processing player assignment!")
+            self.notify_info("Error processing player assignment!")
 
     def on_turn_started(self, data: Optional[Dict] = None):
         """
@@ -134,9 +168,8 @@ class GameBase:
         """
         self.game_started = True # confirme que le jeu est actif
         self.is_my_turn = True
-        if self.render:
-            self.render.edit_info_label(f"Your turn (Player {self.player_number})")
-            self.render.needs_render = True # rafraîchit pour indiquer que c'est notre tour
+        self.notify_info(f"Your turn (Player {self.player_number})")
+        self.notify_board_changed() # rafraîchit pour indiquer que c'est notre tour
         Logger.info("GameBase", f"Turn started for Player {self.player_number}")
 
     def on_turn_ended(self, data: Optional[Dict] = None):
@@ -147,9 +180,8 @@ class GameBase:
         self.game_started = True
         self.is_my_turn = False
         other_player = 2 if self.player_number == 1 else 1
-        if self.render:
-            self.render.edit_info_label(f"Player {other_player}'s turn")
-            self.render.needs_render = True # rafraîchit pour indiquer l'attente
+        self.notify_info(f"Player {other_player}'s turn")
+        self.notify_board_changed() # rafraîchit pour indiquer l'attente
         Logger.info("GameBase", f"Turn ended for Player {self.player_number}")
 
     def on_network_action(self, action_data: Dict):
@@ -165,16 +197,175 @@ class GameBase:
         # pour traiter les actions spécifiques à leur jeu.
         # exemple: mettre à jour self.board.board, self.round_turn, etc.
         
-        # tentative de mise à jour générique si la sous-classe n'a pas traité l'action
-        if "board_state" in action_data:
-            processed = self.update_board_from_state(action_data["board_state"])
-            if processed:
-                Logger.info("GameBase", "Generic board update applied.")
-                if self.render: self.render.needs_render = True
-            else:
-                 Logger.warning("GameBase", "Received action with board_state, but generic update failed or was skipped.")
+        # mise à jour générique si la sous-classe n'a pas traité l'action
+        if self.apply_network_action(action_data):
+            Logger.info("GameBase", "Generic board update applied.")
+            self.notify_board_changed()
         else:
-            Logger.warning("GameBase", "Received network action was not processed by subclass and lacks 'board_state'.")
+            Logger.warning("GameBase", "Received network action could not be applied, waiting for a snapshot.")
+
+    def apply_network_action(self, action_data: Dict) -> bool:
+        """
+        fonction : applique au jeu local un coup reçu de l'adversaire.
+        un coup accompagné de 'board_state' est un instantané qui remplace l'état local ; sinon seul le coup est reçu,
+        il est rejoué par les règles du jeu (captures et verrous compris) puis vérifié par le hachage de la position.
+        un coup manqué ou un état divergent déclenche une demande d'instantané.
+
+        params:
+            action_data: dictionnaire de l'action ('seq', 'hash', le coup, optionnellement 'board_state').
+
+        retour:
+            bool: True si l'état local est à jour, False si un instantané a été demandé.
+        """
+        seq = action_data.get("seq")
+        if action_data.get("board_state") is not None:
+            return self._apply_snapshot(action_data["board_state"], seq, action_data.get("hash"))
+
+        if seq != self.network_seq + 1:
+            Logger.warning("GameBase", f"Missed network move: expected {self.network_seq + 1}, received {seq}")
+            self.request_snapshot()
+            return False
+
+        player = 2 - self.player_number # l'adversaire vient de jouer
+        move = self._network_move(action_data, player)
+        if move is None:
+            Logger.error("GameBase", f"Received move does not fit the local board: {action_data}")
+            self.request_snapshot()
+            return False
+
+        attack_map = self.get_attack_map() if hasattr(self, 'get_attack_map') else None # synchronisée avant le coup
+        play_move(GAME_TYPES[self.game_type], self.board.board, player, move, getattr(self, 'locked_pieces', None), attack_map)
+        self._on_network_move(player, move)
+        self._advance_network_turn(player)
+        self.network_seq = seq
+
+        if action_data.get("hash") != self.network_position_hash():
+            Logger.warning("GameBase", f"Position hash mismatch after network move {seq}")
+            self.request_snapshot()
+            return False
+        return True
+
+    def _network_move(self, action_data: Dict, player: int) -> Optional[Move]:
+        """
+        fonction : extrait le coup d'une action réseau et vérifie qu'il s'applique au plateau local.
+
+        params:
+            action_data: dictionnaire de l'action.
+            player: joueur qui a joué le coup (0 ou 1).
+
+        retour:
+            Move ou None si le coup est absent ou ne correspond pas au plateau.
+        """
+        keys = ("row", "col") if "row" in action_data else ("from_row", "from_col", "to_row", "to_col")
+        try:
+            move = tuple(int(action_data[key]) for key in keys)
+        except (KeyError, TypeError, ValueError):
+            return None
+        size = len(self.board.board)
+        if not all(0 <= value < size for value in move):
+            return None
+        if len(move) == 2: # isolation : la case doit être libre
+            return move if self.board.board[move[0]][move[1]][0] is None else None
+        return move if self.board.board[move[0]][move[1]][0] == player else None # la pièce déplacée appartient au joueur
+
+    def _on_network_move(self, player: int, move: Move):
+        """
+        procédure : appelée après qu'un coup réseau a été rejoué sur le plateau (état propre au jeu à tenir à jour).
+
+        params:
+            player: joueur qui a joué le coup (0 ou 1).
+            move: coup rejoué.
+        """
+        pass
+
+    def _apply_snapshot(self, board_state: Dict, seq: Optional[int], position_hash: Optional[int]) -> bool:
+        """
+        fonction : remplace l'état local par un instantané reçu.
+
+        params:
+            board_state: état complet du jeu (voir get_board_state).
+            seq: numéro du coup atteint par l'instantané (None : coup suivant).
+            position_hash: hachage de la position de l'instantané (None : non vérifié).
+
+        retour:
+            bool: True si l'instantané a été appliqué.
+        """
+        if not self.update_board_from_state(board_state):
+            return False
+        self.network_seq = seq if seq is not None else self.network_seq + 1
+        self.awaiting_snapshot = False
+        if position_hash is not None and position_hash != self.network_position_hash():
+            Logger.warning("GameBase", f"Snapshot hash mismatch at move {self.network_seq}")
+        return True
+
+    def request_snapshot(self):
+        """
+        procédure : demande à l'adversaire l'état complet de la partie (une seule demande à la fois).
+        """
+        if self.awaiting_snapshot:
+            return
+        self.awaiting_snapshot = True
+        self.notify_info("Synchronizing with opponent...")
+        if self.network_client:
+            self.network_client.send_sync_request(self.network_seq)
+
+    def on_game_state(self, data: Dict):
+        """
+        procédure : gère l'instantané envoyé par l'adversaire en réponse à une demande.
+
+        params:
+            data: dictionnaire contenant 'board_state', 'seq' et 'hash'.
+        """
+        board_state = data.get("board_state") if isinstance(data, dict) else None
+        if board_state is None:
+            Logger.error("GameBase", f"Received invalid game snapshot: {data}")
+            return
+        if self._apply_snapshot(board_state, data.get("seq"), data.get("hash")):
+            Logger.info("GameBase", f"Resynchronized at move {self.network_seq}")
+            self.notify_board_changed()
+
+    def on_sync_request(self, data: Optional[Dict] = None):
+        """
+        procédure : répond à une demande d'instantané de l'adversaire avec l'état local complet.
+
+        params:
+            data: dictionnaire contenant le dernier coup appliqué par l'adversaire ('seq').
+        """
+        if not self.network_client:
+            return
+        Logger.info("GameBase", f"Sending snapshot at move {self.network_seq} (opponent at {(data or {}).get('seq')})")
+        self.network_client.send_game_state({
+            "board_state": self.get_board_state(),
+            "seq": self.network_seq,
+            "hash": self.network_position_hash()
+        })
+
+    def network_position_hash(self) -> int:
+        """
+        fonction : hachage de Zobrist de la position, envoyé avec chaque coup et vérifié par l'adversaire.
+
+        retour:
+            int: hachage 64 bits.
+        """
+        return self.board.position_hash(self.round_turn, getattr(self, 'first_turn', False), getattr(self, 'locked_pieces', None))
+
+    def _advance_network_turn(self, player: int):
+        """
+        procédure : passe le trait après le coup réseau d'un joueur (mêmes règles que GameState.apply_move).
+
+        params:
+            player: joueur qui vient de jouer (0 ou 1).
+        """
+        self.round_turn = 1 - player
+        if getattr(self, 'first_turn', False) and self.round_turn == 0:
+            self.first_turn = False # fin du premier tour
+
+    def on_board_loaded(self):
+        """
+        procédure : appelée quand le plateau a été remplacé en bloc (sauvegarde chargée, état reçu) ;
+        les jeux y reconstruisent l'état qu'ils dérivent du plateau.
+        """
+        pass
 
     def update_board_from_state(self, state: Dict) -> bool:
         """
@@ -225,6 +416,7 @@ class GameBase:
                           if self.check_win(player_who_moved):
                               Logger.success("GameBase", f"Victory detected during state update for Player {player_who_moved + 1}")
                   
+             self.on_board_loaded()
              Logger.game("GameBase", f"Board state updated successfully. Turn: {self.round_turn}")
              save_game(self) # sauvegarde l'état reçu
              return True
@@ -243,8 +435,7 @@ class GameBase:
         Logger.warning("GameBase", f"Disconnection event: {message}")
         self.game_started = False
         self.is_my_turn = False
-        if self.render:
-            self.render.edit_info_label(f"Game ended: {message}")
+        self.notify_info(f"Game ended: {message}")
         
         if self.render is not None and hasattr(self.render, 'end_game_waiting_input') and self.render.end_game_waiting_input:
             pass
@@ -253,21 +444,27 @@ class GameBase:
 
     def send_network_action(self, action_data: Dict):
         """
-        procédure : envoie une action de jeu locale au serveur.
-        ajoute automatiquement l'état actuel du plateau à l'action.
+        procédure : envoie une action de jeu locale au serveur, une fois le coup appliqué au plateau local.
+        ajoute le numéro du coup et le hachage de la position atteinte ; l'état complet du plateau n'est ajouté
+        qu'au premier coup (chaque joueur a construit son plateau avec ses propres quadrants) puis tous les
+        SNAPSHOT_INTERVAL coups.
 
         params:
             action_data: dictionnaire contenant les détails spécifiques de l'action (ex: coup joué).
         """
         if self.is_network_game and self.network_client and self.is_my_turn:
-            # ajoute l'état complet du jeu pour synchronisation
-            action_data["board_state"] = self.get_board_state()
+            self._advance_network_turn(self.player_number - 1)
+            self.network_seq = getattr(self, 'network_seq', 0) + 1
+            action_data["seq"] = self.network_seq
+            action_data["hash"] = self.network_position_hash()
+            if self.network_seq == 1 or self.network_seq % SNAPSHOT_INTERVAL == 0:
+                action_data["board_state"] = self.get_board_state() # instantané de resynchronisation
             
             if "action" not in action_data:
                 action_data["action"] = "move"  # valeur par défaut si non spécifiée
             
             # Log détaillé pour le débogage des problèmes de fin de partie
-            Logger.game("GameBase", f"Sending network action with board state: player={self.player_number}, round_turn={self.round_turn}")
+            Logger.game("GameBase", f"Sending network action {self.network_seq}: player={self.player_number}, round_turn={self.round_turn}")
             
             self.network_client.send_game_action(action_data)
             # sauvegarde locale après avoir envoyé le coup
@@ -312,19 +509,20 @@ class GameBase:
             
         # vérifications pour le mode réseau
         if not self.game_started:
-            if self.render:
-                self.render.edit_info_label("Waiting for game to start...")
+            self.notify_info("Waiting for game to start...")
+            return False
+
+        if getattr(self, 'awaiting_snapshot', False):
+            self.notify_info("Synchronizing with opponent...")
             return False
             
         if self.network_client and not self.network_client.opponent_connected:
-            if self.render:
-                self.render.edit_info_label("Waiting for another player to join...")
+            self.notify_info("Waiting for another player to join...")
             return False
             
         if not self.is_my_turn:
             other_player = 2 if self.player_number == 1 else 1
-            if self.render:
-                self.render.edit_info_label(f"Waiting for Player {other_player}...")
+            self.notify_info(f"Waiting for Player {other_player}...")
             return False
             
         # si on arrive ici, c'est notre tour en réseau
@@ -336,6 +534,8 @@ class GameBase:
         appelée à la fin du jeu ou en cas d'erreur.
         """
         Logger.info("GameBase", "Cleaning up game resources.")
+        if getattr(self, 'bot_worker', None):
+            self.bot_worker.cancel() # un coup calculé après la fin de la partie est ignoré
         if self.network_client:
             self.network_client.disconnect()
             self.network_client = None # libère la référence
@@ -370,8 +570,7 @@ class GameBase:
             Logger.info("GameBase", f"Chat message received: {formatted_message}")
             
             # rafraîchit pour afficher le nouveau message
-            if self.render:
-                self.render.needs_render = True
+            self.notify_board_changed()
                 
         except Exception as e:
             Logger.error("GameBase", f"Error processing chat message: {e}")
@@ -400,8 +599,7 @@ class GameBase:
         self.chat_messages.append(formatted_message)
         
         # rafraîchit l'interface
-        if self.render:
-            self.render.needs_render = True
+        self.notify_board_changed()
             
         # réinitialise l'input
         self.chat_input = ""
@@ -439,24 +637,60 @@ class GameBase:
                     elif event.key == pygame.K_BACKSPACE:
                         # supprime le dernier caractère
                         self.chat_input = self.chat_input[:-1]
-                        if self.render:
-                            self.render.needs_render = True
+                        self.notify_board_changed()
                         return False
                     elif event.unicode and ord(event.unicode) >= 32:
                         # ajoute le caractère tapé
                         self.chat_input += event.unicode
-                        if self.render:
-                            self.render.needs_render = True
+                        self.notify_board_changed()
                         return False
         
-        # gestion du timer pour déclencher le coup du bot
+        # gestion du timer pour déclencher la réflexion du bot
         if hasattr(self, '_bot_timer_set') and self._bot_timer_set:
             if event.type == pygame.USEREVENT:
                 pygame.time.set_timer(pygame.USEREVENT, 0) # désactive le timer
                 self._bot_timer_set = False
-                if hasattr(self, '_bot_play'):
-                    # exécute le coup du bot
-                    if self._bot_play(): # si le bot a joué (et le jeu n'est pas fini)
-                         if self.render: self.render.needs_render = True # rafraîchit après le coup du bot
+                if hasattr(self, '_bot_think'):
+                    self.start_bot_turn()
                     return False # événement traité (timer du bot)
-        return True # événement non traité par la classe de base 
\ No newline at end of file
+
+        # coup calculé par le fil du bot
+        if event.type == BOT_MOVE_EVENT:
+            if getattr(self, 'bot_worker', None) and self.bot_worker.accept(event):
+                if event.error is not None:
+                    Logger.error("GameBase", f"Error during bot play: {event.error}")
+                    self.round_turn = 0 # redonne la main au joueur en cas d'erreur
+                    self.notify_info(f"Bot error: {event.error}")
+                elif self._bot_apply(event.result): # si le bot a joué (et le jeu n'est pas fini)
+                    self.notify_board_changed() # rafraîchit après le coup du bot
+                    if self.ponder_enabled and hasattr(self, '_bot_ponder'):
+                        self.bot_worker.ponder(self.bot, self._bot_ponder())
+            return False # événement traité (résultat du bot)
+        return True # événement non traité par la classe de base
+
+    def start_bot_turn(self) -> None:
+        """
+        procédure : lance la réflexion du bot sur un fil séparé ; la boucle de rendu continue de tourner
+        et le coup est appliqué à la réception de l'événement BOT_MOVE_EVENT.
+        """
+        Logger.game("GameBase", "Bot starting its move")
+        self.notify_info("Bot is thinking...")
+        self.bot_worker.start(self.bot, self._bot_think)
+
+    def _bot_play(self) -> bool:
+        """
+        procédure : calcule et applique le coup du bot dans le fil appelant (sans passer par BotWorker)
+
+        retour:
+            bool: True si le bot a joué et que la partie continue, False sinon.
+        """
+        return self._bot_apply(self._bot_think())
+
+    def concede(self) -> None:
+        """
+        procédure : abandon du joueur en partie contre le bot (possible pendant la réflexion du bot, qui est annulée)
+        """
+        if getattr(self, 'bot_worker', None):
+            self.bot_worker.cancel()
+        Logger.game("GameBase", "Player conceded the game")
+        self.notify_game_over("BOT WON THE GAME !") 
\ No newline at end of file
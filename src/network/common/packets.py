@@ -10,11 +10,13 @@ class PacketType(Enum):
     DISCONNECT = 0x8
     CHAT_SEND = 0x9
     GET_GAME_LIST = 0xB 
+    PROTOCOL = 0xD # CtS : formats proposés, StC : format choisi (voir src/network/common/wire.py)
+    SYNC_REQUEST = 0xE # CtS et StC : demande d'un instantané de la partie, relayée à l'adversaire
     # StC (Server to Client)
     PLAYER_ASSIGNMENT = 0x2
     YOUR_TURN = 0x3
     WAIT_TURN = 0x4
-    GAME_STATE = 0x6
+    GAME_STATE = 0x6 # aussi CtS : instantané envoyé en réponse à SYNC_REQUEST, relayé à l'adversaire
     PLAYER_DISCONNECTED = 0x7
     CHAT_RECEIVE = 0xA
     GAME_LIST = 0xC  
@@ -82,6 +84,12 @@ def create_game_state_dict(state: Dict[str, Any], game_id: str) -> Dict[str, Any
         "data": state
     }
 
+def create_sync_request_dict(seq: int) -> Dict[str, Any]:
+    return {
+        "type": PacketType.SYNC_REQUEST.value,
+        "data": {"seq": seq}
+    }
+
 def create_chat_send_dict(sender_name: str, message: str, player_number: int, game_id: str) -> Dict[str, Any]:
     return {
         "type": PacketType.CHAT_SEND.value,
@@ -104,6 +112,18 @@ def create_chat_receive_dict(sender_name: str, message: str, player_number: int,
         }
     }
 
+def create_protocol_request_dict(protocols: List[str]) -> Dict[str, Any]:
+    return {
+        "type": PacketType.PROTOCOL.value,
+        "data": {"protocols": protocols}
+    }
+
+def create_protocol_dict(protocol: str) -> Dict[str, Any]:
+    return {
+        "type": PacketType.PROTOCOL.value,
+        "data": {"protocol": protocol}
+    }
+
 def create_get_game_list_dict() -> Dict[str, Any]:
     return {
         "type": PacketType.GET_GAME_LIST.value,
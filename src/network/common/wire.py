@@ -0,0 +1,276 @@
+import json
+import struct
+from typing import Any, Dict, List, Tuple
+
+# formats d'échange : lignes JSON (par défaut, toujours compris) ou trames binaires négociées par un paquet PROTOCOL
+PROTOCOL_JSON = "json"
+PROTOCOL_BINARY = "binary"
+PROTOCOLS = (PROTOCOL_JSON, PROTOCOL_BINARY)
+
+# trame binaire : longueur (4 octets, type + contenu), type du paquet (1 octet), contenu au format MessagePack
+FRAME_HEADER = struct.Struct("!IB")
+# longueur maximale d'une trame : l'octet de poids fort de la longueur est toujours nul, ce qui distingue
+# une trame binaire d'une ligne JSON (qui commence par "{")
+MAX_FRAME_SIZE = 0xFFFFFF
+
+_UINT8 = struct.Struct("!B")
+_UINT16 = struct.Struct("!H")
+_UINT32 = struct.Struct("!I")
+_INT8 = struct.Struct("!b")
+_INT16 = struct.Struct("!h")
+_INT32 = struct.Struct("!i")
+_INT64 = struct.Struct("!q")
+_UINT64 = struct.Struct("!Q")
+_FLOAT64 = struct.Struct("!d")
+
+class ProtocolError(ValueError):
+    """
+    classe : données reçues qui ne forment pas un paquet valide
+    """
+
+def _pack_length(out: bytearray, length: int, fix_tag: int, fix_max: int, tag16: int, tag32: int) -> None:
+    """
+    procédure : écrit l'en-tête d'une chaîne, d'une liste ou d'un dictionnaire (forme courte si possible)
+    params :
+        out - tampon de sortie
+        length - nombre d'octets ou d'éléments
+        fix_tag - préfixe de la forme courte (longueur dans l'octet de type)
+        fix_max - longueur maximale de la forme courte
+        tag16, tag32 - types des longueurs sur 2 et 4 octets
+    """
+    if length <= fix_max:
+        out.append(fix_tag | length)
+    elif length <= 0xFFFF:
+        out.append(tag16)
+        out += _UINT16.pack(length)
+    else:
+        out.append(tag32)
+        out += _UINT32.pack(length)
+
+def pack_value(value: Any, out: bytearray) -> None:
+    """
+    procédure : encode une valeur JSON (None, booléen, entier, flottant, chaîne, liste, dictionnaire) au format MessagePack
+    les clés non textuelles des dictionnaires sont converties comme le ferait json.dumps
+    params :
+        value - valeur à encoder
+        out - tampon de sortie
+    """
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value <= 0x7F:
+            out.append(value)
+        elif -32 <= value < 0:
+            out.append(value & 0xFF)
+        elif -0x80 <= value <= 0x7F:
+            out.append(0xD0)
+            out += _INT8.pack(value)
+        elif -0x8000 <= value <= 0x7FFF:
+            out.append(0xD1)
+            out += _INT16.pack(value)
+        elif -0x80000000 <= value <= 0x7FFFFFFF:
+            out.append(0xD2)
+            out += _INT32.pack(value)
+        elif -0x8000000000000000 <= value <= 0x7FFFFFFFFFFFFFFF:
+            out.append(0xD3)
+            out += _INT64.pack(value)
+        elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+            out.append(0xCF)
+            out += _UINT64.pack(value)
+        else:
+            raise ValueError(f"Integer too large for binary protocol: {value}")
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += _FLOAT64.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        if len(data) <= 31:
+            out.append(0xA0 | len(data))
+        elif len(data) <= 0xFF:
+            out.append(0xD9)
+            out.append(len(data))
+        else:
+            _pack_length(out, len(data), 0xA0, 31, 0xDA, 0xDB)
+        out += data
+    elif isinstance(value, (list, tuple)):
+        _pack_length(out, len(value), 0x90, 15, 0xDC, 0xDD)
+        for item in value:
+            pack_value(item, out)
+    elif isinstance(value, dict):
+        _pack_length(out, len(value), 0x80, 15, 0xDE, 0xDF)
+        for key, item in value.items():
+            pack_value(key if isinstance(key, str) else json.dumps(key), out)
+            pack_value(item, out)
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+def unpack_value(view: memoryview, offset: int) -> Tuple[Any, int]:
+    """
+    fonction : décode une valeur MessagePack directement depuis la vue (les chaînes sont décodées sans copie intermédiaire)
+    params :
+        view - vue sur les octets reçus
+        offset - position de la valeur
+    retour : (valeur, position suivante)
+    """
+    try:
+        tag = view[offset]
+        offset += 1
+        if tag <= 0x7F:
+            return tag, offset
+        if tag >= 0xE0:
+            return tag - 0x100, offset
+        if 0xA0 <= tag <= 0xBF:
+            return _unpack_str(view, offset, tag & 0x1F)
+        if 0x90 <= tag <= 0x9F:
+            return _unpack_list(view, offset, tag & 0x0F)
+        if 0x80 <= tag <= 0x8F:
+            return _unpack_dict(view, offset, tag & 0x0F)
+        if tag == 0xC0:
+            return None, offset
+        if tag == 0xC2:
+            return False, offset
+        if tag == 0xC3:
+            return True, offset
+        if tag == 0xD9:
+            return _unpack_str(view, offset + 1, view[offset])
+        if tag == 0xDA:
+            return _unpack_str(view, offset + 2, _UINT16.unpack_from(view, offset)[0])
+        if tag == 0xDB:
+            return _unpack_str(view, offset + 4, _UINT32.unpack_from(view, offset)[0])
+        if tag == 0xDC:
+            return _unpack_list(view, offset + 2, _UINT16.unpack_from(view, offset)[0])
+        if tag == 0xDD:
+            return _unpack_list(view, offset + 4, _UINT32.unpack_from(view, offset)[0])
+        if tag == 0xDE:
+            return _unpack_dict(view, offset + 2, _UINT16.unpack_from(view, offset)[0])
+        if tag == 0xDF:
+            return _unpack_dict(view, offset + 4, _UINT32.unpack_from(view, offset)[0])
+        fixed = _FIXED_TYPES.get(tag)
+        if fixed is not None:
+            return fixed.unpack_from(view, offset)[0], offset + fixed.size
+    except (IndexError, struct.error, UnicodeDecodeError, TypeError, RecursionError) as e: # TypeError : clé non hachable
+        raise ProtocolError(f"Truncated or invalid binary payload: {e}") from e
+    raise ProtocolError(f"Unsupported binary type 0x{tag:02x}")
+
+_FIXED_TYPES = {0xCB: _FLOAT64, 0xCC: _UINT8, 0xCD: _UINT16, 0xCE: _UINT32, 0xCF: _UINT64,
+                0xD0: _INT8, 0xD1: _INT16, 0xD2: _INT32, 0xD3: _INT64}
+
+def _unpack_str(view: memoryview, offset: int, length: int) -> Tuple[str, int]:
+    """
+    fonction : décode une chaîne UTF-8 depuis la vue
+    retour : (chaîne, position suivante)
+    """
+    end = offset + length
+    if end > len(view):
+        raise ProtocolError("Truncated string in binary payload")
+    return str(view[offset:end], "utf-8"), end
+
+def _unpack_list(view: memoryview, offset: int, count: int) -> Tuple[List[Any], int]:
+    """
+    fonction : décode une liste de count valeurs
+    retour : (liste, position suivante)
+    """
+    items = []
+    for _ in range(count):
+        item, offset = unpack_value(view, offset)
+        items.append(item)
+    return items, offset
+
+def _unpack_dict(view: memoryview, offset: int, count: int) -> Tuple[Dict[Any, Any], int]:
+    """
+    fonction : décode un dictionnaire de count paires
+    retour : (dictionnaire, position suivante)
+    """
+    items = {}
+    for _ in range(count):
+        key, offset = unpack_value(view, offset)
+        items[key], offset = unpack_value(view, offset)
+    return items, offset
+
+def encode_packet(packet_dict: Dict, protocol: str = PROTOCOL_JSON) -> bytes:
+    """
+    fonction : encode un paquet pour l'envoi
+    un paquet dont le type ne tient pas dans un octet reste en JSON (le destinataire comprend toujours les deux formats)
+    params :
+        packet_dict - paquet {"type": ..., "data": ...}
+        protocol - PROTOCOL_JSON ou PROTOCOL_BINARY
+    retour : les octets à envoyer
+    """
+    packet_type = packet_dict.get("type") if isinstance(packet_dict, dict) else None
+    if protocol == PROTOCOL_BINARY and isinstance(packet_type, int) and 0 <= packet_type <= 0xFF:
+        frame = bytearray(FRAME_HEADER.size)
+        pack_value(packet_dict.get("data"), frame)
+        length = len(frame) - 4
+        if length > MAX_FRAME_SIZE:
+            raise ValueError(f"Packet too large for binary protocol: {length} bytes")
+        FRAME_HEADER.pack_into(frame, 0, length, packet_type)
+        return bytes(frame)
+    return (json.dumps(packet_dict) + '\n').encode('utf-8')
+
+class PacketDecoder:
+    """
+    classe : découpe les octets reçus d'une connexion en paquets, lignes JSON comme trames binaires
+    les octets s'accumulent dans un bytearray parcouru par position : chaque octet n'est examiné qu'une fois,
+    et le tampon n'est réduit qu'une fois par bloc reçu (au lieu d'une copie du reste du tampon par message)
+    """
+    def __init__(self) -> None:
+        """
+        procédure : initialise un tampon vide
+        """
+        self.buffer = bytearray() # octets reçus pas encore décodés
+        self.scanned = 0 # octets de la ligne JSON incomplète déjà parcourus à la recherche du saut de ligne
+
+    def pending(self) -> int:
+        """
+        fonction : nombre d'octets reçus en attente d'un paquet complet
+        retour : taille du tampon
+        """
+        return len(self.buffer)
+
+    def feed(self, chunk: bytes) -> List[Tuple[Any, int]]:
+        """
+        fonction : ajoute un bloc reçu et décode les paquets complets
+        un paquet invalide lève ProtocolError (ou json.JSONDecodeError) après avoir été retiré du tampon :
+        le décodage peut reprendre au bloc suivant
+        params :
+            chunk - octets reçus
+        retour : liste de (paquet, taille en octets) dans l'ordre de réception
+        """
+        buffer = self.buffer
+        buffer += chunk
+        packets = []
+        position = 0
+        try:
+            with memoryview(buffer) as view:
+                while position < len(buffer):
+                    start = position
+                    if buffer[start] == 0: # trame binaire
+                        if len(buffer) - start < FRAME_HEADER.size:
+                            break
+                        length, packet_type = FRAME_HEADER.unpack_from(view, start)
+                        end = start + 4 + length
+                        if end > len(buffer):
+                            break
+                        position = end # la trame est consommée même si son contenu est invalide
+                        # décodage sur la vue entière : une sous-vue retenue par la trace d'une erreur empêcherait de réduire le tampon
+                        data, data_end = unpack_value(view, start + FRAME_HEADER.size)
+                        if data_end != end:
+                            raise ProtocolError("Binary frame length does not match its content")
+                        packets.append(({"type": packet_type, "data": data}, end - start))
+                    else: # ligne JSON
+                        newline = buffer.find(b'\n', max(start, self.scanned))
+                        if newline < 0:
+                            self.scanned = len(buffer)
+                            break
+                        position = newline + 1 # la ligne est consommée même si elle est invalide
+                        line = bytes(view[start:newline]).strip()
+                        if line:
+                            packets.append((json.loads(line), position - start))
+        finally:
+            del buffer[:position]
+            self.scanned = max(self.scanned - position, 0)
+        return packets
@@ -0,0 +1,147 @@
+import asyncio
+import socket
+from typing import Optional, Tuple
+from src.utils.logger import Logger
+from src.network.server.game_server import GameServer
+from src.network.server.outbound_queue import StreamOutboundQueue
+
+class StreamConnection:
+    """
+    classe : connexion d'un client servie par asyncio, avec l'interface de socket utilisée par les gestionnaires
+    (sendall, getpeername, shutdown, close) : ConnectionManager, GameManager et ChatManager l'utilisent comme un socket
+    """
+    def __init__(self, writer: asyncio.StreamWriter):
+        """
+        procédure : initialise la connexion
+        params :
+            writer - flux d'écriture asyncio du client
+        """
+        self.writer = writer
+        self.peername = writer.get_extra_info("peername") # mémorisé : reste disponible après la fermeture
+
+    def sendall(self, data: bytes) -> None:
+        """
+        procédure : ajoute les données au tampon d'envoi (sans bloquer la boucle d'événements)
+        params :
+            data - les octets à envoyer
+        """
+        if self.writer.is_closing(): # même erreur qu'un socket fermé pour ConnectionManager.send_json
+            raise BrokenPipeError("connection closed")
+        self.writer.write(data)
+
+    def getpeername(self) -> Tuple[str, int]:
+        """
+        fonction : retourne l'adresse du client
+        retour : (hôte, port)
+        """
+        return self.peername
+
+    def shutdown(self, how: int = socket.SHUT_RDWR) -> None:
+        """
+        procédure : ferme la connexion (la fermeture du flux couvre les deux sens)
+        params :
+            how - ignoré, présent pour l'interface de socket
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        procédure : ferme le flux après l'envoi des données en attente
+        """
+        if not self.writer.is_closing():
+            self.writer.close()
+
+class AsyncGameServer(GameServer):
+    """
+    classe : serveur de jeu sur une boucle d'événements asyncio
+    toutes les connexions sont servies par un seul fil : une connexion inactive ne coûte qu'une coroutine en attente
+    de lecture, et les paquets sont traités par les mêmes fonctions que le serveur à un fil par client
+    """
+    def __init__(self):
+        """
+        procédure : initialise le serveur de jeu
+        """
+        super().__init__()
+        self.server: Optional[asyncio.AbstractServer] = None # serveur asyncio, créé par open
+
+    async def open(self) -> asyncio.AbstractServer:
+        """
+        fonction : ouvre le socket d'écoute
+        retour : le serveur asyncio (les connexions sont acceptées dès que la boucle tourne)
+        """
+        self.server = await asyncio.start_server(self.handle_connection, self.config_manager.get_host(),
+                                                 self.config_manager.get_port(), backlog=self.config_manager.get_backlog(),
+                                                 reuse_address=True)
+        Logger.server_internal("Server", f"Async server started on {self.config_manager.get_host()}:{self.config_manager.get_port()}, listening...")
+        return self.server
+
+    async def serve(self) -> None:
+        """
+        procédure : ouvre le socket d'écoute et sert les connexions jusqu'à l'arrêt du serveur
+        """
+        server = await self.open()
+        async with server:
+            try:
+                await server.serve_forever()
+            except asyncio.CancelledError:
+                pass
+
+    def start(self) -> None:
+        """
+        procédure : démarre le serveur et commence à écouter les connexions
+        """
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            Logger.server_error("Server", f"Failed to bind or listen: {e}")
+        except Exception as e:
+            Logger.server_error("Server", f"Server error: {str(e)}")
+        finally:
+            self.cleanup()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        procédure : gère la connexion d'un client (équivalent de handle_client)
+        params :
+            reader - flux de lecture du client
+            writer - flux d'écriture du client
+        """
+        connection = StreamConnection(writer)
+        address = connection.getpeername()
+        addr_str = f"{address[0]}:{address[1]}" if isinstance(address, tuple) else str(address)
+        Logger.server_internal("Server", f"New connection from {address}")
+        self.connection_manager.add_client(connection, StreamOutboundQueue)
+        try:
+            while True:
+                try:
+                    chunk = await reader.read(4096)
+                    if not chunk:
+                        Logger.server_internal("Server", f"Client {addr_str} disconnected (received empty chunk).")
+                        break
+
+                    messages = self.connection_manager.process_received_data(connection, chunk)
+                    for packet_dict in messages:
+                        self.process_json_packet(connection, packet_dict) # les réponses partent par les tâches d'écriture des clients
+                except ConnectionResetError:
+                    Logger.server_internal("Server", f"Client {addr_str} disconnected forcefully (connection reset).")
+                    break
+                except OSError as e:
+                    Logger.server_error("Server", f"Socket error for client {addr_str}: {str(e)}")
+                    break
+                except Exception as e:
+                    Logger.server_error("Server", f"Error handling client {addr_str}: {str(e)}")
+                    break
+        finally:
+            if connection in self.connection_manager.clients: # pas encore déconnecté par un paquet (DISCONNECT, erreur)
+                self.connection_manager.disconnect_client(connection, "Connection ended")
+
+    def cleanup(self) -> None:
+        """
+        procédure : nettoie les ressources du serveur
+        """
+        Logger.server_internal("Server", "Shutting down server and cleaning up...")
+        if self.server is not None:
+            self.server.close()
+            Logger.server_internal("Server", "Server socket closed.")
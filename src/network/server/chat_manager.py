@@ -26,7 +26,8 @@ class ChatManager:
             message = packet_data["message"]
             player_number = packet_data.get("player_number", 0)
 
-            if client_socket not in [sock for sock in game.players.values()]: # on vérifie si le client est un joueur de la partie
+            players = list(game.players.values()) # copie : les joueurs peuvent changer depuis un autre fil
+            if client_socket not in players: # on vérifie si le client est un joueur de la partie
                 Logger.server_error("Server", f"Client {client_socket.getpeername()} tried to send chat to game {game_id} but is not a player")
                 return False
 
@@ -39,7 +40,7 @@ class ChatManager:
                 game_id=game_id
             ) # on crée le paquet de réception du chat
  
-            for player_socket in game.players.values(): # on envoie le message à tous les joueurs de la partie
+            for player_socket in players: # on envoie le message à tous les joueurs de la partie
                 if player_socket != client_socket: # on envoie le message à tous les joueurs de la partie sauf le client qui a envoyé le message
                     # (le client qui a envoyé le message affiche son propre message)
                     Logger.server_internal("Server", f"Forwarding chat message to {player_socket.getpeername()} in game {game_id}")
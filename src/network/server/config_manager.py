@@ -15,6 +15,10 @@ class ConfigManager:
         self.port = 5000
         self.max_players = 2  # 2 joueurs par partie
         self.timeout = 60 # délai d'attente en secondes (si le client ne répond pas, il est déconnecté)
+        self.backlog = 128 # nombre de connexions en attente d'acceptation (listen)
+        self.protocol = "json" # format binaire accepté si "binary" (négocié par le client, voir src/network/common/wire.py)
+        self.outbound = {} # paramètres des files d'envoi des clients (voir OutboundQueue)
+        self.logging = {} # paramètres des logs : format, échantillonnage et écriture asynchrone (voir Logger.start_async)
 
     def load_config(self) -> None:
         """
@@ -31,6 +35,10 @@ class ConfigManager:
                 self.port = config['port']
                 self.max_players = config.get('max_players', 2)
                 self.timeout = config.get('timeout', 60)
+                self.backlog = config.get('backlog', 128)
+                self.protocol = config.get('protocol', 'json')
+                self.outbound = config.get('outbound', {})
+                self.logging = config.get('logging', {})
                 Logger.server_internal("Server", f"Config loaded from {config_path.resolve()}")
 
         except Exception as e:
@@ -63,4 +71,32 @@ class ConfigManager:
         fonction : retourne le délai d'attente
         retour : le délai d'attente en secondes
         """
-        return self.timeout 
\ No newline at end of file
+        return self.timeout
+
+    def get_backlog(self) -> int:
+        """
+        fonction : retourne la taille de la file des connexions en attente d'acceptation
+        retour : le backlog passé à listen
+        """
+        return self.backlog
+
+    def get_protocol(self) -> str:
+        """
+        fonction : retourne le format d'échange accepté en plus du JSON
+        retour : "binary" si les clients peuvent négocier les trames binaires, "json" sinon
+        """
+        return self.protocol
+
+    def get_outbound(self) -> dict:
+        """
+        fonction : retourne les paramètres des files d'envoi des clients
+        retour : dictionnaire (max_packets, overflow_policy, max_batch_bytes, block_timeout)
+        """
+        return self.outbound
+
+    def get_logging(self) -> dict:
+        """
+        fonction : retourne les paramètres de l'écriture asynchrone des logs
+        retour : dictionnaire (structured, sampling, max_queue, drop_policy, path, max_bytes, backup_count, batch_size)
+        """
+        return self.logging
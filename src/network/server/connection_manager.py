@@ -1,19 +1,46 @@
 import socket
-import json
 from typing import Dict, Optional, List
 from src.utils.logger import Logger
 from src.network.common.packets import PacketType, create_disconnect_dict, create_player_disconnected_dict
+from src.network.common.wire import PROTOCOL_JSON, PacketDecoder, encode_packet
+from src.network.server.outbound_queue import OVERFLOW_POLICIES, OutboundQueue, ThreadedOutboundQueue
+
+# composant des logs de paquets, échantillonné par le bloc "logging" de configs/server.json
+PACKET_LOG_COMPONENT = "Packets"
+
+def packet_type_name(packet_dict: Dict) -> str:
+    """
+    fonction : nom du type d'un paquet pour les logs
+    params :
+        packet_dict - le paquet
+    retour : nom du PacketType, ou la valeur brute si elle est inconnue
+    """
+    type_value = packet_dict.get("type") if isinstance(packet_dict, dict) else None
+    try:
+        return PacketType(type_value).name
+    except ValueError:
+        return str(type_value)
 
 class ConnectionManager:
     """
     classe : gère les connexions des clients et la communication réseau
+    les dictionnaires ne sont modifiés que par des opérations élémentaires (affectation, pop) : un retrait est atomique,
+    et seul le fil qui retire l'association d'un client à sa partie traite sa déconnexion
     """
-    def __init__(self):
+    def __init__(self, outbound: Optional[Dict] = None):
         """
         procédure : initialise le gestionnaire de connexion
+        params :
+            outbound - paramètres des files d'envoi (max_packets, overflow_policy, max_batch_bytes, block_timeout)
         """
-        self.clients: Dict[socket.socket, bytes] = {} # dictionnaire des clients connectés (socket, données reçues)
+        self.clients: Dict[socket.socket, PacketDecoder] = {} # dictionnaire des clients connectés (socket, décodeur des données reçues)
+        self.client_protocol: Dict[socket.socket, str] = {} # format d'envoi négocié par client (JSON si absent)
         self.client_to_game: Dict[socket.socket, str] = {} # dictionnaire des clients connectés à une partie (socket, identifiant de la partie)
+        self.outbound: Dict[socket.socket, OutboundQueue] = {} # dictionnaire des files d'envoi (socket, file)
+        self.outbound_options: Dict = dict(outbound or {})
+        if self.outbound_options.get("overflow_policy", "disconnect") not in OVERFLOW_POLICIES:
+            Logger.server_error("Server", f"Unknown overflow policy {self.outbound_options['overflow_policy']}, using disconnect")
+            self.outbound_options["overflow_policy"] = "disconnect"
         self.game_manager = None # GameManager
 
     def set_game_manager(self, game_manager) -> None:
@@ -24,22 +51,28 @@ class ConnectionManager:
         """
         self.game_manager = game_manager
 
-    def add_client(self, client_socket: socket.socket) -> None:
+    def add_client(self, client_socket: socket.socket, queue_class=ThreadedOutboundQueue) -> None:
         """
-        procédure : ajoute un nouveau client
+        procédure : ajoute un nouveau client et crée sa file d'envoi
         params :
             client_socket - le socket du client à ajouter
+            queue_class - type de file d'envoi (fil d'écriture, ou tâche asyncio pour AsyncGameServer)
         """
-        self.clients[client_socket] = b""
+        self.clients[client_socket] = PacketDecoder()
+        self.outbound[client_socket] = queue_class(client_socket, **self.outbound_options)
 
-    def remove_client(self, client_socket: socket.socket) -> None:
+    def remove_client(self, client_socket: socket.socket, flush_timeout: float = 1.0) -> None:
         """
-        procédure : retire un client
+        procédure : retire un client et ferme sa file d'envoi
         params :
             client_socket - le socket du client à retirer
+            flush_timeout - durée maximale d'envoi des paquets encore en file (0 : abandonnés)
         """
-        if client_socket in self.clients:
-            del self.clients[client_socket]
+        self.clients.pop(client_socket, None)
+        self.client_protocol.pop(client_socket, None)
+        queue = self.outbound.pop(client_socket, None)
+        if queue is not None:
+            queue.close(flush_timeout)
 
     def get_client_game(self, client_socket: socket.socket) -> Optional[str]:
         """
@@ -68,45 +101,73 @@ class ConnectionManager:
         """
         return self.client_to_game.pop(client_socket, None)
 
+    def set_client_protocol(self, client_socket: socket.socket, protocol: str) -> None:
+        """
+        procédure : choisit le format des paquets envoyés à un client
+        params :
+            client_socket - le socket du client
+            protocol - PROTOCOL_JSON ou PROTOCOL_BINARY
+        """
+        self.client_protocol[client_socket] = protocol
+
     def send_json(self, client_socket: socket.socket, packet_dict: Dict) -> bool:
         """
-        fonction : envoie un message JSON à un client
+        fonction : envoie un paquet à un client, en JSON ou en trame binaire selon le format négocié
+        (ajouté à sa file d'envoi : ne bloque pas sur un client lent)
         params :
             client_socket - le socket du client
             packet_dict - le dictionnaire à envoyer
-        retour : True si l'envoi a réussi, False sinon
+        retour : True si le message a été envoyé ou mis en file, False sinon
         """
         try:
-            json_string = json.dumps(packet_dict) # on convertit le dictionnaire en chaîne de caractères JSON
-            message_to_send = (json_string + '\n').encode('utf-8') # on ajoute un retour à la ligne et on encode en UTF-8
-            client_socket.sendall(message_to_send) # on envoie le message au client
-            Logger.server_send("Server", f"Sent JSON to {client_socket.getpeername()}: {json_string}") 
+            message_to_send = encode_packet(packet_dict, self.client_protocol.get(client_socket, PROTOCOL_JSON)) # on encode le paquet
+            queue = self.outbound.get(client_socket)
+            if queue is None: # client sans file d'envoi (pas ajouté par add_client)
+                client_socket.sendall(message_to_send) # on envoie le message au client
+            elif not queue.put(message_to_send): # on ajoute le message à la file du client
+                if queue.closed:
+                    Logger.server_error("Server", f"Failed to send to {client_socket.getpeername()}: connection closed")
+                    return False
+                Logger.server_error("Server", f"Outbound queue full for {client_socket.getpeername()} ({queue.overflow_policy}), packet dropped")
+                if queue.overflow_policy != "drop": # client trop lent : on le déconnecte plutôt que de bloquer sa partie
+                    self.disconnect_client(client_socket, "Outbound queue full", flush_timeout=0)
+                return False
+            packet_type = packet_type_name(packet_dict)
+            Logger.server_send(PACKET_LOG_COMPONENT, "Sent %s (%d bytes) to %s", packet_type, len(message_to_send), client_socket.getpeername(),
+                               game_id=self.get_client_game(client_socket), packet_type=packet_type, size=len(message_to_send))
             return True
         except BrokenPipeError:
             Logger.server_error("Server", f"Failed to send to {client_socket.getpeername()}: Broken pipe") 
             return False
         except Exception as e:
-            Logger.server_error("Server", f"Error sending JSON to {client_socket.getpeername()}: {str(e)}")
+            Logger.server_error("Server", f"Error sending packet to {client_socket.getpeername()}: {str(e)}")
             return False
 
-    def disconnect_client(self, client_socket: socket.socket, reason: str) -> None:
+    def disconnect_client(self, client_socket: socket.socket, reason: str, flush_timeout: float = 1.0) -> None:
+        """
+        procédure : déconnecte un client et ferme sa partie
+        params :
+            client_socket - le socket du client
+            reason - la raison de la déconnexion
+            flush_timeout - durée maximale d'envoi des paquets encore en file (0 : abandonnés)
+        """
         try:
-            game_id = self.get_client_game(client_socket)
+            game_id = self.remove_client_game(client_socket) # retrait atomique : un seul appel traite la partie du client
             if game_id and self.game_manager:
                 game = self.game_manager.get_game(game_id)
                 if game:
-                    other_socket = game.get_other_player_socket(client_socket)
-                    if other_socket:
-                        disconnect_dict = create_player_disconnected_dict(game_id, f"Other player disconnected: {reason}")
-                        try:
-                            self.send_json(other_socket, disconnect_dict)
-                        except:
-                            pass
-                    self.game_manager.remove_game(game_id)
+                    with game.lock: # pas de coup ni d'arrivée de joueur pendant la fermeture de la partie
+                        other_socket = game.get_other_player_socket(client_socket)
+                        if other_socket and not game.closed:
+                            disconnect_dict = create_player_disconnected_dict(game_id, f"Other player disconnected: {reason}")
+                            try:
+                                self.send_json(other_socket, disconnect_dict)
+                            except:
+                                pass
+                        self.game_manager.remove_game(game_id)
 
             Logger.server_internal("Server", f"Disconnecting client {client_socket.getpeername()}. Reason: {reason}")
-            self.remove_client_game(client_socket)
-            self.remove_client(client_socket)
+            self.remove_client(client_socket, flush_timeout)
             try:
                 client_socket.shutdown(socket.SHUT_RDWR)
             except:
@@ -120,33 +181,28 @@ class ConnectionManager:
 
     def process_received_data(self, client_socket: socket.socket, chunk: bytes) -> List[Dict]:
         """
-        fonction : traite les données reçues d'un client
+        fonction : traite les données reçues d'un client (lignes JSON ou trames binaires)
         params :
             client_socket - le socket du client
             chunk - les données reçues
-        retour : liste des messages JSON traités
+        retour : liste des paquets décodés
         """
-        if not chunk:
+        decoder = self.clients.get(client_socket)
+        if not chunk or decoder is None:
             return []
 
-        self.clients[client_socket] += chunk # on ajoute les données reçues au buffer
-        buffer = self.clients[client_socket] # on récupère le buffer
-        messages = [] # on initialise la liste des messages
+        try:
+            packets = decoder.feed(chunk) # on décode les paquets complets du tampon du client
+        except ValueError as e: # JSON ou trame binaire invalide
+            Logger.server_error("Server", f"Invalid packet received from {client_socket.getpeername()}: {e}")
+            self.disconnect_client(client_socket, "Invalid packet format") # on déconnecte le client car le message n'est pas valide
+            return []
 
-        while b'\n' in buffer: # on parcourt le buffer jusqu'à trouver un retour à la ligne
-            message_bytes, remaining_buffer = buffer.split(b'\n', 1) # on sépare le buffer en deux parties : le message et le reste
-            buffer = remaining_buffer # on met à jour le buffer
-            self.clients[client_socket] = buffer # on met à jour le buffer
-
-            message_string = message_bytes.decode('utf-8').strip() # on décode le message en UTF-8 et on retire les espaces
-            if message_string: # on vérifie si le message n'est pas vide
-                try:
-                    packet_dict = json.loads(message_string) # on convertit le message en dictionnaire
-                    Logger.server_receive("Server", f"Received JSON from {client_socket.getpeername()}: {message_string}") 
-                    messages.append(packet_dict) # on ajoute le dictionnaire au tableau des messages
-                except json.JSONDecodeError:
-                    Logger.server_error("Server", f"Invalid JSON received from {client_socket.getpeername()}: {message_string}")
-                    self.disconnect_client(client_socket, "Invalid JSON format") # on déconnecte le client car le message n'est pas valide
-                    return []
-
-        return messages # on retourne la liste des messages
\ No newline at end of file
+        messages = [] # on initialise la liste des messages
+        for packet_dict, size in packets:
+            packet_type = packet_type_name(packet_dict)
+            Logger.server_receive(PACKET_LOG_COMPONENT, "Received %s (%d bytes) from %s", packet_type, size,
+                                  client_socket.getpeername(), game_id=self.get_client_game(client_socket),
+                                  packet_type=packet_type, size=size)
+            messages.append(packet_dict) # on ajoute le dictionnaire au tableau des messages
+        return messages # on retourne la liste des messages
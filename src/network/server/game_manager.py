@@ -1,4 +1,5 @@
 import socket
+import threading
 from typing import Dict, Optional, List
 from src.utils.logger import Logger
 from src.network.server.game_session import GameSession
@@ -11,12 +12,15 @@ from src.network.common.packets import (
 class GameManager:
     """
     classe : gère les parties de jeu et les sessions
+    le registre est copié à chaque ajout ou retrait (sous un verrou réservé aux écritures) : les lectures parcourent
+    le dictionnaire courant sans verrou, et l'état de chaque partie est protégé par le verrou de sa session
     """
     def __init__(self):
         """
         procédure : initialise le gestionnaire de jeu
         """
-        self.games: Dict[str, GameSession] = {} # dictionnaire des parties de jeu (identifiant, session)
+        self.games: Dict[str, GameSession] = {} # dictionnaire des parties de jeu (identifiant, session), jamais modifié en place
+        self._registry_lock = threading.Lock() # verrou des ajouts et retraits de parties
 
     def create_game(self, game_id: str, game_type: str) -> GameSession:
         """
@@ -27,9 +31,32 @@ class GameManager:
         retour : la session de jeu créée
         """
         game = GameSession(game_id, game_type) # on crée la session de jeu
-        self.games[game_id] = game # on ajoute la session de jeu au dictionnaire
+        with self._registry_lock:
+            games = dict(self.games) # on copie le registre
+            games[game_id] = game # on ajoute la session de jeu à la copie
+            self.games = games # on publie la copie (remplacement atomique)
         return game # on retourne la session de jeu
 
+    def get_or_create_game(self, game_id: str, game_type: str) -> GameSession:
+        """
+        fonction : récupère une partie, ou la crée si elle n'existe pas (deux clients ne créent jamais deux sessions)
+        params :
+            game_id - l'identifiant de la partie
+            game_type - le type de jeu si la partie est créée
+        retour : la session de jeu
+        """
+        game = self.games.get(game_id)
+        if game:
+            return game
+        with self._registry_lock:
+            game = self.games.get(game_id) # on vérifie à nouveau sous le verrou
+            if not game:
+                game = GameSession(game_id, game_type)
+                games = dict(self.games)
+                games[game_id] = game
+                self.games = games
+            return game
+
     def get_game(self, game_id: str) -> Optional[GameSession]:
         """
         fonction : récupère une partie
@@ -45,13 +72,18 @@ class GameManager:
         params :
             game_id - l'identifiant de la partie à supprimer
         """
-        if game_id in self.games: # on vérifie si la partie existe
-            del self.games[game_id] # on retire la session de jeu du dictionnaire
-            Logger.server_internal("Server", f"Removed game session: {game_id}") # on log la suppression de la partie
+        with self._registry_lock:
+            if game_id not in self.games: # on vérifie si la partie existe
+                return
+            games = dict(self.games) # on copie le registre
+            game = games.pop(game_id) # on retire la session de jeu de la copie
+            self.games = games # on publie la copie
+        game.closed = True # un client qui attendait le verrou de la partie ne la rejoindra pas
+        Logger.server_internal("Server", f"Removed game session: {game_id}") # on log la suppression de la partie
 
     def get_available_games(self) -> List[Dict]:
         """
-        fonction : récupère la liste des parties disponibles
+        fonction : récupère la liste des parties disponibles (sans verrou : parcourt le registre publié)
         retour : liste des parties disponibles avec leurs informations
         """
         return [
@@ -131,17 +163,18 @@ class GameManager:
         if not game: # on vérifie si la partie existe 
             return None
 
-        player_number = game.remove_player(client_socket) # on retire le joueur de la partie
-        game.active = False
+        with game.lock:
+            player_number = game.remove_player(client_socket) # on retire le joueur de la partie
+            game.active = False
 
-        if player_number:
-            other_socket = game.get_other_player_socket(client_socket) # on récupère le socket de l'autre joueur dans la partie (session)
-            if other_socket: # on vérifie si l'autre joueur existe
-                from src.network.common.packets import create_player_disconnected_dict
-                disconnect_msg = f"Player {player_number} disconnected"
-                player_disconnected_dict = create_player_disconnected_dict(disconnect_msg, game_id) # on crée le paquet de déconnexion du joueur 
-                connection_manager.send_json(other_socket, player_disconnected_dict) # on envoie le paquet de déconnexion du joueur à l'autre joueur
+            if player_number:
+                other_socket = game.get_other_player_socket(client_socket) # on récupère le socket de l'autre joueur dans la partie (session)
+                if other_socket: # on vérifie si l'autre joueur existe
+                    from src.network.common.packets import create_player_disconnected_dict
+                    disconnect_msg = f"Player {player_number} disconnected"
+                    player_disconnected_dict = create_player_disconnected_dict(disconnect_msg, game_id) # on crée le paquet de déconnexion du joueur 
+                    connection_manager.send_json(other_socket, player_disconnected_dict) # on envoie le paquet de déconnexion du joueur à l'autre joueur
 
-        self.remove_game(game_id) 
+            self.remove_game(game_id) 
 
         return player_number 
\ No newline at end of file
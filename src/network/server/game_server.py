@@ -3,8 +3,9 @@ import json
 import threading
 from typing import Dict, Optional, Tuple
 from src.utils.logger import Logger
-from src.network.common.packets import PacketType, create_game_list_dict
-from src.network.server.connection_manager import ConnectionManager
+from src.network.common.packets import PacketType, create_game_list_dict, create_protocol_dict
+from src.network.common.wire import PROTOCOL_BINARY, PROTOCOL_JSON
+from src.network.server.connection_manager import PACKET_LOG_COMPONENT, ConnectionManager
 from src.network.server.game_manager import GameManager
 from src.network.server.chat_manager import ChatManager
 from src.network.server.config_manager import ConfigManager
@@ -21,23 +22,38 @@ class GameServer:
         self.config_manager = ConfigManager() # pour récupérer les paramètres du serveur
         self.config_manager.load_config() # on charge les paramètres du serveur
         
-        self.connection_manager = ConnectionManager() # pour gérer les connexions des clients 
+        self.connection_manager = ConnectionManager(self.config_manager.get_outbound()) # pour gérer les connexions des clients et leurs files d'envoi
         self.game_manager = GameManager() # pour gérer les parties
         self.chat_manager = ChatManager() # pour gérer les messages de chat
         
         self.connection_manager.set_game_manager(self.game_manager) # on associe le gestionnaire de parties au gestionnaire de connexions
         
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM) # on crée le socket du serveur
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # on permet la réutilisation de l'adresse du socket : on peut relancer le serveur sans attendre le timeout
+        self.server_socket: Optional[socket.socket] = None # socket d'écoute, créé au démarrage
         Logger.initialize()
 
+    def start_logging(self) -> None:
+        """
+        procédure : passe les logs du serveur en écriture asynchrone : les fils des clients ne font que mettre
+        les messages en file, l'écriture sur la sortie ou dans le fichier ne bloque jamais les sockets
+        le format (texte ou JSON) et l'échantillonnage par composant viennent du même bloc de configuration
+        """
+        config = dict(self.config_manager.get_logging())
+        try:
+            Logger.set_structured(bool(config.pop("structured", False)))
+            Logger.set_sampling(config.pop("sampling", None))
+            Logger.start_async(**config)
+        except (TypeError, ValueError, OSError) as e:
+            Logger.server_error("Server", f"Invalid logging config, using synchronous logs: {e}")
+
     def start(self) -> None:
         """
         procédure : démarre le serveur et commence à écouter les connexions
         """
         try:
+            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM) # on crée le socket du serveur
+            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # on permet la réutilisation de l'adresse du socket : on peut relancer le serveur sans attendre le timeout
             self.server_socket.bind((self.config_manager.get_host(), self.config_manager.get_port())) # on lie le socket à l'adresse et au port
-            self.server_socket.listen(self.config_manager.get_max_players()) # on écoute les connexions entrantes
+            self.server_socket.listen(self.config_manager.get_backlog()) # on écoute les connexions entrantes (file des connexions pas encore acceptées)
             Logger.server_internal("Server", f"Server started on {self.config_manager.get_host()}:{self.config_manager.get_port()}, listening...")
             
             while True:
@@ -111,7 +127,9 @@ class GameServer:
                 Logger.server_error("Server", f"Unknown packet type value from {client_socket.getpeername()}: {packet_type_val}")
                 return
 
-            Logger.server_internal("Server", f"Processing packet from {client_socket.getpeername()}: Type={packet_type_enum.name}, Data={packet_data}")
+            # sans le contenu du paquet : les coups et instantanés sont gros et fréquents
+            Logger.server_internal(PACKET_LOG_COMPONENT, "Processing %s from %s", packet_type_enum.name, client_socket.getpeername(),
+                                   game_id=self.connection_manager.get_client_game(client_socket), packet_type=packet_type_enum.name)
 
             # call les fonctions de traitement des paquets (handle CtoS)
             if packet_type_enum == PacketType.CONNECT: # on vérifie si le type du paquet est CONNECT
@@ -124,6 +142,10 @@ class GameServer:
                 self.handle_chat_message(client_socket, packet_data)
             elif packet_type_enum == PacketType.GET_GAME_LIST:
                 self.handle_get_game_list(client_socket)
+            elif packet_type_enum == PacketType.PROTOCOL:
+                self.handle_protocol(client_socket, packet_data)
+            elif packet_type_enum in (PacketType.SYNC_REQUEST, PacketType.GAME_STATE):
+                self.handle_state_sync(client_socket, packet_type_enum, packet_data)
             else:
                 Logger.server_error("Server", f"No handler for packet type from {client_socket.getpeername()}: {packet_type_enum.name}")
 
@@ -149,16 +171,19 @@ class GameServer:
 
             Logger.server_internal("Server", f"Connect request from {player_name} for game '{game_name}' (type: {game_type})")
 
-            game = self.game_manager.get_game(game_name) # on récupère la partie
-            if not game: # on vérifie si la partie existe
-                game = self.game_manager.create_game(game_name, game_type) # on crée la partie
+            while True:
+                game = self.game_manager.get_or_create_game(game_name, game_type) # on récupère la partie ou on la crée
+                with game.lock: # la vérification de la place et l'ajout du joueur sont atomiques
+                    if game.closed: # la partie a été retirée entre-temps : on en recrée une
+                        continue
 
-            if game.is_full(): # on vérifie si la partie est pleine
-                self.connection_manager.disconnect_client(client_socket, f"Game '{game_name}' is full") # on déconnecte le client car la partie est pleine
-                return
+                    if game.is_full(): # on vérifie si la partie est pleine
+                        self.connection_manager.disconnect_client(client_socket, f"Game '{game_name}' is full") # on déconnecte le client car la partie est pleine
+                        return
 
-            if self.game_manager.handle_player_join(game, client_socket, player_name, self.connection_manager): # on ajoute le joueur à la partie
-                self.connection_manager.set_client_game(client_socket, game_name) # on associe le client à la partie
+                    if self.game_manager.handle_player_join(game, client_socket, player_name, self.connection_manager): # on ajoute le joueur à la partie
+                        self.connection_manager.set_client_game(client_socket, game_name) # on associe le client à la partie
+                    return
 
         except Exception as e:
             Logger.server_error("Server", f"Error handling connection: {str(e)}")
@@ -176,21 +201,49 @@ class GameServer:
             return
 
         game = self.game_manager.get_game(game_id) # on récupère la partie
-        if not game or not game.active or not game.is_full(): # on vérifie si la partie existe et si elle est active et si elle est pleine
+        if not game:
             return
 
-        if not game.is_player_turn(client_socket): # on vérifie si c'est le tour du joueur
+        with game.lock: # vérification du tour, envoi de l'action et changement de tour sans action concurrente
+            if game.closed or not game.active or not game.is_full(): # on vérifie si la partie est toujours ouverte, active et pleine
+                return
+
+            if not game.is_player_turn(client_socket): # on vérifie si c'est le tour du joueur
+                return
+
+            other_socket = game.get_other_player_socket(client_socket) # on récupère le socket de l'autre joueur dans la partie (session)
+            if other_socket: # on vérifie si l'autre joueur existe 
+                action_packet_dict = {
+                    "type": PacketType.GAME_ACTION.value,
+                    "data": packet_data
+                }
+                if self.connection_manager.send_json(other_socket, action_packet_dict): # on envoie l'action à l'autre joueur
+                    game.switch_turn(client_socket) # on met à jour le tour du joueur
+                    self._send_turn_updates(game) # on envoie les mises à jour de tour aux joueurs
+
+    def handle_state_sync(self, client_socket: socket.socket, packet_type: PacketType, packet_data: Dict) -> None:
+        """
+        procédure : relaie une demande d'instantané ou un instantané à l'autre joueur, sans changer de tour
+        (le serveur ne connaît pas l'état des parties : l'instantané vient du client de l'adversaire)
+        params :
+            client_socket - le socket du client
+            packet_type - SYNC_REQUEST ou GAME_STATE
+            packet_data - les données du paquet
+        """
+        game_id = self.connection_manager.get_client_game(client_socket) # on récupère l'identifiant de la partie
+        if not game_id: # on vérifie si le client est dans une partie
             return
 
-        other_socket = game.get_other_player_socket(client_socket) # on récupère le socket de l'autre joueur dans la partie (session)
-        if other_socket: # on vérifie si l'autre joueur existe 
-            action_packet_dict = {
-                "type": PacketType.GAME_ACTION.value,
-                "data": packet_data
-            }
-            if self.connection_manager.send_json(other_socket, action_packet_dict): # on envoie l'action à l'autre joueur
-                game.current_turn = 3 - game.current_turn # on met à jour le tour du joueur
-                self._send_turn_updates(game) # on envoie les mises à jour de tour aux joueurs
+        game = self.game_manager.get_game(game_id) # on récupère la partie
+        if not game:
+            return
+
+        with game.lock: # l'instantané ne s'intercale pas au milieu d'une action et de son changement de tour
+            if game.closed or not game.is_full():
+                return
+            other_socket = game.get_other_player_socket(client_socket) # on récupère le socket de l'autre joueur
+            if other_socket:
+                self.connection_manager.send_json(other_socket, {"type": packet_type.value, "data": packet_data})
 
     def handle_chat_message(self, client_socket: socket.socket, packet_data: Dict) -> None:
         """
@@ -219,6 +272,21 @@ class GameServer:
         response = create_game_list_dict(games_list) # on crée le paquet de réponse
         self.connection_manager.send_json(client_socket, response) # on envoie la liste des parties disponibles au client
 
+    def handle_protocol(self, client_socket: socket.socket, packet_data: Dict) -> None:
+        """
+        procédure : gère une négociation du format d'échange : répond dans le format courant,
+        puis envoie les paquets suivants dans le format choisi
+        params :
+            client_socket - le socket du client
+            packet_data - les formats proposés par le client
+        """
+        requested = packet_data.get("protocols", [])
+        binary = self.config_manager.get_protocol() == PROTOCOL_BINARY and PROTOCOL_BINARY in requested
+        protocol = PROTOCOL_BINARY if binary else PROTOCOL_JSON
+        self.connection_manager.send_json(client_socket, create_protocol_dict(protocol)) # réponse dans le format courant
+        self.connection_manager.set_client_protocol(client_socket, protocol)
+        Logger.server_internal("Server", f"Protocol for {client_socket.getpeername()}: {protocol}")
+
     def _send_turn_updates(self, game: GameSession) -> None:
         """
         procédure : envoie les mises à jour de tour aux joueurs
@@ -242,6 +310,8 @@ class GameServer:
         procédure : nettoie les ressources du serveur
         """
         Logger.server_internal("Server", "Shutting down server and cleaning up...")
+        if self.server_socket is None:
+            return
         try:
             self.server_socket.close()
             Logger.server_internal("Server", "Server socket closed.")
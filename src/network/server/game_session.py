@@ -1,9 +1,12 @@
 import socket
+import threading
 from typing import Dict, Optional
 
 class GameSession:
     """
     classe : session de jeu qui gère les joueurs et les tours de jeu
+    chaque session a son propre verrou : les fils des clients d'une partie se synchronisent entre eux,
+    sans bloquer les autres parties
     """
     def __init__(self, game_id: str, game_type: str):
         """
@@ -17,6 +20,8 @@ class GameSession:
         self.players: Dict[int, socket.socket] = {} # dictionnaire des joueurs (numéro du joueur, socket du joueur)
         self.current_turn = 1 # numéro du joueur actuel (1 ou 2)
         self.active = True # indique si la partie est active
+        self.closed = False # indique si la partie a été retirée du registre (plus aucun joueur ne peut la rejoindre)
+        self.lock = threading.RLock() # verrou de la partie (joueurs, tour, fermeture)
 
     def add_player(self, player_socket: socket.socket) -> int:
         """
@@ -25,11 +30,12 @@ class GameSession:
             player_socket - le socket du joueur à ajouter
         retour : le numéro du joueur ajouté
         """
-        if len(self.players) >= 2: # on vérifie si la partie est pleine
-            raise ValueError("Game session is full")
-        player_number = 1 if 1 not in self.players else 2 # on détermine le numéro du joueur
-        self.players[player_number] = player_socket # on ajoute le joueur au dictionnaire
-        return player_number
+        with self.lock:
+            if len(self.players) >= 2: # on vérifie si la partie est pleine
+                raise ValueError("Game session is full")
+            player_number = 1 if 1 not in self.players else 2 # on détermine le numéro du joueur
+            self.players[player_number] = player_socket # on ajoute le joueur au dictionnaire
+            return player_number
 
     def remove_player(self, player_socket: socket.socket) -> Optional[int]:
         """
@@ -38,15 +44,11 @@ class GameSession:
             player_socket - le socket du joueur à retirer
         retour : le numéro du joueur retiré ou None
         """
-        player_to_remove = None # on initialise le numéro du joueur à retirer
-        for player_number, sock in self.players.items(): # on parcourt le dictionnaire des joueurs
-            if sock == player_socket: # on vérifie si le socket du joueur est le même que le socket du joueur à retirer
-                player_to_remove = player_number # on détermine le numéro du joueur à retirer
-                break
-        if player_to_remove is not None: # on vérifie si le numéro du joueur à retirer existe
-            del self.players[player_to_remove] # on retire le joueur du dictionnaire
-            return player_to_remove # on retourne le numéro du joueur retiré
-        return None 
+        with self.lock:
+            player_to_remove = self.get_player_number(player_socket) # on détermine le numéro du joueur à retirer
+            if player_to_remove is not None: # on vérifie si le numéro du joueur à retirer existe
+                del self.players[player_to_remove] # on retire le joueur du dictionnaire
+            return player_to_remove # on retourne le numéro du joueur retiré (ou None)
 
     def get_other_player_socket(self, current_socket: socket.socket) -> Optional[socket.socket]:
         """
@@ -55,7 +57,7 @@ class GameSession:
             current_socket - le socket du joueur actuel
         retour : le socket du joueur opposé ou None
         """
-        for sock in self.players.values(): # on parcourt le dictionnaire des joueurs
+        for sock in list(self.players.values()): # on parcourt une copie des joueurs (modifiables par un autre fil)
             if sock != current_socket: # on vérifie si le socket du joueur est différent du socket du joueur actuel
                 return sock # on retourne le socket du joueur opposé
         return None # on retourne None si le joueur opposé n'existe pas
@@ -67,7 +69,7 @@ class GameSession:
             player_socket - le socket du joueur
         retour : le numéro du joueur ou None
         """
-        for player_number, sock in self.players.items(): # on parcourt le dictionnaire des joueurs
+        for player_number, sock in list(self.players.items()): # on parcourt une copie des joueurs (modifiables par un autre fil)
             if sock == player_socket: # on vérifie si le socket du joueur est le même que le socket du joueur
                 return player_number # on retourne le numéro du joueur
         return None # on retourne None si le numéro du joueur n'existe pas
@@ -96,12 +98,26 @@ class GameSession:
         """
         return len(self.players) == 0
 
+    def switch_turn(self, player_socket: socket.socket) -> bool:
+        """
+        fonction : passe le tour à l'autre joueur si c'est bien le tour de ce joueur (vérification et changement atomiques)
+        params :
+            player_socket - le socket du joueur qui termine son tour
+        retour : True si le tour a changé, False si ce n'était pas le tour du joueur
+        """
+        with self.lock:
+            if not self.is_player_turn(player_socket):
+                return False
+            self.current_turn = 3 - self.current_turn
+            return True
+
     def start(self) -> None:
         """
         procédure : démarre la partie
         """
-        self.active = True
-        self.current_turn = 1
+        with self.lock:
+            self.active = True
+            self.current_turn = 1
 
     def get_player_count(self) -> int:
         """
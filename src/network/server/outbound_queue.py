@@ -0,0 +1,252 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+from src.utils.logger import Logger
+
+# politiques quand la file d'un client est pleine : perdre le paquet, déconnecter le client, ou attendre (block_timeout)
+OVERFLOW_POLICIES = ("drop", "disconnect", "block")
+
+class OutboundQueue:
+    """
+    classe : file bornée des paquets à envoyer à un client, vidée par un écrivain dédié (fil ou tâche asyncio)
+    l'envoi d'un paquet ne fait que l'ajouter à la file : un client lent ne bloque jamais le fil qui lui écrit,
+    et les petits paquets en attente sont regroupés en une seule écriture
+    """
+    def __init__(self, max_packets: int = 256, overflow_policy: str = "disconnect", max_batch_bytes: int = 65536,
+                 block_timeout: float = 5.0) -> None:
+        """
+        procédure : initialise la file
+        params :
+            max_packets - nombre maximal de paquets en attente
+            overflow_policy - comportement quand la file est pleine (voir OVERFLOW_POLICIES)
+            max_batch_bytes - taille maximale d'une écriture regroupée
+            block_timeout - attente maximale d'une place avec la politique "block", en secondes
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.max_packets: int = max_packets
+        self.overflow_policy: str = overflow_policy
+        self.max_batch_bytes: int = max_batch_bytes
+        self.block_timeout: float = block_timeout
+        self.packets: Deque[bytes] = deque() # paquets encodés en attente d'envoi
+        self.condition = threading.Condition() # protège la file, réveille l'écrivain et les producteurs en attente
+        self.writing: bool = False # un lot est en cours d'écriture
+        self.closed: bool = False
+        self.dropped: int = 0 # paquets refusés parce que la file était pleine
+
+    def _can_block(self) -> bool:
+        """
+        fonction : indique si un producteur peut attendre qu'une place se libère
+        retour : True si l'écrivain tourne dans un autre fil que les producteurs
+        """
+        return True
+
+    def _wake(self) -> None:
+        """
+        procédure : réveille l'écrivain (appelée avec le verrou de la file)
+        """
+        self.condition.notify_all()
+
+    def put(self, data: bytes) -> bool:
+        """
+        fonction : ajoute un paquet encodé à la file, selon la politique de débordement
+        params :
+            data - les octets du paquet
+        retour : True si le paquet a été accepté, False s'il a été refusé (file pleine ou fermée)
+        """
+        with self.condition:
+            if len(self.packets) >= self.max_packets and self.overflow_policy == "block" and self._can_block():
+                deadline = time.monotonic() + self.block_timeout
+                while not self.closed and len(self.packets) >= self.max_packets:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+            if self.closed:
+                return False
+            if len(self.packets) >= self.max_packets:
+                self.dropped += 1
+                return False
+            self.packets.append(data)
+            self._wake()
+            return True
+
+    def take_batch(self) -> bytes:
+        """
+        fonction : retire de la file les paquets en attente, dans la limite de max_batch_bytes (au moins un paquet)
+        retour : les paquets regroupés, vide si la file est vide
+        """
+        with self.condition:
+            batch = []
+            size = 0
+            while self.packets and (not batch or size + len(self.packets[0]) <= self.max_batch_bytes):
+                packet = self.packets.popleft()
+                batch.append(packet)
+                size += len(packet)
+            self.writing = bool(batch)
+            self.condition.notify_all() # des places se sont libérées
+            return b"".join(batch)
+
+    def _written(self) -> None:
+        """
+        procédure : marque la fin de l'écriture d'un lot
+        """
+        with self.condition:
+            self.writing = False
+            self.condition.notify_all()
+
+    def pending(self) -> int:
+        """
+        fonction : nombre de paquets en attente
+        retour : taille de la file
+        """
+        return len(self.packets)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        fonction : attend que tous les paquets en attente soient écrits
+        params :
+            timeout - durée maximale d'attente en secondes
+        retour : True si la file a été vidée
+        """
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            while (self.packets or self.writing) and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+            return not self.packets
+
+    def close(self, flush_timeout: float = 1.0) -> None:
+        """
+        procédure : ferme la file ; les paquets en attente sont encore envoyés pendant flush_timeout
+        params :
+            flush_timeout - durée maximale d'envoi des paquets en attente (0 : abandonnés)
+        """
+        with self.condition:
+            self.closed = True
+            if flush_timeout <= 0:
+                self.packets.clear()
+            self._wake()
+
+class ThreadedOutboundQueue(OutboundQueue):
+    """
+    classe : file d'envoi d'un socket, vidée par un fil d'écriture (serveur à un fil par client)
+    """
+    def __init__(self, client_socket, **options) -> None:
+        """
+        procédure : initialise la file et démarre le fil d'écriture
+        params :
+            client_socket - le socket du client
+            options - paramètres de OutboundQueue
+        """
+        super().__init__(**options)
+        self.client_socket = client_socket
+        self.thread = threading.Thread(target=self._run, name="OutboundWriter", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        """
+        procédure : boucle du fil d'écriture : attend des paquets et les envoie par lots
+        """
+        while True:
+            with self.condition:
+                while not self.packets and not self.closed:
+                    self.condition.wait()
+                if not self.packets: # file fermée et vide
+                    return
+            batch = self.take_batch()
+            try:
+                self.client_socket.sendall(batch)
+            except OSError as e:
+                Logger.server_error("Server", f"Failed to write to client: {e}")
+                with self.condition:
+                    self.closed = True
+                    self.packets.clear()
+                    self.writing = False
+                    self.condition.notify_all()
+                return
+            self._written()
+
+    def close(self, flush_timeout: float = 1.0) -> None:
+        """
+        procédure : ferme la file et attend la fin du fil d'écriture
+        params :
+            flush_timeout - durée maximale d'envoi des paquets en attente (0 : abandonnés)
+        """
+        super().close(flush_timeout)
+        if threading.current_thread() is not self.thread:
+            self.thread.join(max(flush_timeout, 0.0))
+
+class StreamOutboundQueue(OutboundQueue):
+    """
+    classe : file d'envoi d'une connexion asyncio, vidée par une tâche de la boucle d'événements
+    la boucle ne peut pas attendre une place : la politique "block" y déconnecte le client comme "disconnect"
+    """
+    def __init__(self, connection, **options) -> None:
+        """
+        procédure : initialise la file et démarre la tâche d'écriture (à appeler depuis la boucle d'événements)
+        params :
+            connection - la StreamConnection du client
+            options - paramètres de OutboundQueue
+        """
+        super().__init__(**options)
+        self.writer: asyncio.StreamWriter = connection.writer
+        self.event = asyncio.Event()
+        self.task: Optional[asyncio.Task] = asyncio.get_running_loop().create_task(self._run())
+
+    def _can_block(self) -> bool:
+        """
+        fonction : les producteurs tournent dans la boucle d'événements qui vide la file
+        retour : False
+        """
+        return False
+
+    def _wake(self) -> None:
+        """
+        procédure : réveille la tâche d'écriture
+        """
+        self.event.set()
+        super()._wake()
+
+    async def _run(self) -> None:
+        """
+        procédure : tâche d'écriture : attend des paquets et les écrit par lots, au rythme du client
+        """
+        while True:
+            await self.event.wait()
+            self.event.clear()
+            while True:
+                batch = self.take_batch()
+                if not batch:
+                    break
+                try:
+                    self.writer.write(batch)
+                    await self.writer.drain() # attend que le client lise (ne bloque que cette tâche)
+                except (ConnectionError, RuntimeError):
+                    self.closed = True
+                    self.packets.clear()
+                    return
+                finally:
+                    self._written()
+            if self.closed:
+                return
+
+    def close(self, flush_timeout: float = 1.0) -> None:
+        """
+        procédure : ferme la file ; les paquets en attente sont confiés au flux, qui les envoie avant de se fermer
+        params :
+            flush_timeout - 0 pour abandonner les paquets en attente
+        """
+        super().close(flush_timeout)
+        while not self.writer.is_closing():
+            batch = self.take_batch()
+            if not batch:
+                break
+            self.writer.write(batch)
+        self._written()
+        if self.task is not None:
+            self.task.cancel()
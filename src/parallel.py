@@ -0,0 +1,77 @@
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from src.utils.logger import Logger
+
+class ParallelSearch:
+    """
+    classe : répartit la recherche des bots sur un groupe de processus (contourne le verrou global de python)
+    les processus sont créés au premier appel puis réutilisés à chaque coup ; les plateaux leur sont envoyés
+    sous forme compacte sérialisée (BitBoard.serialize), jamais en listes imbriquées
+    """
+    def __init__(self, workers: int) -> None:
+        """
+        procédure : configure le groupe de processus sans le démarrer
+        params :
+            workers - nombre de processus
+        """
+        if workers < 1:
+            raise ValueError(f"Invalid worker count: {workers}")
+        self.workers: int = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def split(self, moves: Sequence[Any]) -> List[List[Any]]:
+        """
+        fonction : répartit les coups de la racine entre les processus
+        params :
+            moves - coups triés du meilleur au moins bon
+        retour : une liste de coups par processus (distribution tour à tour pour répartir les bons coups)
+        """
+        chunk_count = min(self.workers, len(moves))
+        return [list(moves[index::chunk_count]) for index in range(chunk_count)]
+
+    def run(self, function: Callable[..., Any], jobs: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        fonction : exécute une fonction de recherche sur chaque lot d'arguments en parallèle
+        params :
+            function - fonction définie au niveau d'un module (elle doit pouvoir être envoyée aux processus)
+            jobs - arguments de chaque appel
+        retour : résultats dans l'ordre des lots
+        """
+        if self._executor is None:
+            # "spawn" : les processus ne copient pas l'état de pygame du processus principal
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            Logger.bot("ParallelSearch", "Started a pool of %s search processes", self.workers)
+        futures = [self._executor.submit(function, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """
+        procédure : arrête les processus (ils seront recréés au prochain appel de run)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+def merge_root_results(worker_results: Sequence[Sequence[Tuple[int, float, Any, int]]],
+                       win_threshold: float) -> List[Tuple[int, float, Any, int]]:
+    """
+    fonction : fusionne les itérations terminées par les processus d'une recherche alpha-beta répartie à la racine
+    params :
+        worker_results - pour chaque processus, liste des (profondeur, score, meilleur coup ou variation, noeuds)
+                         de chaque itération terminée sur ses coups de la racine
+        win_threshold - score à partir duquel un résultat est une victoire forcée
+    retour : meilleur résultat de chaque profondeur terminée par tous les processus (noeuds additionnés),
+             ou la meilleure victoire forcée trouvée par l'un d'eux
+    """
+    nodes = sum(results[-1][3] for results in worker_results if results)
+    wins = [results[-1] for results in worker_results if results and results[-1][1] >= win_threshold]
+    if wins:
+        depth, score, best, _ = max(wins, key=lambda result: result[1])
+        return [(depth, score, best, nodes)]
+    merged = []
+    # une profondeur n'est comparable que si tous les processus l'ont terminée
+    for index in range(min(len(results) for results in worker_results)):
+        depth, score, best, _ = max((results[index] for results in worker_results), key=lambda result: result[1])
+        merged.append((depth, score, best, nodes))
+    return merged
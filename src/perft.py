@@ -0,0 +1,245 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import time
+from pathlib import Path
+from src.board import Board
+from src.captures import AttackMap
+from src.game_state import GAME_TYPES, layout_quadrants
+from src.move_tables import KATERENGA_TARGET_CAMPS
+from src.moves import generate_moves
+from src.zobrist import Position
+from src.windows.selector.config_loader import ConfigLoader
+from src.utils.logger import Logger
+
+# fichier des nombres de feuilles de référence (oracle de régression du générateur de coups)
+GOLDEN_FILE = "tests/perft_golden.json"
+# dispositions mesurées par défaut : (noms des quadrants, quarts de tour à droite)
+DEFAULT_LAYOUTS: Tuple[Tuple[Tuple[str, ...], Tuple[int, ...]], ...] = (
+    (("1", "2", "3", "4"), (0, 0, 0, 0)),
+    (("5", "6", "7", "8"), (0, 1, 2, 3)),
+    (("2", "4", "6", "8"), (1, 3, 0, 2)),
+)
+# profondeur par défaut de chaque jeu (quelques secondes par disposition)
+DEFAULT_DEPTHS = {"katerenga": 4, "isolation": 4, "congress": 4}
+
+Layout = Tuple[Sequence[str], Sequence[int]]
+
+def start_position(game_type: int, quadrants: List[List[List[List[Optional[int]]]]]) -> Tuple[Position, Optional[AttackMap]]:
+    """
+    fonction : position de départ d'un jeu pour une disposition
+    params :
+        game_type - numéro du jeu (voir GAME_TYPES)
+        quadrants - les quatre quadrants de la disposition
+    retour : (position, carte des attaques pour l'isolation sinon None)
+    """
+    board = Board(quadrants, game_type).board
+    if game_type == GAME_TYPES["isolation"]:
+        return Position.from_board(board, 0), AttackMap(board)
+    return Position.from_board(board, 0, first_turn=game_type == GAME_TYPES["katerenga"]), None
+
+def _camp_masks(size: int) -> Tuple[int, int]:
+    """
+    fonction : bitboards des deux camps à atteindre par chaque joueur du katerenga
+    params :
+        size - taille du plateau
+    retour : (masque du joueur 0, masque du joueur 1)
+    """
+    return tuple(sum(1 << row * size + col for row, col in KATERENGA_TARGET_CAMPS[player]) for player in (0, 1))
+
+def _game_over(position: Position, game_type: int, camps: Tuple[int, int]) -> bool:
+    """
+    fonction : vérifie si le joueur qui vient de jouer a gagné (les positions terminales n'ont aucun coup)
+    params :
+        position - position après le coup
+        game_type - numéro du jeu
+        camps - masques des camps du katerenga
+    retour : True si la partie est terminée par une victoire
+    la victoire par blocage n'a pas besoin d'être testée : l'adversaire n'a alors aucun coup
+    """
+    player = 1 - position.turn
+    if game_type == GAME_TYPES["katerenga"]:
+        return position.board.occupancy[player] & camps[player] == camps[player]
+    return len(position.board.groups(player)) == 1
+
+def _moves(position: Position, game_type: int) -> List[Tuple[int, int]]:
+    """
+    fonction : coups légaux de la position sous forme (case de départ, case d'arrivée)
+    params :
+        position - position courante
+        game_type - katerenga ou congress
+    retour : liste des coups
+    """
+    size = position.board.size
+    if game_type == GAME_TYPES["congress"]:
+        moves = generate_moves(position.board, position.turn, captures=False)
+    else:
+        moves = generate_moves(position.board, position.turn, position.first_turn)
+    return [(from_row * size + from_col, to_row * size + to_col) for from_row, from_col, to_row, to_col in moves]
+
+def perft(position: Position, game_type: int, depth: int, attack_map: Optional[AttackMap] = None) -> int:
+    """
+    fonction : compte les feuilles de l'arbre des coups légaux jusqu'à une profondeur donnée
+    params :
+        position - position de départ (restaurée à la fin)
+        game_type - numéro du jeu
+        depth - nombre de demi-coups
+        attack_map - carte des attaques de la position (isolation, restaurée à la fin)
+    retour : nombre de positions atteintes à la profondeur depth
+    """
+    if game_type == GAME_TYPES["isolation"]:
+        return _perft_isolation(attack_map if attack_map is not None else AttackMap(position.board), position.turn, depth)
+    return _perft_moves(position, game_type, depth, _camp_masks(position.board.size))
+
+def _perft_moves(position: Position, game_type: int, depth: int, camps: Tuple[int, int]) -> int:
+    """
+    fonction : perft par déplacements (katerenga, congress) avec make_move / unmake_move
+    params :
+        position - position courante
+        game_type - numéro du jeu
+        depth - profondeur restante
+        camps - masques des camps du katerenga
+    retour : nombre de feuilles
+    """
+    if depth == 0:
+        return 1
+    moves = _moves(position, game_type)
+    if depth == 1:
+        return len(moves) # comptage direct des feuilles, sans jouer le dernier coup
+    nodes = 0
+    for from_square, to_square in moves:
+        undo = position.make_move(from_square, to_square)
+        if not _game_over(position, game_type, camps): # une position gagnée n'a plus de coups
+            nodes += _perft_moves(position, game_type, depth - 1, camps)
+        position.unmake_move(undo)
+    return nodes
+
+def _perft_isolation(attack_map: AttackMap, turn: int, depth: int) -> int:
+    """
+    fonction : perft de l'isolation : pose d'une tour sur chaque case vide non menacée
+    params :
+        attack_map - carte des attaques de la position courante
+        turn - joueur qui a le trait
+        depth - profondeur restante
+    retour : nombre de feuilles
+    """
+    if depth == 0:
+        return 1
+    mask = attack_map.safe_squares_mask(turn, check_all_pieces=True)
+    if depth == 1:
+        return bin(mask).count("1")
+    size = attack_map.compact.size
+    nodes = 0
+    while mask:
+        low_bit = mask & -mask
+        mask ^= low_bit
+        row, col = divmod(low_bit.bit_length() - 1, size)
+        attack_map.place(row, col, turn)
+        nodes += _perft_isolation(attack_map, 1 - turn, depth - 1)
+        attack_map.remove(row, col)
+    return nodes
+
+def divide(position: Position, game_type: int, depth: int, attack_map: Optional[AttackMap] = None) -> Dict[str, int]:
+    """
+    fonction : perft détaillé par coup de la racine, pour localiser l'écart avec un autre générateur
+    params :
+        position - position de départ
+        game_type - numéro du jeu
+        depth - nombre de demi-coups (au moins 1)
+        attack_map - carte des attaques (isolation)
+    retour : dictionnaire "r,c" ou "r,c-r,c" vers le nombre de feuilles sous ce coup
+    """
+    counts: Dict[str, int] = {}
+    if game_type == GAME_TYPES["isolation"]:
+        attack_map = attack_map if attack_map is not None else AttackMap(position.board)
+        for row, col in attack_map.safe_squares(position.turn, check_all_pieces=True):
+            attack_map.place(row, col, position.turn)
+            counts[f"{row},{col}"] = _perft_isolation(attack_map, 1 - position.turn, depth - 1)
+            attack_map.remove(row, col)
+        return counts
+    size = position.board.size
+    camps = _camp_masks(size)
+    for from_square, to_square in _moves(position, game_type):
+        undo = position.make_move(from_square, to_square)
+        over = depth > 1 and _game_over(position, game_type, camps)
+        key = "{},{}-{},{}".format(*divmod(from_square, size), *divmod(to_square, size))
+        counts[key] = 0 if over else _perft_moves(position, game_type, depth - 1, camps)
+        position.unmake_move(undo)
+    return counts
+
+def layout_key(names: Sequence[str], rotations: Sequence[int]) -> str:
+    """
+    fonction : identifiant d'une disposition dans le fichier de référence
+    params :
+        names - noms des quadrants
+        rotations - quarts de tour à droite
+    retour : chaîne de la forme "1:0,2:0,3:0,4:0"
+    """
+    return ",".join(f"{name}:{rotation}" for name, rotation in zip(names, rotations))
+
+def load_golden(path: str = GOLDEN_FILE) -> Dict[str, Dict[str, List[int]]]:
+    """
+    fonction : lit les nombres de feuilles de référence
+    params :
+        path - fichier json {jeu: {disposition: [feuilles à la profondeur 1, 2, ...]}}
+    retour : références, vides si le fichier n'existe pas
+    """
+    if not Path(path).exists():
+        Logger.warning("Perft", f"Golden file not found: {path}")
+        return {}
+    with Path(path).open(encoding="utf-8") as file:
+        return json.load(file)
+
+def run_perft(game_names: Sequence[str], depths: Optional[Dict[str, int]] = None, layouts: Sequence[Layout] = DEFAULT_LAYOUTS,
+              golden: Optional[Dict[str, Dict[str, List[int]]]] = None,
+              quadrants_config: Optional[Dict[str, List[List[List[Optional[int]]]]]] = None) -> List[Dict[str, Any]]:
+    """
+    fonction : mesure perft à chaque profondeur jusqu'à la profondeur demandée, pour chaque jeu et disposition
+    params :
+        game_names - jeux à mesurer (voir GAME_TYPES)
+        depths - profondeur maximale par jeu (None : DEFAULT_DEPTHS)
+        layouts - dispositions (noms des quadrants, rotations)
+        golden - références à comparer (None : pas de comparaison)
+        quadrants_config - quadrants disponibles (None : configs/quadrants.json)
+    retour : une ligne par jeu, disposition et profondeur (feuilles, durée, feuilles par seconde, référence, accord)
+    """
+    depths = {**DEFAULT_DEPTHS, **(depths or {})}
+    if quadrants_config is None:
+        config_result = ConfigLoader().load_quadrants()
+        if not config_result:
+            raise ValueError("Failed to load quadrants configuration")
+        quadrants_config = config_result[0]
+
+    results = []
+    for game_name in game_names:
+        game_type = GAME_TYPES[game_name]
+        for names, rotations in layouts:
+            key = layout_key(names, rotations)
+            position, attack_map = start_position(game_type, layout_quadrants(quadrants_config, names, rotations))
+            expected_counts = (golden or {}).get(game_name, {}).get(key, [])
+            for depth in range(1, depths[game_name] + 1):
+                start = time.perf_counter()
+                nodes = perft(position, game_type, depth, attack_map)
+                elapsed = time.perf_counter() - start
+                expected = expected_counts[depth - 1] if depth <= len(expected_counts) else None
+                results.append({"game": game_name, "layout": key, "depth": depth, "nodes": nodes, "elapsed": elapsed,
+                                "nodes_per_second": nodes / elapsed if elapsed > 0 else 0.0,
+                                "expected": expected, "ok": expected is None or expected == nodes})
+                if expected is not None and expected != nodes:
+                    Logger.error("Perft", f"{game_name} [{key}] depth {depth}: {nodes} nodes, expected {expected}")
+    return results
+
+def write_golden(results: Sequence[Dict[str, Any]], path: str = GOLDEN_FILE) -> None:
+    """
+    procédure : enregistre les nombres de feuilles mesurés comme nouvelles références
+    params :
+        results - lignes retournées par run_perft
+        path - fichier json de référence
+    """
+    golden = load_golden(path)
+    for result in sorted(results, key=lambda line: line["depth"]):
+        counts = golden.setdefault(result["game"], {}).setdefault(result["layout"], [])
+        del counts[result["depth"] - 1:]
+        counts.append(result["nodes"])
+    with Path(path).open("w", encoding="utf-8") as file:
+        json.dump(golden, file, indent=2)
+    Logger.success("Perft", f"Golden counts written to {path}")
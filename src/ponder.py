@@ -0,0 +1,78 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+from src.utils.logger import Logger
+
+class PonderResult(NamedTuple):
+    """
+    classe : résultat d'une réflexion sur le temps de l'adversaire (pondering)
+    structure :
+        move - réponse prédite de l'adversaire (coup encodé par le bot)
+        key - hachage de la position attendue après cette réponse
+        results - itérations terminées sur cette position (format de la recherche du bot)
+        elapsed - durée de la réflexion en secondes
+        completed - True si la recherche est allée à son terme avant d'être arrêtée
+    """
+    move: int
+    key: int
+    results: List[Any]
+    elapsed: float
+    completed: bool
+
+class PonderStats:
+    """
+    classe : statistiques de la réflexion sur le temps de l'adversaire, communes aux trois bots
+    une prédiction est réussie quand le coup réel de l'adversaire mène à la position préparée
+    """
+    def __init__(self, name: str) -> None:
+        """
+        procédure : initialise les compteurs
+        params :
+            name - nom du bot dans les journaux
+        """
+        self.name: str = name
+        self.ponders: int = 0
+        self.hits: int = 0
+        self.time_saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        fonction : proportion de prédictions réussies
+        retour : taux entre 0 et 1
+        """
+        return self.hits / self.ponders if self.ponders else 0.0
+
+    def record(self, hit: bool, time_saved: float) -> None:
+        """
+        procédure : enregistre l'issue d'une réflexion quand le coup réel de l'adversaire arrive
+        params :
+            hit - True si la prédiction est réussie
+            time_saved - temps de réflexion économisé sur le coup du bot en secondes
+        """
+        self.ponders += 1
+        if hit:
+            self.hits += 1
+            self.time_saved += time_saved
+        Logger.bot(self.name, "Ponder %s (%.2fs saved), hit rate %.0f%% over %s moves, %.2fs saved in total",
+                   "hit" if hit else "miss", time_saved, self.hit_rate * 100, self.ponders, self.time_saved)
+
+    def check(self, pondered: Optional[PonderResult], key: int, budget: float) -> Optional[PonderResult]:
+        """
+        fonction : compare la position réelle à la position préparée et enregistre l'issue de la prédiction
+        params :
+            pondered - dernière réflexion du bot ou None
+            key - hachage de la position réelle
+            budget - temps de réflexion normal du bot en secondes
+        retour : la réflexion si la prédiction est réussie, sinon None
+        """
+        if pondered is None:
+            return None
+        hit = pondered.key == key
+        self.record(hit, min(pondered.elapsed, budget) if hit else 0.0)
+        return pondered if hit else None
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        fonction : statistiques sous forme de dictionnaire
+        retour : ponders, hits, hit_rate, time_saved
+        """
+        return {"ponders": self.ponders, "hits": self.hits, "hit_rate": self.hit_rate, "time_saved": self.time_saved}
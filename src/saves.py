@@ -1,6 +1,7 @@
 from typing import Dict, Any, List, Optional
 import os
 import json
+from src.zobrist import hash_board
 from src.utils.logger import Logger
 
 
@@ -23,7 +24,8 @@ def save_game(game: Any) -> None:
         game_state: Dict[str, Any] = {
             'board': [[[cell[0], cell[1]] for cell in row] for row in game.board.board],
             'round_turn': game.round_turn,
-            'game': game_type  # type de jeu (katerenga, isolation, congress)
+            'game': game_type,  # type de jeu (katerenga, isolation, congress)
+            'position_hash': _position_hash(game)  # clé de la position (hachage de Zobrist en hexadécimal)
         }
 
         os.makedirs("saves", exist_ok=True)
@@ -37,6 +39,18 @@ def save_game(game: Any) -> None:
         raise
 
 
+def _position_hash(game: Any) -> str:
+    """
+    fonction : calcule le hachage de Zobrist de la position du jeu
+    params :
+        game - instance du jeu
+    retour : hachage 64 bits sous forme de chaîne hexadécimale
+    """
+    position_hash = hash_board(game.board.board, game.round_turn,
+                               getattr(game, 'first_turn', False), getattr(game, 'locked_pieces', None))
+    return f"{position_hash:016x}"
+
+
 def load_game(game: Any) -> bool:
     """
     fonction : charge l'état du jeu depuis une sauvegarde
@@ -84,3 +98,6 @@ def _update_game_state(game: Any, game_state: Dict[str, Any]) -> None:
             current_board[i][j][1] = saved_board[i][j][1]
     
     game.round_turn = game_state['round_turn']
+
+    if hasattr(game, 'on_board_loaded'):
+        game.on_board_loaded() # état dérivé du plateau (ex : connectivité du congress)
@@ -0,0 +1,132 @@
+from typing import Dict, Optional, Tuple
+from array import array
+from src.utils.logger import Logger
+
+# type de borne du score stocké
+EXACT = 0
+LOWER_BOUND = 1 # score >= valeur stockée (coupure beta)
+UPPER_BOUND = 2 # score <= valeur stockée (aucun coup n'a dépassé alpha)
+# valeur d'un coup absent
+NO_MOVE = -1
+# politiques de remplacement
+REPLACEMENT_POLICIES = ("depth", "always")
+# octets occupés par une entrée : clé (8), score (8), coup (4), profondeur (1), borne (1), génération (1)
+ENTRY_BYTES = 23
+
+class TranspositionTable:
+    """
+    classe : table de transposition à taille fixe pour la recherche des bots
+    structure :
+        tableaux parallèles (module array) indexés par les bits de poids faible du hachage de Zobrist
+        keys[i], depths[i], flags[i], scores[i], moves[i], ages[i] - une entrée par case
+    la mémoire est allouée une seule fois : elle ne grandit pas au fil des parties
+    """
+    def __init__(self, size_mb: float = 8, policy: str = "depth") -> None:
+        """
+        procédure : alloue la table
+        params :
+            size_mb - taille maximale de la table en mégaoctets
+            policy - "depth" (garde l'entrée la plus profonde de la recherche courante) ou "always" (remplace toujours)
+        """
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        self.policy: str = policy
+        # nombre d'entrées : plus grande puissance de deux qui tient dans la taille demandée
+        entry_count = max(1, int(size_mb * 1024 * 1024) // ENTRY_BYTES)
+        self.size: int = 1 << (entry_count.bit_length() - 1)
+        self.mask: int = self.size - 1
+        self.keys = array("Q", bytes(8 * self.size))
+        self.scores = array("d", bytes(8 * self.size))
+        self.moves = array("i", [NO_MOVE]) * self.size
+        self.depths = array("b", [-1]) * self.size # -1 : case vide
+        self.flags = array("B", bytes(self.size))
+        self.ages = array("B", bytes(self.size))
+        self.generation: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stores: int = 0
+        self.overwrites: int = 0
+        Logger.bot("TranspositionTable", "Allocated %s entries (%.1f MB, policy=%s)", self.size, self.size * ENTRY_BYTES / 1048576, policy)
+
+    def new_search(self) -> None:
+        """
+        procédure : commence une nouvelle recherche (les entrées plus anciennes deviennent remplaçables)
+        """
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self) -> None:
+        """
+        procédure : vide la table et remet les compteurs à zéro, sans réallouer
+        """
+        self.depths[:] = array("b", [-1]) * self.size
+        self.moves[:] = array("i", [NO_MOVE]) * self.size
+        self.generation = 0
+        self.hits = self.misses = self.stores = self.overwrites = 0
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, float, int]]:
+        """
+        fonction : cherche une position dans la table
+        params :
+            key - hachage de Zobrist 64 bits de la position
+        retour : (profondeur, borne, score, coup) ou None si la position est absente
+        """
+        index = key & self.mask
+        if self.depths[index] >= 0 and self.keys[index] == key:
+            self.hits += 1
+            return self.depths[index], self.flags[index], self.scores[index], self.moves[index]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, flag: int, score: float, move: int = NO_MOVE) -> None:
+        """
+        procédure : enregistre le résultat de la recherche d'une position selon la politique de remplacement
+        params :
+            key - hachage de Zobrist 64 bits de la position
+            depth - profondeur restante de la recherche (0 à 127)
+            flag - EXACT, LOWER_BOUND ou UPPER_BOUND
+            score - score trouvé
+            move - meilleur coup encodé par le bot (NO_MOVE si aucun)
+        """
+        index = key & self.mask
+        stored_depth = self.depths[index]
+        if stored_depth >= 0 and self.keys[index] != key:
+            # collision d'index : en politique "depth", on garde l'entrée plus profonde de la recherche courante
+            if self.policy == "depth" and self.ages[index] == self.generation and stored_depth > depth:
+                return
+            self.overwrites += 1
+        elif stored_depth >= 0 and move == NO_MOVE:
+            move = self.moves[index] # même position : conserve le meilleur coup connu
+        self.keys[index] = key
+        self.depths[index] = min(depth, 127)
+        self.flags[index] = flag
+        self.scores[index] = score
+        self.moves[index] = move
+        self.ages[index] = self.generation
+        self.stores += 1
+
+    def best_move(self, key: int) -> int:
+        """
+        fonction : coup stocké pour une position, sans compter de succès ni d'échec (tri des coups)
+        params :
+            key - hachage de Zobrist 64 bits de la position
+        retour : coup encodé ou NO_MOVE
+        """
+        index = key & self.mask
+        if self.depths[index] >= 0 and self.keys[index] == key:
+            return self.moves[index]
+        return NO_MOVE
+
+    def stats(self) -> Dict[str, float]:
+        """
+        fonction : statistiques d'utilisation de la table
+        retour : dictionnaire (succès, échecs, taux de succès, écritures, remplacements, taille)
+        """
+        probes = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "entries": self.size
+        }
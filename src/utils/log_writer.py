@@ -0,0 +1,212 @@
+from typing import Any, Callable, List, Optional, TextIO, Tuple
+import os
+import queue
+import sys
+import threading
+import time
+
+# politiques quand la file est pleine : ignorer le nouveau message, évincer le plus ancien, ou attendre
+DROP_POLICIES = ("drop_new", "drop_oldest", "block")
+# marqueur de fin de la file (arrêt du fil d'écriture)
+_STOP = object()
+
+Record = Tuple[Any, ...]
+
+class StreamSink:
+    """
+    classe : destination d'écriture vers la sortie standard (ou un autre flux)
+    """
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        procédure : initialise la destination
+        params :
+            stream - flux d'écriture, None pour sys.stdout lu à chaque écriture (suit les redirections)
+        """
+        self.stream: Optional[TextIO] = stream
+
+    def write(self, text: str) -> None:
+        """
+        procédure : écrit un lot de lignes puis vide le tampon du flux
+        params :
+            text - lignes terminées par un saut de ligne
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def close(self) -> None:
+        """
+        procédure : rien à fermer pour un flux partagé
+        """
+
+class RotatingFileSink:
+    """
+    classe : destination d'écriture vers un fichier, renommé en path.1, path.2... au-delà d'une taille maximale
+    """
+    def __init__(self, path: str, max_bytes: int = 1048576, backup_count: int = 3) -> None:
+        """
+        procédure : ouvre le fichier en ajout
+        params :
+            path - chemin du fichier de logs
+            max_bytes - taille au-delà de laquelle le fichier est archivé
+            backup_count - nombre de fichiers archivés conservés
+        """
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self.backup_count: int = backup_count
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "a", encoding="utf-8")
+
+    def _rotate(self) -> None:
+        """
+        procédure : archive le fichier courant et en ouvre un nouveau
+        """
+        self.file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, text: str) -> None:
+        """
+        procédure : écrit un lot de lignes, en archivant le fichier s'il dépasse la taille maximale
+        params :
+            text - lignes terminées par un saut de ligne
+        """
+        if self.file.tell() > 0 and self.file.tell() + len(text.encode("utf-8")) > self.max_bytes:
+            self._rotate()
+        self.file.write(text)
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        procédure : ferme le fichier
+        """
+        self.file.close()
+
+class LogWriter:
+    """
+    classe : file de messages bornée vidée par un seul fil d'écriture
+    les producteurs ne font qu'ajouter un enregistrement à la file : le formatage et l'écriture ont lieu sur le fil
+    d'écriture, par lots, et un message est perdu (et compté) plutôt que de bloquer quand la file est pleine
+    """
+    def __init__(self, formatter: Callable[..., str], sink: Any = None, max_queue: int = 10000,
+                 drop_policy: str = "drop_new", batch_size: int = 256) -> None:
+        """
+        procédure : crée la file et démarre le fil d'écriture
+        params :
+            formatter - fonction appelée avec les éléments d'un enregistrement, retourne la ligne à écrire
+            sink - destination (StreamSink, RotatingFileSink), None pour la sortie standard
+            max_queue - nombre maximal de messages en attente
+            drop_policy - comportement quand la file est pleine (voir DROP_POLICIES)
+            batch_size - nombre maximal de messages écrits en une fois
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.formatter = formatter
+        self.sink = sink if sink is not None else StreamSink()
+        self.drop_policy: str = drop_policy
+        self.batch_size: int = batch_size
+        self.dropped: int = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: Record) -> bool:
+        """
+        fonction : ajoute un message à la file selon la politique de débordement
+        params :
+            record - (horodatage, niveau, composant, message, args...)
+        retour : True si le message a été accepté
+        """
+        if self.drop_policy == "block":
+            self._queue.put(record)
+            return True
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            pass
+        with self._lock:
+            self.dropped += 1
+        if self.drop_policy == "drop_oldest":
+            try:
+                self._queue.get_nowait() # évince le plus ancien message en attente
+                self._queue.task_done()
+                self._queue.put_nowait(record)
+                return True
+            except (queue.Empty, queue.Full):
+                pass
+        return False
+
+    def _run(self) -> None:
+        """
+        procédure : boucle du fil d'écriture : attend un message puis écrit tous ceux en attente en un seul lot
+        """
+        while True:
+            batch: List[Any] = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(record is _STOP for record in batch)
+            lines = []
+            for record in batch:
+                if record is not _STOP:
+                    try:
+                        lines.append(self.formatter(*record))
+                    except Exception as e: # un message mal formé ne doit pas arrêter l'écriture
+                        lines.append(f"[LogWriter] failed to format {record[3]!r}: {e}")
+            try:
+                if lines:
+                    self.sink.write("\n".join(lines) + "\n")
+            except Exception:
+                pass # sortie indisponible (flux fermé) : les messages sont perdus
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def pending(self) -> int:
+        """
+        fonction : nombre de messages pas encore écrits
+        retour : taille de la file
+        """
+        return self._queue.unfinished_tasks
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        fonction : attend l'écriture des messages en attente
+        params :
+            timeout - durée maximale d'attente en secondes
+        retour : True si la file a été vidée
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and self._thread.is_alive():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.002)
+        return True
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        procédure : écrit les messages en attente, arrête le fil d'écriture et ferme la destination
+        params :
+            timeout - durée maximale d'attente en secondes
+        """
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            self._thread.join(timeout)
+        self.sink.close()
@@ -1,8 +1,14 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Dict, Iterable, Optional
+import atexit
+import json
+import os
+import random
+import time
 import colorama
 from colorama import Fore, Style
+from src.utils.log_writer import LogWriter, RotatingFileSink, StreamSink
 
 colorama.init(autoreset=True)
 
@@ -24,12 +30,36 @@ class LogLevel(Enum):
     SERVER_INTERNAL = (Fore.CYAN, 'SERVER_INTERNAL')
     SERVER_ERROR = (Fore.RED, 'SERVER_ERROR')
 
+# niveaux désactivés par défaut : traces du moteur de règles, du plateau et des bots (appelées des milliers de fois par coup)
+DEFAULT_DISABLED_LEVELS = (LogLevel.MOVE, LogLevel.BOARD, LogLevel.BOT)
+# variable d'environnement listant les niveaux à réactiver pour le débogage (ex : "move,bot" ou "all")
+LOG_LEVELS_ENV = "LUDORIA_LOG"
+
 class Logger:
     """
     classe : gestionnaire de logs avec différents niveaux et couleurs
     implémente le pattern singleton
+    chaque niveau a un indicateur de classe <niveau>_enabled : un niveau désactivé ne coûte qu'un test d'attribut,
+    et le message n'est formaté (message % args) que s'il est affiché
     """
     _instance = None
+    _writer: Optional[LogWriter] = None # écriture asynchrone (None : print direct depuis le fil appelant)
+    _atexit_registered = False
+    _structured = False # une ligne JSON par message au lieu du texte coloré
+    _sampling: Dict[str, float] = {} # taux d'échantillonnage par composant (absent : tous les messages)
+    info_enabled = True
+    success_enabled = True
+    warning_enabled = True
+    error_enabled = True
+    move_enabled = True
+    game_enabled = True
+    board_enabled = True
+    bot_enabled = True
+    debug_enabled = True
+    server_receive_enabled = True
+    server_send_enabled = True
+    server_internal_enabled = True
+    server_error_enabled = True
 
     def __init__(self):
         """
@@ -46,135 +76,317 @@ class Logger:
             cls._instance = Logger()
 
     @classmethod
-    def _format_message(cls, level: LogLevel, component: str, message: Any) -> str:
+    def set_enabled(cls, level: LogLevel, enabled: bool) -> None:
+        """
+        procédure : active ou désactive un niveau de log
+        params :
+            level - niveau de log
+            enabled - True pour afficher les messages de ce niveau
+        """
+        setattr(cls, f"{level.name.lower()}_enabled", enabled)
+
+    @classmethod
+    def enable(cls, *levels: LogLevel) -> None:
+        """
+        procédure : active des niveaux de log
+        params :
+            levels - niveaux à activer
+        """
+        for level in levels:
+            cls.set_enabled(level, True)
+
+    @classmethod
+    def disable(cls, *levels: LogLevel) -> None:
+        """
+        procédure : désactive des niveaux de log
+        params :
+            levels - niveaux à désactiver
+        """
+        for level in levels:
+            cls.set_enabled(level, False)
+
+    @classmethod
+    def is_enabled(cls, level: LogLevel) -> bool:
+        """
+        fonction : indique si un niveau de log est affiché
+        params :
+            level - niveau de log
+        retour : True si les messages de ce niveau sont affichés
+        """
+        return getattr(cls, f"{level.name.lower()}_enabled")
+
+    @classmethod
+    def configure(cls, disabled: Iterable[LogLevel] = DEFAULT_DISABLED_LEVELS, overrides: str = "") -> None:
+        """
+        procédure : applique la configuration des niveaux (niveaux désactivés puis niveaux réactivés)
+        params :
+            disabled - niveaux désactivés, les autres sont activés
+            overrides - noms de niveaux à réactiver séparés par des virgules, ou "all"
+        """
+        disabled = set(disabled)
+        for level in LogLevel:
+            cls.set_enabled(level, level not in disabled)
+        names = {name.strip().upper() for name in overrides.split(",") if name.strip()}
+        for level in LogLevel:
+            if "ALL" in names or level.name in names:
+                cls.set_enabled(level, True)
+
+    @classmethod
+    def set_structured(cls, enabled: bool = True) -> None:
+        """
+        procédure : active ou désactive la sortie structurée (une ligne JSON par message)
+        params :
+            enabled - True pour écrire des lignes JSON
+        """
+        cls._structured = enabled
+
+    @classmethod
+    def set_sampling(cls, rates: Optional[Dict[str, float]] = None) -> None:
+        """
+        procédure : règle l'échantillonnage des messages par composant
+        params :
+            rates - taux entre 0 et 1 par composant (ex : {"Packets": 0.01}), None pour tout garder
+        """
+        rates = dict(rates or {})
+        for component, rate in rates.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Invalid sampling rate for {component}: {rate}")
+        cls._sampling = rates
+
+    @classmethod
+    def _format_message(cls, level: LogLevel, component: str, message: Any, args: tuple = (),
+                        timestamp: Optional[float] = None, colors: bool = True, fields: Optional[Dict[str, Any]] = None,
+                        structured: bool = False) -> str:
         """
         fonction : formate un message de log
         params :
             level - niveau de log
             component - composant source
-            message - contenu du message
-        retour : message formaté avec couleurs
+            message - contenu du message, ou gabarit %-style si args est fourni
+            args - arguments du gabarit (formatés seulement ici)
+            timestamp - heure d'émission du message (None : maintenant)
+            colors - False pour une ligne sans codes de couleur (fichiers)
+            fields - champs structurés du message (game_id, packet_type, size...)
+            structured - True pour une ligne JSON (sans couleurs)
+        retour : message formaté avec couleurs, ou ligne JSON
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        moment = datetime.fromtimestamp(timestamp) if timestamp is not None else datetime.now()
         color_code, level_name = level.value
-        base_message = f"[{timestamp}] [{level_name}] [{component}] {str(message)}"
+        text = str(message) % args if args else str(message)
+        if structured:
+            record = {"time": moment.isoformat(timespec="milliseconds"), "level": level_name, "component": component, "message": text}
+            if fields:
+                record.update(fields)
+            return json.dumps(record, default=str)
+        base_message = f"[{moment.strftime('%Y-%m-%d %H:%M:%S')}] [{level_name}] [{component}] {text}"
+        if not colors:
+            return base_message
         return f"{color_code}{Style.BRIGHT}{base_message}{Style.RESET_ALL}"
 
     @classmethod
-    def _log(cls, level: LogLevel, component: str, message: Any):
+    def _log(cls, level: LogLevel, component: str, message: Any, args: tuple = (), fields: Optional[Dict[str, Any]] = None):
         """
-        procédure : affiche un message de log
+        procédure : affiche un message de log, ou le confie au fil d'écriture s'il est démarré
         params :
             level - niveau de log
             component - composant source
             message - contenu du message
+            args - arguments du gabarit du message
+            fields - champs structurés du message
         """
+        rate = cls._sampling.get(component)
+        if rate is not None and random.random() >= rate: # message écarté par l'échantillonnage, avant tout formatage
+            return
         if not cls._instance:
             cls.initialize()
-        print(cls._format_message(level, component, message))
-        
+        writer = cls._writer
+        if writer is not None:
+            # un message qui n'est pas une chaîne (paquet, exception) est figé avant d'être mis en file
+            writer.submit((time.time(), level, component, message if isinstance(message, str) else str(message), args, fields))
+            return
+        print(cls._format_message(level, component, message, args, fields=fields, structured=cls._structured))
+
+    @classmethod
+    def start_async(cls, max_queue: int = 10000, drop_policy: str = "drop_new", path: Optional[str] = None,
+                    max_bytes: int = 1048576, backup_count: int = 3, batch_size: int = 256) -> None:
+        """
+        procédure : passe à l'écriture asynchrone : les appels ne font que mettre le message en file,
+        un seul fil d'écriture formate et écrit les messages par lots
+        params :
+            max_queue - nombre maximal de messages en attente
+            drop_policy - "drop_new", "drop_oldest" ou "block" quand la file est pleine
+            path - fichier de logs avec archivage par taille (None : sortie standard)
+            max_bytes - taille d'archivage du fichier
+            backup_count - nombre de fichiers archivés conservés
+            batch_size - nombre maximal de messages écrits en une fois
+        """
+        cls.stop_async()
+        sink = RotatingFileSink(path, max_bytes, backup_count) if path else StreamSink()
+        colors = path is None
+        cls._writer = LogWriter(lambda timestamp, level, component, message, args, fields:
+                                cls._format_message(level, component, message, args, timestamp, colors, fields, cls._structured),
+                                sink, max_queue, drop_policy, batch_size)
+        if not cls._atexit_registered:
+            atexit.register(cls.stop_async) # écrit les derniers messages à la sortie du programme
+            cls._atexit_registered = True
+
+    @classmethod
+    def stop_async(cls, timeout: float = 1.0) -> None:
+        """
+        procédure : écrit les messages en attente puis revient à l'écriture directe
+        params :
+            timeout - durée maximale d'attente en secondes
+        """
+        writer, cls._writer = cls._writer, None
+        if writer is not None:
+            writer.stop(timeout)
+            if writer.dropped:
+                cls.warning("Logger", "%s log messages were dropped (queue full)", writer.dropped)
+
+    @classmethod
+    def flush(cls, timeout: float = 1.0) -> bool:
+        """
+        fonction : attend l'écriture des messages en file
+        params :
+            timeout - durée maximale d'attente en secondes
+        retour : True si tous les messages ont été écrits
+        """
+        return cls._writer.flush(timeout) if cls._writer is not None else True
+
     @classmethod
-    def debug(cls, component: str, message: Any):
+    def dropped_messages(cls) -> int:
+        """
+        fonction : nombre de messages perdus parce que la file était pleine
+        retour : compteur du fil d'écriture courant (0 en écriture directe)
+        """
+        return cls._writer.dropped if cls._writer is not None else 0
+
+    @classmethod
+    def debug(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau débogage (gris)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.DEBUG, component, message)
+        if cls.debug_enabled:
+            cls._log(LogLevel.DEBUG, component, message, args)
 
     @classmethod
-    def info(cls, component: str, message: Any):
+    def info(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau info (bleu)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.INFO, component, message)
+        if cls.info_enabled:
+            cls._log(LogLevel.INFO, component, message, args)
 
     @classmethod
-    def success(cls, component: str, message: Any):
+    def success(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau succès (vert)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.SUCCESS, component, message)
+        if cls.success_enabled:
+            cls._log(LogLevel.SUCCESS, component, message, args)
 
     @classmethod
-    def warning(cls, component: str, message: Any):
+    def warning(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau avertissement (jaune)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.WARNING, component, message)
+        if cls.warning_enabled:
+            cls._log(LogLevel.WARNING, component, message, args)
 
     @classmethod
-    def error(cls, component: str, message: Any):
+    def error(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau erreur (rouge)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.ERROR, component, message)
+        if cls.error_enabled:
+            cls._log(LogLevel.ERROR, component, message, args)
 
     @classmethod
-    def move(cls, component: str, message: Any):
+    def move(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau déplacement (magenta)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.MOVE, component, message)
+        if cls.move_enabled:
+            cls._log(LogLevel.MOVE, component, message, args)
 
     @classmethod
-    def game(cls, component: str, message: Any):
+    def game(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau jeu (cyan)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.GAME, component, message)
+        if cls.game_enabled:
+            cls._log(LogLevel.GAME, component, message, args)
 
     @classmethod
-    def board(cls, component: str, message: Any):
+    def board(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau plateau (blanc)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.BOARD, component, message)
+        if cls.board_enabled:
+            cls._log(LogLevel.BOARD, component, message, args)
 
     @classmethod
-    def bot(cls, component: str, message: Any):
+    def bot(cls, component: str, message: Any, *args: Any):
         """
         procédure : log niveau bot (bleu clair)
         params :
             component - composant source
-            message - contenu du message
+            message - contenu du message (gabarit %-style si args est fourni)
+            args - arguments du gabarit, formatés seulement si le niveau est activé
         """
-        cls._log(LogLevel.BOT, component, message)
+        if cls.bot_enabled:
+            cls._log(LogLevel.BOT, component, message, args)
 
     @classmethod
-    def server_receive(cls, component: str, message: Any):
-        cls._log(LogLevel.SERVER_RECEIVE, component, message)
+    def server_receive(cls, component: str, message: Any, *args: Any, **fields: Any):
+        if cls.server_receive_enabled:
+            cls._log(LogLevel.SERVER_RECEIVE, component, message, args, fields)
 
     @classmethod
-    def server_send(cls, component: str, message: Any):
-        cls._log(LogLevel.SERVER_SEND, component, message)
+    def server_send(cls, component: str, message: Any, *args: Any, **fields: Any):
+        if cls.server_send_enabled:
+            cls._log(LogLevel.SERVER_SEND, component, message, args, fields)
 
     @classmethod
-    def server_internal(cls, component: str, message: Any):
-        cls._log(LogLevel.SERVER_INTERNAL, component, message)
+    def server_internal(cls, component: str, message: Any, *args: Any, **fields: Any):
+        if cls.server_internal_enabled:
+            cls._log(LogLevel.SERVER_INTERNAL, component, message, args, fields)
 
     @classmethod
-    def server_error(cls, component: str, message: Any):
-        cls._log(LogLevel.SERVER_ERROR, component, message)
\ No newline at end of file
+    def server_error(cls, component: str, message: Any, *args: Any):
+        if cls.server_error_enabled:
+            cls._log(LogLevel.SERVER_ERROR, component, message, args)
+
+Logger.configure(overrides=os.environ.get(LOG_LEVELS_ENV, ""))
@@ -4,6 +4,8 @@ from src.windows.render.constants import RenderConstants
 from src.windows.render.player_handler import PlayerHandler
 from src.moves import available_move
 from src.captures import is_threatened
+from src.bitboard import BitBoard
+from src.move_tables import get_move_tables
 
 class BoardHandler:
     """
@@ -36,6 +38,13 @@ class BoardHandler:
         # gestionnaire des joueurs
         self.player_handler = PlayerHandler(player_shadows, images)
         
+        # destinations prévisualisées de la pièce sélectionnée (recalculées à chaque rendu)
+        self.preview_moves = set()
+        
+        # cases du dernier coup du bot et instant de début du fondu (pygame.time.get_ticks)
+        self.highlighted_cells = []
+        self.highlight_start = 0
+        
         Logger.info("BoardHandler", "Board handler initialized")
         
     def calculate_board_position(self, window_width, window_height, is_network_game=False):
@@ -62,6 +71,25 @@ class BoardHandler:
             
         return board_x, board_y
         
+    def highlight_cells(self, cells):
+        """
+        procédure : démarre la mise en évidence de cases (dernier coup du bot) qui s'estompe en LAST_MOVE_DURATION ms.
+        
+        params:
+            cells: liste de tuples (row, col)
+        """
+        self.highlighted_cells = list(cells)
+        self.highlight_start = pygame.time.get_ticks()
+        
+    def is_animating(self):
+        """
+        fonction : indique si une mise en évidence est en cours (le plateau doit alors être redessiné à chaque image).
+        
+        retour:
+            bool: True pendant le fondu
+        """
+        return bool(self.highlighted_cells) and pygame.time.get_ticks() - self.highlight_start < RenderConstants.LAST_MOVE_DURATION
+        
     def render(self, screen, board_x, board_y):
         """
         procédure : dessine le plateau de jeu avec ses marges.
@@ -74,6 +102,12 @@ class BoardHandler:
         # fond gris pour les marges
         self.board_surface.fill(RenderConstants.BOARD_BG_COLOR)
         
+        # destinations de la pièce sélectionnée (ou cases libres d'isolation), calculées une seule fois pour tout le plateau
+        if getattr(self.game, 'game_type', None) == "isolation" and hasattr(self.game, 'get_attack_map'):
+            self.preview_moves = set(self.game.get_attack_map().safe_squares(0, check_all_pieces=True)) # toutes les pièces menacent : le joueur n'importe pas
+        else:
+            self.preview_moves = self._selected_piece_destinations()
+        
         # dessine toutes les cellules du plateau
         for row_i, row in enumerate(self.game.board.board):
             for col_i, cell in enumerate(row):
@@ -85,6 +119,35 @@ class BoardHandler:
         # affiche le plateau complet sur l'écran
         screen.blit(self.board_surface, (board_x, board_y))
         
+    def _selected_piece_destinations(self):
+        """
+        fonction : calcule les cases à prévisualiser pour la pièce sélectionnée (katerenga et congress)
+        utilise les tables de déplacements précalculées au lieu d'appeler available_move pour chaque case.
+        
+        retour:
+            set de tuples (row, col) des destinations valides (hors camps, cases vides uniquement au congress)
+        """
+        selected_piece = getattr(self.game, 'selected_piece', None)
+        if selected_piece is None or getattr(self.game, 'game_type', None) not in ("katerenga", "congress"):
+            return set()
+        
+        compact = BitBoard.from_board(self.game.board.board)
+        square = compact.index(*selected_piece)
+        player = compact.player_at(square)
+        if player is None:
+            return set()
+        
+        occupied = compact.occupied
+        destinations = set()
+        # les camps ne sont jamais prévisualisés : seules les destinations géométriques sont parcourues
+        for target in get_move_tables(compact).attacks(square, occupied):
+            if compact.occupancy[player] >> target & 1:
+                continue # case alliée
+            if self.game.game_type == "congress" and occupied >> target & 1:
+                continue # pas de capture au congress
+            destinations.add(compact.position(target))
+        return destinations
+        
     def _draw_cell(self, row, col, cell, x, y):
         """
         procédure : dessine une cellule individuelle et son contenu.
@@ -118,16 +181,12 @@ class BoardHandler:
         # 4. prévisualisation des mouvements possibles
         is_valid_move = False
         if hasattr(self.game, 'game_type'):
-            if self.game.game_type == "katerenga":
-                if hasattr(self.game, 'selected_piece') and self.game.selected_piece is not None:
-                    from_row, from_col = self.game.selected_piece
-                    is_valid_move = available_move(self.game.board.board, from_row, from_col, row, col) and terrain_id not in [4, 5]
-            elif self.game.game_type == "congress":
-                if hasattr(self.game, 'selected_piece') and self.game.selected_piece is not None:
-                    from_row, from_col = self.game.selected_piece
-                    is_valid_move = available_move(self.game.board.board, from_row, from_col, row, col) and cell[0] is None
+            if self.game.game_type in ("katerenga", "congress"):
+                is_valid_move = (row, col) in self.preview_moves
             elif self.game.game_type == "isolation":
-                if hasattr(self.game, 'round_turn'):
+                if hasattr(self.game, 'get_attack_map'):
+                    is_valid_move = (row, col) in self.preview_moves
+                elif hasattr(self.game, 'round_turn'):
                     current_player = self.game.round_turn if not self.game.is_network_game else (self.game.player_number - 1)
                     is_valid_move = cell[0] is None and not is_threatened(self.game.board.board, row, col, 1 - current_player, check_all_pieces=True)
         else:
@@ -140,6 +199,13 @@ class BoardHandler:
             overlay.fill((255, 255, 255, 100))
             self.board_surface.blit(overlay, cell_rect.topleft)
         
+        # 5. mise en évidence du dernier coup du bot (fondu)
+        if (row, col) in self.highlighted_cells and self.is_animating():
+            progress = (pygame.time.get_ticks() - self.highlight_start) / RenderConstants.LAST_MOVE_DURATION
+            overlay = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+            overlay.fill(RenderConstants.LAST_MOVE_COLOR + (int(160 * (1 - progress)),))
+            self.board_surface.blit(overlay, cell_rect.topleft)
+        
     def handle_click(self, pos, board_x, board_y):
         """
         fonction : traite un clic sur le plateau et le convertit en coordonnées logiques.
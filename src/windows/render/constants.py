@@ -16,6 +16,8 @@ class RenderConstants:
     SELECTION_WIDTH = 4         # épaisseur du cadre de sélection
     BOARD_BG_COLOR = (100, 100, 100)   # couleur de l'arrière-plan du plateau
     INFO_OVERLAY_COLOR = (0, 0, 0, 180) # couleur semi-transparente de la barre d'info
+    LAST_MOVE_COLOR = (255, 215, 0)    # couleur de la mise en évidence du dernier coup du bot
+    LAST_MOVE_DURATION = 600    # durée du fondu de la mise en évidence en millisecondes
     
     # constantes pour le chat
     CHAT_WIDTH = 250            # largeur du panneau de chat en pixels
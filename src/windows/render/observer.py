@@ -0,0 +1,53 @@
+from src.game_state import GameObserver
+
+class RenderObserver(GameObserver):
+    """
+    classe : abonné qui relaie les événements d'une partie vers l'affichage pygame.
+
+    la logique de jeu ne connaît que les notifications ; seul cet adaptateur appelle Render.
+    """
+
+    def __init__(self, render):
+        """
+        constructeur : associe l'abonné à un affichage.
+
+        params:
+            render: instance de Render qui reçoit les événements
+        """
+        self.render = render
+
+    def on_info(self, text):
+        """
+        procédure : affiche le message dans la barre d'information.
+
+        params:
+            text: message à afficher
+        """
+        self.render.edit_info_label(text)
+
+    def on_move(self, cells):
+        """
+        procédure : met en évidence les cases du coup joué.
+
+        params:
+            cells: liste de tuples (row, col) à mettre en évidence
+        """
+        self.render.animate_move(cells)
+
+    def on_board_changed(self):
+        """
+        procédure : demande un nouveau rendu du plateau à la prochaine image.
+        """
+        self.render.needs_render = True
+
+    def on_game_over(self, text, wait_for_input=False):
+        """
+        procédure : affiche la pop-up de fin de partie.
+
+        params:
+            text: annonce du gagnant
+            wait_for_input: si True, la boucle de rendu attend l'action du joueur avant de se fermer
+        """
+        self.render.show_end_popup(text)
+        if wait_for_input:
+            self.render.end_game_waiting_input = True
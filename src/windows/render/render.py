@@ -7,6 +7,7 @@ from src.windows.components.button import Button
 from src.utils.logger import Logger
 from src.windows.render.image_loader import ImageLoader
 from src.utils.theme_manager import ThemeManager
+from src.bot_worker import BOT_MOVE_EVENT
 from datetime import datetime
 
 class Render:
@@ -106,6 +107,16 @@ class Render:
         if self.info_bar_handler.edit_info_label(text):
             self.needs_render = True
 
+    def animate_move(self, cells):
+        """
+        procédure : met en évidence les cases d'un coup du bot (remplace l'ancienne pause bloquante après son coup).
+        
+        params:
+            cells: liste de tuples (row, col) à mettre en évidence
+        """
+        self.board_handler.highlight_cells(cells)
+        self.needs_render = True
+
     def show_end_popup(self, winner_text):
         """
         Active la pop-up de fin de partie avec le texte du gagnant.
@@ -199,6 +210,17 @@ class Render:
             action=self._pause_popup_quit
         )
         self.pause_popup_buttons = [resume_btn, quit_btn]
+        if getattr(self.game, 'game_mode', None) == "Bot" and hasattr(self.game, 'concede'):
+            # abandon possible à tout moment contre le bot, y compris pendant sa réflexion
+            concede_btn = Button(
+                popup_x + (popup_width - button_width) // 2,
+                popup_y + 60 + 2 * (button_height + button_spacing),
+                button_width,
+                button_height,
+                "CONCEDE",
+                action=self._pause_popup_concede
+            )
+            self.pause_popup_buttons.append(concede_btn)
         self.needs_render = True
 
     def _pause_popup_resume(self):
@@ -206,8 +228,15 @@ class Render:
         self.pause_popup_action = "resume"
         self.needs_render = True
 
+    def _pause_popup_concede(self):
+        self.pause_popup_active = False
+        self.game.concede()
+        self.needs_render = True
+
     def _pause_popup_quit(self):
         self.pause_popup_active = False
+        if getattr(self.game, 'bot_worker', None):
+            self.game.bot_worker.cancel()
         self.running = False
         pygame.quit()
         sys.exit()
@@ -343,6 +372,12 @@ class Render:
                     self.running = False
                     break
                 
+                # le timer et le résultat du bot sont traités même quand la pop-up de pause est ouverte
+                if event.type in (pygame.USEREVENT, BOT_MOVE_EVENT) and hasattr(self.game, 'handle_events'):
+                    self.game.handle_events(event)
+                    self.needs_render = True
+                    continue
+                
                 # vérifie si le popup de fin de partie est actif
                 if self.pause_popup_active:
                     if event.type == pygame.MOUSEBUTTONDOWN:
@@ -363,8 +398,6 @@ class Render:
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:
                         self.handle_click(event.pos)
-                elif event.type == pygame.USEREVENT and hasattr(self.game, 'handle_events'):
-                    self.game.handle_events(event)
                 elif hasattr(self.game, 'handle_events'):
                     if not self.game.handle_events(event):
                         self.needs_render = True
@@ -377,6 +410,13 @@ class Render:
                     self.running = False
                     break
             
+            # indicateur animé pendant la réflexion du bot (la boucle n'est plus bloquée par le bot)
+            bot_worker = getattr(self.game, 'bot_worker', None)
+            if bot_worker is not None and bot_worker.is_thinking():
+                self.edit_info_label("Bot is thinking" + "." * (pygame.time.get_ticks() // 400 % 4))
+            if self.board_handler.is_animating():
+                self.needs_render = True
+            
             # rendu si nécessaire
             if self.needs_render:
                 self.render_board()
@@ -0,0 +1,216 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import random
+from src.bitboard import BitBoard
+
+# graine fixe : les clés sont identiques dans tous les processus (bots, serveur, sauvegardes)
+ZOBRIST_SEED = 0x4C75646F
+# types de case des camps du katerenga (un pion qui y entre est verrouillé)
+CAMP_CELL_TYPES = (4, 5)
+
+class ZobristKeys:
+    """
+    classe : clés aléatoires 64 bits du hachage de Zobrist pour une taille de plateau
+    structure :
+        pieces[player][square] - clé d'un pion du joueur sur la case
+        locked[square] - clé d'un pion verrouillé sur la case (katerenga)
+        side - clé ajoutée quand le joueur 1 a le trait
+        first_turn - clé ajoutée pendant le premier tour du katerenga
+    """
+    def __init__(self, size: int) -> None:
+        """
+        procédure : tire les clés de manière déterministe
+        params :
+            size - taille du plateau (8 ou 10)
+        """
+        rng = random.Random(ZOBRIST_SEED + size)
+        square_count = size * size
+        self.size: int = size
+        self.pieces: List[List[int]] = [[rng.getrandbits(64) for _ in range(square_count)] for _ in range(2)]
+        self.locked: List[int] = [rng.getrandbits(64) for _ in range(square_count)]
+        self.side: int = rng.getrandbits(64)
+        self.first_turn: int = rng.getrandbits(64)
+
+    def full_hash(self, compact: BitBoard, turn: int, first_turn: bool = False, locked: int = 0) -> int:
+        """
+        fonction : calcule le hachage complet d'une position (utilisé une fois, puis mis à jour incrémentalement)
+        params :
+            compact - plateau compact
+            turn - joueur qui a le trait (0 ou 1)
+            first_turn - premier tour du katerenga en cours
+            locked - bitboard des pions verrouillés
+        retour : hachage 64 bits
+        """
+        value = 0
+        for player in (0, 1):
+            for square in compact.pieces(player):
+                value ^= self.pieces[player][square]
+        while locked:
+            low_bit = locked & -locked
+            value ^= self.locked[low_bit.bit_length() - 1]
+            locked ^= low_bit
+        if turn:
+            value ^= self.side
+        if first_turn:
+            value ^= self.first_turn
+        return value
+
+_KEYS_CACHE: Dict[int, ZobristKeys] = {}
+
+def get_zobrist_keys(size: int) -> ZobristKeys:
+    """
+    fonction : retourne les clés de Zobrist d'une taille de plateau, tirées une seule fois
+    params :
+        size - taille du plateau (8 ou 10)
+    retour : clés partagées
+    """
+    keys = _KEYS_CACHE.get(size)
+    if keys is None:
+        keys = ZobristKeys(size)
+        _KEYS_CACHE[size] = keys
+    return keys
+
+def locked_mask(size: int, locked_pieces: Optional[Iterable[Sequence[int]]]) -> int:
+    """
+    fonction : convertit la liste des pions verrouillés du jeu en bitboard
+    params :
+        size - taille du plateau
+        locked_pieces - positions (row, col) ou [row, col] des pions verrouillés, ou None
+    retour : bitboard des cases verrouillées
+    """
+    mask = 0
+    for row, col in locked_pieces or ():
+        mask |= 1 << (row * size + col)
+    return mask
+
+def hash_board(board: List[List[List[Optional[int]]]], turn: int, first_turn: bool = False,
+               locked_pieces: Optional[Iterable[Sequence[int]]] = None) -> int:
+    """
+    fonction : hachage de Zobrist d'un plateau en listes imbriquées
+    params :
+        board - plateau de jeu
+        turn - joueur qui a le trait (0 ou 1)
+        first_turn - premier tour du katerenga en cours
+        locked_pieces - positions des pions verrouillés (katerenga)
+    retour : hachage 64 bits
+    """
+    compact = BitBoard.from_board(board)
+    return get_zobrist_keys(compact.size).full_hash(compact, turn, first_turn, locked_mask(compact.size, locked_pieces))
+
+class Position:
+    """
+    classe : position de jeu compacte avec hachage de Zobrist maintenu à chaque coup
+    structure :
+        board - plateau compact
+        turn - joueur qui a le trait (0 ou 1)
+        first_turn - premier tour du katerenga en cours (pas de capture)
+        locked - bitboard des pions verrouillés dans les camps
+        hash - hachage 64 bits de la position
+    """
+    __slots__ = ("board", "turn", "first_turn", "locked", "hash", "keys")
+
+    def __init__(self, compact: BitBoard, turn: int, first_turn: bool = False, locked: int = 0) -> None:
+        """
+        procédure : initialise la position et calcule son hachage complet
+        params :
+            compact - plateau compact (modifié en place par les coups)
+            turn - joueur qui a le trait (0 ou 1)
+            first_turn - premier tour du katerenga en cours
+            locked - bitboard des pions verrouillés
+        """
+        self.board: BitBoard = compact
+        self.turn: int = turn
+        self.first_turn: bool = first_turn
+        self.locked: int = locked
+        self.keys: ZobristKeys = get_zobrist_keys(compact.size)
+        self.hash: int = self.keys.full_hash(compact, turn, first_turn, locked)
+
+    @classmethod
+    def from_board(cls, board: List[List[List[Optional[int]]]], turn: int, first_turn: bool = False,
+                   locked_pieces: Optional[Iterable[Sequence[int]]] = None) -> "Position":
+        """
+        fonction : construit une position à partir du plateau en listes imbriquées
+        params :
+            board - plateau de jeu
+            turn - joueur qui a le trait (0 ou 1)
+            first_turn - premier tour du katerenga en cours
+            locked_pieces - positions des pions verrouillés (katerenga)
+        retour : position indépendante du plateau d'origine
+        """
+        compact = BitBoard.from_board(board)
+        return cls(compact, turn, first_turn, locked_mask(compact.size, locked_pieces))
+
+    def copy(self) -> "Position":
+        """
+        fonction : copie la position (utile pour chercher sans toucher à l'original)
+        retour : nouvelle position
+        """
+        clone = Position.__new__(Position)
+        clone.board = self.board.copy()
+        clone.turn = self.turn
+        clone.first_turn = self.first_turn
+        clone.locked = self.locked
+        clone.keys = self.keys
+        clone.hash = self.hash
+        return clone
+
+    def _end_turn(self) -> None:
+        """
+        procédure : passe le trait et termine le premier tour quand la main revient au joueur 0
+        """
+        self.turn = 1 - self.turn
+        self.hash ^= self.keys.side
+        if self.first_turn and self.turn == 0:
+            self.first_turn = False
+            self.hash ^= self.keys.first_turn
+
+    def make_move(self, from_square: int, to_square: int) -> Tuple[int, int, Optional[int], int, bool, int]:
+        """
+        fonction : joue un déplacement (capture et verrouillage dans un camp compris) et met à jour le hachage
+        params :
+            from_square - index de la case de départ
+            to_square - index de la case d'arrivée
+        retour : informations d'annulation à passer à unmake_move
+        """
+        previous = (self.locked, self.first_turn, self.hash)
+        pieces = self.keys.pieces
+        player = self.turn
+        captured = self.board.move(from_square, to_square)
+        self.hash ^= pieces[player][from_square] ^ pieces[player][to_square]
+        if captured is not None:
+            self.hash ^= pieces[captured][to_square]
+        if self.board.cells[to_square] in CAMP_CELL_TYPES:
+            self.locked |= 1 << to_square
+            self.hash ^= self.keys.locked[to_square]
+        self._end_turn()
+        return (from_square, to_square, captured) + previous
+
+    def make_place(self, square: int) -> Tuple[int, int, Optional[int], int, bool, int]:
+        """
+        fonction : pose un pion du joueur qui a le trait (isolation) et met à jour le hachage
+        params :
+            square - index de la case vide
+        retour : informations d'annulation à passer à unmake_move
+        """
+        undo = (-1, square, None, self.locked, self.first_turn, self.hash)
+        self.board.place(square, self.turn)
+        self.hash ^= self.keys.pieces[self.turn][square]
+        self._end_turn()
+        return undo
+
+    def unmake_move(self, undo: Tuple[int, int, Optional[int], int, bool, int]) -> None:
+        """
+        procédure : annule le dernier coup joué avec make_move ou make_place
+        params :
+            undo - informations retournées par make_move ou make_place
+        """
+        from_square, to_square, captured, locked, first_turn, previous_hash = undo
+        if from_square < 0:
+            self.board.remove(to_square)
+        else:
+            self.board.move(to_square, from_square)
+            if captured is not None:
+                self.board.place(to_square, captured)
+        self.turn = 1 - self.turn
+        self.first_turn = first_turn
+        self.locked = locked
+        self.hash = previous_hash
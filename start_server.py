@@ -1,6 +1,14 @@
+import argparse
 from src.network.server.game_server import GameServer
+from src.network.server.async_game_server import AsyncGameServer
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ludoria multiplayer server")
+    parser.add_argument("--mode", choices=["threaded", "asyncio"], default="threaded",
+                        help="one thread per client, or a single asyncio event loop for all clients")
+    args = parser.parse_args()
+
     print("Starting Ludoria Server...")
-    server = GameServer()
-    server.start() 
\ No newline at end of file
+    server = AsyncGameServer() if args.mode == "asyncio" else GameServer()
+    server.start_logging()
+    server.start()
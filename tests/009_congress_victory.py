@@ -87,7 +87,8 @@ class TestCongressVictory(TestBase):
                             game.board.board[r][c][0] = 0  # place la pièce du joueur 1
                             game.board.board[piece_r][piece_c][0] = None  # retire la pièce de sa position d'origine
                             
-                            # vérifie si cela crée une condition de victoire
+                            # vérifie si cela crée une condition de victoire (plateau modifié hors du jeu : suivi reconstruit)
+                            game.on_board_loaded()
                             if game.check_connected_pieces(0):
                                 valid_move = (r, c)
                                 source_piece = (piece_r, piece_c)
@@ -106,6 +107,8 @@ class TestCongressVictory(TestBase):
             if valid_move:
                 break
                 
+        game.on_board_loaded()  # suivi de connectivité du plateau restauré
+
         # s'assure qu'on a trouvé un coup gagnant
         self.assertIsNotNone(valid_move, "Could not find a winning move for player 1")
         self.assertIsNotNone(source_piece, "Could not identify source piece for winning move")
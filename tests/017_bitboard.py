@@ -0,0 +1,62 @@
+from test_base import TestBase
+import unittest
+
+from src.board import Board
+from src.bitboard import BitBoard
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestBitBoard(TestBase):
+    """Test de la représentation compacte du plateau (conversion et opérations de base)"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        # quatre quadrants différents pour que les couleurs ne soient pas symétriques
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+
+    def test_round_trip_all_games(self):
+        """test de la conversion aller-retour pour les plateaux 10x10 (katerenga) et 8x8 (isolation, congress)"""
+        for game_number, size in ((0, 10), (1, 8), (2, 8)):
+            board = Board(self.selected_quadrants, game_number)
+            compact = board.to_bitboard()
+            self.assertEqual(compact.size, size)
+            self.assertEqual(compact.to_board(), board.board)  # test conversion sans perte
+            self.assertEqual(BitBoard.deserialize(compact.serialize()).to_board(), board.board)  # test sérialisation
+
+    def test_katerenga_layers(self):
+        """test des couches de couleurs et d'occupation du katerenga"""
+        board = Board(self.selected_quadrants, 0)
+        compact = board.to_bitboard()
+        self.assertEqual(compact.get(0, 0), [None, 4])  # test camp du haut
+        self.assertEqual(compact.get(9, 9), [None, 5])  # test camp du bas
+        self.assertEqual(compact.get(0, 5), [None, None])  # test bord gris sans type
+        self.assertEqual(compact.occupancy[0].bit_count(), 8)  # test 8 pions par joueur
+        self.assertEqual(compact.occupancy[1].bit_count(), 8)
+        self.assertEqual(sum(color.bit_count() for color in compact.colors), 68)  # test 64 cases colorées + 4 camps
+
+    def test_move_and_load(self):
+        """test du déplacement avec capture et du retour vers les listes imbriquées"""
+        board = Board(self.selected_quadrants, 0)
+        compact = board.to_bitboard()
+        from_square, to_square = compact.index(1, 1), compact.index(8, 1)
+        self.assertEqual(compact.move(from_square, to_square), 1)  # test capture du pion adverse
+        self.assertEqual(compact.player_at(to_square), 0)
+        self.assertIsNone(compact.player_at(from_square))
+        board.load_bitboard(compact)
+        self.assertEqual(board.board[8][1][0], 0)
+        self.assertIsNone(board.board[1][1][0])
+
+    def test_groups(self):
+        """test du découpage en groupes orthogonalement connectés sans passer d'un bord à l'autre"""
+        compact = BitBoard(8)
+        for row, col in ((0, 7), (1, 0), (1, 1), (5, 5)):
+            compact.place(compact.index(row, col), 0)
+        groups = compact.groups(0)
+        self.assertEqual(sorted(group.bit_count() for group in groups), [1, 1, 2])  # (0,7) et (1,0) ne sont pas voisins
+
+if __name__ == "__main__":
+    unittest.main()
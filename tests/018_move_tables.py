@@ -0,0 +1,65 @@
+from test_base import TestBase
+import unittest
+
+from src.board import Board
+from src.bitboard import BitBoard
+from src.moves import available_move
+from src.move_tables import get_move_tables
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestMoveTables(TestBase):
+    """Test des tables de déplacements précalculées par disposition de quadrants"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config, self.quadrant_names, _ = config_result
+
+    def _quadrants(self, offset):
+        """retourne quatre quadrants consécutifs de la configuration à partir d'un décalage"""
+        return [self.quadrants_config[self.quadrant_names[(offset + i) % len(self.quadrant_names)]] for i in range(4)]
+
+    def test_tables_are_cached_per_layout(self):
+        """test de la réutilisation des tables pour une même disposition"""
+        first = get_move_tables(Board(self._quadrants(0), 2).to_bitboard())
+        second = get_move_tables(Board(self._quadrants(0), 1).to_bitboard())  # même disposition 8x8, autre jeu
+        self.assertIs(first, second)  # test tables partagées
+        katerenga = get_move_tables(Board(self._quadrants(0), 0).to_bitboard())
+        self.assertIsNot(first, katerenga)  # test disposition 10x10 différente
+
+    def test_destinations_match_available_move(self):
+        """test de l'égalité entre les destinations des tables et available_move sur les plateaux de départ"""
+        for offset in range(len(self.quadrant_names)):
+            for game_number in (0, 2):
+                board = Board(self._quadrants(offset), game_number).board
+                compact = BitBoard.from_board(board)
+                tables = get_move_tables(compact)
+                size = len(board)
+                camps = [(0, 0), (0, 9), (9, 0), (9, 9)] if size == 10 else []
+                for square in range(size * size):
+                    player = compact.player_at(square)
+                    if player is None or compact.position(square) in camps:
+                        continue
+                    row, col = compact.position(square)
+                    expected = {(r, c) for r in range(size) for c in range(size)
+                                if (r, c) not in camps and available_move(board, row, col, r, c)}
+                    # les camps sont gérés à part (uniquement les camps adverses depuis les deux dernières lignes)
+                    found = {compact.position(t) for t in tables.destinations(square, player, compact)} - set(camps)
+                    self.assertEqual(found, expected, f"Mismatch for piece at ({row},{col})")
+
+    def test_rook_red_stop(self):
+        """test de l'arrêt à la première case rouge (voir 006_rook_moves.py) calculé dans la table"""
+        board = [[[None, 1] for _ in range(8)] for _ in range(8)]
+        board[3][3] = [0, 0]  # joueur 0, case rouge
+        board[3][6] = [None, 0]  # case rouge sur le chemin
+        compact = BitBoard.from_board(board)
+        destinations = {compact.position(t) for t in get_move_tables(compact).destinations(compact.index(3, 3), 0, compact)}
+        self.assertIn((3, 6), destinations)  # test arrêt sur la case rouge
+        self.assertNotIn((3, 7), destinations)  # test pas au-delà de la case rouge
+
+
+if __name__ == "__main__":
+    unittest.main()
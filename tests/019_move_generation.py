@@ -0,0 +1,97 @@
+from test_base import TestBase
+import unittest
+import random
+
+from src.board import Board
+from src.moves import available_move, generate_moves
+from src.windows.selector.config_loader import ConfigLoader
+
+CAMPS = [(0, 0), (0, 9), (9, 0), (9, 9)]
+OPPONENT_CAMPS = {0: [(9, 0), (9, 9)], 1: [(0, 0), (0, 9)]}
+
+
+class TestMoveGeneration(TestBase):
+    """Test de parité entre generate_moves et available_move sur des positions aléatoires"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config, self.quadrant_names, _ = config_result
+        self.rng = random.Random(42)  # graine fixe pour des positions reproductibles
+
+    def _random_board(self, game_number):
+        """crée un plateau avec des quadrants et des pions placés aléatoirement"""
+        quadrants = [self.quadrants_config[self.rng.choice(self.quadrant_names)] for _ in range(4)]
+        board = Board(quadrants, game_number).board
+        size = len(board)
+        playable = [(r, c) for r in range(size) for c in range(size) if board[r][c][1] is not None and board[r][c][1] <= 3]
+        for row, col in playable:
+            board[row][col][0] = None
+        for row, col in self.rng.sample(playable, self.rng.randint(4, 20)):
+            board[row][col][0] = self.rng.randint(0, 1)
+        if size == 10:
+            # quelques pièces verrouillées dans les camps adverses
+            for player, camps in OPPONENT_CAMPS.items():
+                for camp in camps:
+                    if self.rng.random() < 0.3:
+                        board[camp[0]][camp[1]][0] = player
+        return board
+
+    def _expected_moves(self, board, player, first_turn, captures):
+        """coups légaux obtenus en sondant available_move sur toutes les paires de cases"""
+        size = len(board)
+        expected = set()
+        for row in range(size):
+            for col in range(size):
+                if board[row][col][0] != player or (size == 10 and (row, col) in CAMPS):
+                    continue  # pièce adverse ou verrouillée dans un camp
+                for dest_row in range(size):
+                    for dest_col in range(size):
+                        destination = board[dest_row][dest_col][0]
+                        if size == 10 and (dest_row, dest_col) in CAMPS and (dest_row, dest_col) not in OPPONENT_CAMPS[player]:
+                            continue  # seuls les camps adverses sont accessibles
+                        if destination is not None and (first_turn or not captures):
+                            continue  # pas de capture
+                        if available_move(board, row, col, dest_row, dest_col):
+                            expected.add((row, col, dest_row, dest_col))
+        return expected
+
+    def test_katerenga_parity(self):
+        """test sur des plateaux 10x10 aléatoires, avec et sans premier tour"""
+        for _ in range(25):
+            board = self._random_board(0)
+            first_turn = self.rng.random() < 0.3
+            for player in (0, 1):
+                generated = list(generate_moves(board, player, first_turn))
+                self.assertEqual(len(generated), len(set(generated)))  # test aucun doublon
+                self.assertEqual(set(generated), self._expected_moves(board, player, first_turn, True))
+
+    def test_congress_parity(self):
+        """test sur des plateaux 8x8 aléatoires, sans capture"""
+        for _ in range(25):
+            board = self._random_board(2)
+            for player in (0, 1):
+                generated = set(generate_moves(board, player, captures=False))
+                self.assertEqual(generated, self._expected_moves(board, player, False, False))
+
+    def test_captures_parity(self):
+        """test sur des plateaux 8x8 aléatoires avec captures autorisées"""
+        for _ in range(25):
+            board = self._random_board(1)
+            for player in (0, 1):
+                generated = set(generate_moves(board, player))
+                self.assertEqual(generated, self._expected_moves(board, player, False, True))
+
+    def test_locked_pieces(self):
+        """test des pièces verrouillées ignorées par le générateur"""
+        board = self._random_board(0)
+        pieces = [(r, c) for r in range(10) for c in range(10) if board[r][c][0] == 0 and (r, c) not in CAMPS]
+        locked = pieces[:2]
+        for from_row, from_col, _, _ in generate_moves(board, 0, locked_pieces=locked):
+            self.assertNotIn((from_row, from_col), locked)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from test_base import TestBase
+import unittest
+import random
+from unittest.mock import patch
+
+from src.board import Board
+from src.captures import AttackMap, is_threatened, has_valid_move
+from src.isolation.bot import IsolationBot
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestAttackMap(TestBase):
+    """Test de la carte des attaques incrémentale d'Isolation"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config, self.quadrant_names, _ = config_result
+        self.rng = random.Random(7)  # graine fixe pour des parties reproductibles
+
+    def _empty_board(self):
+        """crée un plateau d'isolation vide avec des quadrants tirés au hasard"""
+        quadrants = [self.quadrants_config[self.rng.choice(self.quadrant_names)] for _ in range(4)]
+        board = Board(quadrants, 1).board
+        for row in board:
+            for cell in row:
+                cell[0] = None
+        return board
+
+    @patch('src.captures.Logger')  # évite les milliers de logs du balayage complet
+    def test_parity_with_full_scan(self, mock_logger):
+        """test de l'égalité avec is_threatened et has_valid_move après des poses et retraits aléatoires"""
+        for _ in range(3):
+            board = self._empty_board()
+            attack_map = AttackMap(board)
+            for _ in range(12):
+                row, col = self.rng.randrange(8), self.rng.randrange(8)
+                if board[row][col][0] is None:
+                    player = self.rng.randint(0, 1)
+                    board[row][col][0] = player
+                    attack_map.place(row, col, player)
+                else:
+                    board[row][col][0] = None
+                    attack_map.remove(row, col)
+                for player in (0, 1):
+                    for check_all_pieces in (True, False):
+                        for r in range(8):
+                            for c in range(8):
+                                if board[r][c][0] is None:
+                                    self.assertEqual(attack_map.is_threatened(r, c, player, check_all_pieces),
+                                                     is_threatened(board, r, c, player, check_all_pieces))
+                        self.assertEqual(has_valid_move(board, player, check_all_pieces, attack_map=attack_map),
+                                         has_valid_move(board, player, check_all_pieces))
+                # test état incrémental identique à une reconstruction complète
+                rebuilt = AttackMap(board)
+                self.assertEqual(attack_map.counts, rebuilt.counts)
+                self.assertEqual(attack_map.safe_masks, rebuilt.safe_masks)
+
+    def test_bot_restores_map(self):
+        """test du bot : coup légal et carte restaurée après l'évaluation des coups"""
+        board = self._empty_board()
+        attack_map = AttackMap(board)
+        for row, col, player in ((0, 0, 0), (7, 7, 1)):
+            board[row][col][0] = player
+            attack_map.place(row, col, player)
+        counts = [player_counts[:] for player_counts in attack_map.counts]
+        move = IsolationBot(player_id=2).get_move(board, attack_map)
+        self.assertIn(move, attack_map.safe_squares(1, check_all_pieces=True))  # test coup sur une case libre
+        self.assertEqual(attack_map.counts, counts)  # test carte inchangée
+        self.assertTrue(attack_map.matches(board))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from test_base import TestBase
+import unittest
+import random
+
+from src.board import Board
+from src.moves import generate_moves
+from src.zobrist import Position, ZobristKeys, get_zobrist_keys, hash_board
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestZobrist(TestBase):
+    """Test du hachage de Zobrist des positions et de sa mise à jour incrémentale"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+        self.rng = random.Random(3)  # graine fixe pour des parties reproductibles
+
+    def test_keys_are_deterministic(self):
+        """test des clés identiques d'un tirage à l'autre (partage entre processus et sauvegardes)"""
+        for size in (8, 10):
+            self.assertEqual(ZobristKeys(size).pieces, get_zobrist_keys(size).pieces)
+
+    def test_state_flags_change_hash(self):
+        """test de la prise en compte du trait, du premier tour et des pions verrouillés"""
+        board = Board(self.selected_quadrants, 0)
+        base = board.position_hash(0)
+        self.assertNotEqual(base, board.position_hash(1))  # test trait
+        self.assertNotEqual(base, board.position_hash(0, first_turn=True))  # test premier tour
+        self.assertNotEqual(base, board.position_hash(0, locked_pieces=[[1, 1]]))  # test pion verrouillé
+        self.assertEqual(board.position_hash(0, locked_pieces=[(1, 1)]), board.position_hash(0, locked_pieces=[[1, 1]]))
+
+    def test_incremental_make_unmake(self):
+        """test de l'égalité entre hachage incrémental et recalcul complet sur une partie aléatoire de katerenga"""
+        board = Board(self.selected_quadrants, 0)
+        position = board.to_position(0, first_turn=True)
+        keys = get_zobrist_keys(10)
+        for _ in range(40):
+            locked = [position.board.position(square) for square in range(100) if position.locked >> square & 1]
+            moves = list(generate_moves(position.board, position.turn, position.first_turn, locked))
+            if not moves:
+                break
+            from_row, from_col, to_row, to_col = self.rng.choice(moves)
+            position.make_move(from_row * 10 + from_col, to_row * 10 + to_col)
+            self.assertEqual(position.hash, keys.full_hash(position.board, position.turn, position.first_turn, position.locked))
+        self.assertFalse(position.first_turn)  # test fin du premier tour
+
+    def test_unmake_restores_position(self):
+        """test de la restauration exacte après une suite de coups et d'annulations"""
+        board = Board(self.selected_quadrants, 0)
+        position = board.to_position(0, first_turn=True)
+        start = (position.hash, position.board.serialize(), position.turn, position.first_turn, position.locked)
+        undos = []
+        for _ in range(30):
+            locked = [position.board.position(square) for square in range(100) if position.locked >> square & 1]
+            moves = list(generate_moves(position.board, position.turn, position.first_turn, locked))
+            if not moves:
+                break
+            from_row, from_col, to_row, to_col = self.rng.choice(moves)
+            undos.append(position.make_move(from_row * 10 + from_col, to_row * 10 + to_col))
+        for undo in reversed(undos):
+            position.unmake_move(undo)
+        self.assertEqual((position.hash, position.board.serialize(), position.turn, position.first_turn, position.locked), start)
+
+    def test_isolation_placement(self):
+        """test du hachage incrémental des poses de tours"""
+        board = Board(self.selected_quadrants, 1)
+        position = board.to_position(0)
+        undo = position.make_place(27)
+        board.board[3][3][0] = 0
+        self.assertEqual(position.hash, hash_board(board.board, 1))
+        position.unmake_move(undo)
+        board.board[3][3][0] = None
+        self.assertEqual(position.hash, Position.from_board(board.board, 0).hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
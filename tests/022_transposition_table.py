@@ -0,0 +1,53 @@
+from test_base import TestBase
+import unittest
+
+from src.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND, NO_MOVE, ENTRY_BYTES
+
+
+class TestTranspositionTable(TestBase):
+    """Test de la table de transposition à taille fixe"""
+
+    def test_size_is_bounded(self):
+        """test de la taille en puissance de deux qui tient dans la mémoire demandée"""
+        table = TranspositionTable(1)
+        self.assertEqual(table.size & (table.size - 1), 0)  # test puissance de deux
+        self.assertLessEqual(table.size * ENTRY_BYTES, 1024 * 1024)
+        self.assertGreater(table.size * 2 * ENTRY_BYTES, 1024 * 1024)  # test table pas trop petite
+        with self.assertRaises(ValueError):
+            TranspositionTable(1, "unknown")
+
+    def test_store_and_probe(self):
+        """test de l'écriture, de la lecture et des compteurs de succès et d'échecs"""
+        table = TranspositionTable(0.01)
+        key = 0xDEADBEEFCAFEBABE
+        self.assertIsNone(table.probe(key))
+        table.store(key, 3, LOWER_BOUND, 12.5, 42)
+        self.assertEqual(table.probe(key), (3, LOWER_BOUND, 12.5, 42))
+        self.assertIsNone(table.probe(key ^ (1 << 63)))  # test même index, clé différente
+        self.assertEqual((table.hits, table.misses), (1, 2))
+        table.store(key, 4, EXACT, float("inf"))
+        self.assertEqual(table.probe(key), (4, EXACT, float("inf"), 42))  # test coup conservé
+        self.assertEqual(table.best_move(key), 42)
+
+    def test_replacement_policies(self):
+        """test du remplacement par profondeur et du remplacement systématique"""
+        deep, shallow = 5, 1 << 62 | 5  # même index, clés différentes
+        table = TranspositionTable(0.01, "depth")
+        table.store(deep, 6, EXACT, 1.0, 7)
+        table.store(shallow, 2, UPPER_BOUND, 2.0, 8)
+        self.assertIsNotNone(table.probe(deep))  # test entrée profonde conservée
+        table.new_search()
+        table.store(shallow, 2, UPPER_BOUND, 2.0, 8)
+        self.assertIsNotNone(table.probe(shallow))  # test entrée d'une ancienne recherche remplacée
+        table = TranspositionTable(0.01, "always")
+        table.store(deep, 6, EXACT, 1.0, 7)
+        table.store(shallow, 2, UPPER_BOUND, 2.0, 8)
+        self.assertIsNone(table.probe(deep))
+        self.assertEqual(table.overwrites, 1)
+        table.clear()
+        self.assertIsNone(table.probe(shallow))
+        self.assertEqual(table.best_move(shallow), NO_MOVE)
+
+
+if __name__ == "__main__":
+    unittest.main()
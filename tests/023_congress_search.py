@@ -0,0 +1,69 @@
+from test_base import TestBase
+import unittest
+import time
+from types import SimpleNamespace
+
+from src.board import Board
+from src.congress.bot import CongressBot
+from src.congress.connectivity import ConnectivityTracker
+from src.moves import generate_moves
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestCongressSearch(TestBase):
+    """Test de la recherche alpha-beta du bot Congress"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+
+    def _bot(self, board):
+        """crée un bot branché sur un faux jeu qui ne contient que le plateau"""
+        return CongressBot(SimpleNamespace(board=board), tt_size_mb=1)
+
+    def test_finds_connecting_move(self):
+        """test de la victoire immédiate trouvée sur un plateau de rois"""
+        board = Board(self.selected_quadrants, 2)
+        for row in board.board:
+            for cell in row:
+                cell[0], cell[1] = None, 2  # cases bleues : déplacements du roi
+        for row, col in ((0, 0), (0, 1), (2, 2)):
+            board.board[row][col][0] = 1
+        for row, col in ((7, 7), (5, 4)):
+            board.board[row][col][0] = 0
+        bot = self._bot(board)
+        (from_row, from_col), (to_row, to_col) = bot.get_move()
+        self.assertEqual((from_row, from_col), (2, 2))
+        self.assertIn((to_row, to_col), [(1, 1), (1, 0), (1, 2)])
+        self.assertFalse(ConnectivityTracker(board.to_bitboard()).is_connected(1))  # test plateau du jeu intact
+
+    def test_respects_time_budget(self):
+        """test de l'arrêt de l'approfondissement itératif au temps imparti"""
+        board = Board(self.selected_quadrants, 2)
+        bot = self._bot(board)
+        bot.max_depth = 20
+        bot.max_time = 0.3
+        before = [[cell[:] for cell in row] for row in board.board]
+        start = time.time()
+        move = bot.get_move()
+        self.assertLess(time.time() - start, 1.0)
+        self.assertIsNotNone(move)
+        self.assertEqual(board.board, before)  # test plateau restauré après la recherche
+        self.assertGreater(len(bot.principal_variation), 0)
+
+    def test_move_is_legal(self):
+        """test d'un coup légal depuis la position de départ"""
+        board = Board(self.selected_quadrants, 2)
+        bot = self._bot(board)
+        bot.max_depth = 2
+        move = bot.get_move()
+        self.assertIn(move, [((from_row, from_col), (to_row, to_col)) for from_row, from_col, to_row, to_col
+                             in generate_moves(board.board, 1, captures=False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
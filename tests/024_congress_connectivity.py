@@ -0,0 +1,132 @@
+from test_base import TestBase
+import unittest
+import math
+import random
+from unittest.mock import MagicMock
+
+from src.board import Board
+from src.bitboard import BitBoard
+from src.congress.bot import CongressBot
+from src.congress.game import Game as CongressGame
+from src.congress.connectivity import ConnectivityTracker
+from src.moves import generate_moves
+from src.zobrist import Position
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestCongressConnectivity(TestBase):
+    """Test du suivi incrémental de la connectivité du congress"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+        self.rng = random.Random(11)  # graine fixe pour des parties reproductibles
+
+    def _assert_same_state(self, tracker, compact):
+        """compare le suivi incrémental avec un suivi recalculé depuis le plateau"""
+        rebuilt = ConnectivityTracker(compact)
+        self.assertEqual(tracker.adjacent_pairs, rebuilt.adjacent_pairs)
+        self.assertEqual(tracker.largest_groups, rebuilt.largest_groups)
+        self.assertEqual(tracker.group_counts, rebuilt.group_counts)
+        for player in (0, 1):
+            self.assertTrue(math.isclose(tracker.center_sums[player], rebuilt.center_sums[player]))
+
+    def test_incremental_moves_and_undo(self):
+        """test de l'égalité avec un recalcul complet sur une partie aléatoire, puis de l'annulation"""
+        board = Board(self.selected_quadrants, 2)
+        position = Position.from_board(board.board, 0)
+        tracker = ConnectivityTracker(position.board)
+        start = (tracker.adjacent_pairs[:], tracker.center_sums[:], tracker.largest_groups[:], tracker.group_counts[:])
+        undos = []
+        for _ in range(30):
+            moves = list(generate_moves(position.board, position.turn, captures=False))
+            from_row, from_col, to_row, to_col = self.rng.choice(moves)
+            player = position.turn
+            undos.append(position.make_move(from_row * 8 + from_col, to_row * 8 + to_col))
+            tracker.moved(from_row * 8 + from_col, to_row * 8 + to_col, player)
+            self._assert_same_state(tracker, position.board)
+        for undo in reversed(undos):
+            tracker.undo()
+            position.unmake_move(undo)
+        self.assertEqual((tracker.adjacent_pairs, tracker.center_sums, tracker.largest_groups, tracker.group_counts), start)
+
+    def _reference_score(self, board, player):
+        """score de connectivité recalculé sur les listes imbriquées : paires voisines, proximité au centre, plus grand groupe"""
+        pieces = {(row, col) for row in range(8) for col in range(8) if board[row][col][0] == player}
+        if not pieces:
+            return 0.0
+        pairs = sum((row + d_row, col + d_col) in pieces for row, col in pieces for d_row, d_col in ((0, 1), (1, 0)))
+        center = sum(7 - (abs(row - 3.5) + abs(col - 3.5)) for row, col in pieces)
+        largest, seen = 0, set()
+        for start in pieces:
+            if start in seen:
+                continue
+            stack, size = [start], 0
+            seen.add(start)
+            while stack:
+                row, col = stack.pop()
+                size += 1
+                for neighbor in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                    if neighbor in pieces and neighbor not in seen:
+                        seen.add(neighbor)
+                        stack.append(neighbor)
+            largest = max(largest, size)
+        return pairs / (len(pieces) * 2) * 50 + center / (len(pieces) * 7) * 20 + largest / len(pieces) * 100
+
+    def test_evaluation_matches_board(self):
+        """test de l'évaluation de la recherche négamax comparée à un recalcul sur les listes imbriquées"""
+        board = Board(self.selected_quadrants, 2)
+        bot = CongressBot(MagicMock(), tt_size_mb=1)
+        moves = (((0, 1), (3, 3)), ((1, 0), (3, 4)), ((0, 3), (4, 4)))
+        for index in range(len(moves) + 1):
+            tracker = ConnectivityTracker(board.to_bitboard())
+            for player in (0, 1):
+                self.assertTrue(math.isclose(tracker.connectivity_score(player), self._reference_score(board.board, player)))
+            expected = self._reference_score(board.board, 1) - self._reference_score(board.board, 0) * 0.8
+            self.assertTrue(math.isclose(bot._evaluate_tracker(tracker), expected))
+            if index < len(moves):
+                (from_row, from_col), (to_row, to_col) = moves[index]
+                board.board[to_row][to_col][0] = board.board[from_row][from_col][0]
+                board.board[from_row][from_col][0] = None
+
+    def test_evaluation_of_connected_players(self):
+        """test de l'évaluation d'une victoire et d'une défaite : pièces d'un joueur toutes reliées"""
+        bot = CongressBot(MagicMock(), tt_size_mb=1)
+        for connected, expected in ((1, math.inf), (0, -math.inf)):
+            compact = BitBoard(8)
+            for row, col in ((0, 0), (0, 1), (1, 1)):
+                compact.place(row * 8 + col, connected)
+            for row, col in ((7, 7), (5, 4)):
+                compact.place(row * 8 + col, 1 - connected)
+            tracker = ConnectivityTracker(compact)
+            self.assertTrue(tracker.is_connected(connected))
+            self.assertFalse(tracker.is_connected(1 - connected))
+            self.assertEqual(bot._evaluate_tracker(tracker), expected)
+
+    def test_game_tracker_follows_moves(self):
+        """test du suivi tenu par la partie : coups joués par clics et par le bot, puis état reçu"""
+        game = CongressGame("test_save", self.selected_quadrants, "Bot", headless=True)
+        game.bot.max_time = 0.05
+        for _ in range(6):
+            from_row, from_col, to_row, to_col = self.rng.choice(list(generate_moves(game.board.board, 0, captures=False)))
+            game.on_click(from_row, from_col)
+            if not game.on_click(to_row, to_col):
+                break
+            self._assert_same_state(game.connectivity, game.board.to_bitboard())
+            if not game._bot_play() or game.round_turn != 0:
+                break
+            self._assert_same_state(game.connectivity, game.board.to_bitboard())
+        self.assertEqual(game.connectivity.compact.occupancy, game.board.to_bitboard().occupancy)
+        state = game.get_board_state()
+        state["board"] = Board(self.selected_quadrants, 2).board
+        self.assertTrue(game.update_board_from_state(state))
+        self._assert_same_state(game.connectivity, game.board.to_bitboard())
+        self.assertEqual(game.connectivity.compact.occupancy, game.board.to_bitboard().occupancy)
+
+
+if __name__ == "__main__":
+    unittest.main()
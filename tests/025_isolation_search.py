@@ -0,0 +1,55 @@
+from test_base import TestBase, isolation_wins, late_isolation_position
+import unittest
+import random
+import time
+
+from src.isolation.bot import IsolationBot
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestIsolationSearch(TestBase):
+    """Test de la recherche alpha-beta du bot Isolation"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config, self.quadrant_names, _ = config_result
+        self.rng = random.Random(5)  # graine fixe pour des parties reproductibles
+
+    def _late_position(self, max_safe):
+        """fin de partie aléatoire avec au plus max_safe cases libres"""
+        return late_isolation_position(self.rng, self.quadrants_config, self.quadrant_names, max_safe)
+
+    def test_plays_winning_move(self):
+        """test du coup gagnant joué dès qu'il en existe un dans une fin de partie"""
+        checked = 0
+        for _ in range(8):
+            board, attack_map, turn = self._late_position(6)
+            if not attack_map.safe_mask or not isolation_wins(attack_map, turn):
+                continue
+            bot = IsolationBot(player_id=turn + 1, tt_size_mb=1, endgame_threshold=0)  # recherche alpha-beta, sans le solveur
+            row, col = bot.get_move(board, attack_map)
+            self.assertGreater(bot._nodes, 0)
+            attack_map.place(row, col, turn)
+            self.assertFalse(isolation_wins(attack_map, 1 - turn), "Bot missed a forced win")
+            attack_map.remove(row, col)
+            checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_time_limit_and_restored_map(self):
+        """test du respect du temps de réflexion et de la carte des attaques restaurée"""
+        board, attack_map, turn = self._late_position(64)
+        bot = IsolationBot(player_id=turn + 1, tt_size_mb=1)
+        bot.time_limit = 0.3
+        counts = [player_counts[:] for player_counts in attack_map.counts]
+        start = time.time()
+        move = bot.get_move(board, attack_map)
+        self.assertLess(time.time() - start, 1.0)
+        self.assertIn(move, attack_map.safe_squares(turn, check_all_pieces=True))
+        self.assertEqual(attack_map.counts, counts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from test_base import TestBase, isolation_wins, late_isolation_position
+import unittest
+import random
+import time
+
+from src.isolation.bot import IsolationBot
+from src.isolation.solver import IsolationSolver
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestIsolationSolver(TestBase):
+    """Test du solveur exact des fins de partie d'Isolation"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config, self.quadrant_names, _ = config_result
+        self.rng = random.Random(9)  # graine fixe pour des parties reproductibles
+
+    def _late_position(self, max_safe):
+        """fin de partie aléatoire avec au plus max_safe cases libres"""
+        return late_isolation_position(self.rng, self.quadrants_config, self.quadrant_names, max_safe)
+
+    def test_matches_exhaustive_search(self):
+        """test de l'égalité avec une recherche exhaustive sur des fins de partie aléatoires"""
+        solver = IsolationSolver()
+        for _ in range(15):
+            _, attack_map, turn = self._late_position(7)
+            if not attack_map.safe_mask:
+                continue
+            wins, square = solver.solve(attack_map)
+            self.assertEqual(wins, isolation_wins(attack_map, turn))
+            self.assertTrue(attack_map.safe_mask >> square & 1)  # test coup légal
+            if wins:
+                row, col = attack_map.compact.position(square)
+                attack_map.place(row, col, turn)
+                self.assertFalse(isolation_wins(attack_map, 1 - turn))  # test coup gagnant
+                attack_map.remove(row, col)
+
+    def test_bot_uses_solver_below_threshold(self):
+        """test de la prise de relais du solveur par le bot sous le seuil de cases libres"""
+        board, attack_map, turn = self._late_position(10)
+        bot = IsolationBot(player_id=turn + 1, tt_size_mb=1, endgame_threshold=10)
+        bot.get_move(board, attack_map)
+        self.assertGreater(len(bot.solver.cache), 0)
+        bot = IsolationBot(player_id=turn + 1, tt_size_mb=1, endgame_threshold=2)
+        bot.time_limit = 0.2
+        bot.get_move(board, attack_map)
+        self.assertEqual(len(bot.solver.cache), 0)  # test recherche heuristique au-dessus du seuil
+
+    def test_interrupted_solve(self):
+        """test de l'arrêt de la résolution à l'annulation et à l'échéance, puis de la reprise avec le cache"""
+        _, attack_map, _ = self._late_position(20)
+        expected = IsolationSolver().solve(attack_map)
+        solver = IsolationSolver()
+        self.assertIsNone(solver.solve(attack_map, cancelled=lambda: True))
+        self.assertEqual(solver.nodes, 1024)  # test arrêt au premier contrôle
+        self.assertIsNone(solver.solve(attack_map, deadline=time.time() - 1.0))
+        self.assertEqual(solver.solve(attack_map), expected)
+        bounded = IsolationSolver(max_entries=100)
+        self.assertEqual(bounded.solve(attack_map), expected)
+        self.assertLessEqual(len(bounded.cache), 100)  # test cache borné pendant la résolution
+
+    def test_bot_falls_back_within_time_limit(self):
+        """test du repli sur la recherche alpha-beta quand la résolution dépasse sa part du temps de réflexion"""
+        board, attack_map, turn = self._late_position(40)
+        bot = IsolationBot(player_id=turn + 1, tt_size_mb=1, endgame_threshold=64)
+        bot.time_limit = 0.3
+        start = time.time()
+        move = bot.get_move(board, attack_map)
+        self.assertLess(time.time() - start, 0.5)
+        self.assertGreater(bot.solver.nodes, 0)
+        self.assertIn(move, bot.get_valid_moves(board, attack_map))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from test_base import TestBase
+import unittest
+import time
+from types import SimpleNamespace
+
+from src.board import Board
+from src.katerenga.bot import KaterengaBot
+from src.katerenga.mcts import decode_move
+from src.moves import generate_moves
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestKaterengaMCTS(TestBase):
+    """Test de la recherche Monte Carlo du bot Katerenga"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+
+    def _game(self, board, first_turn=False, locked_pieces=None):
+        """crée un faux jeu qui ne contient que l'état lu par le bot"""
+        return SimpleNamespace(board=board, first_turn=first_turn, locked_pieces=locked_pieces or [])
+
+    def test_takes_winning_camp(self):
+        """test de l'entrée dans le second camp adverse quand elle gagne la partie"""
+        board = Board(self.selected_quadrants, 0)
+        for row in board.board:
+            for cell in row:
+                cell[0] = None
+        board.board[0][0][0] = 1  # premier camp déjà occupé
+        board.board[1][5][0] = 1  # pièce sur la ligne d'accès aux camps
+        board.board[8][4][0] = 1
+        for row, col in ((2, 2), (5, 5), (7, 1)):
+            board.board[row][col][0] = 0
+        bot = KaterengaBot(self._game(board, locked_pieces=[(0, 0)]), iterations=300, time_limit=None, seed=3)
+        self.assertEqual(bot.choose_move(), (1, 5, 0, 9))
+
+    def test_respects_time_budget(self):
+        """test de l'arrêt de la recherche au temps imparti et du coup légal"""
+        board = Board(self.selected_quadrants, 0)
+        before = [[cell[:] for cell in row] for row in board.board]
+        bot = KaterengaBot(self._game(board, first_turn=True), time_limit=0.3, seed=1)
+        start = time.time()
+        move = bot.choose_move()
+        self.assertLess(time.time() - start, 1.0)
+        self.assertIn(move, list(generate_moves(board.board, 1, True)))
+        self.assertEqual(board.board, before)  # test plateau du jeu intact
+        self.assertGreater(bot.mcts.last_stats["playouts_per_second"], 0)
+
+    def test_iteration_budget(self):
+        """test du nombre d'itérations demandé, avec des simulations aléatoires"""
+        board = Board(self.selected_quadrants, 0)
+        bot = KaterengaBot(self._game(board, first_turn=True), iterations=50, time_limit=None, playout_policy="random", seed=2)
+        self.assertIsNotNone(bot.choose_move())
+        self.assertEqual(bot.mcts.last_stats["iterations"], 50)
+
+    def test_tree_reuse(self):
+        """test de la reprise du sous-arbre après le coup du bot et la réponse de l'adversaire"""
+        board = Board(self.selected_quadrants, 0)
+        game = self._game(board, first_turn=True)
+        bot = KaterengaBot(game, iterations=400, time_limit=None, seed=4)
+        from_row, from_col, to_row, to_col = bot.choose_move()
+        board.board[to_row][to_col][0] = 1
+        board.board[from_row][from_col][0] = None
+        game.first_turn = False
+        # réponse de l'adversaire : l'enfant le plus visité du sous-arbre conservé
+        reply = max(bot.mcts.root.children, key=lambda child: child.visits)
+        reply_visits = reply.visits
+        from_square, to_square = decode_move(reply.move)
+        board.board[to_square // 10][to_square % 10][0] = 0
+        board.board[from_square // 10][from_square % 10][0] = None
+        bot.choose_move()
+        self.assertEqual(bot.mcts.last_stats["reused_visits"], reply_visits)
+        self.assertGreater(reply_visits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from test_base import TestBase
+import unittest
+import time
+from types import SimpleNamespace
+
+from src.board import Board
+from src.captures import AttackMap
+from src.congress.bot import CongressBot
+from src.isolation.bot import IsolationBot
+from src.katerenga.bot import KaterengaBot
+from src.parallel import ParallelSearch, merge_root_results
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestParallelSearch(TestBase):
+    """Test de la recherche répartie sur plusieurs processus"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+        self.pools = []
+
+    def tearDown(self):
+        for pool in self.pools:
+            pool.shutdown()  # arrêt des processus de recherche
+        super().tearDown()
+
+    def test_split_and_merge(self):
+        """test de la répartition des coups et de la fusion des itérations"""
+        parallel = ParallelSearch(3)
+        self.assertEqual(parallel.split([1, 2, 3, 4, 5]), [[1, 4], [2, 5], [3]])
+        self.assertEqual(parallel.split([7]), [[7]])
+        with self.assertRaises(ValueError):
+            ParallelSearch(0)
+        # profondeur commune aux deux processus : 1 ; le meilleur score l'emporte
+        merged = merge_root_results([[(1, 2.0, "a", 10), (2, 1.0, "a", 30)], [(1, 5.0, "b", 20)]], 100)
+        self.assertEqual(merged, [(1, 5.0, "b", 50)])
+        # une victoire forcée trouvée par un processus décide du coup
+        merged = merge_root_results([[(1, 2.0, "a", 10), (2, 3.0, "a", 30)], [(1, 150.0, "b", 20)]], 100)
+        self.assertEqual(merged, [(1, 150.0, "b", 50)])
+
+    def test_congress_parallel(self):
+        """test de la victoire immédiate trouvée par la recherche répartie du bot Congress"""
+        board = Board(self.selected_quadrants, 2)
+        for row in board.board:
+            for cell in row:
+                cell[0], cell[1] = None, 2  # cases bleues : déplacements du roi
+        for row, col in ((0, 0), (0, 1), (2, 2)):
+            board.board[row][col][0] = 1
+        for row, col in ((7, 7), (5, 4)):
+            board.board[row][col][0] = 0
+        bot = CongressBot(SimpleNamespace(board=board), tt_size_mb=1, workers=2)
+        self.pools.append(bot.parallel)
+        (from_row, from_col), (to_row, to_col) = bot.get_move()
+        self.assertEqual((from_row, from_col), (2, 2))
+        self.assertIn((to_row, to_col), [(1, 1), (1, 0), (1, 2)])
+
+    def test_isolation_parallel(self):
+        """test d'un coup légal dans le temps imparti avec la recherche répartie du bot Isolation"""
+        board = Board(self.selected_quadrants, 1)
+        board.board[3][3][0] = 0
+        attack_map = AttackMap(board.board)
+        bot = IsolationBot(player_id=2, tt_size_mb=1, endgame_threshold=0, workers=2)
+        self.pools.append(bot.parallel)
+        bot.time_limit = 0.5
+        start = time.time()
+        move = bot.get_move(board.board, attack_map)
+        self.assertLess(time.time() - start, 5.0)  # démarrage des processus compris
+        self.assertIn(move, bot.get_valid_moves(board.board, attack_map))
+
+    def test_katerenga_root_parallel(self):
+        """test de la parallélisation à la racine du bot Katerenga"""
+        board = Board(self.selected_quadrants, 0)
+        for row in board.board:
+            for cell in row:
+                cell[0] = None
+        board.board[0][0][0] = 1  # premier camp déjà occupé
+        board.board[1][5][0] = 1  # pièce sur la ligne d'accès aux camps
+        board.board[8][4][0] = 1
+        for row, col in ((2, 2), (5, 5), (7, 1)):
+            board.board[row][col][0] = 0
+        game = SimpleNamespace(board=board, first_turn=False, locked_pieces=[(0, 0)])
+        bot = KaterengaBot(game, iterations=200, time_limit=None, seed=3, workers=2)
+        self.pools.append(bot.mcts.parallel)
+        self.assertEqual(bot.choose_move(), (1, 5, 0, 9))
+        self.assertEqual(bot.mcts.last_stats["iterations"], 400)  # itérations des deux processus
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+from test_base import TestBase
+import unittest
+import threading
+import time
+import pygame
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.board import Board
+from src.bot_worker import BotWorker, BOT_MOVE_EVENT
+from src.katerenga.bot import KaterengaBot
+from src.network.client.game_base import GameBase
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class FakeGame(GameBase):
+    """jeu minimal qui enregistre les coups appliqués"""
+
+    def __init__(self, bot, think):
+        super().__init__("test_bot_worker", [], game_mode="Bot")
+        self.bot = bot
+        self.round_turn = 1
+        self.render = MagicMock()
+        self._think = think
+        self.applied = []
+
+    def _bot_think(self):
+        return self._think()
+
+    def _bot_apply(self, move):
+        self.applied.append(move)
+        self.round_turn = 0
+        return True
+
+
+class TestBotWorker(TestBase):
+    """Test de la réflexion du bot hors de la boucle de rendu"""
+
+    def setUp(self):
+        super().setUp()
+        pygame.init()
+        pygame.event.clear()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+
+    def tearDown(self):
+        pygame.quit()
+        super().tearDown()
+
+    def _wait_event(self, timeout=5.0):
+        """attend le prochain événement BOT_MOVE_EVENT"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            for event in pygame.event.get(BOT_MOVE_EVENT):
+                return event
+            time.sleep(0.01)
+        return None
+
+    def test_result_is_posted(self):
+        """test du résultat rapporté par l'événement pygame"""
+        worker = BotWorker()
+        token = worker.start(SimpleNamespace(), lambda: (1, 2))
+        self.assertTrue(worker.is_thinking())
+        event = self._wait_event()
+        self.assertIsNotNone(event)
+        self.assertEqual((event.token, event.result, event.error), (token, (1, 2), None))
+        self.assertTrue(worker.accept(event))
+        self.assertFalse(worker.is_thinking())
+
+    def test_cancel_discards_result(self):
+        """test de l'annulation : le bot est interrompu et son résultat ignoré"""
+        release = threading.Event()
+        bot = MagicMock()
+        bot.cancel.side_effect = release.set  # le bot s'arrête dès la demande d'annulation
+        worker = BotWorker()
+        worker.start(bot, lambda: release.wait(5.0) and (0, 0))
+        worker.cancel()
+        bot.cancel.assert_called_once()
+        self.assertFalse(worker.is_thinking())
+        self.assertIsNone(self._wait_event(0.5))  # résultat périmé jamais posté
+
+    def test_cancel_stops_search(self):
+        """test de l'interruption de la recherche Monte Carlo par cancel"""
+        board = Board(self.selected_quadrants, 0)
+        bot = KaterengaBot(SimpleNamespace(board=board, first_turn=True, locked_pieces=[]), time_limit=30.0, seed=1)
+        worker = BotWorker()
+        start = time.time()
+        worker.start(bot, bot.choose_move)
+        time.sleep(0.2)
+        worker.cancel()
+        worker._thread.join(5.0)
+        self.assertFalse(worker._thread.is_alive())
+        self.assertLess(time.time() - start, 5.0)
+
+    def test_game_applies_bot_move(self):
+        """test du cycle complet : timer du bot, réflexion sur le fil, application à la réception"""
+        game = FakeGame(SimpleNamespace(), lambda: (3, 4))
+        game._bot_timer_set = True
+        self.assertFalse(game.handle_events(pygame.event.Event(pygame.USEREVENT)))
+        self.assertTrue(game.bot_worker.is_thinking())
+        event = self._wait_event()
+        self.assertIsNotNone(event)
+        self.assertFalse(game.handle_events(event))
+        self.assertEqual(game.applied, [(3, 4)])
+        self.assertEqual(game.round_turn, 0)
+
+    def test_concede_while_thinking(self):
+        """test de l'abandon pendant la réflexion du bot"""
+        release = threading.Event()
+        bot = MagicMock()
+        bot.cancel.side_effect = release.set
+        game = FakeGame(bot, lambda: release.wait(5.0) and (0, 0))
+        game.start_bot_turn()
+        game.concede()
+        bot.cancel.assert_called_once()
+        game.render.show_end_popup.assert_called_once_with("BOT WON THE GAME !")
+        self.assertIsNone(self._wait_event(0.5))
+        self.assertEqual(game.applied, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from test_base import TestBase
+import unittest
+import time
+from types import SimpleNamespace
+
+from src.board import Board
+from src.bot_worker import BotWorker
+from src.captures import AttackMap
+from src.congress.bot import CongressBot
+from src.isolation.bot import IsolationBot
+from src.katerenga.bot import KaterengaBot
+from src.katerenga.mcts import decode_move
+from src.moves import generate_moves
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestBotPondering(TestBase):
+    """Test de la réflexion des bots pendant le tour du joueur"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+
+    def _ponder(self, bot, snapshot, duration=0.5):
+        """fait réfléchir le bot sur un fil pendant duration secondes, comme pendant le tour du joueur"""
+        worker = BotWorker()
+        worker.ponder(bot, lambda: bot.ponder(snapshot))
+        self.assertTrue(worker.is_pondering())
+        time.sleep(duration)
+        worker.stop_pondering()
+        self.assertFalse(worker.is_pondering())
+        return bot._ponder if hasattr(bot, "_ponder") else bot.mcts._ponder
+
+    def _congress_after_bot_move(self):
+        """partie de congress où le bot vient de jouer"""
+        board = Board(self.selected_quadrants, 2)
+        bot = CongressBot(SimpleNamespace(board=board), tt_size_mb=1)
+        bot.max_depth = 20
+        bot.max_time = 0.3
+        (from_row, from_col), (to_row, to_col) = bot.get_move()
+        board.board[to_row][to_col][0] = 1
+        board.board[from_row][from_col][0] = None
+        return board, bot
+
+    def test_congress_hit_answers_instantly(self):
+        """test de la réponse immédiate quand le joueur joue le coup prédit"""
+        board, bot = self._congress_after_bot_move()
+        position = board.to_position(0)
+        pondered = self._ponder(bot, position)
+        self.assertTrue(pondered.results)
+        (from_row, from_col), (to_row, to_col) = position.board.position(pondered.move >> 6), position.board.position(pondered.move & 63)
+        board.board[to_row][to_col][0] = 0
+        board.board[from_row][from_col][0] = None
+        start = time.time()
+        move = bot.get_move()
+        self.assertLess(time.time() - start, 0.15)  # budget de 0.3s déjà couvert par la réflexion anticipée
+        self.assertIn(move, [((from_row, from_col), (to_row, to_col)) for from_row, from_col, to_row, to_col
+                             in generate_moves(board.board, 1, captures=False)])
+        self.assertEqual((bot.ponder_stats.ponders, bot.ponder_stats.hits), (1, 1))
+        self.assertAlmostEqual(bot.ponder_stats.time_saved, 0.3)
+
+    def test_congress_miss(self):
+        """test d'une prédiction manquée : recherche normale et statistiques"""
+        board, bot = self._congress_after_bot_move()
+        position = board.to_position(0)
+        pondered = self._ponder(bot, position, 0.2)
+        predicted = (position.board.position(pondered.move >> 6), position.board.position(pondered.move & 63))
+        from_row, from_col, to_row, to_col = next(move for move in generate_moves(board.board, 0, captures=False)
+                                                  if ((move[0], move[1]), (move[2], move[3])) != predicted)
+        board.board[to_row][to_col][0] = 0
+        board.board[from_row][from_col][0] = None
+        self.assertIsNotNone(bot.get_move())
+        stats = bot.ponder_stats.as_dict()
+        self.assertEqual((stats["ponders"], stats["hits"], stats["hit_rate"], stats["time_saved"]), (1, 0, 0.0, 0.0))
+
+    def test_isolation_hit(self):
+        """test de la reprise de la réflexion anticipée du bot Isolation"""
+        board = Board(self.selected_quadrants, 1)
+        board.board[3][3][0] = 0
+        bot = IsolationBot(player_id=2, tt_size_mb=1, endgame_threshold=0)
+        bot.time_limit = 0.3
+        row, col = bot.get_move(board.board)
+        board.board[row][col][0] = 1
+        pondered = self._ponder(bot, AttackMap(board.board))
+        row, col = divmod(pondered.move, len(board.board))
+        board.board[row][col][0] = 0
+        start = time.time()
+        move = bot.get_move(board.board)
+        self.assertLess(time.time() - start, 0.15)
+        self.assertIn(move, bot.get_valid_moves(board.board))
+        self.assertEqual(bot.ponder_stats.hits, 1)
+
+    def test_katerenga_reuses_pondered_subtree(self):
+        """test de la reprise du sous-arbre de la réponse prédite par la recherche Monte Carlo"""
+        board = Board(self.selected_quadrants, 0)
+        game = SimpleNamespace(board=board, first_turn=True, locked_pieces=[])
+        bot = KaterengaBot(game, iterations=300, time_limit=None, seed=5)
+        from_row, from_col, to_row, to_col = bot.choose_move()
+        board.board[to_row][to_col][0] = 1
+        board.board[from_row][from_col][0] = None
+        game.first_turn = False
+        pondered = self._ponder(bot, board.to_position(0, False, []), 0.3)
+        from_square, to_square = decode_move(pondered.move)
+        board.board[to_square // 10][to_square % 10][0] = 0
+        board.board[from_square // 10][from_square % 10][0] = None
+        bot.choose_move()
+        reused = bot.mcts.last_stats["reused_visits"]
+        self.assertGreater(reused, 0)
+        self.assertEqual(bot.mcts.last_stats["iterations"], max(1, 300 - reused))  # budget réduit des visites reprises
+        self.assertEqual(bot.ponder_stats.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
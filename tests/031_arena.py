@@ -0,0 +1,97 @@
+from test_base import TestBase
+import unittest
+import json
+import os
+import random
+import tempfile
+
+from src.arena import create_player, parse_bot_spec, play_game, random_quadrants, run_arena
+from src.game_state import GAME_TYPES, GameState
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class TestArena(TestBase):
+    """Test de l'arène de parties entre bots sans interface"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config = config_result[0]
+
+    def test_parse_bot_spec(self):
+        """test de la lecture des descriptions de bots"""
+        self.assertEqual(parse_bot_spec("random"), ("random", {}))
+        self.assertEqual(parse_bot_spec("default:max_time=0.2,tt_size_mb=1,playout_policy=random"),
+                         ("default", {"max_time": 0.2, "tt_size_mb": 1, "playout_policy": "random"}))
+        with self.assertRaises(ValueError):
+            parse_bot_spec("minimax")
+        with self.assertRaises(ValueError):
+            parse_bot_spec("default:max_time")
+
+    def test_random_layout(self):
+        """test du tirage reproductible des dispositions"""
+        names, rotations, quadrants = random_quadrants(self.quadrants_config, random.Random(7))
+        self.assertEqual((names, rotations), random_quadrants(self.quadrants_config, random.Random(7))[:2])
+        for name, rotation, quadrant in zip(names, rotations, quadrants):
+            original = self.quadrants_config[name]
+            size = len(original)
+            for row in range(size):
+                for col in range(size):
+                    # position d'origine de la case après rotation quarts de tour à droite
+                    source_row, source_col = row, col
+                    for _ in range(rotation):
+                        source_row, source_col = size - 1 - source_col, source_row
+                    self.assertEqual(list(quadrant[row][col]), list(original[source_row][source_col]))
+
+    def test_isolation_rules(self):
+        """test des règles de l'isolation : le dernier joueur qui a pu poser une tour gagne"""
+        _, _, quadrants = random_quadrants(self.quadrants_config, random.Random(1))
+        game = GameState(GAME_TYPES["isolation"], quadrants)
+        rng = random.Random(2)
+        winner = None
+        while winner is None:
+            player = game.round_turn
+            winner = game.apply_move(rng.choice(game.legal_moves()))
+        self.assertEqual(winner, player)
+        self.assertEqual(game.legal_moves(), [])
+
+    def test_bots_play_both_sides(self):
+        """test des coups légaux des bots quel que soit le joueur contrôlé"""
+        _, _, quadrants = random_quadrants(self.quadrants_config, random.Random(3))
+        options = {"katerenga": {"iterations": 20, "time_limit": None},
+                   "congress": {"max_time": 0.05, "max_depth": 2, "tt_size_mb": 1},
+                   "isolation": {"time_limit": 0.05, "tt_size_mb": 1}}
+        for game_name, game_type in GAME_TYPES.items():
+            game = GameState(game_type, quadrants)
+            players = [create_player(game, "default", options[game_name], player, 0) for player in (0, 1)]
+            for _ in range(2):
+                move = players[game.round_turn]()
+                self.assertIn(tuple(move), game.legal_moves(), game_name)
+                self.assertIsNone(game.apply_move(tuple(move)))
+
+    def test_max_moves_draw(self):
+        """test de la partie nulle au nombre maximal de coups"""
+        _, _, quadrants = random_quadrants(self.quadrants_config, random.Random(4))
+        outcome = play_game(GAME_TYPES["congress"], quadrants, [("random", {}), ("random", {})], 5, max_moves=4)
+        self.assertEqual((outcome["winner"], outcome["moves"]), (None, 4))
+        self.assertEqual([len(times) for times in outcome["think_times"]], [2, 2])
+
+    def test_run_arena_writes_results(self):
+        """test du tournoi : couleurs alternées, taux de victoire et fichier de résultats"""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            results = run_arena("isolation", "default:time_limit=0.05,tt_size_mb=1", "random", 2, seed=3,
+                                output=output, quadrants_config=self.quadrants_config)
+            with open(output, encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["wins"], results["wins"])
+        self.assertEqual(sum(results["wins"].values()), 2)
+        self.assertEqual([game["first_player"] for game in results["results"]], ["a", "b"])
+        self.assertGreaterEqual(results["win_rate"]["a"], 0.5)  # le bot bat le joueur aléatoire
+        total_moves = sum(game["moves"] for game in results["results"])
+        self.assertEqual(results["think_time"]["a"]["moves"] + results["think_time"]["b"]["moves"], total_moves)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+from test_base import TestBase
+import unittest
+import random
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+from src.arena import random_quadrants
+from src.game_state import GAME_TYPES, GameObserver, GameState, has_won
+from src.katerenga.game import Game as KaterengaGame
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class RecordingObserver(GameObserver):
+    """abonné qui enregistre les événements reçus"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_info(self, text):
+        self.events.append(("info", text))
+
+    def on_move(self, cells):
+        self.events.append(("move", list(cells)))
+
+    def on_game_over(self, text, wait_for_input=False):
+        self.events.append(("game_over", text))
+
+
+class TestGameState(TestBase):
+    """Test de l'état de partie sans affichage et des abonnés aux événements"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config = config_result[0]
+
+    def test_no_pygame_import(self):
+        """test de l'import de l'état de partie et de l'arène sans pygame"""
+        code = "import sys, src.game_state, src.arena; print('pygame' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "False")
+
+    def test_random_games_notify_observers(self):
+        """test des événements diffusés pendant des parties aléatoires des trois jeux"""
+        rng = random.Random(11)
+        for game_name, game_type in GAME_TYPES.items():
+            _, _, quadrants = random_quadrants(self.quadrants_config, rng)
+            state = GameState(game_type, quadrants)
+            observer = RecordingObserver()
+            state.subscribe(observer)
+            state.subscribe(observer)  # un abonné n'est enregistré qu'une fois
+            winner, moves = None, 0
+            while winner is None and moves < 300:
+                player = state.round_turn
+                move = rng.choice(state.legal_moves())
+                winner = state.apply_move(move)
+                moves += 1
+                self.assertEqual(observer.events[-2][0], "move", game_name)
+                cells = observer.events[-2][1]
+                self.assertEqual(cells[-1], tuple(move[-2:]), game_name)
+                self.assertEqual(winner == player, has_won(game_type, state.board.board, player, state.first_turn,
+                                                           state.locked_pieces, state.attack_map), game_name)
+            self.assertEqual(len(observer.events), 2 * moves)
+            if winner is not None:
+                self.assertEqual(observer.events[-1], ("game_over", f"PLAYER {winner + 1} WON THE GAME !"))
+            state.unsubscribe(observer)
+            if winner is None:
+                state.apply_move(state.legal_moves()[0])
+                self.assertEqual(len(observer.events), 2 * moves)  # plus aucun événement après désabonnement
+
+    def test_headless_game(self):
+        """test d'une partie de Katerenga sans affichage : victoire annoncée aux abonnés"""
+        game = KaterengaGame("test_game_state", [self.quadrants_config[name] for name in sorted(self.quadrants_config)[:4]],
+                             "Solo", headless=True)
+        self.assertIsNone(game.render)
+        observer = RecordingObserver()
+        game.subscribe(observer)
+        for row in range(10):
+            for col in range(10):
+                game.board.board[row][col][0] = None
+        game.board.board[9][0][0] = 0
+        game.board.board[9][9][0] = 0
+        game.board.board[4][4][0] = 1
+        game.board.board[5][5][0] = 0  # pièce encore mobile du joueur 1 (celles des camps sont bloquées)
+        self.assertTrue(game.check_win(0))
+        self.assertEqual(observer.events, [("game_over", "PLAYER 1 WON THE GAME !")])
+        self.assertFalse(game.check_win(1))
+
+    def test_render_subscription(self):
+        """test du remplacement de l'affichage : seul le dernier Render reçoit les événements"""
+        game = KaterengaGame("test_game_state", [self.quadrants_config[name] for name in sorted(self.quadrants_config)[:4]],
+                             "Solo", headless=True)
+        first, second = MagicMock(), MagicMock()
+        game.render = first
+        game.render = second
+        game.notify_info("Player 1's turn")
+        game.notify_game_over("PLAYER 1 WON THE GAME !", wait_for_input=True)
+        first.edit_info_label.assert_not_called()
+        second.edit_info_label.assert_called_once_with("Player 1's turn")
+        second.show_end_popup.assert_called_once_with("PLAYER 1 WON THE GAME !")
+        self.assertIs(second.end_game_waiting_input, True)
+        game.render = None
+        game.notify_board_changed()
+        self.assertEqual(game._get_observers(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
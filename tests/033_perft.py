@@ -0,0 +1,76 @@
+from test_base import TestBase
+import unittest
+import copy
+import os
+import tempfile
+
+from src.game_state import GAME_TYPES, GameState, layout_quadrants
+from src.perft import DEFAULT_LAYOUTS, divide, layout_key, load_golden, perft, run_perft, start_position, write_golden
+from src.windows.selector.config_loader import ConfigLoader
+
+
+def naive_perft(state, depth):
+    """perft de référence : copie complète de l'état de partie à chaque coup"""
+    if depth == 0:
+        return 1
+    nodes = 0
+    for move in state.legal_moves():
+        child = copy.deepcopy(state)
+        if child.apply_move(move) is None or depth == 1:
+            nodes += naive_perft(child, depth - 1)
+    return nodes
+
+
+class TestPerft(TestBase):
+    """Test du comptage des feuilles de l'arbre des coups (perft)"""
+
+    def setUp(self):
+        super().setUp()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config = config_result[0]
+
+    def test_golden_counts(self):
+        """test des nombres de feuilles de référence jusqu'à la profondeur 3"""
+        golden = load_golden()
+        results = run_perft(sorted(GAME_TYPES), {game: 3 for game in GAME_TYPES}, golden=golden,
+                            quadrants_config=self.quadrants_config)
+        self.assertEqual(len(results), 3 * len(DEFAULT_LAYOUTS) * 3)
+        for result in results:
+            self.assertIsNotNone(result["expected"], result)
+            self.assertTrue(result["ok"], result)
+            self.assertGreaterEqual(result["nodes_per_second"], 0.0)
+
+    def test_matches_game_state(self):
+        """test de l'accord avec les règles de GameState à la profondeur 2"""
+        names, rotations = DEFAULT_LAYOUTS[1]
+        for game_name, game_type in GAME_TYPES.items():
+            quadrants = layout_quadrants(self.quadrants_config, names, rotations)
+            position, attack_map = start_position(game_type, quadrants)
+            self.assertEqual(perft(position, game_type, 2, attack_map), naive_perft(GameState(game_type, quadrants), 2), game_name)
+
+    def test_divide_restores_position(self):
+        """test du détail par coup de la racine et de la position restaurée"""
+        names, rotations = DEFAULT_LAYOUTS[2]
+        for game_name, game_type in GAME_TYPES.items():
+            position, attack_map = start_position(game_type, layout_quadrants(self.quadrants_config, names, rotations))
+            board_before, hash_before = position.board.serialize(), position.hash
+            counts = divide(position, game_type, 3, attack_map)
+            self.assertEqual(sum(counts.values()), perft(position, game_type, 3, attack_map), game_name)
+            self.assertEqual((position.board.serialize(), position.hash), (board_before, hash_before))
+            if attack_map is not None:
+                self.assertEqual(attack_map.compact.serialize(), board_before)
+
+    def test_write_golden(self):
+        """test de l'écriture des références"""
+        names, rotations = DEFAULT_LAYOUTS[0]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "golden.json")
+            results = run_perft(["congress"], {"congress": 2}, layouts=[(names, rotations)], quadrants_config=self.quadrants_config)
+            write_golden(results, path)
+            self.assertEqual(load_golden(path), {"congress": {layout_key(names, rotations): [result["nodes"] for result in results]}})
+
+
+if __name__ == "__main__":
+    unittest.main()
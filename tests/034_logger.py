@@ -0,0 +1,85 @@
+from test_base import TestBase
+import unittest
+import io
+import os
+import subprocess
+import sys
+from contextlib import redirect_stdout
+
+from src.board import Board
+from src.moves import available_move
+from src.utils.logger import DEFAULT_DISABLED_LEVELS, LOG_LEVELS_ENV, LogLevel, Logger
+from src.windows.selector.config_loader import ConfigLoader
+
+
+class Exploding:
+    """argument dont le formatage fait échouer le test"""
+
+    def __str__(self):
+        raise AssertionError("disabled log message was formatted")
+
+
+class TestLogger(TestBase):
+    """Test du filtrage des niveaux de log et du formatage différé"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in LogLevel}
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def test_default_levels(self):
+        """test des niveaux désactivés par défaut"""
+        Logger.configure()
+        for level in LogLevel:
+            self.assertEqual(Logger.is_enabled(level), level not in DEFAULT_DISABLED_LEVELS, level)
+        self.assertEqual(set(DEFAULT_DISABLED_LEVELS), {LogLevel.MOVE, LogLevel.BOARD, LogLevel.BOT})
+
+    def test_disabled_level_is_not_formatted(self):
+        """test d'un niveau désactivé : ni formatage ni affichage"""
+        Logger.disable(LogLevel.BOT)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Logger.bot("Test", "value %s", Exploding())
+        self.assertEqual(output.getvalue(), "")
+
+    def test_lazy_formatting(self):
+        """test du formatage des arguments quand le niveau est activé"""
+        Logger.enable(LogLevel.MOVE)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Logger.move("Test", "move from (%d,%d) at %.1f%%", 3, 4, 12.5)
+            Logger.info("Test", "100% literal")
+        lines = output.getvalue().splitlines()
+        self.assertIn("[MOVE] [Test] move from (3,4) at 12.5%", lines[0])
+        self.assertIn("[INFO] [Test] 100% literal", lines[1])
+
+    def test_rules_engine_is_silent(self):
+        """test du moteur de règles sans affichage quand les traces de coups sont désactivées"""
+        Logger.configure()
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        board = Board([quadrants_config[quadrant_names[0]] for _ in range(4)], 2).board
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for row in range(8):
+                for col in range(8):
+                    available_move(board, 0, 0, row, col)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_environment_override(self):
+        """test de la réactivation de niveaux par variable d'environnement"""
+        code = "from src.utils.logger import Logger; print(Logger.bot_enabled, Logger.move_enabled, Logger.board_enabled)"
+        environment = dict(os.environ, **{LOG_LEVELS_ENV: "bot, board"})
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=environment,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+        self.assertEqual(output.split(), ["True", "False", "True"])
+
+
+if __name__ == "__main__":
+    unittest.main()
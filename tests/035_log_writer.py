@@ -0,0 +1,131 @@
+from test_base import TestBase
+import unittest
+import os
+import tempfile
+import threading
+import time
+
+from src.utils.log_writer import LogWriter, RotatingFileSink
+from src.utils.logger import LogLevel, Logger
+
+
+class ListSink:
+    """destination qui garde les lots écrits, et peut rester bloquée jusqu'à release"""
+
+    def __init__(self, blocked=False):
+        self.batches = []
+        self.release = threading.Event()
+        if not blocked:
+            self.release.set()
+
+    def write(self, text):
+        self.release.wait(5.0)
+        self.batches.append(text)
+
+    def close(self):
+        pass
+
+    def lines(self):
+        return "".join(self.batches).splitlines()
+
+
+def format_record(timestamp, level, component, message, args):
+    """formatage minimal des enregistrements de test"""
+    return message % args if args else message
+
+
+class TestLogWriter(TestBase):
+    """Test de l'écriture des logs par un fil dédié"""
+
+    def tearDown(self):
+        Logger.stop_async()
+        super().tearDown()
+
+    def test_threads_batched(self):
+        """test des messages de plusieurs fils écrits dans l'ordre de chaque fil, par lots"""
+        sink = ListSink()
+        writer = LogWriter(format_record, sink, max_queue=100000)
+
+        def produce(name):
+            for index in range(500):
+                writer.submit((0.0, None, name, "%s %d", (name, index)))
+
+        threads = [threading.Thread(target=produce, args=(f"t{number}",)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(writer.flush(5.0))
+        writer.stop()
+        lines = sink.lines()
+        self.assertEqual(len(lines), 2000)
+        for number in range(4):
+            indexes = [int(line.split()[1]) for line in lines if line.startswith(f"t{number} ")]
+            self.assertEqual(indexes, list(range(500)))
+        self.assertLess(len(sink.batches), 2000)  # plusieurs messages par écriture
+        self.assertEqual(writer.dropped, 0)
+
+    def test_drop_new_never_blocks(self):
+        """test d'une sortie bloquée : les producteurs ne sont jamais bloqués et les pertes sont comptées"""
+        sink = ListSink(blocked=True)
+        writer = LogWriter(format_record, sink, max_queue=10, drop_policy="drop_new")
+        start = time.time()
+        accepted = sum(writer.submit((0.0, None, "Test", f"message {index}", ())) for index in range(1000))
+        self.assertLess(time.time() - start, 1.0)
+        self.assertEqual(writer.dropped, 1000 - accepted)
+        self.assertLessEqual(accepted, 11)  # la file plus le message déjà pris par le fil d'écriture
+        sink.release.set()
+        writer.stop()
+        self.assertEqual(sink.lines(), [f"message {index}" for index in range(accepted)])
+
+    def test_drop_oldest_keeps_recent(self):
+        """test de l'éviction des messages les plus anciens"""
+        sink = ListSink(blocked=True)
+        writer = LogWriter(format_record, sink, max_queue=10, drop_policy="drop_oldest")
+        for index in range(100):
+            self.assertTrue(writer.submit((0.0, None, "Test", f"message {index}", ())))
+        self.assertGreaterEqual(writer.dropped, 89)
+        sink.release.set()
+        writer.stop()
+        self.assertEqual(sink.lines()[-10:], [f"message {index}" for index in range(90, 100)])
+
+    def test_invalid_policy(self):
+        """test du refus d'une politique inconnue"""
+        with self.assertRaises(ValueError):
+            LogWriter(format_record, ListSink(), drop_policy="ignore")
+
+    def test_rotating_file(self):
+        """test de l'archivage du fichier de logs par taille"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "logs", "server.log")
+            sink = RotatingFileSink(path, max_bytes=100, backup_count=2)
+            for index in range(10):
+                sink.write(f"{index:02d}" + "x" * 37 + "\n")  # 40 octets par ligne, deux lignes par fichier
+            sink.close()
+            self.assertEqual(sorted(os.listdir(os.path.dirname(path))), ["server.log", "server.log.1", "server.log.2"])
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual([line[:2] for line in file], ["08", "09"])
+            with open(path + ".2", encoding="utf-8") as file:
+                self.assertEqual([line[:2] for line in file], ["04", "05"])
+
+    def test_logger_async_file(self):
+        """test du Logger en écriture asynchrone vers un fichier, sans codes de couleur"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "client.log")
+            Logger.start_async(path=path)
+            Logger.info("Test", "asynchronous %s", "message")
+            Logger.set_enabled(LogLevel.DEBUG, False)
+            Logger.debug("Test", "hidden")
+            Logger.set_enabled(LogLevel.DEBUG, True)
+            self.assertTrue(Logger.flush(2.0))
+            Logger.stop_async()
+            with open(path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("[INFO] [Test] asynchronous message"))
+        self.assertNotIn("\x1b", lines[0])
+        self.assertEqual(Logger.dropped_messages(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
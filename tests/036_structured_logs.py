@@ -0,0 +1,118 @@
+from test_base import TestBase
+import unittest
+import io
+import json
+import random
+import socket
+from contextlib import redirect_stdout
+
+from src.network.common.packets import create_game_action_dict, create_your_turn_dict
+from src.network.server.connection_manager import PACKET_LOG_COMPONENT, ConnectionManager
+from src.network.server.game_server import GameServer
+from src.utils.logger import LogLevel, Logger
+
+
+class TestStructuredLogs(TestBase):
+    """Test des logs structurés (JSON) et de l'échantillonnage par composant"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in LogLevel}
+        Logger.enable(LogLevel.SERVER_SEND, LogLevel.SERVER_RECEIVE)
+
+    def tearDown(self):
+        Logger.set_structured(False)
+        Logger.set_sampling(None)
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def capture(self, function):
+        """exécute function et retourne les lignes affichées"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            function()
+        return output.getvalue().splitlines()
+
+    def test_json_line(self):
+        """test d'un message structuré : une ligne JSON avec ses champs"""
+        Logger.set_structured(True)
+        lines = self.capture(lambda: Logger.server_send("Packets", "Sent %s (%d bytes)", "YOUR_TURN", 42,
+                                                        game_id="game", packet_type="YOUR_TURN", size=42))
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual((record["level"], record["component"], record["message"]), ("SERVER_SEND", "Packets", "Sent YOUR_TURN (42 bytes)"))
+        self.assertEqual((record["game_id"], record["packet_type"], record["size"]), ("game", "YOUR_TURN", 42))
+        self.assertIn("time", record)
+
+    def test_text_mode_ignores_fields(self):
+        """test du mode texte : les champs ne changent pas la ligne affichée"""
+        lines = self.capture(lambda: Logger.server_send("Packets", "Sent %s", "YOUR_TURN", game_id="game", size=42))
+        self.assertEqual(len(lines), 1)
+        self.assertIn("[SERVER_SEND] [Packets] Sent YOUR_TURN", lines[0])
+        self.assertNotIn("game", lines[0])
+
+    def test_sampling(self):
+        """test de l'échantillonnage : seuls les composants configurés sont réduits"""
+        random.seed(7)
+        Logger.set_sampling({"Packets": 0.0, "Sampled": 0.5})
+
+        def emit():
+            for index in range(1000):
+                Logger.server_send("Packets", "dropped %d", index)
+                Logger.server_send("Sampled", "kept %d", index)
+                Logger.server_send("Server", "always %d", index)
+
+        lines = self.capture(emit)
+        self.assertFalse(any("[Packets]" in line for line in lines))
+        self.assertEqual(sum("[Server]" in line for line in lines), 1000)
+        self.assertTrue(400 < sum("[Sampled]" in line for line in lines) < 600)
+
+    def test_invalid_rate(self):
+        """test du refus d'un taux hors de [0, 1]"""
+        with self.assertRaises(ValueError):
+            Logger.set_sampling({"Packets": 1.5})
+
+    def test_connection_manager_fields(self):
+        """test des champs des paquets envoyés et reçus par le serveur"""
+        Logger.set_structured(True)
+        manager = ConnectionManager()
+        server_side, client_side = socket.socketpair()
+        try:
+            manager.add_client(server_side)
+            manager.set_client_game(server_side, "game")
+            sent = self.capture(lambda: manager.send_json(server_side, create_your_turn_dict("game")))
+            size = len(client_side.recv(4096))
+            data = (json.dumps(create_game_action_dict({"from": [0, 0], "to": [1, 1]})) + "\n").encode("utf-8")
+            received = self.capture(lambda: manager.process_received_data(server_side, data))
+        finally:
+            server_side.close()
+            client_side.close()
+        sent_record, received_record = json.loads(sent[0]), json.loads(received[0])
+        self.assertEqual((sent_record["component"], sent_record["level"]), (PACKET_LOG_COMPONENT, "SERVER_SEND"))
+        self.assertEqual((sent_record["game_id"], sent_record["packet_type"], sent_record["size"]), ("game", "YOUR_TURN", size))
+        self.assertEqual((received_record["level"], received_record["packet_type"], received_record["size"]),
+                         ("SERVER_RECEIVE", "GAME_ACTION", len(data)))
+
+    def test_server_processing_fields(self):
+        """test du log de traitement d'un paquet par le serveur : champs du paquet, sans son contenu"""
+        Logger.set_structured(True)
+        Logger.enable(LogLevel.SERVER_INTERNAL)
+        server = GameServer()
+        server_side, client_side = socket.socketpair()
+        try:
+            server.connection_manager.add_client(server_side)
+            server.connection_manager.set_client_game(server_side, "game")
+            lines = self.capture(lambda: server.process_json_packet(server_side, create_game_action_dict({"marker": "payload"}, "game")))
+        finally:
+            server_side.close()
+            client_side.close()
+        records = [json.loads(line) for line in lines if line.startswith("{")]
+        processing = [record for record in records if record["level"] == "SERVER_INTERNAL" and record["component"] == PACKET_LOG_COMPONENT]
+        self.assertEqual(len(processing), 1)
+        self.assertEqual((processing[0]["packet_type"], processing[0]["game_id"]), ("GAME_ACTION", "game"))
+        self.assertNotIn("payload", json.dumps(processing[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
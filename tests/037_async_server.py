@@ -0,0 +1,121 @@
+from test_base import TestBase
+import unittest
+import asyncio
+import json
+import threading
+
+from src.network.common.packets import PacketType, create_connect_dict, create_game_action_dict
+from src.network.server.async_game_server import AsyncGameServer
+from src.network.server.config_manager import ConfigManager
+from src.utils.logger import LogLevel, Logger
+
+SERVER_LEVELS = (LogLevel.SERVER_SEND, LogLevel.SERVER_RECEIVE, LogLevel.SERVER_INTERNAL, LogLevel.SERVER_ERROR)
+
+
+async def send(writer, packet_dict):
+    """envoie un paquet JSON au serveur"""
+    writer.write((json.dumps(packet_dict) + "\n").encode("utf-8"))
+    await writer.drain()
+
+
+async def receive(reader):
+    """lit le prochain paquet JSON du serveur"""
+    line = await asyncio.wait_for(reader.readline(), 2.0)
+    return json.loads(line)
+
+
+class TestAsyncServer(TestBase):
+    """Test du serveur de jeu asyncio"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in SERVER_LEVELS}
+        Logger.disable(*SERVER_LEVELS)
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def run_with_server(self, scenario):
+        """démarre un serveur asyncio sur un port libre et exécute scenario(server, port)"""
+        async def main():
+            server = AsyncGameServer()
+            server.config_manager.host, server.config_manager.port = "127.0.0.1", 0
+            listener = await server.open()
+            try:
+                return await scenario(server, listener.sockets[0].getsockname()[1])
+            finally:
+                server.cleanup()
+                await listener.wait_closed()
+        return asyncio.run(main())
+
+    def test_game_flow(self):
+        """test d'une partie : assignation, tours, action transmise et déconnexion"""
+        async def scenario(server, port):
+            reader1, writer1 = await asyncio.open_connection("127.0.0.1", port)
+            reader2, writer2 = await asyncio.open_connection("127.0.0.1", port)
+            await send(writer1, create_connect_dict("alice", "game", "congress"))
+            self.assertEqual((await receive(reader1))["type"], PacketType.PLAYER_ASSIGNMENT.value)
+            await send(writer2, create_connect_dict("bob", "game", "congress"))
+            self.assertEqual((await receive(reader2))["type"], PacketType.PLAYER_ASSIGNMENT.value)
+            self.assertEqual((await receive(reader1))["type"], PacketType.YOUR_TURN.value)
+            self.assertEqual((await receive(reader2))["type"], PacketType.WAIT_TURN.value)
+
+            await send(writer2, create_game_action_dict({"action_type": "move"}))  # pas son tour : ignoré
+            await send(writer1, create_game_action_dict({"action_type": "move"}))
+            action = await receive(reader2)
+            self.assertEqual((action["type"], action["data"]["action_type"]), (PacketType.GAME_ACTION.value, "move"))
+            self.assertEqual((await receive(reader1))["type"], PacketType.WAIT_TURN.value)
+            self.assertEqual((await receive(reader2))["type"], PacketType.YOUR_TURN.value)
+            self.assertEqual(server.game_manager.get_game("game").current_turn, 2)
+
+            writer1.close()
+            self.assertEqual((await receive(reader2))["type"], PacketType.PLAYER_DISCONNECTED.value)
+            self.assertIsNone(server.game_manager.get_game("game"))  # la partie est fermée
+            writer2.close()
+            await asyncio.sleep(0.05)
+            self.assertEqual(server.connection_manager.clients, {})
+
+        self.run_with_server(scenario)
+
+    def test_idle_connections_single_thread(self):
+        """test de nombreuses connexions inactives servies sans nouveau fil"""
+        threads_before = threading.active_count()
+
+        async def scenario(server, port):
+            connections = [await asyncio.open_connection("127.0.0.1", port) for _ in range(200)]
+            await asyncio.sleep(0.05)
+            self.assertEqual(len(server.connection_manager.clients), 200)
+            self.assertEqual(threading.active_count(), threads_before)
+            reader, writer = connections[0]
+            await send(writer, {"type": PacketType.GET_GAME_LIST.value, "data": {}})
+            self.assertEqual(await receive(reader), {"type": PacketType.GAME_LIST.value, "data": {"games": []}})
+            for _, writer in connections:
+                writer.close()
+            await asyncio.sleep(0.05)
+            self.assertEqual(server.connection_manager.clients, {})
+
+        self.run_with_server(scenario)
+
+    def test_invalid_json_disconnects(self):
+        """test de la déconnexion d'un client qui envoie un JSON invalide"""
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"{not json\n")
+            await writer.drain()
+            self.assertEqual(await asyncio.wait_for(reader.read(), 2.0), b"")
+            writer.close()
+
+        self.run_with_server(scenario)
+
+    def test_backlog_config(self):
+        """test du backlog de listen distinct du nombre de joueurs"""
+        config_manager = ConfigManager()
+        config_manager.load_config()
+        self.assertEqual(config_manager.get_backlog(), 128)
+        self.assertEqual(config_manager.get_max_players(), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
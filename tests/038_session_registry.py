@@ -0,0 +1,165 @@
+from test_base import TestBase
+import unittest
+import json
+import threading
+import time
+
+from src.network.common.packets import PacketType, create_game_action_dict
+from src.network.server.game_manager import GameManager
+from src.network.server.game_server import GameServer
+from src.utils.logger import LogLevel, Logger
+
+SERVER_LEVELS = (LogLevel.SERVER_SEND, LogLevel.SERVER_RECEIVE, LogLevel.SERVER_INTERNAL, LogLevel.SERVER_ERROR)
+
+
+class FakeSocket:
+    """socket simulé : note les paquets envoyés dans un journal partagé"""
+
+    def __init__(self, name, sent):
+        self.name = name
+        self.sent = sent
+
+    def sendall(self, data):
+        for line in data.splitlines():  # plusieurs paquets regroupés par la file d'envoi
+            self.sent.append((self.name, json.loads(line)))
+
+    def getpeername(self):
+        return (self.name, 0)
+
+    def shutdown(self, how):
+        pass
+
+    def close(self):
+        pass
+
+
+def run_threads(target, arguments):
+    """exécute target(argument) dans un fil par argument, tous démarrés ensemble"""
+    barrier = threading.Barrier(len(arguments))
+
+    def run(argument):
+        barrier.wait()
+        target(argument)
+
+    threads = [threading.Thread(target=run, args=(argument,)) for argument in arguments]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestSessionRegistry(TestBase):
+    """Test du registre des parties partagé entre les fils des clients"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in SERVER_LEVELS}
+        Logger.disable(*SERVER_LEVELS)
+        self.server = GameServer()
+        self.sent = []
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def flush(self, clients):
+        """attend l'envoi des paquets en file pour ces clients"""
+        for client in clients:
+            queue = self.server.connection_manager.outbound.get(client)
+            if queue is not None:
+                self.assertTrue(queue.flush(2.0))
+
+    def connect(self, client):
+        """ajoute un client et envoie son paquet CONNECT"""
+        self.server.connection_manager.add_client(client)
+        self.server.handle_connect(client, {"player_name": client.name, "game_name": "game", "game_type": "congress"})
+
+    def test_get_or_create_single_session(self):
+        """test de la création concurrente d'une même partie"""
+        manager = GameManager()
+        sessions = []
+        run_threads(lambda _: sessions.append(manager.get_or_create_game("game", "congress")), range(16))
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+        self.assertEqual(list(manager.games), ["game"])
+
+    def test_concurrent_joins(self):
+        """test de clients rejoignant la même partie en même temps : exactement deux joueurs"""
+        clients = [FakeSocket(f"client{index}", self.sent) for index in range(20)]
+        run_threads(self.connect, clients)
+        self.flush(clients)
+        game = self.server.game_manager.get_game("game")
+        self.assertEqual(game.get_player_count(), 2)
+        self.assertEqual(sorted(game.players), [1, 2])
+        assigned = [name for name, packet in self.sent if packet["type"] == PacketType.PLAYER_ASSIGNMENT.value]
+        self.assertEqual(sorted(assigned), sorted(client.name for client in game.players.values()))
+
+    def test_atomic_turns(self):
+        """test d'actions simultanées des deux joueurs : chaque action transmise est suivie du bon changement de tour"""
+        players = [FakeSocket("player1", self.sent), FakeSocket("player2", self.sent)]
+        for player in players:
+            self.connect(player)
+        self.flush(players)
+        del self.sent[:]
+
+        def play(player):
+            deadline = time.monotonic() + 0.3
+            while time.monotonic() < deadline:
+                self.server.handle_game_action(player, create_game_action_dict({"sender": player.name})["data"])
+                time.sleep(0)  # laisse l'autre joueur tenter son action
+
+        run_threads(play, players)
+        self.flush(players)
+        received = {player.name: [packet for name, packet in self.sent if name == player.name] for player in players}
+        forwarded = {name: [packet["data"]["sender"] for packet in packets if packet["type"] == PacketType.GAME_ACTION.value]
+                     for name, packets in received.items()}
+        self.assertGreater(len(forwarded["player1"]), 0)
+        self.assertEqual(set(forwarded["player2"]), {"player1"})
+        self.assertEqual(set(forwarded["player1"]), {"player2"})
+        self.assertIn(len(forwarded["player2"]) - len(forwarded["player1"]), (0, 1))  # les joueurs ont joué chacun leur tour
+        for name, packets in received.items():  # après chaque coup reçu vient YOUR_TURN, après chaque coup joué WAIT_TURN
+            turns = [packet["type"] for packet in packets if packet["type"] != PacketType.GAME_ACTION.value]
+            expected = [PacketType.YOUR_TURN.value, PacketType.WAIT_TURN.value] if name == "player2" else [PacketType.WAIT_TURN.value, PacketType.YOUR_TURN.value]
+            self.assertEqual(turns, (expected * len(turns))[:len(turns)], name)
+        total = len(forwarded["player1"]) + len(forwarded["player2"])
+        self.assertEqual(self.server.game_manager.get_game("game").current_turn, 1 + total % 2)
+
+    def test_lock_free_listing(self):
+        """test de la liste des parties pendant des créations et suppressions concurrentes"""
+        manager = GameManager()
+        errors = []
+
+        def churn(worker):
+            for index in range(300):
+                manager.create_game(f"game{worker}-{index}", "congress")
+                manager.remove_game(f"game{worker}-{index - 1}")
+
+        def listing(_):
+            try:
+                for _ in range(300):
+                    for game in manager.get_available_games():
+                        self.assertEqual(game["max_players"], 2)
+            except RuntimeError as e:  # dictionnaire modifié pendant le parcours
+                errors.append(e)
+
+        run_threads(lambda worker: churn(worker) if worker < 4 else listing(worker), range(8))
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(manager.games), [f"game{worker}-299" for worker in range(4)])
+
+    def test_disconnect_closes_game_once(self):
+        """test de la déconnexion simultanée des deux joueurs : partie fermée une seule fois"""
+        players = [FakeSocket("player1", self.sent), FakeSocket("player2", self.sent)]
+        for player in players:
+            self.connect(player)
+        game = self.server.game_manager.get_game("game")
+        run_threads(lambda player: self.server.connection_manager.disconnect_client(player, "test"), players)
+        self.assertTrue(game.closed)
+        self.assertIsNone(self.server.game_manager.get_game("game"))
+        self.assertEqual(self.server.connection_manager.clients, {})
+        self.assertEqual(self.server.connection_manager.client_to_game, {})
+        notices = [packet for _, packet in self.sent if packet["type"] == PacketType.PLAYER_DISCONNECTED.value]
+        self.assertEqual(len(notices), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
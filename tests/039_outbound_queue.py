@@ -0,0 +1,145 @@
+from test_base import TestBase
+import unittest
+import asyncio
+import json
+import threading
+import time
+
+from src.network.common.packets import PacketType, create_your_turn_dict
+from src.network.server.async_game_server import StreamConnection
+from src.network.server.game_server import GameServer
+from src.network.server.outbound_queue import StreamOutboundQueue, ThreadedOutboundQueue
+from src.utils.logger import LogLevel, Logger
+
+SERVER_LEVELS = (LogLevel.SERVER_SEND, LogLevel.SERVER_RECEIVE, LogLevel.SERVER_INTERNAL, LogLevel.SERVER_ERROR)
+
+
+class SlowSocket:
+    """socket simulé dont l'envoi reste bloqué jusqu'à release (client qui ne lit plus)"""
+
+    def __init__(self, name, blocked=False):
+        self.name = name
+        self.writes = []
+        self.release = threading.Event()
+        if not blocked:
+            self.release.set()
+
+    def sendall(self, data):
+        self.release.wait(5.0)
+        self.writes.append(data)
+
+    def packets(self):
+        return [json.loads(line) for data in self.writes for line in data.splitlines()]
+
+    def getpeername(self):
+        return (self.name, 0)
+
+    def shutdown(self, how):
+        self.release.set()  # un socket fermé interrompt l'envoi en cours
+
+    def close(self):
+        pass
+
+
+class TestOutboundQueue(TestBase):
+    """Test des files d'envoi bornées des clients du serveur"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in SERVER_LEVELS}
+        Logger.disable(*SERVER_LEVELS)
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def test_coalesced_writes(self):
+        """test du regroupement des paquets en attente en une seule écriture, dans l'ordre"""
+        client = SlowSocket("client", blocked=True)
+        queue = ThreadedOutboundQueue(client, max_packets=100)
+        for index in range(50):
+            self.assertTrue(queue.put(f"{index}\n".encode()))
+        client.release.set()
+        self.assertTrue(queue.flush(2.0))
+        queue.close()
+        self.assertLessEqual(len(client.writes), 2)  # le premier paquet, puis tous les autres d'un coup
+        self.assertEqual(b"".join(client.writes), b"".join(f"{index}\n".encode() for index in range(50)))
+
+    def test_drop_policy(self):
+        """test de la politique drop : les paquets en trop sont perdus sans bloquer"""
+        client = SlowSocket("client", blocked=True)
+        queue = ThreadedOutboundQueue(client, max_packets=5, overflow_policy="drop")
+        start = time.monotonic()
+        accepted = sum(queue.put(b"x\n") for _ in range(20))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertIn(accepted, (5, 6))  # la file, plus le paquet déjà pris par le fil d'écriture
+        self.assertEqual(queue.dropped, 20 - accepted)
+        client.release.set()
+        queue.close()
+
+    def test_block_policy(self):
+        """test de la politique block : attente d'une place, limitée par block_timeout"""
+        client = SlowSocket("client", blocked=True)
+        queue = ThreadedOutboundQueue(client, max_packets=1, overflow_policy="block", block_timeout=0.2)
+        queue.put(b"first\n")
+        while queue.pending():  # le fil d'écriture a pris le premier paquet
+            time.sleep(0.001)
+        queue.put(b"second\n")
+        start = time.monotonic()
+        self.assertFalse(queue.put(b"refused\n"))
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+        threading.Timer(0.05, client.release.set).start()
+        self.assertTrue(queue.put(b"third\n"))  # une place se libère pendant l'attente
+        self.assertTrue(queue.flush(2.0))
+        queue.close()
+        self.assertEqual(b"".join(client.writes), b"first\nsecond\nthird\n")
+
+    def test_slow_client_disconnected(self):
+        """test d'un client lent : l'autre joueur n'est jamais bloqué, le client lent est déconnecté"""
+        server = GameServer()
+        server.connection_manager.outbound_options = {"max_packets": 8, "overflow_policy": "disconnect"}
+        slow, fast = SlowSocket("slow", blocked=True), SlowSocket("fast")
+        for name, client in (("slow", slow), ("fast", fast)):
+            server.connection_manager.add_client(client)
+            server.handle_connect(client, {"player_name": name, "game_name": "game", "game_type": "congress"})
+        other = SlowSocket("other")  # une autre partie continue pendant ce temps
+        server.connection_manager.add_client(other)
+
+        start = time.monotonic()
+        results = [server.connection_manager.send_json(slow, create_your_turn_dict("game")) for _ in range(20)]
+        self.assertTrue(server.connection_manager.send_json(other, create_your_turn_dict("other")))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertIn(False, results)
+        self.assertNotIn(slow, server.connection_manager.clients)
+        self.assertIsNone(server.game_manager.get_game("game"))
+        self.assertTrue(server.connection_manager.outbound[fast].flush(2.0))
+        self.assertEqual(fast.packets()[-1]["type"], PacketType.PLAYER_DISCONNECTED.value)
+        self.assertTrue(server.connection_manager.outbound[other].flush(2.0))
+        self.assertEqual(other.packets(), [create_your_turn_dict("other")])
+
+    def test_stream_queue_never_blocks_loop(self):
+        """test de la file asyncio : la politique block refuse au lieu d'arrêter la boucle d'événements"""
+        async def scenario():
+            accepted = asyncio.get_running_loop().create_future()
+            listener = await asyncio.start_server(lambda reader, writer: accepted.set_result(writer), "127.0.0.1", 0)
+            reader, client_writer = await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1])
+            connection = StreamConnection(await accepted)
+            queue = StreamOutboundQueue(connection, max_packets=5, overflow_policy="block", block_timeout=5.0)
+            start = time.monotonic()
+            results = [queue.put(f"{index}\n".encode()) for index in range(6)]
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual(results, [True] * 5 + [False])
+            received = [await asyncio.wait_for(reader.readline(), 2.0) for _ in range(5)]
+            self.assertEqual(received, [f"{index}\n".encode() for index in range(5)])
+            queue.close()
+            connection.close()
+            client_writer.close()
+            listener.close()
+            await listener.wait_closed()
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
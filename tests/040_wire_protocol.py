@@ -0,0 +1,144 @@
+from test_base import TestBase
+import unittest
+import threading
+import time
+
+from src.network.client.client import NetworkClient
+from src.network.common.packets import (
+    PacketType, create_chat_receive_dict, create_game_action_dict, create_game_list_dict,
+    create_player_assignment_dict, create_protocol_request_dict
+)
+from src.network.common.wire import (
+    PROTOCOL_BINARY, PROTOCOL_JSON, PacketDecoder, ProtocolError, encode_packet
+)
+from src.network.server.game_server import GameServer
+from src.utils.logger import LogLevel, Logger
+
+QUIET_LEVELS = (LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR, LogLevel.SERVER_SEND, LogLevel.SERVER_RECEIVE,
+                LogLevel.SERVER_INTERNAL, LogLevel.SERVER_ERROR)
+
+BOARD = [[[index % 3, None] for index in range(row, row + 8)] for row in range(8)]
+PACKETS = [
+    create_player_assignment_dict(1, "game", "congress"),
+    create_game_action_dict({"from_row": 0, "from_col": 7, "to_row": 3, "to_col": 7, "board_state": {"board": BOARD}}),
+    create_chat_receive_dict("joueur", "é" * 300, 2, 1700000000.5),
+    create_game_list_dict([{"game_id": f"partie {index}", "player_count": 1, "max_players": 2} for index in range(20)]),
+    {"type": PacketType.GAME_STATE.value, "data": {"values": [None, True, False, -1, -200, 70000, -2 ** 40, 2 ** 63, 0.25, ""]}},
+]
+
+
+class TestWireProtocol(TestBase):
+    """Test du protocole binaire et de la négociation du format d'échange"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in QUIET_LEVELS}
+        Logger.disable(*QUIET_LEVELS)
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def test_roundtrip(self):
+        """test de l'encodage et du décodage des paquets dans les deux formats"""
+        for protocol in (PROTOCOL_JSON, PROTOCOL_BINARY):
+            for packet in PACKETS:
+                data = encode_packet(packet, protocol)
+                self.assertEqual(data[0] == 0, protocol == PROTOCOL_BINARY)
+                self.assertEqual(PacketDecoder().feed(data), [(packet, len(data))])
+
+    def test_binary_smaller(self):
+        """test de la taille des trames binaires par rapport aux lignes JSON"""
+        for packet in PACKETS[1:4]:
+            self.assertLess(len(encode_packet(packet, PROTOCOL_BINARY)), len(encode_packet(packet, PROTOCOL_JSON)))
+
+    def test_split_mixed_stream(self):
+        """test d'un flux mêlant les deux formats, découpé à chaque position"""
+        stream = b"".join(encode_packet(packet, protocol) for packet in PACKETS for protocol in (PROTOCOL_BINARY, PROTOCOL_JSON))
+        expected = [packet for packet in PACKETS for _ in range(2)]
+        for cut in range(1, len(stream)):
+            decoder = PacketDecoder()
+            packets = decoder.feed(stream[:cut]) + decoder.feed(stream[cut:])
+            self.assertEqual([packet for packet, _ in packets], expected)
+            self.assertEqual(decoder.pending(), 0)
+        decoder = PacketDecoder()
+        packets = [packet for index in range(0, len(stream), 7) for packet, _ in decoder.feed(stream[index:index + 7])]
+        self.assertEqual(packets, expected)
+
+    def test_burst(self):
+        """test d'une rafale de paquets reçue en un seul bloc"""
+        stream = b"".join(encode_packet(PACKETS[1], PROTOCOL_BINARY) for _ in range(2000))
+        packets = PacketDecoder().feed(stream)
+        self.assertEqual(len(packets), 2000)
+        self.assertEqual(sum(size for _, size in packets), len(stream))
+
+    def test_invalid_data_consumed(self):
+        """test d'un paquet invalide : erreur, puis reprise du décodage au paquet suivant"""
+        valid = encode_packet(PACKETS[0], PROTOCOL_BINARY)
+        invalid = [b"{not json\n", b"\x00\x00\x00\x02\x01\xc1", b"\x00\x00\x00\x04\x01\xa5ab", b"\x00\x00\x00\x03\x01\x01\x02"]
+        for data in invalid:
+            decoder = PacketDecoder()
+            with self.assertRaises(ValueError):
+                decoder.feed(data + valid)
+            self.assertEqual(decoder.feed(b""), [(PACKETS[0], len(valid))])
+        with self.assertRaises(ProtocolError):
+            PacketDecoder().feed(b"\x00\x00\x00\x02\x01\xc1")
+
+    def test_unencodable_type_stays_json(self):
+        """test d'un type de paquet hors octet : envoyé en JSON même en mode binaire"""
+        packet = {"type": "custom", "data": {}}
+        self.assertEqual(encode_packet(packet, PROTOCOL_BINARY), encode_packet(packet, PROTOCOL_JSON))
+
+    def test_negotiation(self):
+        """test de la négociation avec un serveur réel : paquets binaires dans les deux sens"""
+        server = GameServer()
+        server.config_manager.host, server.config_manager.port = "127.0.0.1", 0
+        server.config_manager.protocol = PROTOCOL_BINARY
+        thread = threading.Thread(target=server.start, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 2.0
+        while (server.server_socket is None or server.server_socket.getsockname()[1] == 0) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        client = NetworkClient()
+        client.host, client.port = server.server_socket.getsockname()
+        client.preferred_protocol = PROTOCOL_BINARY
+        received = threading.Event()
+        client.register_handler("game_list_received", lambda games: received.set())
+        try:
+            while not client.connect_to_lobby(): # le socket est lié mais peut ne pas encore écouter
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            deadline = time.monotonic() + 2.0
+            while client.protocol != PROTOCOL_BINARY and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(client.protocol, PROTOCOL_BINARY)
+            client.request_game_list()
+            self.assertTrue(received.wait(2.0))
+            self.assertEqual(list(server.connection_manager.client_protocol.values()), [PROTOCOL_BINARY])
+        finally:
+            client.disconnect("test")
+            server.server_socket.close()
+
+    def test_server_refuses_binary(self):
+        """test d'un serveur limité au JSON : la demande du client reçoit "json" """
+        server = GameServer()
+        server.config_manager.protocol = PROTOCOL_JSON
+        sent = []
+
+        class FakeSocket:
+            def sendall(self, data):
+                sent.append(data)
+
+            def getpeername(self):
+                return ("client", 0)
+
+        client = FakeSocket()
+        server.process_json_packet(client, create_protocol_request_dict([PROTOCOL_BINARY, PROTOCOL_JSON]))
+        self.assertEqual(PacketDecoder().feed(b"".join(sent))[0][0]["data"], {"protocol": PROTOCOL_JSON})
+        self.assertEqual(server.connection_manager.client_protocol[client], PROTOCOL_JSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+from test_base import TestBase
+import unittest
+import json
+import random
+
+from src.arena import random_quadrants
+from src.game_state import GameObserver
+from src.katerenga.game import Game as KaterengaGame
+from src.congress.game import Game as CongressGame
+from src.isolation.game import Game as IsolationGame
+from src.moves import generate_moves
+from src.network.client.game_base import SNAPSHOT_INTERVAL
+from src.network.common.packets import PacketType, create_game_action_dict, create_sync_request_dict
+from src.network.common.wire import PROTOCOL_BINARY, PROTOCOL_JSON, encode_packet
+from src.network.server.game_server import GameServer
+from src.utils.logger import LogLevel, Logger
+from src.windows.selector.config_loader import ConfigLoader
+
+QUIET_LEVELS = (LogLevel.INFO, LogLevel.SUCCESS, LogLevel.WARNING, LogLevel.ERROR, LogLevel.GAME, LogLevel.SERVER_SEND,
+                LogLevel.SERVER_RECEIVE, LogLevel.SERVER_INTERNAL, LogLevel.SERVER_ERROR)
+
+
+class GameOverObserver(GameObserver):
+    """abonné qui note la fin de partie"""
+
+    def __init__(self):
+        self.over = False
+
+    def on_game_over(self, text, wait_for_input=False):
+        self.over = True
+
+
+class LinkedClient:
+    """client réseau simulé : remet les paquets au jeu de l'adversaire après un aller-retour JSON"""
+
+    def __init__(self):
+        self.peer = None
+        self.opponent_connected = True
+        self.actions = []
+        self.requests = []
+        self.drop_next = False  # le prochain coup est perdu en route
+
+    def send_game_action(self, action):
+        packet = create_game_action_dict(action, "game")
+        self.actions.append(packet)
+        if self.drop_next:
+            self.drop_next = False
+            return
+        self.peer.on_network_action(json.loads(json.dumps(packet))["data"])
+
+    def send_sync_request(self, seq):
+        self.requests.append(seq)
+        self.peer.on_sync_request(create_sync_request_dict(seq)["data"])
+
+    def send_game_state(self, state):
+        self.peer.on_game_state(json.loads(json.dumps(state)))
+
+    def disconnect(self, reason=""):
+        pass
+
+
+class TestDeltaActions(TestBase):
+    """Test des coups réseau transmis sans l'état complet du plateau"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in QUIET_LEVELS}
+        Logger.disable(*QUIET_LEVELS)
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        self.quadrants_config = config_result[0]
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def create_players(self, game_class, seed):
+        """crée les deux joueurs d'une partie réseau, chacun avec sa propre disposition de quadrants"""
+        rng = random.Random(seed)
+        players = []
+        for number in (1, 2):
+            game = game_class("test_save", random_quadrants(self.quadrants_config, rng)[2], "Solo", headless=True)
+            game.is_network_game = True
+            game.player_number = number
+            game.game_started = True
+            game.is_my_turn = number == 1
+            game.network_client = LinkedClient()
+            game.observer = GameOverObserver()
+            game.subscribe(game.observer)
+            players.append(game)
+        players[0].network_client.peer, players[1].network_client.peer = players[1], players[0]
+        return players
+
+    def play_move(self, game, rng):
+        """joue par clics un coup au hasard du joueur local ; retour : False si aucun coup n'a été accepté"""
+        player = game.player_number - 1
+        if isinstance(game, IsolationGame):
+            moves = [((row, col),) for row, col in game.get_attack_map().safe_squares(player, check_all_pieces=True)]
+        else:
+            moves = [((from_row, from_col), (to_row, to_col)) for from_row, from_col, to_row, to_col
+                     in generate_moves(game.board.board, player, getattr(game, "first_turn", False), getattr(game, "locked_pieces", []),
+                                       captures=not isinstance(game, CongressGame))]
+        rng.shuffle(moves)
+        sent = len(game.network_client.actions)
+        for clicks in moves:
+            game.selected_piece = None
+            for row, col in clicks:
+                game.on_click(row, col)
+            if len(game.network_client.actions) > sent:
+                return True
+        return False
+
+    def play_game(self, game_class, seed, max_moves=40):
+        """joue une partie entre deux joueurs liés, en vérifiant la synchronisation après chaque coup"""
+        players = self.create_players(game_class, seed)
+        rng = random.Random(seed)
+        for index in range(max_moves):
+            mover, receiver = players[index % 2], players[1 - index % 2]
+            if mover.observer.over or receiver.observer.over or not self.play_move(mover, rng):
+                break
+            mover.is_my_turn, receiver.is_my_turn = False, True  # YOUR_TURN / WAIT_TURN du serveur
+            self.assertEqual([[cell[0] for cell in row] for row in receiver.board.board],
+                             [[cell[0] for cell in row] for row in mover.board.board])
+            self.assertEqual(receiver.network_position_hash(), mover.network_position_hash())
+            self.assertEqual((receiver.round_turn, receiver.network_seq), (mover.round_turn, mover.network_seq))
+        return players
+
+    def test_games_stay_in_sync(self):
+        """test de parties des trois jeux : l'état reste identique, sans demande d'instantané"""
+        for game_class in (KaterengaGame, CongressGame, IsolationGame):
+            for seed in range(3):
+                players = self.play_game(game_class, seed)
+                actions = sorted(players[0].network_client.actions + players[1].network_client.actions,
+                                 key=lambda packet: packet["data"]["seq"])
+                self.assertGreater(len(actions), 2)
+                self.assertEqual([packet["data"]["seq"] for packet in actions], list(range(1, len(actions) + 1)))
+                snapshots = [packet["data"]["seq"] for packet in actions if "board_state" in packet["data"]]
+                self.assertEqual(snapshots, [seq for seq in range(1, len(actions) + 1) if seq == 1 or seq % SNAPSHOT_INTERVAL == 0])
+                self.assertEqual(players[0].network_client.requests + players[1].network_client.requests, [])
+                # le premier coup transmet la disposition de son auteur : les couleurs sont alors identiques
+                self.assertEqual(players[1].board.board, players[0].board.board)
+
+    def test_katerenga_locks_derived(self):
+        """test du verrou d'une pièce entrée dans un camp, déduit par les règles chez l'adversaire"""
+        players = self.create_players(KaterengaGame, 0)
+        for game in players:
+            for row in range(10):
+                for col in range(10):
+                    game.board.board[row][col][0] = None
+            game.board.board[8][9][0] = 0
+            game.board.board[1][1][0] = 1
+            game.board.board[3][3][0] = 1
+            game.network_seq = 1  # la disposition a déjà été transmise
+        players[0].first_turn = players[1].first_turn = False
+        players[0].board.board[8][9][1] = players[1].board.board[8][9][1] = 0  # case roi : le camp (9, 9) est accessible
+        players[0].on_click(8, 9)
+        players[0].on_click(9, 9)
+        data = players[0].network_client.actions[-1]["data"]
+        self.assertNotIn("board_state", data)
+        self.assertNotIn("locked_pieces", data)
+        self.assertEqual([tuple(cell) for cell in players[1].locked_pieces], [(9, 9)])
+        self.assertEqual(players[1].network_position_hash(), players[0].network_position_hash())
+
+    def test_missed_move_resync(self):
+        """test d'un coup perdu : l'écart de numéro est détecté, l'instantané demandé rétablit un état commun"""
+        players = self.create_players(CongressGame, 1)
+        rng = random.Random(1)
+        for index in range(6):
+            mover, receiver = players[index % 2], players[1 - index % 2]
+            if index == 3:
+                mover.network_client.drop_next = True
+            self.assertTrue(self.play_move(mover, rng))
+            mover.is_my_turn, receiver.is_my_turn = False, True
+        # le joueur 1 a manqué le coup 4 et joue à son tour un coup 4 : le joueur 2 attendait le coup 5
+        self.assertEqual(players[1].network_client.requests, [4])
+        self.assertEqual(players[0].network_client.requests, [])
+        self.assertFalse(players[1].awaiting_snapshot)
+        self.assertEqual(players[0].network_seq, players[1].network_seq)
+        self.assertEqual(players[0].board.board, players[1].board.board)
+
+    def test_hash_mismatch_resync(self):
+        """test d'un état local divergent : détecté par le hachage et corrigé par un instantané"""
+        players = self.create_players(IsolationGame, 2)
+        rng = random.Random(2)
+        self.assertTrue(self.play_move(players[0], rng))
+        players[0].is_my_turn, players[1].is_my_turn = False, True
+        free = next((row, col) for row in range(8) for col in range(8)
+                    if players[0].board.board[row][col][0] is None and players[1].board.board[row][col][0] is None)
+        players[0].board.board[free[0]][free[1]][0] = 0  # le joueur 1 voit une tour de trop
+        self.assertTrue(self.play_move(players[1], rng))
+        self.assertEqual(players[0].network_client.requests, [2])
+        self.assertEqual(players[0].board.board, players[1].board.board)
+        self.assertEqual(players[0].network_position_hash(), players[1].network_position_hash())
+
+    def test_bandwidth(self):
+        """test de la taille d'un coup : plus de dix fois plus petit que l'action avec l'état complet"""
+        for game_class in (KaterengaGame, CongressGame, IsolationGame):
+            players = self.play_game(game_class, 0, max_moves=4)
+            mover = players[0]
+            packet = next(packet for packet in mover.network_client.actions if "board_state" not in packet["data"])
+            full = create_game_action_dict(dict(packet["data"], board_state=mover.get_board_state()))
+            self.assertGreater(len(encode_packet(full, PROTOCOL_JSON)), 10 * len(encode_packet(packet, PROTOCOL_BINARY)))
+            self.assertGreater(len(encode_packet(full, PROTOCOL_JSON)), 5 * len(encode_packet(packet, PROTOCOL_JSON)))
+
+    def test_server_relays_sync(self):
+        """test du relais par le serveur : demande et instantané transmis à l'adversaire, sans changement de tour"""
+        server = GameServer()
+        sent = []
+
+        class FakeSocket:
+            def __init__(self, name):
+                self.name = name
+
+            def sendall(self, data):
+                sent.extend((self.name, json.loads(line)) for line in data.splitlines())
+
+            def getpeername(self):
+                return (self.name, 0)
+
+        players = [FakeSocket("player1"), FakeSocket("player2")]
+        for player in players:
+            server.handle_connect(player, {"player_name": player.name, "game_name": "game", "game_type": "congress"})
+        game = server.game_manager.get_game("game")
+        turn = game.current_turn
+        del sent[:]
+        server.process_json_packet(players[0], create_sync_request_dict(3))
+        server.process_json_packet(players[1], {"type": PacketType.GAME_STATE.value, "data": {"seq": 3, "hash": 1}})
+        self.assertEqual(sent, [("player2", create_sync_request_dict(3)),
+                                ("player1", {"type": PacketType.GAME_STATE.value, "data": {"seq": 3, "hash": 1}})])
+        self.assertEqual(game.current_turn, turn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from test_base import TestBase
+import unittest
+import time
+
+import pygame
+
+from src.bot_worker import BOT_MOVE_EVENT
+from src.katerenga.game import Game as KaterengaGame
+from src.congress.game import Game as CongressGame
+from src.isolation.game import Game as IsolationGame
+from src.utils.logger import LogLevel, Logger
+from src.windows.selector.config_loader import ConfigLoader
+
+QUIET_LEVELS = (LogLevel.INFO, LogLevel.SUCCESS, LogLevel.GAME, LogLevel.BOT)
+
+
+class TestBotPonderEvents(TestBase):
+    """Test de la réflexion anticipée lancée par la boucle d'événements des jeux après le coup du bot"""
+
+    def setUp(self):
+        super().setUp()
+        self.enabled = {level: Logger.is_enabled(level) for level in QUIET_LEVELS}
+        Logger.disable(*QUIET_LEVELS)
+        config_result = ConfigLoader().load_quadrants()  # charge les quadrants
+        if not config_result:
+            self.fail("Failed to load quadrants configuration")
+        quadrants_config, quadrant_names, _ = config_result
+        self.selected_quadrants = [quadrants_config[quadrant_names[i % len(quadrant_names)]] for i in range(4)]
+
+    def tearDown(self):
+        for level, enabled in self.enabled.items():
+            Logger.set_enabled(level, enabled)
+        super().tearDown()
+
+    def create_game(self, game_class):
+        """partie contre le bot, avec un temps de réflexion réduit, où le bot a le trait"""
+        game = game_class("test_save", self.selected_quadrants, "Bot", headless=True)
+        if game_class is KaterengaGame:
+            game.bot.mcts.iterations, game.bot.mcts.time_limit = 200, 0.2
+        elif game_class is CongressGame:
+            game.bot.max_time = 0.2
+        else:
+            game.board.board[3][3][0] = 0  # tour du joueur déjà placée
+            game.bot.time_limit = 0.2
+        game.round_turn = 1
+        return game
+
+    def wait_bot_event(self, timeout=5.0):
+        """attend l'événement BOT_MOVE_EVENT posté par le fil du bot"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            events = pygame.event.get(BOT_MOVE_EVENT)
+            if events:
+                return events[0]
+            time.sleep(0.01)
+        self.fail("Bot move event not received")
+
+    def test_ponder_after_bot_move(self):
+        """test des trois jeux : le coup du bot reçu par handle_events est joué puis le bot réfléchit sur le temps du joueur"""
+        for game_class in (KaterengaGame, CongressGame, IsolationGame):
+            game = self.create_game(game_class)
+            board = [[cell[0] for cell in row] for row in game.board.board]
+            game.start_bot_turn()
+            event = self.wait_bot_event()
+            try:
+                self.assertFalse(game.handle_events(event))
+                self.assertNotEqual([[cell[0] for cell in row] for row in game.board.board], board)
+                self.assertEqual(game.round_turn, 0)
+                self.assertTrue(game.bot_worker.is_pondering(), game_class.__module__)
+            finally:
+                game.bot_worker.cancel()
+            self.assertFalse(game.bot_worker.is_pondering())
+
+
+if __name__ == "__main__":
+    unittest.main()
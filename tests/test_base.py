@@ -6,6 +6,35 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.board import Board
+from src.captures import AttackMap
+
+
+def late_isolation_position(rng, quadrants_config, quadrant_names, max_safe):
+    """joue des coups aléatoires d'isolation jusqu'à ce qu'il reste au plus max_safe cases libres
+    retour : (plateau, carte des attaques, joueur qui a le trait)"""
+    quadrants = [quadrants_config[rng.choice(quadrant_names)] for _ in range(4)]
+    board = Board(quadrants, 1).board
+    attack_map = AttackMap(board)
+    turn = 0
+    while attack_map.safe_mask.bit_count() > max_safe:
+        row, col = rng.choice(attack_map.safe_squares(turn, check_all_pieces=True))
+        board[row][col][0] = turn
+        attack_map.place(row, col, turn)
+        turn = 1 - turn
+    return board, attack_map, turn
+
+
+def isolation_wins(attack_map, player):
+    """recherche exhaustive sur la carte des attaques : True si le joueur qui a le trait gagne"""
+    for row, col in attack_map.safe_squares(player, check_all_pieces=True):
+        attack_map.place(row, col, player)
+        opponent_wins = isolation_wins(attack_map, 1 - player)
+        attack_map.remove(row, col)
+        if not opponent_wins:
+            return True
+    return False
+
 class TestBase(unittest.TestCase):
     def setUp(self):
         pygame.init()